@@ -33,7 +33,14 @@ from maverick_agents.llm import (
     get_openrouter_llm,
     list_ollama_models,
 )
-from maverick_agents.memory import ConversationStore, MemoryStore, UserMemoryStore
+from maverick_agents.memory import (
+    ConversationStore,
+    MemoryStore,
+    RedisConversationStore,
+    RedisMemoryStore,
+    RedisUserMemoryStore,
+    UserMemoryStore,
+)
 from maverick_agents.personas import (
     DEFAULT_CACHE_TTL_SECONDS,
     DEFAULT_PERSONA_PARAMS,
@@ -131,6 +138,9 @@ __all__ = [
     "MemoryStore",
     "ConversationStore",
     "UserMemoryStore",
+    "RedisMemoryStore",
+    "RedisConversationStore",
+    "RedisUserMemoryStore",
     # Utils - Logging
     "OrchestrationLogger",
     "get_orchestration_logger",
@@ -8,6 +8,7 @@ Provides comprehensive market analysis including:
 - Risk-adjusted recommendations
 """
 
+import asyncio
 import hashlib
 import logging
 from datetime import datetime
@@ -23,6 +24,7 @@ from langgraph.prebuilt import ToolNode
 from maverick_agents.base import PersonaAwareAgent
 from maverick_agents.circuit_breaker import circuit_manager
 from maverick_agents.exceptions import AgentInitializationError
+from maverick_agents.memory import create_conversation_store
 from maverick_agents.state import MarketAnalysisState
 
 logger = logging.getLogger(__name__)
@@ -105,7 +107,8 @@ class MarketAnalysisAgent(PersonaAwareAgent):
             tool_registry: Optional tool registry for getting tools by name
             persona: Investor persona
             ttl_hours: Cache TTL in hours
-            conversation_store: Optional conversation storage
+            conversation_store: Conversation storage (default: the store
+                selected by create_conversation_store)
             checkpointer: Optional memory checkpointer
 
         Raises:
@@ -153,7 +156,12 @@ class MarketAnalysisAgent(PersonaAwareAgent):
                 reason=str(e),
             )
 
-        self.conversation_store = conversation_store
+        # Configured store (shared through Redis with AGENT_MEMORY_BACKEND=redis)
+        self.conversation_store = (
+            conversation_store
+            if conversation_store is not None
+            else create_conversation_store(ttl_hours=ttl_hours)
+        )
         self.ttl_hours = ttl_hours
 
         # Circuit breakers for external APIs
@@ -510,7 +518,7 @@ Remember to:
         start_time = datetime.now()
 
         # Check cache first
-        cached = self._check_enhanced_cache(query, session_id, screening_strategy)
+        cached = await self._check_enhanced_cache(query, session_id, screening_strategy)
         if cached:
             return cached
 
@@ -548,11 +556,12 @@ Remember to:
         analysis_results = self._extract_enhanced_results(result)
 
         # Cache results if conversation store available
-        if self.conversation_store:
-            query_hash = hashlib.sha256(query.lower().encode()).hexdigest()[:8]
-            cache_key = f"{screening_strategy}_{query_hash}"
+        if self.conversation_store is not None:
+            cache_key = self._analysis_cache_key(query, screening_strategy)
 
-            self.conversation_store.save_analysis(
+            # Stores may block on network I/O; keep them off the event loop
+            await asyncio.to_thread(
+                self.conversation_store.save_analysis,
                 session_id=session_id,
                 symbol=cache_key,
                 analysis_type=f"{screening_strategy}_analysis",
@@ -561,18 +570,23 @@ Remember to:
 
         return analysis_results
 
-    def _check_enhanced_cache(
+    @staticmethod
+    def _analysis_cache_key(query: str, strategy: str) -> str:
+        """Cache key for an analysis, shared by lookups and saves."""
+        query_hash = hashlib.sha256(query.lower().encode()).hexdigest()[:8]
+        return f"{strategy}_{query_hash}"
+
+    async def _check_enhanced_cache(
         self, query: str, session_id: str, strategy: str
     ) -> dict[str, Any] | None:
         """Check for cached analysis with strategy awareness."""
-        if not self.conversation_store:
+        if self.conversation_store is None:
             return None
 
-        # Create a hash of the query to use as cache key
-        query_hash = hashlib.md5(query.lower().encode()).hexdigest()[:8]
-        cache_key = f"{strategy}_{query_hash}"
+        cache_key = self._analysis_cache_key(query, strategy)
 
-        cached = self.conversation_store.get_analysis(
+        cached = await asyncio.to_thread(
+            self.conversation_store.get_analysis,
             session_id=session_id,
             symbol=cache_key,
             analysis_type=f"{strategy}_analysis",
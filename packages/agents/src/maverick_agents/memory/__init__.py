@@ -1,7 +1,7 @@
 """
 Memory stores for agent conversations and user data.
 
-Provides in-memory storage with TTL support for:
+Provides bounded in-process and Redis-backed storage with TTL support for:
 - Conversation-specific data and analysis caching
 - User preferences and risk profiles
 - Trade history and watchlists
@@ -10,11 +10,21 @@ Provides in-memory storage with TTL support for:
 from maverick_agents.memory.stores import (
     ConversationStore,
     MemoryStore,
+    RedisConversationStore,
+    RedisMemoryStore,
+    RedisUserMemoryStore,
     UserMemoryStore,
+    create_conversation_store,
+    create_user_memory_store,
 )
 
 __all__ = [
     "MemoryStore",
     "ConversationStore",
     "UserMemoryStore",
+    "RedisMemoryStore",
+    "RedisConversationStore",
+    "RedisUserMemoryStore",
+    "create_conversation_store",
+    "create_user_memory_store",
 ]
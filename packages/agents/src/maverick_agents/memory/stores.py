@@ -1,27 +1,129 @@
 """
 Memory stores for agent conversations and user data.
+
+``MemoryStore`` is a bounded in-process store: entries carry monotonic expiry
+timestamps indexed by a min-heap, the store is capped by LRU eviction and
+each namespace (session or user) has its own quota. ``RedisMemoryStore``
+implements the same interface on Redis so server replicas share memory.
 """
 
 from __future__ import annotations
 
+import heapq
+import json
 import logging
-from datetime import datetime, timedelta
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_ENTRIES = 10_000
 
-class MemoryStore:
-    """Base class for memory storage with TTL support."""
+# Rebuild the expiry heap once stale entries outnumber live ones by this factor
+_HEAP_COMPACT_RATIO = 2
+
+
+@dataclass(slots=True)
+class _MemoryEntry:
+    """Stored value with monotonic expiry."""
 
-    def __init__(self, ttl_hours: float = 24.0):
+    value: Any
+    expires_at: float
+    created_at: float
+
+
+class MemoryStore:
+    """Bounded in-process memory storage with TTL support.
+
+    Expiry uses ``time.monotonic()`` and a min-heap so expired entries are
+    purged in O(k log n) instead of scanning the store. Keys are grouped into
+    namespaces (the first ``namespace_depth`` colon-separated segments) that
+    can each be held to a quota; both limits evict least recently used first.
+    """
+
+    # Number of leading key segments forming the namespace ("session" / "user:42")
+    namespace_depth = 1
+    # Per-namespace quota applied when the constructor does not override it
+    default_namespace_quota: int | None = None
+
+    def __init__(
+        self,
+        ttl_hours: float = 24.0,
+        max_entries: int | None = DEFAULT_MAX_ENTRIES,
+        namespace_quota: int | None = None,
+    ):
         """Initialize memory store.
 
         Args:
             ttl_hours: Default time-to-live in hours for stored values
+            max_entries: Maximum entries held before LRU eviction (None = unbounded)
+            namespace_quota: Maximum entries per namespace (None = class default)
         """
         self.ttl_hours = ttl_hours
-        self.store: dict[str, dict[str, Any]] = {}
+        self.max_entries = max_entries
+        self.namespace_quota = (
+            namespace_quota
+            if namespace_quota is not None
+            else self.default_namespace_quota
+        )
+        self.store: OrderedDict[str, _MemoryEntry] = OrderedDict()
+        self._expiry_heap: list[tuple[float, str]] = []
+        self._namespaces: dict[str, OrderedDict[str, None]] = {}
+        self._lock = threading.RLock()
+        self._evictions = 0
+        self._expirations = 0
+
+    def _namespace(self, key: str) -> str:
+        """Return the namespace a key belongs to."""
+        depth = self.namespace_depth
+        return ":".join(key.split(":", depth)[:depth])
+
+    def _ttl_seconds(self, ttl_hours: float | None) -> float:
+        return (ttl_hours or self.ttl_hours) * 3600
+
+    def _remove(self, key: str) -> _MemoryEntry | None:
+        """Remove a key from the store and namespace index (heap is lazy)."""
+        entry = self.store.pop(key, None)
+        if entry is None:
+            return None
+
+        namespace = self._namespace(key)
+        members = self._namespaces.get(namespace)
+        if members is not None:
+            members.pop(key, None)
+            if not members:
+                del self._namespaces[namespace]
+        return entry
+
+    def _purge_expired(self, now: float) -> int:
+        """Pop expired entries off the heap, skipping superseded heap items."""
+        heap = self._expiry_heap
+        removed = 0
+
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self.store.get(key)
+            if entry is not None and entry.expires_at == expires_at:
+                self._remove(key)
+                removed += 1
+
+        if len(heap) > _HEAP_COMPACT_RATIO * len(self.store) + 64:
+            self._expiry_heap = [
+                (entry.expires_at, key) for key, entry in self.store.items()
+            ]
+            heapq.heapify(self._expiry_heap)
+
+        self._expirations += removed
+        return removed
+
+    def _evict(self, key: str) -> None:
+        self._remove(key)
+        self._evictions += 1
 
     def set(self, key: str, value: Any, ttl_hours: float | None = None) -> None:
         """Store a value with optional custom TTL.
@@ -31,14 +133,28 @@ class MemoryStore:
             value: Value to store
             ttl_hours: Custom TTL in hours (uses default if not specified)
         """
-        ttl = ttl_hours or self.ttl_hours
-        expiry = datetime.now() + timedelta(hours=ttl)
+        now = time.monotonic()
+        expires_at = now + self._ttl_seconds(ttl_hours)
 
-        self.store[key] = {
-            "value": value,
-            "expiry": expiry.isoformat(),
-            "created": datetime.now().isoformat(),
-        }
+        with self._lock:
+            self._purge_expired(now)
+
+            self.store[key] = _MemoryEntry(value, expires_at, time.time())
+            self.store.move_to_end(key)
+            heapq.heappush(self._expiry_heap, (expires_at, key))
+
+            namespace = self._namespace(key)
+            members = self._namespaces.setdefault(namespace, OrderedDict())
+            members[key] = None
+            members.move_to_end(key)
+
+            if self.namespace_quota is not None:
+                while len(members) > self.namespace_quota:
+                    self._evict(next(iter(members)))
+
+            if self.max_entries is not None:
+                while len(self.store) > self.max_entries:
+                    self._evict(next(iter(self.store)))
 
     def get(self, key: str) -> Any | None:
         """Get a value if not expired.
@@ -49,17 +165,19 @@ class MemoryStore:
         Returns:
             Stored value or None if not found or expired
         """
-        if key not in self.store:
-            return None
-
-        entry = self.store[key]
-        expiry = datetime.fromisoformat(entry["expiry"])
+        with self._lock:
+            entry = self.store.get(key)
+            if entry is None:
+                return None
 
-        if datetime.now() > expiry:
-            del self.store[key]
-            return None
+            if time.monotonic() >= entry.expires_at:
+                self._remove(key)
+                self._expirations += 1
+                return None
 
-        return entry["value"]
+            self.store.move_to_end(key)
+            self._namespaces[self._namespace(key)].move_to_end(key)
+            return entry.value
 
     def delete(self, key: str) -> None:
         """Delete a value.
@@ -67,8 +185,8 @@ class MemoryStore:
         Args:
             key: Storage key to delete
         """
-        if key in self.store:
-            del self.store[key]
+        with self._lock:
+            self._remove(key)
 
     def clear_expired(self) -> int:
         """Clear all expired entries.
@@ -76,17 +194,8 @@ class MemoryStore:
         Returns:
             Number of entries cleared
         """
-        now = datetime.now()
-        expired_keys = []
-
-        for key, entry in self.store.items():
-            if now > datetime.fromisoformat(entry["expiry"]):
-                expired_keys.append(key)
-
-        for key in expired_keys:
-            del self.store[key]
-
-        return len(expired_keys)
+        with self._lock:
+            return self._purge_expired(time.monotonic())
 
     def clear_all(self) -> int:
         """Clear all entries.
@@ -94,9 +203,12 @@ class MemoryStore:
         Returns:
             Number of entries cleared
         """
-        count = len(self.store)
-        self.store.clear()
-        return count
+        with self._lock:
+            count = len(self.store)
+            self.store.clear()
+            self._expiry_heap.clear()
+            self._namespaces.clear()
+            return count
 
     def keys(self) -> list[str]:
         """Get all non-expired keys.
@@ -104,18 +216,69 @@ class MemoryStore:
         Returns:
             List of valid keys
         """
-        now = datetime.now()
-        valid_keys = []
+        with self._lock:
+            self._purge_expired(time.monotonic())
+            return list(self.store)
+
+    def _prefix_candidates(self, prefix: str) -> list[str]:
+        """Keys that may match a prefix, using the namespace index when possible."""
+        if prefix.count(":") >= self.namespace_depth:
+            return list(self._namespaces.get(self._namespace(prefix), ()))
+        return list(self.store)
+
+    def items_with_prefix(self, prefix: str) -> list[tuple[str, Any]]:
+        """Get all non-expired entries whose key starts with a prefix.
+
+        Args:
+            prefix: Key prefix (e.g. ``"session-1:analysis:"``)
+
+        Returns:
+            List of (key, value) pairs
+        """
+        with self._lock:
+            self._purge_expired(time.monotonic())
+            return [
+                (key, self.store[key].value)
+                for key in self._prefix_candidates(prefix)
+                if key.startswith(prefix)
+            ]
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Delete all entries whose key starts with a prefix.
 
-        for key, entry in self.store.items():
-            if now <= datetime.fromisoformat(entry["expiry"]):
-                valid_keys.append(key)
+        Args:
+            prefix: Key prefix
 
-        return valid_keys
+        Returns:
+            Number of entries deleted
+        """
+        with self._lock:
+            keys = [k for k in self._prefix_candidates(prefix) if k.startswith(prefix)]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get store size and eviction statistics.
+
+        Returns:
+            Dictionary with entry counts and eviction/expiry totals
+        """
+        with self._lock:
+            return {
+                "entries": len(self.store),
+                "namespaces": len(self._namespaces),
+                "max_entries": self.max_entries,
+                "namespace_quota": self.namespace_quota,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
 
 
 class ConversationStore(MemoryStore):
-    """Store for conversation-specific data."""
+    """Store for conversation-specific data (one namespace per session)."""
+
+    default_namespace_quota = 500
 
     def save_analysis(
         self, session_id: str, symbol: str, analysis_type: str, data: dict[str, Any]
@@ -188,16 +351,9 @@ class ConversationStore(MemoryStore):
         Returns:
             List of analysis records
         """
-        analyses = []
-        prefix = f"{session_id}:analysis:"
-
-        for key, entry in self.store.items():
-            if key.startswith(prefix):
-                # Check if not expired
-                if datetime.now() <= datetime.fromisoformat(entry["expiry"]):
-                    analyses.append(entry["value"])
-
-        return analyses
+        return [
+            value for _, value in self.items_with_prefix(f"{session_id}:analysis:")
+        ]
 
     def clear_session(self, session_id: str) -> int:
         """Clear all data for a session.
@@ -208,25 +364,23 @@ class ConversationStore(MemoryStore):
         Returns:
             Number of entries cleared
         """
-        prefix = f"{session_id}:"
-        keys_to_delete = [k for k in self.store.keys() if k.startswith(prefix)]
-
-        for key in keys_to_delete:
-            del self.store[key]
-
-        return len(keys_to_delete)
+        return self.delete_prefix(f"{session_id}:")
 
 
 class UserMemoryStore(MemoryStore):
-    """Store for user-specific long-term memory."""
+    """Store for user-specific long-term memory (one namespace per user)."""
 
-    def __init__(self, ttl_hours: float = 168.0):  # 1 week default
+    namespace_depth = 2
+    default_namespace_quota = 256
+
+    def __init__(self, ttl_hours: float = 168.0, **kwargs: Any):  # 1 week default
         """Initialize user memory store.
 
         Args:
             ttl_hours: Default TTL in hours (default: 1 week)
+            **kwargs: Store limits passed to ``MemoryStore``
         """
-        super().__init__(ttl_hours)
+        super().__init__(ttl_hours, **kwargs)
 
     def save_preference(self, user_id: str, preference_type: str, value: Any) -> None:
         """Save user preference.
@@ -359,10 +513,310 @@ class UserMemoryStore(MemoryStore):
         Returns:
             Number of entries cleared
         """
-        prefix = f"user:{user_id}:"
-        keys_to_delete = [k for k in self.store.keys() if k.startswith(prefix)]
+        return self.delete_prefix(f"user:{user_id}:")
+
+
+class RedisMemoryStore(MemoryStore):
+    """Redis-backed memory store with the ``MemoryStore`` interface.
+
+    Values are JSON encoded under ``{key_prefix}:k:{key}`` with a native Redis
+    TTL, so expiry costs nothing in-process. Each namespace keeps a sorted-set
+    index scored by last access, which serves prefix listings and enforces the
+    per-namespace quota across replicas. The overall size bound is Redis'
+    ``maxmemory`` policy rather than ``max_entries``.
+
+    Redis errors are logged and treated as misses so agents keep working
+    without shared memory. The client is synchronous, so async callers run
+    store calls with ``asyncio.to_thread`` rather than on the event loop.
+    """
+
+    def __init__(
+        self,
+        redis_client: Any | None = None,
+        *,
+        key_prefix: str = "maverick:memory",
+        **kwargs: Any,
+    ):
+        """Initialize Redis memory store.
+
+        Args:
+            redis_client: Sync Redis client with ``decode_responses=True``
+                (created from settings if omitted)
+            key_prefix: Prefix for all keys written by this store
+            **kwargs: TTL and quota options passed to ``MemoryStore``
+        """
+        super().__init__(**kwargs)
+
+        if redis_client is None:
+            from maverick_core.caching import create_redis_client
+
+            redis_client = create_redis_client()
+            if redis_client is None:
+                raise RuntimeError("redis is required for RedisMemoryStore")
+
+        self._redis = redis_client
+        self.key_prefix = key_prefix
+
+    def _data_key(self, key: str) -> str:
+        return f"{self.key_prefix}:k:{key}"
+
+    def _index_key(self, namespace: str) -> str:
+        return f"{self.key_prefix}:ns:{namespace}"
+
+    @staticmethod
+    def _now_ms() -> float:
+        # Wall clock: scores are compared across replicas, so monotonic won't do
+        return time.time() * 1000
+
+    def set(self, key: str, value: Any, ttl_hours: float | None = None) -> None:
+        """Store a value with optional custom TTL.
+
+        Args:
+            key: Storage key
+            value: JSON-serializable value to store
+            ttl_hours: Custom TTL in hours (uses default if not specified)
+        """
+        ttl_ms = int(self._ttl_seconds(ttl_hours) * 1000)
+        index_key = self._index_key(self._namespace(key))
+
+        try:
+            pipe = self._redis.pipeline()
+            pipe.set(self._data_key(key), json.dumps(value, default=str), px=ttl_ms)
+            pipe.zadd(index_key, {key: self._now_ms()})
+            pipe.pttl(index_key)
+            pipe.zcard(index_key)
+            _, _, index_ttl, size = pipe.execute()
+
+            # The index must outlive the longest-lived entry it references
+            if index_ttl < ttl_ms:
+                self._redis.pexpire(index_key, ttl_ms)
+
+            if self.namespace_quota is not None and size > self.namespace_quota:
+                evicted = self._redis.zpopmin(index_key, size - self.namespace_quota)
+                if evicted:
+                    self._redis.delete(
+                        *(self._data_key(member) for member, _ in evicted)
+                    )
+                    self._evictions += len(evicted)
+        except Exception as e:
+            logger.warning(f"Redis memory store set failed for {key}: {e}")
+
+    def get(self, key: str) -> Any | None:
+        """Get a value if not expired.
+
+        Args:
+            key: Storage key
+
+        Returns:
+            Stored value or None if not found, expired or Redis is unavailable
+        """
+        index_key = self._index_key(self._namespace(key))
+
+        try:
+            pipe = self._redis.pipeline()
+            pipe.get(self._data_key(key))
+            pipe.zadd(index_key, {key: self._now_ms()}, xx=True)
+            raw, _ = pipe.execute()
+
+            if raw is None:
+                self._redis.zrem(index_key, key)
+                return None
+            return json.loads(raw)
+        except Exception as e:
+            logger.warning(f"Redis memory store get failed for {key}: {e}")
+            return None
+
+    def delete(self, key: str) -> None:
+        """Delete a value.
+
+        Args:
+            key: Storage key to delete
+        """
+        try:
+            pipe = self._redis.pipeline()
+            pipe.delete(self._data_key(key))
+            pipe.zrem(self._index_key(self._namespace(key)), key)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Redis memory store delete failed for {key}: {e}")
+
+    def _scan_logical_keys(self) -> list[str]:
+        data_prefix = self._data_key("")
+        return [
+            key[len(data_prefix) :]
+            for key in self._redis.scan_iter(match=f"{data_prefix}*", count=500)
+        ]
+
+    def _matching_keys(self, prefix: str) -> list[str]:
+        if prefix.count(":") >= self.namespace_depth:
+            members = self._redis.zrange(
+                self._index_key(self._namespace(prefix)), 0, -1
+            )
+        else:
+            members = self._scan_logical_keys()
+        return [key for key in members if key.startswith(prefix)]
+
+    def clear_expired(self) -> int:
+        """Drop namespace index members whose values Redis has expired.
+
+        Returns:
+            Number of stale index members removed
+        """
+        removed = 0
+        try:
+            for index_key in self._redis.scan_iter(
+                match=self._index_key("*"), count=500
+            ):
+                members = self._redis.zrange(index_key, 0, -1)
+                if not members:
+                    continue
+                values = self._redis.mget([self._data_key(m) for m in members])
+                stale = [m for m, v in zip(members, values, strict=True) if v is None]
+                if stale:
+                    removed += self._redis.zrem(index_key, *stale)
+        except Exception as e:
+            logger.warning(f"Redis memory store cleanup failed: {e}")
+        return removed
+
+    def clear_all(self) -> int:
+        """Clear all entries written under this store's key prefix.
+
+        Returns:
+            Number of entries cleared
+        """
+        try:
+            keys = self._scan_logical_keys()
+            stale_indexes = list(
+                self._redis.scan_iter(match=self._index_key("*"), count=500)
+            )
+            to_delete = [self._data_key(k) for k in keys] + stale_indexes
+            for i in range(0, len(to_delete), 500):
+                self._redis.delete(*to_delete[i : i + 500])
+            return len(keys)
+        except Exception as e:
+            logger.warning(f"Redis memory store clear failed: {e}")
+            return 0
+
+    def keys(self) -> list[str]:
+        """Get all non-expired keys.
+
+        Returns:
+            List of valid keys
+        """
+        try:
+            return self._scan_logical_keys()
+        except Exception as e:
+            logger.warning(f"Redis memory store key scan failed: {e}")
+            return []
+
+    def items_with_prefix(self, prefix: str) -> list[tuple[str, Any]]:
+        """Get all non-expired entries whose key starts with a prefix.
+
+        Args:
+            prefix: Key prefix
+
+        Returns:
+            List of (key, value) pairs
+        """
+        try:
+            keys = self._matching_keys(prefix)
+            if not keys:
+                return []
+            values = self._redis.mget([self._data_key(k) for k in keys])
+        except Exception as e:
+            logger.warning(f"Redis memory store prefix read failed for {prefix}: {e}")
+            return []
+
+        return [
+            (key, json.loads(raw))
+            for key, raw in zip(keys, values, strict=True)
+            if raw is not None
+        ]
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Delete all entries whose key starts with a prefix.
+
+        Args:
+            prefix: Key prefix
+
+        Returns:
+            Number of entries deleted
+        """
+        try:
+            keys = self._matching_keys(prefix)
+            if not keys:
+                return 0
+            pipe = self._redis.pipeline()
+            pipe.delete(*(self._data_key(k) for k in keys))
+            for key in keys:
+                pipe.zrem(self._index_key(self._namespace(key)), key)
+            return pipe.execute()[0]
+        except Exception as e:
+            logger.warning(f"Redis memory store prefix delete failed for {prefix}: {e}")
+            return 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get store configuration and eviction statistics.
+
+        Returns:
+            Dictionary with backend details and eviction totals
+        """
+        return {
+            "backend": "redis",
+            "key_prefix": self.key_prefix,
+            "namespace_quota": self.namespace_quota,
+            "evictions": self._evictions,
+        }
+
+
+class RedisConversationStore(RedisMemoryStore, ConversationStore):
+    """Conversation store shared across server replicas through Redis."""
+
+
+class RedisUserMemoryStore(RedisMemoryStore, UserMemoryStore):
+    """User memory store shared across server replicas through Redis."""
+
+
+def _use_redis_backend() -> bool:
+    return os.getenv("AGENT_MEMORY_BACKEND", "memory").lower() == "redis"
+
+
+def create_conversation_store(**kwargs: Any) -> ConversationStore:
+    """Create a conversation store for the configured backend.
+
+    ``AGENT_MEMORY_BACKEND=redis`` selects ``RedisConversationStore``; the
+    bounded in-process store is used otherwise or when Redis is unavailable.
+
+    Args:
+        **kwargs: Store options (TTL, quotas, Redis client)
+
+    Returns:
+        Conversation store instance
+    """
+    if _use_redis_backend():
+        try:
+            return RedisConversationStore(**kwargs)
+        except RuntimeError as e:
+            logger.warning(f"Falling back to in-process conversation store: {e}")
+    kwargs.pop("redis_client", None)
+    kwargs.pop("key_prefix", None)
+    return ConversationStore(**kwargs)
+
+
+def create_user_memory_store(**kwargs: Any) -> UserMemoryStore:
+    """Create a user memory store for the configured backend.
 
-        for key in keys_to_delete:
-            del self.store[key]
+    Args:
+        **kwargs: Store options (TTL, quotas, Redis client)
 
-        return len(keys_to_delete)
+    Returns:
+        User memory store instance
+    """
+    if _use_redis_backend():
+        try:
+            return RedisUserMemoryStore(**kwargs)
+        except RuntimeError as e:
+            logger.warning(f"Falling back to in-process user memory store: {e}")
+    kwargs.pop("redis_client", None)
+    kwargs.pop("key_prefix", None)
+    return UserMemoryStore(**kwargs)
@@ -13,6 +13,13 @@ import logging
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
+from maverick_core.caching import (
+    LLMResponseCache,
+    get_llm_cache,
+    get_llm_model_id,
+    make_llm_cache_key,
+)
+
 from maverick_agents.research.config import PERSONA_RESEARCH_FOCUS
 
 if TYPE_CHECKING:
@@ -20,6 +27,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Bump when the analysis prompt changes so cached responses are not reused
+CONTENT_ANALYSIS_PROMPT_VERSION = "content_analysis:v1"
+
 
 @runtime_checkable
 class LLMProtocol(Protocol):
@@ -43,16 +53,23 @@ class ContentAnalyzer:
     - Fallback analysis when LLM is unavailable
     """
 
-    def __init__(self, llm: LLMProtocol, batch_size: int = 4):
+    def __init__(
+        self,
+        llm: LLMProtocol,
+        batch_size: int = 4,
+        response_cache: LLMResponseCache | None = None,
+    ):
         """
         Initialize the content analyzer.
 
         Args:
             llm: LLM instance for AI-powered analysis
             batch_size: Number of items to process concurrently
+            response_cache: LLM response cache (defaults to the shared cache)
         """
         self.llm = llm
         self._batch_size = batch_size
+        self.response_cache = response_cache or get_llm_cache()
         self.logger = logging.getLogger(f"{__name__}.ContentAnalyzer")
 
     @staticmethod
@@ -142,12 +159,27 @@ class ContentAnalyzer:
                 self._create_human_message(analysis_prompt),
             ]
 
-            response = await self.llm.ainvoke(messages)
-
-            raw_content = self._coerce_message_content(response.content).strip()
+            async def invoke_llm() -> str | None:
+                response = await self.llm.ainvoke(messages)
+                text = self._coerce_message_content(response.content).strip()
+                # Unparseable responses are returned as None so they are not cached
+                return text if self._parse_json_response(text) else None
+
+            if self.response_cache is not None:
+                cache_key = make_llm_cache_key(
+                    model_id=get_llm_model_id(self.llm),
+                    prompt_version=CONTENT_ANALYSIS_PROMPT_VERSION,
+                    content=content[:3000],
+                    persona=persona,
+                )
+                raw_content = await self.response_cache.get_or_compute(
+                    cache_key, invoke_llm
+                )
+            else:
+                raw_content = await invoke_llm()
 
             # Try to extract JSON from the response
-            analysis = self._parse_json_response(raw_content)
+            analysis = self._parse_json_response(raw_content) if raw_content else {}
 
             return {
                 "insights": analysis.get("KEY_INSIGHTS", []),
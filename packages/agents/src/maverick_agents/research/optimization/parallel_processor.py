@@ -11,10 +11,16 @@ import asyncio
 import logging
 import re
 import time
+from collections.abc import AsyncIterator
 from datetime import datetime
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 from langchain_core.messages import HumanMessage, SystemMessage
+from maverick_core.caching import (
+    LLMResponseCache,
+    get_llm_cache,
+    make_llm_cache_key,
+)
 
 if TYPE_CHECKING:
     from maverick_agents.llm import OpenRouterProvider
@@ -27,6 +33,9 @@ from maverick_agents.research.optimization.model_selection import (
 
 logger = logging.getLogger(__name__)
 
+# Bump when the batch prompt templates change so cached responses are not reused
+BATCH_ANALYSIS_PROMPT_VERSION = "batch_analysis:v1"
+
 
 class ParallelLLMProcessor:
     """Handles parallel LLM operations with intelligent load balancing."""
@@ -35,8 +44,10 @@ class ParallelLLMProcessor:
         self,
         openrouter_provider: OpenRouterProvider,
         max_concurrent: int = 5,
+        response_cache: LLMResponseCache | None = None,
     ):
         self.provider = openrouter_provider
+        self.response_cache = response_cache or get_llm_cache()
         self.max_concurrent = max_concurrent
         self.semaphore = asyncio.BoundedSemaphore(max_concurrent)
         self.model_selector = AdaptiveModelSelector(openrouter_provider)
@@ -51,10 +62,56 @@ class ParallelLLMProcessor:
         time_budget_seconds: float,
         current_confidence: float = 0.0,
     ) -> list[dict]:
-        """Analyze multiple sources in parallel with adaptive optimization."""
+        """Analyze multiple sources in parallel with adaptive optimization.
+
+        Results are returned in source order. Batches that finished before the
+        time budget expired keep their analysis; only unfinished batches fall
+        back.
+        """
+
+        batch_results: dict[int, list[dict]] = {}
+        async for batch_id, results in self.stream_content_analysis(
+            sources=sources,
+            analysis_type=analysis_type,
+            persona=persona,
+            time_budget_seconds=time_budget_seconds,
+            current_confidence=current_confidence,
+        ):
+            batch_results[batch_id] = results
+
+        final_results = []
+        successful_batches = 0
+        for batch_id in sorted(batch_results):
+            results = batch_results[batch_id]
+            if not any(r["analysis"].get("batch_timeout") for r in results):
+                successful_batches += 1
+            final_results.extend(results)
+
+        if batch_results:
+            logger.info(
+                f"Parallel analysis complete: {successful_batches}/{len(batch_results)} batches successful"
+            )
+
+        return final_results
+
+    async def stream_content_analysis(
+        self,
+        sources: list[dict],
+        analysis_type: str,
+        persona: str,
+        time_budget_seconds: float,
+        current_confidence: float = 0.0,
+    ) -> AsyncIterator[tuple[int, list[dict]]]:
+        """Analyze sources in parallel, yielding each batch as it completes.
+
+        Yields ``(batch_id, results)`` tuples in completion order so callers
+        can start downstream work before the slowest batch returns. When the
+        time budget expires, unfinished batches are cancelled and yielded as
+        fallback results. Closing the iterator early cancels pending batches.
+        """
 
         if not sources:
-            return []
+            return
 
         combined_content = "\n".join(
             [source.get("content", "")[:1000] for source in sources[:5]]
@@ -84,56 +141,65 @@ class ParallelLLMProcessor:
             f"Starting parallel analysis: {len(sources)} sources in {len(batches)} batches"
         )
 
-        running_tasks = []
-        for i, batch in enumerate(batches):
-            task_future = asyncio.create_task(
-                self._analyze_source_batch(
-                    batch=batch,
-                    batch_id=i,
-                    analysis_type=analysis_type,
-                    persona=persona,
-                    model_config=model_config,
-                    overall_complexity=overall_complexity,
-                )
-            )
-            running_tasks.append((i, task_future))
-
-            if i < len(batches) - 1:
-                await asyncio.sleep(0.01)
-
-        batch_results: list[Any] = [None] * len(batches)
-        timeout_at = time.time() + (time_budget_seconds * 0.9)
+        timeout_at = time.monotonic() + (time_budget_seconds * 0.9)
+        batch_ids: dict[asyncio.Task, int] = {}
+        pending: set[asyncio.Task] = set()
 
         try:
-            for batch_id, task_future in running_tasks:
-                remaining_time = timeout_at - time.time()
-                if remaining_time <= 0:
-                    raise TimeoutError()
-
-                try:
-                    result = await asyncio.wait_for(task_future, timeout=remaining_time)
-                    batch_results[batch_id] = result
-                except Exception as e:
-                    batch_results[batch_id] = e
-        except TimeoutError:
-            logger.warning(f"Parallel analysis timeout after {time_budget_seconds}s")
-            return self._create_fallback_results(sources)
+            for i, batch in enumerate(batches):
+                task = asyncio.create_task(
+                    self._analyze_source_batch(
+                        batch=batch,
+                        batch_id=i,
+                        analysis_type=analysis_type,
+                        persona=persona,
+                        model_config=model_config,
+                        overall_complexity=overall_complexity,
+                    )
+                )
+                batch_ids[task] = i
+                pending.add(task)
 
-        final_results = []
-        successful_batches = 0
-        for i, batch_result in enumerate(batch_results):
-            if isinstance(batch_result, Exception):
-                logger.warning(f"Batch {i} failed: {batch_result}")
-                final_results.extend(self._create_fallback_results(batches[i]))
-            else:
-                final_results.extend(batch_result)
-                successful_batches += 1
+                if i < len(batches) - 1:
+                    await asyncio.sleep(0.01)
 
-        logger.info(
-            f"Parallel analysis complete: {successful_batches}/{len(batches)} batches successful"
-        )
+            while pending:
+                remaining_time = timeout_at - time.monotonic()
+                if remaining_time <= 0:
+                    break
 
-        return final_results
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=remaining_time,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in sorted(done, key=batch_ids.__getitem__):
+                    batch_id = batch_ids[task]
+                    error = "cancelled" if task.cancelled() else task.exception()
+                    if error is not None:
+                        logger.warning(f"Batch {batch_id} failed: {error}")
+                        yield batch_id, self._create_fallback_results(batches[batch_id])
+                    else:
+                        yield batch_id, task.result()
+
+            if pending:
+                logger.warning(
+                    f"Parallel analysis timeout after {time_budget_seconds}s: "
+                    f"{len(pending)}/{len(batches)} batches unfinished"
+                )
+                unfinished = sorted(pending, key=batch_ids.__getitem__)
+                for task in unfinished:
+                    task.cancel()
+                pending = set()
+                await asyncio.gather(*unfinished, return_exceptions=True)
+                for task in unfinished:
+                    batch_id = batch_ids[task]
+                    yield batch_id, self._create_fallback_results(batches[batch_id])
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
 
     def _create_optimal_batches(
         self, sources: list[dict], batch_size: int
@@ -176,23 +242,45 @@ class ParallelLLMProcessor:
                     max_tokens=model_config.max_tokens,
                 )
 
+                raw_content = ""
+
+                async def invoke_llm() -> str | None:
+                    nonlocal raw_content
+                    result = await asyncio.wait_for(
+                        llm.ainvoke(
+                            [
+                                SystemMessage(
+                                    content="You are a financial analyst. Provide structured, concise analysis."
+                                ),
+                                HumanMessage(content=batch_prompt),
+                            ]
+                        ),
+                        timeout=model_config.timeout_seconds,
+                    )
+                    raw_content = result.content
+                    # Only cache responses with one section per source
+                    if self._split_source_sections(raw_content, batch) is None:
+                        return None
+                    return raw_content
+
                 start_time = time.time()
-                result = await asyncio.wait_for(
-                    llm.ainvoke(
-                        [
-                            SystemMessage(
-                                content="You are a financial analyst. Provide structured, concise analysis."
-                            ),
-                            HumanMessage(content=batch_prompt),
-                        ]
-                    ),
-                    timeout=model_config.timeout_seconds,
-                )
+                if self.response_cache is not None:
+                    cache_key = make_llm_cache_key(
+                        model_id=model_config.model_id,
+                        prompt_version=BATCH_ANALYSIS_PROMPT_VERSION,
+                        content=batch_prompt,
+                        persona=persona,
+                    )
+                    result_content = await self.response_cache.get_or_compute(
+                        cache_key, invoke_llm
+                    )
+                else:
+                    result_content = await invoke_llm()
 
                 execution_time = time.time() - start_time
 
                 parsed_results = self._parse_batch_analysis_result(
-                    result.content, batch
+                    result_content or raw_content, batch
                 )
 
                 logger.debug(
@@ -285,12 +373,10 @@ Maintain {persona} investor perspective throughout.""",
 
         results = []
 
-        source_sections = re.split(r"\n(?:SOURCE\s+\d+|---+)", result_content)
+        source_sections = self._split_source_sections(result_content, batch)
 
-        if len(source_sections) >= len(batch):
-            for source, section in zip(
-                batch, source_sections[1 : len(batch) + 1], strict=False
-            ):
+        if source_sections is not None:
+            for source, section in zip(batch, source_sections, strict=False):
                 parsed = self._parse_source_analysis(section, source)
                 results.append(parsed)
         else:
@@ -302,6 +388,16 @@ Maintain {persona} investor perspective throughout.""",
 
         return results
 
+    def _split_source_sections(
+        self, result_content: str, batch: list[dict]
+    ) -> list[str] | None:
+        """Split a batch result into per-source sections, None if unstructured."""
+        # The text before the first marker is a preamble, not a section
+        source_sections = re.split(r"\n(?:SOURCE\s+\d+|---+)", result_content or "")
+        if len(source_sections) <= len(batch):
+            return None
+        return source_sections[1 : len(batch) + 1]
+
     def _parse_source_analysis(self, analysis_text: str, source: dict) -> dict:
         """Parse analysis text for a single source."""
 
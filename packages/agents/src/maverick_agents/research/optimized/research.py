@@ -15,6 +15,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
@@ -143,6 +144,24 @@ class OptimizedContentAnalyzer(ContentAnalyzer):
             current_confidence=current_confidence,
         )
 
+    def stream_analyze_content(
+        self,
+        sources: list[dict],
+        persona: str,
+        analysis_type: str,
+        time_budget_seconds: float,
+        current_confidence: float = 0.0,
+    ) -> AsyncIterator[tuple[int, list[dict]]]:
+        """Analyze multiple sources in parallel, yielding batches as they complete."""
+
+        return self.parallel_processor.stream_content_analysis(
+            sources=sources,
+            analysis_type=analysis_type,
+            persona=persona,
+            time_budget_seconds=time_budget_seconds,
+            current_confidence=current_confidence,
+        )
+
     def _parse_optimized_response(
         self, response_content: str, persona: str
     ) -> dict[str, Any]:
@@ -450,13 +469,39 @@ class OptimizedDeepResearchAgent(DeepResearchAgent):
         time_per_source = time_budget_seconds / len(sources_to_process)
 
         if len(sources_to_process) > 3 and time_per_source < 8:
-            analyzed_sources = await self.optimized_analyzer.batch_analyze_content(
+            # Consume batches as they complete so synthesis can start as soon
+            # as the confidence target is met, without waiting on stragglers.
+            early_termination_reason = None
+            stream = self.optimized_analyzer.stream_analyze_content(
                 sources=sources_to_process,
                 persona=self.persona.name.lower(),
                 analysis_type=focus_areas[0] if focus_areas else "general",
                 time_budget_seconds=time_budget_seconds,
                 current_confidence=current_confidence,
             )
+            try:
+                async for _batch_id, batch_results in stream:
+                    analyzed_sources.extend(batch_results)
+                    for source in batch_results:
+                        analysis = source.get("analysis", {})
+                        if analysis.get("fallback_used"):
+                            continue
+                        confidence_update = self.confidence_tracker.update_confidence(
+                            analysis, analysis.get("credibility_score", 0.5)
+                        )
+                        if not confidence_update["should_continue"]:
+                            early_termination_reason = confidence_update[
+                                "early_termination_reason"
+                            ]
+
+                    if early_termination_reason:
+                        logger.info(
+                            f"Early termination after {len(analyzed_sources)} sources: "
+                            f"{early_termination_reason}"
+                        )
+                        break
+            finally:
+                await stream.aclose()
 
             confidence_sum = 0.0
             for source in analyzed_sources:
@@ -470,6 +515,15 @@ class OptimizedDeepResearchAgent(DeepResearchAgent):
                 confidence_sum / len(analyzed_sources) if analyzed_sources else 0.0
             )
 
+            if early_termination_reason:
+                return {
+                    "analyzed_sources": analyzed_sources,
+                    "final_confidence": final_confidence,
+                    "early_terminated": True,
+                    "termination_reason": early_termination_reason,
+                    "processing_mode": "parallel_batch_early_termination",
+                }
+
             return {
                 "analyzed_sources": analyzed_sources,
                 "final_confidence": final_confidence,
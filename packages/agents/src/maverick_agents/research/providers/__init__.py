@@ -13,6 +13,12 @@ from maverick_agents.research.providers.base import (
     WebSearchProvider,
     get_cached_search_provider,
 )
+from maverick_agents.research.providers.cache import (
+    WebContentCache,
+    canonicalize_url,
+    get_web_content_cache,
+    reset_web_content_cache,
+)
 from maverick_agents.research.providers.exa import ExaSearchProvider
 from maverick_agents.research.providers.tavily import TavilySearchProvider
 
@@ -26,6 +32,11 @@ __all__ = [
     # Provider implementations
     "ExaSearchProvider",
     "TavilySearchProvider",
+    # Caching
+    "WebContentCache",
+    "canonicalize_url",
+    "get_web_content_cache",
+    "reset_web_content_cache",
     # Factory functions
     "get_cached_search_provider",
 ]
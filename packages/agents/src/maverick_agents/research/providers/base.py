@@ -12,6 +12,11 @@ from abc import ABC, abstractmethod
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
+from maverick_agents.research.providers.cache import (
+    WebContentCache,
+    get_web_content_cache,
+)
+
 if TYPE_CHECKING:
     from maverick_agents.circuit_breaker import CircuitBreakerManager
 
@@ -73,6 +78,7 @@ class WebSearchProvider(ABC):
         api_key: str,
         settings: SettingsProtocol | None = None,
         circuit_manager: CircuitBreakerManager | None = None,
+        content_cache: WebContentCache | None = None,
     ):
         """
         Initialize the web search provider.
@@ -81,11 +87,13 @@ class WebSearchProvider(ABC):
             api_key: API key for authentication
             settings: Optional settings protocol implementation
             circuit_manager: Optional circuit breaker manager
+            content_cache: Search/content cache (defaults to the shared cache)
         """
         self.api_key = api_key
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self.settings = settings or DefaultSettings()
         self.circuit_manager = circuit_manager
+        self.content_cache = content_cache or get_web_content_cache()
 
         # Health tracking
         self._is_healthy = True
@@ -0,0 +1,457 @@
+"""
+Web content cache for search providers.
+
+Caches search results and extracted page content so repeated research
+sessions for the same ticker do not re-pay search API calls.
+
+Entry types:
+    - Search results: keyed on (provider, normalized query, timeframe,
+      options) with a short TTL, since result rankings drift quickly
+    - Page content: keyed on canonical URL with a long TTL. Stale entries
+      are revalidated against the origin with a conditional HEAD request
+      (If-None-Match / If-Modified-Since) before paying for a new extraction.
+      The validators are looked up in the background after a fetch, so a
+      cache miss never waits on the origin.
+
+Entries are zlib-compressed JSON, held in a bounded local LRU and, when a
+Redis client is supplied, a shared Redis tier.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from maverick_core.caching import create_async_redis_client
+from maverick_core.config.base import get_env_bool, get_env_int
+
+logger = logging.getLogger(__name__)
+
+# Default configuration
+DEFAULT_SEARCH_TTL = get_env_int("WEB_CACHE_SEARCH_TTL_SECONDS", 900)
+DEFAULT_CONTENT_TTL = get_env_int("WEB_CACHE_CONTENT_TTL_SECONDS", 86400)
+DEFAULT_CONTENT_MAX_STALE = get_env_int("WEB_CACHE_CONTENT_MAX_STALE_SECONDS", 604800)
+DEFAULT_WEB_CACHE_MAX_MB = get_env_int("WEB_CACHE_MAX_MB", 64)
+WEB_CACHE_KEY_PREFIX = "web:v1:"
+
+# Query parameters that only track the referrer and never change page content
+_TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid", "ref", "ref_src"}
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Canonicalize a URL so trivially different links share a cache entry.
+
+    Lowercases scheme and host, drops default ports, fragments and tracking
+    parameters (``utm_*`` and friends), sorts the remaining query parameters
+    and strips a trailing slash from non-root paths.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower() or "https"
+    host = (parts.hostname or "").lower()
+    if parts.port and not (
+        (scheme == "http" and parts.port == 80)
+        or (scheme == "https" and parts.port == 443)
+    ):
+        host = f"{host}:{parts.port}"
+
+    path = parts.path or "/"
+    if len(path) > 1:
+        path = path.rstrip("/")
+
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.lower().startswith("utm_")
+            and key.lower() not in _TRACKING_PARAMS
+        )
+    )
+    return urlunsplit((scheme, host, path, query, ""))
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a search query for cache keying."""
+    return " ".join(query.lower().split())
+
+
+def _hash(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()[:32]
+
+
+class WebContentCache:
+    """
+    Cache of search results and page content with conditional revalidation.
+
+    Redis errors disable the shared tier for a short cooldown rather than
+    failing the search path.
+    """
+
+    def __init__(
+        self,
+        redis_client: Any | None = None,
+        search_ttl: int = DEFAULT_SEARCH_TTL,
+        content_ttl: int = DEFAULT_CONTENT_TTL,
+        content_max_stale: int = DEFAULT_CONTENT_MAX_STALE,
+        max_bytes: int = DEFAULT_WEB_CACHE_MAX_MB * 1024 * 1024,
+        revalidate_timeout: float = 5.0,
+        remote_cooldown: float = 30.0,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            redis_client: Optional ``redis.asyncio.Redis`` client (bytes responses)
+            search_ttl: TTL for search results in seconds
+            content_ttl: Seconds page content is served without revalidation
+            content_max_stale: Seconds stale content is kept for revalidation
+            max_bytes: Maximum compressed bytes in the local tier
+            revalidate_timeout: Timeout for conditional HEAD requests
+            remote_cooldown: Seconds to skip Redis after a connection error
+        """
+        self._redis = redis_client
+        self.search_ttl = search_ttl
+        self.content_ttl = content_ttl
+        self.content_max_stale = max(content_max_stale, content_ttl)
+        self._max_bytes = max_bytes
+        self._revalidate_timeout = revalidate_timeout
+        self._remote_cooldown = remote_cooldown
+        self._remote_disabled_until = 0.0
+
+        # key -> (expires_at wall clock, compressed entry)
+        self._local: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._local_bytes = 0
+        self._inflight: dict[str, asyncio.Future[dict[str, Any] | None]] = {}
+        self._validator_tasks: set[asyncio.Task] = set()
+        self._stats = {
+            "search_hits": 0,
+            "search_misses": 0,
+            "content_hits": 0,
+            "content_misses": 0,
+            "revalidated": 0,
+            "revalidation_changed": 0,
+            "evictions": 0,
+            "remote_errors": 0,
+        }
+
+    # Keys
+
+    @staticmethod
+    def search_key(
+        provider: str, query: str, timeframe: str | None = None, **options: Any
+    ) -> str:
+        """Build the cache key for a search result set."""
+        payload = json.dumps(
+            [provider, normalize_query(query), timeframe or "", sorted(options.items())],
+            default=str,
+        )
+        return f"{WEB_CACHE_KEY_PREFIX}search:{provider}:{_hash(payload)}"
+
+    @staticmethod
+    def content_key(url: str) -> str:
+        """Build the cache key for page content."""
+        return f"{WEB_CACHE_KEY_PREFIX}content:{_hash(canonicalize_url(url))}"
+
+    # Storage
+
+    @staticmethod
+    def _encode(entry: dict[str, Any]) -> bytes:
+        return zlib.compress(json.dumps(entry, default=str).encode("utf-8"), 6)
+
+    @staticmethod
+    def _decode(blob: bytes) -> dict[str, Any]:
+        return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+    def _remote_available(self) -> bool:
+        return (
+            self._redis is not None
+            and time.monotonic() >= self._remote_disabled_until
+        )
+
+    def _remote_failed(self, operation: str, error: Exception) -> None:
+        self._stats["remote_errors"] += 1
+        self._remote_disabled_until = time.monotonic() + self._remote_cooldown
+        logger.warning(
+            f"Web cache Redis {operation} failed, using local tier for "
+            f"{self._remote_cooldown:.0f}s: {error}"
+        )
+
+    def _local_store(self, key: str, blob: bytes, expires_at: float) -> None:
+        self._local_drop(key)
+        self._local[key] = (expires_at, blob)
+        self._local_bytes += len(blob)
+        while self._local and self._local_bytes > self._max_bytes:
+            self._local_drop(next(iter(self._local)))
+            self._stats["evictions"] += 1
+
+    def _local_drop(self, key: str) -> None:
+        entry = self._local.pop(key, None)
+        if entry is not None:
+            self._local_bytes -= len(entry[1])
+
+    async def _load(self, key: str) -> dict[str, Any] | None:
+        entry = self._local.get(key)
+        if entry is not None:
+            expires_at, blob = entry
+            if expires_at > time.time():
+                self._local.move_to_end(key)
+                return self._decode(blob)
+            self._local_drop(key)
+
+        if not self._remote_available():
+            return None
+        try:
+            blob = await self._redis.get(key)
+        except Exception as e:
+            self._remote_failed("get", e)
+            return None
+        if blob is None:
+            return None
+
+        decoded = self._decode(blob)
+        self._local_store(key, blob, decoded["expires_at"])
+        return decoded
+
+    async def _store(self, key: str, entry: dict[str, Any]) -> None:
+        blob = self._encode(entry)
+        self._local_store(key, blob, entry["expires_at"])
+
+        if not self._remote_available():
+            return
+        ttl = max(int(entry["expires_at"] - time.time()), 1)
+        try:
+            await self._redis.set(key, blob, ex=ttl)
+        except Exception as e:
+            self._remote_failed("set", e)
+
+    # Search results
+
+    async def get_or_search(
+        self,
+        provider: str,
+        query: str,
+        search: Callable[[], Awaitable[list[dict[str, Any]]]],
+        timeframe: str | None = None,
+        **options: Any,
+    ) -> list[dict[str, Any]]:
+        """
+        Return cached search results or run ``search`` and cache them.
+
+        Empty result sets are not cached so transient provider issues do not
+        stick for the TTL.
+        """
+        key = self.search_key(provider, query, timeframe, **options)
+        entry = await self._load(key)
+        if entry is not None:
+            self._stats["search_hits"] += 1
+            return entry["value"]
+
+        self._stats["search_misses"] += 1
+        results = await search()
+        if results:
+            await self._store(
+                key, {"value": results, "expires_at": time.time() + self.search_ttl}
+            )
+        return results
+
+    # Page content
+
+    async def get_content(self, url: str) -> dict[str, Any] | None:
+        """Return cached content for ``url`` if fresh, without fetching."""
+        entry = await self._load(self.content_key(url))
+        if entry is not None and entry["fresh_until"] > time.time():
+            self._stats["content_hits"] += 1
+            return entry["value"]
+        return None
+
+    async def get_or_fetch_content(
+        self,
+        url: str,
+        fetch: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        """
+        Return cached page content or fetch it through the provider.
+
+        Fresh entries are served directly. Stale entries with an ETag or
+        Last-Modified validator are revalidated with a conditional HEAD
+        request; a 304 extends freshness without calling the provider.
+        Validators for newly fetched content are recorded by a background
+        HEAD request. Results carrying an ``error`` key are not cached.
+        """
+        key = self.content_key(url)
+        entry = await self._load(key)
+        now = time.time()
+
+        if entry is not None:
+            if entry["fresh_until"] > now:
+                self._stats["content_hits"] += 1
+                return entry["value"]
+
+            if await self._revalidate(url, entry):
+                self._stats["revalidated"] += 1
+                entry["fresh_until"] = now + self.content_ttl
+                entry["expires_at"] = now + self.content_max_stale
+                await self._store(key, entry)
+                return entry["value"]
+            self._stats["revalidation_changed"] += 1
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            value = await asyncio.shield(inflight)
+            if value is not None:
+                return value
+            return await fetch()
+
+        self._stats["content_misses"] += 1
+        future: asyncio.Future[dict[str, Any] | None] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._inflight[key] = future
+        value = None
+        try:
+            value = await fetch()
+            if value and not value.get("error"):
+                fresh_until = now + self.content_ttl
+                await self._store(
+                    key,
+                    {
+                        "value": value,
+                        "fresh_until": fresh_until,
+                        "expires_at": now + self.content_max_stale,
+                    },
+                )
+                task = asyncio.create_task(
+                    self._store_validators(key, url, fresh_until)
+                )
+                self._validator_tasks.add(task)
+                task.add_done_callback(self._validator_tasks.discard)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+            if not future.done():
+                future.set_result(value)
+
+    async def _head(self, url: str, headers: dict[str, str]) -> Any:
+        """Issue a HEAD request to the origin."""
+        from maverick_core.http import get_http_client
+
+        client = await get_http_client()
+        return await client.head(url, headers=headers, timeout=self._revalidate_timeout)
+
+    async def _fetch_validators(self, url: str) -> dict[str, str]:
+        """Fetch ETag/Last-Modified validators for ``url`` (best effort)."""
+        try:
+            response = await self._head(url, {})
+        except Exception as e:
+            logger.debug(f"Validator fetch failed for {url}: {e}")
+            return {}
+        if response.status_code >= 400:
+            return {}
+
+        validators = {}
+        if etag := response.headers.get("etag"):
+            validators["etag"] = etag
+        if last_modified := response.headers.get("last-modified"):
+            validators["last_modified"] = last_modified
+        return validators
+
+    async def _store_validators(self, key: str, url: str, fresh_until: float) -> None:
+        """Add origin validators to the entry stored at ``fresh_until``."""
+        validators = await self._fetch_validators(url)
+        if not validators:
+            return
+        entry = await self._load(key)
+        if entry is None or entry["fresh_until"] != fresh_until:
+            # Replaced or dropped while the HEAD request was in flight
+            return
+        entry.update(validators)
+        await self._store(key, entry)
+
+    async def flush_validators(self) -> None:
+        """Wait for background validator lookups to finish."""
+        while self._validator_tasks:
+            await asyncio.gather(*self._validator_tasks, return_exceptions=True)
+
+    async def _revalidate(self, url: str, entry: dict[str, Any]) -> bool:
+        """Return True if the origin reports the cached content unchanged."""
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        if not headers:
+            return False
+
+        try:
+            response = await self._head(url, headers)
+        except Exception as e:
+            logger.debug(f"Revalidation failed for {url}: {e}")
+            return False
+
+        if response.status_code == 304:
+            return True
+        # Some origins ignore conditional HEAD; compare validators directly
+        etag = response.headers.get("etag")
+        return bool(
+            response.status_code < 400 and etag and etag == entry.get("etag")
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            **self._stats,
+            "local_size": len(self._local),
+            "local_bytes": self._local_bytes,
+            "local_max_bytes": self._max_bytes,
+            "remote_enabled": self._redis is not None,
+            "remote_available": self._remote_available(),
+        }
+
+
+# Global cache instance with thread-safe initialization
+_web_content_cache: WebContentCache | None = None
+_web_content_cache_lock = threading.Lock()
+
+
+def get_web_content_cache() -> WebContentCache | None:
+    """
+    Get or create the global web content cache.
+
+    Returns None when disabled with ``WEB_CACHE_ENABLED=false``.
+    """
+    global _web_content_cache
+
+    if not get_env_bool("WEB_CACHE_ENABLED", True):
+        return None
+
+    if _web_content_cache is not None:
+        return _web_content_cache
+
+    with _web_content_cache_lock:
+        if _web_content_cache is None:
+            redis_client = None
+            if get_env_bool("WEB_CACHE_REDIS_ENABLED", True):
+                try:
+                    redis_client = create_async_redis_client(decode_responses=False)
+                except Exception as e:
+                    logger.warning(f"Web cache Redis tier unavailable: {e}")
+            _web_content_cache = WebContentCache(redis_client=redis_client)
+
+    return _web_content_cache
+
+
+def reset_web_content_cache() -> None:
+    """Reset the global web content cache (for testing)."""
+    global _web_content_cache
+
+    with _web_content_cache_lock:
+        _web_content_cache = None
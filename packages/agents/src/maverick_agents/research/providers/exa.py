@@ -14,6 +14,7 @@ from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
 from maverick_agents.research.providers.base import WebSearchError, WebSearchProvider
+from maverick_agents.research.providers.cache import WebContentCache
 
 if TYPE_CHECKING:
     from maverick_agents.circuit_breaker import CircuitBreakerManager
@@ -78,6 +79,7 @@ class ExaSearchProvider(WebSearchProvider):
         api_key: str,
         settings: Any | None = None,
         circuit_manager: CircuitBreakerManager | None = None,
+        content_cache: WebContentCache | None = None,
     ):
         """
         Initialize ExaSearchProvider with financial optimization.
@@ -86,8 +88,9 @@ class ExaSearchProvider(WebSearchProvider):
             api_key: Exa API key
             settings: Optional settings protocol implementation
             circuit_manager: Optional circuit breaker manager
+            content_cache: Search/content cache (defaults to the shared cache)
         """
-        super().__init__(api_key, settings, circuit_manager)
+        super().__init__(api_key, settings, circuit_manager, content_cache)
 
         # Store the API key for verification
         self._api_key_verified = bool(api_key)
@@ -144,6 +147,23 @@ class ExaSearchProvider(WebSearchProvider):
         self, query: str, num_results: int, timeout_budget: float | None, strategy: str
     ) -> list[dict[str, Any]]:
         """Internal method to handle different search strategies."""
+        if self.content_cache is None:
+            return await self._execute_search(
+                query, num_results, timeout_budget, strategy
+            )
+
+        return await self.content_cache.get_or_search(
+            "exa",
+            query,
+            lambda: self._execute_search(query, num_results, timeout_budget, strategy),
+            strategy=strategy,
+            num_results=num_results,
+        )
+
+    async def _execute_search(
+        self, query: str, num_results: int, timeout_budget: float | None, strategy: str
+    ) -> list[dict[str, Any]]:
+        """Run an uncached Exa search for the given strategy."""
         # Check provider health before attempting search
         if not self.is_healthy():
             logger.warning("Exa provider is unhealthy - skipping search")
@@ -493,12 +513,23 @@ class ExaSearchProvider(WebSearchProvider):
         """
         Extract content from a URL using Exa's content extraction.
 
+        Content is cached by canonical URL and revalidated against the origin
+        when stale, so repeat extractions skip the Exa API.
+
         Args:
             url: URL to extract content from
 
         Returns:
             Dictionary containing extracted content
         """
+        if self.content_cache is None:
+            return await self._extract_content(url)
+        return await self.content_cache.get_or_fetch_content(
+            url, lambda: self._extract_content(url)
+        )
+
+    async def _extract_content(self, url: str) -> dict[str, Any]:
+        """Extract content from a URL through the Exa API (uncached)."""
         try:
             from exa_py import AsyncExa
 
@@ -11,6 +11,7 @@ import logging
 from typing import TYPE_CHECKING, Any, Iterable
 
 from maverick_agents.research.providers.base import WebSearchError, WebSearchProvider
+from maverick_agents.research.providers.cache import WebContentCache
 
 if TYPE_CHECKING:
     from maverick_agents.circuit_breaker import CircuitBreakerManager
@@ -48,6 +49,7 @@ class TavilySearchProvider(WebSearchProvider):
         api_key: str,
         settings: Any | None = None,
         circuit_manager: CircuitBreakerManager | None = None,
+        content_cache: WebContentCache | None = None,
     ):
         """
         Initialize TavilySearchProvider.
@@ -56,8 +58,9 @@ class TavilySearchProvider(WebSearchProvider):
             api_key: Tavily API key
             settings: Optional settings protocol implementation
             circuit_manager: Optional circuit breaker manager
+            content_cache: Search/content cache (defaults to the shared cache)
         """
-        super().__init__(api_key, settings, circuit_manager)
+        super().__init__(api_key, settings, circuit_manager, content_cache)
         self.excluded_domains = set(self.EXCLUDED_DOMAINS)
 
         if TavilyClient is None:
@@ -112,11 +115,17 @@ class TavilySearchProvider(WebSearchProvider):
             )
             return self._process_results(response.get("results", []))
 
-        try:
+        async def _guarded_search() -> list[dict[str, Any]]:
             if circuit_breaker:
                 return await circuit_breaker.call(_search, timeout=timeout)
-            else:
-                return await asyncio.wait_for(_search(), timeout=timeout)
+            return await asyncio.wait_for(_search(), timeout=timeout)
+
+        try:
+            if self.content_cache is None:
+                return await _guarded_search()
+            return await self.content_cache.get_or_search(
+                "tavily", query, _guarded_search, num_results=num_results
+            )
 
         except TimeoutError:
             self._record_failure("timeout")
@@ -163,8 +172,9 @@ class TavilySearchProvider(WebSearchProvider):
         """
         Extract content from a URL.
 
-        Note: Tavily doesn't have a dedicated content extraction API,
-        so we return a placeholder indicating this limitation.
+        Note: Tavily doesn't have a dedicated content extraction API, so
+        only content already cached for this URL (e.g. extracted by another
+        provider) is returned; otherwise a placeholder indicates the limitation.
 
         Args:
             url: URL to extract content from
@@ -172,6 +182,11 @@ class TavilySearchProvider(WebSearchProvider):
         Returns:
             Dictionary with content or error
         """
+        if self.content_cache is not None:
+            cached = await self.content_cache.get_content(url)
+            if cached is not None:
+                return cached
+
         return {
             "url": url,
             "content": "",
@@ -0,0 +1,251 @@
+"""Tests for bounded and Redis-backed agent memory stores."""
+
+import fnmatch
+import threading
+import time
+
+import pytest
+
+from maverick_agents.memory import (
+    ConversationStore,
+    MemoryStore,
+    RedisConversationStore,
+    RedisUserMemoryStore,
+    UserMemoryStore,
+)
+
+
+class FakeRedis:
+    """Minimal sync Redis stand-in for the commands the store uses."""
+
+    def __init__(self):
+        self.data: dict[str, tuple[str, float | None]] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.ttls: dict[str, float] = {}
+
+    def _alive(self, key):
+        item = self.data.get(key)
+        if item is not None and item[1] is not None and item[1] <= time.time():
+            del self.data[key]
+            return None
+        return item
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    def set(self, key, value, px=None):
+        self.data[key] = (value, time.time() + px / 1000 if px else None)
+        return True
+
+    def get(self, key):
+        item = self._alive(key)
+        return item[0] if item else None
+
+    def mget(self, keys):
+        return [self.get(k) for k in keys]
+
+    def delete(self, *keys):
+        removed = 0
+        for key in keys:
+            removed += self.data.pop(key, None) is not None
+            removed += self.zsets.pop(key, None) is not None
+        return removed
+
+    def zadd(self, key, mapping, xx=False):
+        zset = self.zsets.setdefault(key, {})
+        for member, score in mapping.items():
+            if xx and member not in zset:
+                continue
+            zset[member] = score
+        return 1
+
+    def zrem(self, key, *members):
+        zset = self.zsets.get(key, {})
+        return sum(zset.pop(m, None) is not None for m in members)
+
+    def zrange(self, key, start, end):
+        return sorted(self.zsets.get(key, {}), key=self.zsets.get(key, {}).get)
+
+    def zcard(self, key):
+        return len(self.zsets.get(key, {}))
+
+    def zpopmin(self, key, count):
+        members = self.zrange(key, 0, -1)[:count]
+        zset = self.zsets[key]
+        return [(m, zset.pop(m)) for m in members]
+
+    def pttl(self, key):
+        return self.ttls.get(key, -1)
+
+    def pexpire(self, key, ms):
+        self.ttls[key] = ms
+
+    def scan_iter(self, match, count=None):
+        keys = [k for k in self.data if self._alive(k)] + list(self.zsets)
+        return [k for k in keys if fnmatch.fnmatchcase(k, match)]
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self):
+        return [getattr(self.redis, n)(*a, **kw) for n, a, kw in self.calls]
+
+
+class TestMemoryStore:
+    """Test expiry indexing, LRU eviction and namespace quotas."""
+
+    def test_expired_entries_purged_from_heap(self):
+        store = MemoryStore(ttl_hours=1.0)
+        store.set("a:1", "keep")
+        store.set("b:1", "drop", ttl_hours=1e-9)
+        time.sleep(0.001)
+
+        assert store.get("b:1") is None
+        assert store.keys() == ["a:1"]
+
+        store.set("c:1", "drop", ttl_hours=1e-9)
+        time.sleep(0.001)
+        assert store.clear_expired() == 1
+        assert store.get_stats()["entries"] == 1
+
+    def test_lru_eviction_respects_recent_reads(self):
+        store = MemoryStore(max_entries=2)
+        store.set("a:1", 1)
+        store.set("b:1", 2)
+        store.get("a:1")
+        store.set("c:1", 3)
+
+        assert store.get("b:1") is None
+        assert store.get("a:1") == 1
+        assert store.get_stats()["evictions"] == 1
+
+    def test_namespace_quota_evicts_within_namespace(self):
+        store = ConversationStore(namespace_quota=2)
+        store.save_analysis("s1", "AAPL", "technical", {})
+        store.save_analysis("s1", "MSFT", "technical", {})
+        store.save_context("s2", "persona", "moderate")
+        store.save_analysis("s1", "NVDA", "technical", {})
+
+        symbols = {a["symbol"] for a in store.list_analyses("s1")}
+        assert symbols == {"MSFT", "NVDA"}
+        assert store.get_context("s2", "persona") == "moderate"
+
+    def test_overwrites_do_not_grow_heap_unbounded(self):
+        store = MemoryStore()
+        for i in range(1000):
+            store.set("a:1", i)
+        assert len(store._expiry_heap) < 200
+        assert store.get("a:1") == 999
+
+    def test_user_namespace_uses_user_id(self):
+        store = UserMemoryStore(namespace_quota=1)
+        store.save_watchlist("1", ["AAPL"])
+        store.save_watchlist("2", ["MSFT"])
+
+        assert store.get_watchlist("1") == ["AAPL"]
+        assert store.clear_user_data("1") == 1
+        assert store.get_watchlist("2") == ["MSFT"]
+
+
+class TestRedisMemoryStore:
+    """Test the Redis-backed store shares data and enforces quotas."""
+
+    def test_replicas_share_conversation_memory(self):
+        redis = FakeRedis()
+        first = RedisConversationStore(redis_client=redis)
+        second = RedisConversationStore(redis_client=redis)
+
+        first.save_analysis("s1", "AAPL", "technical", {"rsi": 65})
+        first.save_context("s1", "persona", "moderate")
+
+        assert second.get_analysis("s1", "AAPL", "technical")["data"] == {"rsi": 65}
+        assert len(second.list_analyses("s1")) == 1
+        assert second.clear_session("s1") == 2
+        assert first.get_context("s1", "persona") is None
+
+    def test_namespace_quota_enforced_in_redis(self):
+        redis = FakeRedis()
+        store = RedisConversationStore(redis_client=redis, namespace_quota=2)
+        for symbol in ("AAPL", "MSFT", "NVDA"):
+            store.save_analysis("s1", symbol, "technical", {})
+            time.sleep(0.002)
+
+        symbols = {a["symbol"] for a in store.list_analyses("s1")}
+        assert symbols == {"MSFT", "NVDA"}
+        assert store.get_stats()["evictions"] == 1
+
+    def test_user_store_keys_and_clear(self):
+        redis = FakeRedis()
+        store = RedisUserMemoryStore(redis_client=redis)
+        store.save_preference("7", "risk", "low")
+        store.save_watchlist("7", ["AAPL"])
+
+        assert sorted(store.keys()) == ["user:7:pref:risk", "user:7:watchlist"]
+        assert store.clear_all() == 2
+        assert store.get_watchlist("7") == []
+
+    def test_redis_errors_are_misses(self):
+        class BrokenRedis:
+            def pipeline(self):
+                raise ConnectionError("down")
+
+        store = RedisConversationStore(redis_client=BrokenRedis())
+        store.save_context("s1", "persona", "moderate")
+        assert store.get_context("s1", "persona") is None
+
+
+class TestAgentMemory:
+    """Test agents share configured memory without blocking the event loop."""
+
+    @staticmethod
+    def _market_agent():
+        from langchain_core.language_models.fake_chat_models import FakeListChatModel
+        from langchain_core.tools import tool
+
+        from maverick_agents import MarketAnalysisAgent
+
+        @tool
+        def screen(query: str) -> str:
+            """Screen stocks."""
+            return query
+
+        return MarketAnalysisAgent(llm=FakeListChatModel(responses=["ok"]), tools=[screen])
+
+    @pytest.mark.asyncio
+    async def test_market_agents_share_redis_memory(self, monkeypatch):
+        redis = FakeRedis()
+        loop_thread = threading.get_ident()
+        redis_threads = set()
+        original_get = redis.get
+
+        def tracking_get(key):
+            redis_threads.add(threading.get_ident())
+            return original_get(key)
+
+        redis.get = tracking_get
+        monkeypatch.setenv("AGENT_MEMORY_BACKEND", "redis")
+        monkeypatch.setattr("maverick_core.caching.create_redis_client", lambda: redis)
+
+        first, second = self._market_agent(), self._market_agent()
+        assert isinstance(first.conversation_store, RedisConversationStore)
+
+        first.conversation_store.save_analysis(
+            "s1",
+            first._analysis_cache_key("Top momentum stocks", "momentum"),
+            "momentum_analysis",
+            {"stocks": ["NVDA"]},
+        )
+        cached = await second._check_enhanced_cache("top momentum stocks", "s1", "momentum")
+
+        assert cached == {"stocks": ["NVDA"]}
+        assert redis_threads and loop_thread not in redis_threads
@@ -1,5 +1,7 @@
 """Tests for research optimization modules."""
 
+import asyncio
+
 import pytest
 
 
@@ -381,3 +383,152 @@ class TestOptimizedPromptEngine:
         # Should return same prompt from cache
         assert prompt1 == prompt2
         assert len(engine.prompt_cache) == 1
+
+
+class TestParallelLLMProcessorStreaming:
+    """Test completion-order streaming in ParallelLLMProcessor."""
+
+    def _make_processor(self, delays: dict[int, float]):
+        from unittest.mock import MagicMock
+
+        from maverick_agents.research.optimization import (
+            ModelConfiguration,
+            ParallelLLMProcessor,
+        )
+
+        processor = ParallelLLMProcessor(MagicMock())
+        processor.model_selector = MagicMock()
+        processor.model_selector.calculate_task_complexity.return_value = 0.5
+        processor.model_selector.select_model_for_time_budget.return_value = (
+            ModelConfiguration(
+                model_id="test/model",
+                max_tokens=1000,
+                temperature=0.3,
+                timeout_seconds=10.0,
+            )
+        )
+
+        async def fake_batch(batch, batch_id, **kwargs):
+            await asyncio.sleep(delays[batch_id])
+            return [{**source, "analysis": {"batch_id": batch_id}} for source in batch]
+
+        processor._analyze_source_batch = fake_batch
+        return processor
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_in_completion_order(self):
+        """Test batches are yielded as they finish, not in submission order."""
+        processor = self._make_processor({0: 0.2, 1: 0.0, 2: 0.1})
+        sources = [{"title": f"s{i}", "content": "x"} for i in range(3)]
+
+        order = [
+            batch_id
+            async for batch_id, _ in processor.stream_content_analysis(
+                sources, "general", "moderate", time_budget_seconds=5.0
+            )
+        ]
+
+        assert order == [1, 2, 0]
+
+    @pytest.mark.asyncio
+    async def test_timeout_keeps_completed_batches(self):
+        """Test only unfinished batches fall back when the budget expires."""
+        processor = self._make_processor({0: 0.0, 1: 5.0, 2: 0.0})
+        sources = [{"title": f"s{i}", "content": "x"} for i in range(3)]
+
+        results = await processor.parallel_content_analysis(
+            sources, "general", "moderate", time_budget_seconds=0.5
+        )
+
+        assert [r["title"] for r in results] == ["s0", "s1", "s2"]
+        assert results[0]["analysis"] == {"batch_id": 0}
+        assert results[1]["analysis"]["batch_timeout"] is True
+        assert results[2]["analysis"] == {"batch_id": 2}
+
+    @pytest.mark.asyncio
+    async def test_closing_stream_waits_for_cancelled_batches(self):
+        """Test closing the stream early leaves no batch tasks running."""
+        processor = self._make_processor({0: 0.0, 1: 5.0, 2: 5.0})
+        sources = [{"title": f"s{i}", "content": "x"} for i in range(3)]
+
+        stream = processor.stream_content_analysis(
+            sources, "general", "moderate", time_budget_seconds=10.0
+        )
+        assert (await anext(stream))[0] == 0
+        await stream.aclose()
+
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+class ScriptedLLM:
+    """LLM returning queued responses and counting calls."""
+
+    model_name = "scripted-llm"
+
+    def __init__(self, *responses: str):
+        self.responses = list(responses)
+        self.calls = 0
+
+    async def ainvoke(self, messages):
+        from types import SimpleNamespace
+
+        self.calls += 1
+        return SimpleNamespace(content=self.responses.pop(0))
+
+
+class TestUnparseableResponsesNotCached:
+    """Test garbage LLM output is never stored in the response cache."""
+
+    @pytest.mark.asyncio
+    async def test_content_analyzer(self):
+        from maverick_core.caching import LLMResponseCache
+
+        from maverick_agents.research.content_analyzer import ContentAnalyzer
+
+        llm = ScriptedLLM("not json", '{"SUMMARY": "ok"}', "not json")
+        analyzer = ContentAnalyzer(llm, response_cache=LLMResponseCache())
+
+        first = await analyzer.analyze_content("Revenue grew", "moderate")
+        second = await analyzer.analyze_content("Revenue grew", "moderate")
+        third = await analyzer.analyze_content("Revenue grew", "moderate")
+
+        assert first["summary"] == ""
+        assert second["summary"] == third["summary"] == "ok"
+        assert llm.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_parallel_processor(self):
+        from unittest.mock import MagicMock
+
+        from maverick_core.caching import LLMResponseCache
+
+        from maverick_agents.research.optimization import (
+            ModelConfiguration,
+            ParallelLLMProcessor,
+        )
+
+        structured = "Analysis\nSOURCE 1: sentiment: bullish\nSOURCE 2: sentiment: bearish"
+        llm = ScriptedLLM("garbage", structured, structured)
+        provider = MagicMock()
+        provider.get_llm.return_value = llm
+        processor = ParallelLLMProcessor(provider, response_cache=LLMResponseCache())
+        config = ModelConfiguration(
+            model_id="test/model", max_tokens=1000, temperature=0.3, timeout_seconds=10.0
+        )
+        batch = [{"title": "a", "content": "x"}, {"title": "b", "content": "y"}]
+
+        async def analyze():
+            return await processor._analyze_source_batch(
+                batch, 0, "general", "moderate", config, 0.5
+            )
+
+        fallback = await analyze()
+        parsed = await analyze()
+        cached = await analyze()
+
+        def directions(results):
+            return [r["analysis"]["sentiment"]["direction"] for r in results]
+
+        assert len(fallback) == 2
+        assert directions(parsed) == directions(cached) == ["bullish", "bearish"]
+        assert llm.calls == 2
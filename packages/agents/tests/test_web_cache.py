@@ -0,0 +1,150 @@
+"""Tests for the search provider web content cache."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from maverick_agents.research.providers import WebContentCache, canonicalize_url
+
+
+class TestCanonicalizeUrl:
+    """Test URL canonicalization used for content keys."""
+
+    def test_strips_tracking_and_fragment(self):
+        assert (
+            canonicalize_url("HTTPS://WWW.Reuters.com/markets/?utm_source=x&b=2&a=1#top")
+            == "https://www.reuters.com/markets?a=1&b=2"
+        )
+
+    def test_drops_default_port(self):
+        assert canonicalize_url("http://example.com:80/a") == "http://example.com/a"
+        assert canonicalize_url("http://example.com:8080/a") == "http://example.com:8080/a"
+
+
+class TestWebContentCache:
+    """Test search and content caching with revalidation."""
+
+    def _make_cache(self, head_responses: list, **kwargs) -> WebContentCache:
+        cache = WebContentCache(**kwargs)
+        self.head_calls: list[dict] = []
+
+        async def fake_head(url, headers):
+            self.head_calls.append(headers)
+            return head_responses.pop(0)
+
+        cache._head = fake_head
+        return cache
+
+    @pytest.mark.asyncio
+    async def test_search_results_cached_by_normalized_query(self):
+        cache = self._make_cache([])
+        calls = 0
+
+        async def search():
+            nonlocal calls
+            calls += 1
+            return [{"url": "https://example.com"}]
+
+        await cache.get_or_search("exa", "AAPL  Earnings", search, num_results=5)
+        results = await cache.get_or_search("exa", "aapl earnings", search, num_results=5)
+
+        assert results == [{"url": "https://example.com"}]
+        assert calls == 1
+
+        await cache.get_or_search("tavily", "aapl earnings", search, num_results=5)
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_search_results_not_cached(self):
+        cache = self._make_cache([])
+        calls = 0
+
+        async def search():
+            nonlocal calls
+            calls += 1
+            return []
+
+        await cache.get_or_search("exa", "q", search)
+        await cache.get_or_search("exa", "q", search)
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_content_revalidated_with_304(self):
+        head_responses = [
+            SimpleNamespace(status_code=200, headers={"etag": '"v1"'}),
+            SimpleNamespace(status_code=304, headers={}),
+        ]
+        cache = self._make_cache(head_responses, content_ttl=60)
+        fetches = 0
+
+        async def fetch():
+            nonlocal fetches
+            fetches += 1
+            return {"url": "https://example.com/a", "content": "body"}
+
+        await cache.get_or_fetch_content("https://example.com/a", fetch)
+        await cache.flush_validators()
+
+        # Age the entry past its freshness window
+        key = cache.content_key("https://example.com/a")
+        entry = cache._decode(cache._local[key][1])
+        entry["fresh_until"] = time.time() - 1
+        await cache._store(key, entry)
+
+        result = await cache.get_or_fetch_content("https://example.com/a/?utm_x=1", fetch)
+
+        assert result["content"] == "body"
+        assert fetches == 1
+        assert self.head_calls[-1] == {"If-None-Match": '"v1"'}
+        assert cache.get_stats()["revalidated"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_does_not_wait_for_validators(self):
+        cache = WebContentCache()
+        head_started, release = asyncio.Event(), asyncio.Event()
+
+        async def slow_head(url, headers):
+            head_started.set()
+            await release.wait()
+            return SimpleNamespace(status_code=200, headers={"last-modified": "Mon"})
+
+        async def fetch():
+            return {"url": "https://example.com/b", "content": "body"}
+
+        cache._head = slow_head
+        result = await asyncio.wait_for(
+            cache.get_or_fetch_content("https://example.com/b", fetch), timeout=1
+        )
+        assert result["content"] == "body"
+        await head_started.wait()
+
+        release.set()
+        await cache.flush_validators()
+        entry = cache._decode(cache._local[cache.content_key("https://example.com/b")][1])
+        assert entry["last_modified"] == "Mon"
+
+    @pytest.mark.asyncio
+    async def test_error_content_not_cached(self):
+        cache = self._make_cache(
+            [SimpleNamespace(status_code=404, headers={})] * 2
+        )
+
+        async def fetch():
+            return {"url": "u", "content": "", "error": "No content found"}
+
+        await cache.get_or_fetch_content("https://example.com/missing", fetch)
+        assert await cache.get_content("https://example.com/missing") is None
+
+    @pytest.mark.asyncio
+    async def test_entries_are_compressed(self):
+        cache = self._make_cache([SimpleNamespace(status_code=200, headers={})])
+        body = "revenue grew " * 1000
+
+        async def fetch():
+            return {"url": "u", "content": body}
+
+        await cache.get_or_fetch_content("https://example.com/long", fetch)
+        await cache.flush_validators()
+        assert cache.get_stats()["local_bytes"] < len(body) / 10
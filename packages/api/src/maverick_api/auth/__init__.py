@@ -11,6 +11,7 @@ from maverick_api.auth.base import AuthStrategy, AuthenticatedUser
 from maverick_api.auth.cookie import CookieAuthStrategy
 from maverick_api.auth.jwt import JWTAuthStrategy
 from maverick_api.auth.api_key import APIKeyAuthStrategy
+from maverick_api.auth.credential_cache import CredentialCache, CredentialCacheSync
 from maverick_api.auth.middleware import AuthMiddleware
 
 __all__ = [
@@ -19,6 +20,8 @@ __all__ = [
     "CookieAuthStrategy",
     "JWTAuthStrategy",
     "APIKeyAuthStrategy",
+    "CredentialCache",
+    "CredentialCacheSync",
     "AuthMiddleware",
 ]
 
@@ -5,14 +5,27 @@ Used for programmatic access. Provides:
 - Simple header-based authentication
 - Per-key rate limits
 - Usage tracking
+
+Verified keys are cached in process (see credential_cache), so a warm key
+is authenticated without touching Redis; usage is flushed in batches.
 """
 
-from datetime import datetime, UTC
+from datetime import datetime, timedelta, UTC
 
 from fastapi import Request
 from redis.asyncio import Redis
 
 from maverick_api.auth.base import AuthStrategy
+from maverick_api.auth.credential_cache import (
+    MISSING,
+    CredentialCache,
+    UsageRecorder,
+    api_key_tag,
+    get_credential_cache,
+    get_usage_recorder,
+    publish_invalidation,
+    user_tag,
+)
 from maverick_schemas.auth import AuthenticatedUser
 from maverick_schemas.base import AuthMethod, Tier
 
@@ -31,6 +44,8 @@ class APIKeyAuthStrategy(AuthStrategy):
         self,
         redis: Redis | None = None,
         key_prefix: str = "mav_",
+        cache: CredentialCache | None = None,
+        usage: UsageRecorder | None = None,
     ):
         """
         Initialize API key auth strategy.
@@ -38,9 +53,13 @@ class APIKeyAuthStrategy(AuthStrategy):
         Args:
             redis: Redis client for key validation
             key_prefix: Expected prefix for API keys
+            cache: Verified-key cache (default: the shared cache)
+            usage: Usage accumulator (default: the shared recorder)
         """
         self._redis = redis
         self._key_prefix = key_prefix
+        self._cache = cache if cache is not None else get_credential_cache()
+        self._usage = usage if usage is not None else get_usage_recorder()
 
     def get_header_name(self) -> str:
         """Return X-API-Key header name."""
@@ -74,43 +93,61 @@ class APIKeyAuthStrategy(AuthStrategy):
                 rate_limit=100,
             )
 
-        # Get key metadata from Redis
+        tag = api_key_tag(api_key)
+        user = self._cache.get(tag)
+        if user is MISSING:
+            # Don't cache a result that a revocation overtook while loading
+            generation = self._cache.generation()
+            user, ttl = await self._load_key(api_key)
+            if user is None:
+                return None
+            self._cache.set(
+                tag,
+                user,
+                tags=(tag, user_tag(user.user_id)),
+                ttl=ttl,
+                generation=generation,
+            )
+
+        await self._record_usage(api_key)
+        return user
+
+    async def _load_key(
+        self, api_key: str
+    ) -> tuple[AuthenticatedUser | None, float | None]:
+        """Load and check key metadata, returning the user and seconds to expiry."""
         key_data = await self._redis.hgetall(f"api_key:{api_key}")
         if not key_data:
-            return None
+            return None, None
 
         # Decode bytes to strings
         data = {k.decode(): v.decode() for k, v in key_data.items()}
 
         # Check if key is expired
+        ttl = None
         expires_at = data.get("expires_at")
         if expires_at:
-            expires = datetime.fromisoformat(expires_at)
-            if datetime.now(UTC) > expires:
-                return None
+            ttl = (datetime.fromisoformat(expires_at) - datetime.now(UTC)).total_seconds()
+            if ttl <= 0:
+                return None, None
 
         # Check if key is revoked
         if data.get("revoked") == "true":
-            return None
-
-        # Update last used
-        await self._redis.hset(
-            f"api_key:{api_key}",
-            "last_used",
-            datetime.now(UTC).isoformat(),
-        )
+            return None, None
 
-        # Increment usage counter
-        today = datetime.now(UTC).strftime("%Y-%m-%d")
-        await self._redis.incr(f"api_key_usage:{api_key}:{today}")
-        await self._redis.expire(f"api_key_usage:{api_key}:{today}", 86400 * 2)
-
-        return AuthenticatedUser(
+        user = AuthenticatedUser(
             user_id=data["user_id"],
             auth_method=AuthMethod.API_KEY,
             tier=Tier(data.get("tier", "free")),
             rate_limit=int(data.get("rate_limit", 100)),
         )
+        return user, ttl
+
+    async def _record_usage(self, api_key: str) -> None:
+        """Accumulate usage; flush inline only if no background flusher runs."""
+        self._usage.record(api_key)
+        if not self._usage.scheduled:
+            await self._usage.flush(self._redis)
 
     async def create_key(
         self,
@@ -179,6 +216,7 @@ class APIKeyAuthStrategy(AuthStrategy):
             return False
 
         await self._redis.hset(f"api_key:{api_key}", "revoked", "true")
+        await publish_invalidation(self._redis, api_key_tag(api_key), cache=self._cache)
         return True
 
     async def get_user_keys(self, user_id: str) -> list[dict]:
@@ -208,8 +246,5 @@ class APIKeyAuthStrategy(AuthStrategy):
         return keys
 
 
-# Import timedelta for expires_in_days
-from datetime import timedelta
-
 __all__ = ["APIKeyAuthStrategy"]
 
@@ -0,0 +1,424 @@
+"""
+In-process credential verification cache.
+
+Verified API keys and per-user block state are held in process memory,
+keyed by a fast hash of the presented secret, so a warm credential is
+authenticated without a Redis round trip. Revoking a key or blocking a user
+publishes the affected tags on a Redis pub/sub channel that every API
+process listens on. Usage counters and last_used timestamps are accumulated
+locally and flushed to Redis in pipelined batches.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, UTC
+from typing import Any
+
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "auth:invalidate"
+
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_TTL_SECONDS = 60.0
+DEFAULT_FLUSH_INTERVAL_SECONDS = 5.0
+
+# Without a live subscription invalidations can be missed, so entries are
+# only trusted for about as long as a revocation is allowed to take.
+UNSUBSCRIBED_TTL_SECONDS = 1.0
+
+USAGE_COUNTER_TTL_SECONDS = 86400 * 2
+
+MISSING = object()
+
+
+def fingerprint(secret: str) -> str:
+    """Fast, fixed-size hash of a presented secret for use as a cache key."""
+    return hashlib.blake2b(secret.encode(), digest_size=16).hexdigest()
+
+
+def api_key_tag(api_key: str) -> str:
+    """Invalidation tag for a single API key."""
+    return f"api_key:{fingerprint(api_key)}"
+
+
+def user_tag(user_id: str) -> str:
+    """Invalidation tag covering everything cached for a user."""
+    return f"user:{user_id}"
+
+
+@dataclass
+class _Entry:
+    value: Any
+    tags: tuple[str, ...]
+    expires_at: float
+
+
+class CredentialCache:
+    """
+    Bounded, TTL'd LRU of verification results.
+
+    Each entry carries invalidation tags; invalidating a tag drops every
+    entry that carries it. While no invalidation subscription is active,
+    entry lifetimes are capped at UNSUBSCRIBED_TTL_SECONDS.
+
+    Every invalidation advances a generation counter. Callers that load a
+    credential asynchronously read generation() first and pass it to set(),
+    which drops the result if any of its tags was invalidated meanwhile.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: float = DEFAULT_TTL_SECONDS,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached credentials
+            ttl: Entry lifetime in seconds while subscribed to invalidations
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.subscribed = False
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._tags: dict[str, set[str]] = {}
+        self._generation = 0
+        # Generation of the last invalidation per tag; results loaded before
+        # _stale_before are always dropped (set when the map is pruned)
+        self._invalidated_at: dict[str, int] = {}
+        self._stale_before = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any:
+        """
+        Look up a cached result.
+
+        Returns:
+            The cached value, or MISSING if absent or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return MISSING
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return MISSING
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def generation(self) -> int:
+        """Current invalidation generation, read before loading a credential."""
+        return self._generation
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        tags: tuple[str, ...] = (),
+        ttl: float | None = None,
+        generation: int | None = None,
+    ) -> None:
+        """
+        Cache a verification result.
+
+        Args:
+            key: Cache key (see fingerprint)
+            value: Result to cache
+            tags: Invalidation tags for the entry
+            ttl: Optional shorter lifetime, e.g. until the credential expires
+            generation: generation() read before the result was loaded; the
+                result is not cached if one of its tags was invalidated since
+        """
+        if generation is not None and self._is_stale(tags, generation):
+            return
+
+        lifetime = self.ttl if ttl is None else min(ttl, self.ttl)
+        if not self.subscribed:
+            lifetime = min(lifetime, UNSUBSCRIBED_TTL_SECONDS)
+        if lifetime <= 0:
+            return
+
+        self._remove(key)
+        self._entries[key] = _Entry(value, tags, time.monotonic() + lifetime)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate(self, *tags: str) -> int:
+        """
+        Drop every entry carrying any of the given tags.
+
+        Returns:
+            Number of entries removed
+        """
+        self._generation += 1
+        if len(self._invalidated_at) + len(tags) > self.max_entries:
+            self._invalidated_at.clear()
+            self._stale_before = self._generation
+
+        removed = 0
+        for tag in tags:
+            self._invalidated_at[tag] = self._generation
+            for key in self._tags.pop(tag, set()):
+                removed += self._remove(key)
+        return removed
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._generation += 1
+        self._stale_before = self._generation
+        self._invalidated_at.clear()
+        self._entries.clear()
+        self._tags.clear()
+
+    def _is_stale(self, tags: tuple[str, ...], generation: int) -> bool:
+        if generation < self._stale_before:
+            return True
+        return any(self._invalidated_at.get(tag, 0) > generation for tag in tags)
+
+    def _remove(self, key: str) -> int:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return 0
+        for tag in entry.tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+        return 1
+
+    def stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "subscribed": self.subscribed,
+        }
+
+
+class UsageRecorder:
+    """
+    Local accumulator for API key usage.
+
+    Replaces the per-request hset/incr/expire with counters that are written
+    in one pipelined batch per flush.
+    """
+
+    def __init__(self):
+        self._counts: dict[tuple[str, str], int] = {}
+        self._last_used: dict[str, str] = {}
+        self.scheduled = False
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def record(self, api_key: str, when: datetime | None = None) -> None:
+        """Count one authenticated request for a key."""
+        when = when or datetime.now(UTC)
+        bucket = (api_key, when.strftime("%Y-%m-%d"))
+        self._counts[bucket] = self._counts.get(bucket, 0) + 1
+        self._last_used[api_key] = when.isoformat()
+
+    async def flush(self, redis: Redis) -> int:
+        """
+        Write accumulated usage to Redis in a single pipeline.
+
+        Counts that fail to flush are kept for the next attempt.
+
+        Returns:
+            Number of requests flushed
+        """
+        if not self._counts:
+            return 0
+
+        counts, self._counts = self._counts, {}
+        last_used, self._last_used = self._last_used, {}
+
+        pipe = redis.pipeline(transaction=False)
+        for api_key, timestamp in last_used.items():
+            pipe.hset(f"api_key:{api_key}", "last_used", timestamp)
+        for (api_key, day), count in counts.items():
+            usage_key = f"api_key_usage:{api_key}:{day}"
+            pipe.incrby(usage_key, count)
+            pipe.expire(usage_key, USAGE_COUNTER_TTL_SECONDS)
+
+        try:
+            await pipe.execute()
+        except Exception:
+            for bucket, count in counts.items():
+                self._counts[bucket] = self._counts.get(bucket, 0) + count
+            for api_key, timestamp in last_used.items():
+                self._last_used.setdefault(api_key, timestamp)
+            raise
+
+        return sum(counts.values())
+
+
+async def publish_invalidation(
+    redis: Redis | None,
+    *tags: str,
+    cache: CredentialCache | None = None,
+) -> None:
+    """
+    Invalidate tags locally and on every process subscribed to the channel.
+
+    Args:
+        redis: Redis client to publish through (local-only when None)
+        tags: Invalidation tags (see api_key_tag and user_tag)
+        cache: Local cache (default: the shared cache)
+    """
+    (cache if cache is not None else get_credential_cache()).invalidate(*tags)
+    if redis is not None:
+        for tag in tags:
+            await redis.publish(INVALIDATION_CHANNEL, tag)
+
+
+class CredentialCacheSync:
+    """
+    Background tasks keeping the local cache coherent with Redis.
+
+    Listens on INVALIDATION_CHANNEL and periodically flushes the usage
+    recorder. If the subscription drops, the cache is cleared and falls back
+    to short entry lifetimes until it is re-established.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        cache: CredentialCache | None = None,
+        recorder: UsageRecorder | None = None,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+    ):
+        """
+        Initialize the sync worker.
+
+        Args:
+            redis: Redis client
+            cache: Cache to invalidate (default: the shared cache)
+            recorder: Usage recorder to flush (default: the shared recorder)
+            flush_interval: Seconds between usage flushes
+        """
+        self.redis = redis
+        self.cache = cache if cache is not None else get_credential_cache()
+        self.recorder = recorder if recorder is not None else get_usage_recorder()
+        self.flush_interval = flush_interval
+        self._tasks: list[asyncio.Task] = []
+
+    async def start(self) -> None:
+        """Start listening and flushing in the background."""
+        if self._tasks:
+            return
+        self.recorder.scheduled = True
+        self._tasks = [
+            asyncio.create_task(self._listen()),
+            asyncio.create_task(self._flush_loop()),
+        ]
+
+    async def stop(self) -> None:
+        """Stop the background tasks and flush outstanding usage."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self.recorder.scheduled = False
+        self.cache.subscribed = False
+        try:
+            await self.recorder.flush(self.redis)
+        except Exception as e:
+            logger.warning(f"Failed to flush API key usage on shutdown: {e}")
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                self.cache.subscribed = True
+                while True:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=1.0
+                    )
+                    if message and message.get("type") == "message":
+                        tag = message["data"]
+                        if isinstance(tag, bytes):
+                            tag = tag.decode()
+                        self.cache.invalidate(tag)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Credential invalidation subscription lost: {e}")
+                await asyncio.sleep(1.0)
+            finally:
+                # Anything cached may have missed an invalidation
+                self.cache.subscribed = False
+                self.cache.clear()
+                try:
+                    await pubsub.unsubscribe(INVALIDATION_CHANNEL)
+                    await pubsub.reset()
+                except Exception:
+                    pass
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.recorder.flush(self.redis)
+            except Exception as e:
+                logger.warning(f"Failed to flush API key usage: {e}")
+
+
+# ============================================
+# Shared instances
+# ============================================
+
+_credential_cache: CredentialCache | None = None
+_usage_recorder: UsageRecorder | None = None
+
+
+def get_credential_cache() -> CredentialCache:
+    """Get the process-wide credential cache."""
+    global _credential_cache
+    if _credential_cache is None:
+        _credential_cache = CredentialCache()
+    return _credential_cache
+
+
+def get_usage_recorder() -> UsageRecorder:
+    """Get the process-wide API key usage recorder."""
+    global _usage_recorder
+    if _usage_recorder is None:
+        _usage_recorder = UsageRecorder()
+    return _usage_recorder
+
+
+__all__ = [
+    "INVALIDATION_CHANNEL",
+    "MISSING",
+    "CredentialCache",
+    "CredentialCacheSync",
+    "UsageRecorder",
+    "api_key_tag",
+    "fingerprint",
+    "get_credential_cache",
+    "get_usage_recorder",
+    "publish_invalidation",
+    "user_tag",
+]
@@ -16,6 +16,13 @@ from jose import jwt, JWTError
 from redis.asyncio import Redis
 
 from maverick_api.auth.base import AuthStrategy
+from maverick_api.auth.credential_cache import (
+    MISSING,
+    CredentialCache,
+    get_credential_cache,
+    publish_invalidation,
+    user_tag,
+)
 from maverick_schemas.auth import AuthenticatedUser, TokenResponse
 from maverick_schemas.base import AuthMethod, Tier
 
@@ -41,6 +48,7 @@ class JWTAuthStrategy(AuthStrategy):
         algorithm: str = "HS256",
         access_token_expire_minutes: int = 15,
         refresh_token_expire_days: int = 30,
+        cache: CredentialCache | None = None,
     ):
         """
         Initialize JWT auth strategy.
@@ -51,12 +59,14 @@ class JWTAuthStrategy(AuthStrategy):
             algorithm: JWT algorithm
             access_token_expire_minutes: Access token lifetime
             refresh_token_expire_days: Refresh token lifetime
+            cache: Cache of per-user block state (default: the shared cache)
         """
         self._secret_key = secret_key
         self._redis = redis
         self._algorithm = algorithm
         self._access_expire = timedelta(minutes=access_token_expire_minutes)
         self._refresh_expire = timedelta(days=refresh_token_expire_days)
+        self._cache = cache if cache is not None else get_credential_cache()
 
     def get_header_name(self) -> str:
         """Return Authorization header name."""
@@ -93,8 +103,7 @@ class JWTAuthStrategy(AuthStrategy):
 
         # Check if user is blocked (security incident)
         if self._redis:
-            blocked = await self._redis.get(f"user_blocked:{user_id}")
-            if blocked:
+            if await self._is_blocked(user_id):
                 raise HTTPException(
                     status_code=401,
                     detail="Session invalidated - please login again",
@@ -246,6 +255,17 @@ class JWTAuthStrategy(AuthStrategy):
         except JWTError:
             pass
 
+    async def _is_blocked(self, user_id: str) -> bool:
+        """Check the block flag, cached in process until invalidated."""
+        tag = user_tag(user_id)
+        key = f"user_blocked:{user_id}"
+        blocked = self._cache.get(key)
+        if blocked is MISSING:
+            generation = self._cache.generation()
+            blocked = bool(await self._redis.get(key))
+            self._cache.set(key, blocked, tags=(tag,), generation=generation)
+        return blocked
+
     async def _revoke_all_user_tokens(self, user_id: str) -> None:
         """
         Revoke all tokens for a user.
@@ -261,6 +281,7 @@ class JWTAuthStrategy(AuthStrategy):
             int(self._refresh_expire.total_seconds()),
             datetime.now(UTC).isoformat(),
         )
+        await publish_invalidation(self._redis, user_tag(user_id), cache=self._cache)
 
 
 __all__ = ["JWTAuthStrategy"]
@@ -52,6 +52,11 @@ class Settings(BaseSettings):
     # Authentication - API Keys
     api_key_prefix: str = Field(default="mav_")
 
+    # Authentication - In-process credential cache
+    auth_cache_ttl_seconds: float = Field(default=60.0)
+    auth_cache_max_entries: int = Field(default=10_000)
+    auth_usage_flush_seconds: float = Field(default=5.0)
+
     # CORS
     cors_origins: list[str] = Field(
         default=["http://localhost:3000", "http://localhost:5173"]
@@ -5,6 +5,7 @@ Creates and configures the FastAPI application with all middleware,
 routers, and exception handlers.
 """
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
@@ -59,6 +60,36 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     app.state.redis = redis
     logger.info("Redis connection pool initialized")
 
+    # Keep the in-process credential cache coherent across workers
+    try:
+        from maverick_api.auth.credential_cache import (
+            CredentialCacheSync,
+            get_credential_cache,
+        )
+
+        credential_cache = get_credential_cache()
+        credential_cache.ttl = settings.auth_cache_ttl_seconds
+        credential_cache.max_entries = settings.auth_cache_max_entries
+        credential_sync = CredentialCacheSync(
+            redis, flush_interval=settings.auth_usage_flush_seconds
+        )
+        await credential_sync.start()
+        app.state.credential_sync = credential_sync
+        logger.info("Credential cache sync started")
+    except Exception as e:
+        logger.warning(f"Failed to start credential cache sync: {e}")
+
+    # Keep the shared alert rule index in sync with rule changes
+    try:
+        from maverick_services.alert_service import get_alert_service
+
+        app.state.alert_rule_listener = asyncio.create_task(
+            get_alert_service(redis_client=redis).listen_for_rule_changes()
+        )
+        logger.info("Alert rule change listener started")
+    except Exception as e:
+        logger.warning(f"Failed to start alert rule change listener: {e}")
+
     # Initialize capabilities system
     try:
         from maverick_server.capabilities_integration import initialize_capabilities
@@ -133,6 +164,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         except Exception as e:
             logger.warning(f"Error stopping task queue: {e}")
 
+    # Stop credential cache sync (flushes pending API key usage)
+    if hasattr(app.state, "credential_sync"):
+        try:
+            await app.state.credential_sync.stop()
+            logger.info("Credential cache sync stopped")
+        except Exception as e:
+            logger.warning(f"Error stopping credential cache sync: {e}")
+
+    # Stop alert rule change listener
+    if hasattr(app.state, "alert_rule_listener"):
+        app.state.alert_rule_listener.cancel()
+        await asyncio.gather(app.state.alert_rule_listener, return_exceptions=True)
+        logger.info("Alert rule change listener stopped")
+
     # Shutdown capabilities
     try:
         from maverick_server.capabilities_integration import shutdown_capabilities
@@ -8,15 +8,19 @@ import logging
 from datetime import datetime, UTC
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from pydantic import Field
 
 from maverick_schemas.base import MaverickBaseModel
 from maverick_schemas.responses import APIResponse, ResponseMeta
 from maverick_schemas.auth import AuthenticatedUser
 from maverick_services import (
+    HAS_PYARROW,
     ExportService,
     ExportFormat,
+    ExportResult,
+    ExportStream,
+    ExportType,
     get_export_service,
 )
 from maverick_api.dependencies import get_current_user, get_request_id
@@ -82,6 +86,40 @@ def get_export_service_dep() -> ExportService:
     return get_export_service()
 
 
+def _parse_format(format: str) -> ExportFormat:
+    try:
+        export_format = ExportFormat(format.lower())
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid format: {format}")
+    if export_format == ExportFormat.PARQUET and not HAS_PYARROW:
+        raise HTTPException(
+            status_code=400,
+            detail="Parquet export is not available on this server (pyarrow not installed)",
+        )
+    return export_format
+
+
+def _file_response(result: ExportResult) -> Response:
+    """Send a buffered export as a download."""
+    return Response(
+        content=result.content,
+        media_type=result.content_type,
+        headers={
+            "Content-Disposition": f"attachment; filename={result.filename}",
+            "X-Row-Count": str(result.row_count),
+        },
+    )
+
+
+def _stream_response(export: ExportStream) -> StreamingResponse:
+    """Send a streamed export as a download."""
+    return StreamingResponse(
+        export.chunks,
+        media_type=export.content_type,
+        headers={"Content-Disposition": f"attachment; filename={export.filename}"},
+    )
+
+
 # ============================================
 # Export Endpoints
 # ============================================
@@ -90,7 +128,9 @@ def get_export_service_dep() -> ExportService:
 @router.post("/portfolio")
 async def export_portfolio(
     data: ExportPortfolioRequest,
-    format: str = Query(default="csv", description="Export format (csv, json)"),
+    format: str = Query(default="csv", description="Export format (csv, json, parquet)"),
+    stream: bool = Query(default=False, description="Stream the file in chunks"),
+    gzip: bool = Query(default=False, description="Gzip-compress the streamed file"),
     user: AuthenticatedUser = Depends(get_current_user),
     export_service: ExportService = Depends(get_export_service_dep),
 ):
@@ -99,10 +139,15 @@ async def export_portfolio(
     
     Returns a downloadable file with portfolio data.
     """
-    try:
-        export_format = ExportFormat(format.lower())
-    except ValueError:
-        raise HTTPException(status_code=400, detail=f"Invalid format: {format}")
+    export_format = _parse_format(format)
+    
+    if stream or gzip:
+        return _stream_response(export_service.stream(
+            ExportType.PORTFOLIO,
+            export_service.portfolio_rows(data.positions, data.include_summary),
+            export_format,
+            compress=gzip,
+        ))
     
     result = await export_service.export_portfolio(
         positions=data.positions,
@@ -110,28 +155,29 @@ async def export_portfolio(
         include_summary=data.include_summary,
     )
     
-    return Response(
-        content=result.content,
-        media_type=result.content_type,
-        headers={
-            "Content-Disposition": f"attachment; filename={result.filename}",
-            "X-Row-Count": str(result.row_count),
-        },
-    )
+    return _file_response(result)
 
 
 @router.post("/watchlist")
 async def export_watchlist(
     data: ExportWatchlistRequest,
     format: str = Query(default="csv"),
+    stream: bool = Query(default=False, description="Stream the file in chunks"),
+    gzip: bool = Query(default=False, description="Gzip-compress the streamed file"),
     user: AuthenticatedUser = Depends(get_current_user),
     export_service: ExportService = Depends(get_export_service_dep),
 ):
     """Export watchlist items."""
-    try:
-        export_format = ExportFormat(format.lower())
-    except ValueError:
-        raise HTTPException(status_code=400, detail=f"Invalid format: {format}")
+    export_format = _parse_format(format)
+    
+    if stream or gzip:
+        return _stream_response(export_service.stream(
+            ExportType.WATCHLIST,
+            export_service.watchlist_rows(data.items),
+            export_format,
+            filename=export_service.watchlist_filename(data.watchlist_name, export_format),
+            compress=gzip,
+        ))
     
     result = await export_service.export_watchlist(
         watchlist_name=data.watchlist_name,
@@ -139,28 +185,29 @@ async def export_watchlist(
         format=export_format,
     )
     
-    return Response(
-        content=result.content,
-        media_type=result.content_type,
-        headers={
-            "Content-Disposition": f"attachment; filename={result.filename}",
-            "X-Row-Count": str(result.row_count),
-        },
-    )
+    return _file_response(result)
 
 
 @router.post("/screening-results")
 async def export_screening_results(
     data: ExportScreeningRequest,
     format: str = Query(default="csv"),
+    stream: bool = Query(default=False, description="Stream the file in chunks"),
+    gzip: bool = Query(default=False, description="Gzip-compress the streamed file"),
     user: AuthenticatedUser = Depends(get_current_user),
     export_service: ExportService = Depends(get_export_service_dep),
 ):
     """Export screening results."""
-    try:
-        export_format = ExportFormat(format.lower())
-    except ValueError:
-        raise HTTPException(status_code=400, detail=f"Invalid format: {format}")
+    export_format = _parse_format(format)
+    
+    if stream or gzip:
+        return _stream_response(export_service.stream(
+            ExportType.SCREENING_RESULTS,
+            export_service.screening_rows(data.results),
+            export_format,
+            filename=export_service.screening_filename(data.screener_name, export_format),
+            compress=gzip,
+        ))
     
     result = await export_service.export_screening_results(
         screener_name=data.screener_name,
@@ -168,20 +215,15 @@ async def export_screening_results(
         format=export_format,
     )
     
-    return Response(
-        content=result.content,
-        media_type=result.content_type,
-        headers={
-            "Content-Disposition": f"attachment; filename={result.filename}",
-            "X-Row-Count": str(result.row_count),
-        },
-    )
+    return _file_response(result)
 
 
 @router.post("/tax-report")
 async def export_tax_report(
     data: ExportTaxReportRequest,
     format: str = Query(default="csv"),
+    stream: bool = Query(default=False, description="Stream the file in chunks"),
+    gzip: bool = Query(default=False, description="Gzip-compress the streamed file"),
     user: AuthenticatedUser = Depends(get_current_user),
     export_service: ExportService = Depends(get_export_service_dep),
 ):
@@ -190,10 +232,16 @@ async def export_tax_report(
     
     Includes summary of short-term and long-term capital gains.
     """
-    try:
-        export_format = ExportFormat(format.lower())
-    except ValueError:
-        raise HTTPException(status_code=400, detail=f"Invalid format: {format}")
+    export_format = _parse_format(format)
+    
+    if stream or gzip:
+        return _stream_response(export_service.stream(
+            ExportType.TAX_REPORT,
+            export_service.tax_report_rows(data.transactions),
+            export_format,
+            filename=f"tax_report_{data.year}.{export_format.value}",
+            compress=gzip,
+        ))
     
     result = await export_service.export_tax_report(
         year=data.year,
@@ -201,42 +249,35 @@ async def export_tax_report(
         format=export_format,
     )
     
-    return Response(
-        content=result.content,
-        media_type=result.content_type,
-        headers={
-            "Content-Disposition": f"attachment; filename={result.filename}",
-            "X-Row-Count": str(result.row_count),
-        },
-    )
+    return _file_response(result)
 
 
 @router.post("/trade-journal")
 async def export_trade_journal(
     data: ExportTradeJournalRequest,
     format: str = Query(default="csv"),
+    stream: bool = Query(default=False, description="Stream the file in chunks"),
+    gzip: bool = Query(default=False, description="Gzip-compress the streamed file"),
     user: AuthenticatedUser = Depends(get_current_user),
     export_service: ExportService = Depends(get_export_service_dep),
 ):
     """Export trade journal with decision tracking."""
-    try:
-        export_format = ExportFormat(format.lower())
-    except ValueError:
-        raise HTTPException(status_code=400, detail=f"Invalid format: {format}")
+    export_format = _parse_format(format)
+    
+    if stream or gzip:
+        return _stream_response(export_service.stream(
+            ExportType.TRADE_JOURNAL,
+            export_service.trade_journal_rows(data.trades),
+            export_format,
+            compress=gzip,
+        ))
     
     result = await export_service.export_trade_journal(
         trades=data.trades,
         format=export_format,
     )
     
-    return Response(
-        content=result.content,
-        media_type=result.content_type,
-        headers={
-            "Content-Disposition": f"attachment; filename={result.filename}",
-            "X-Row-Count": str(result.row_count),
-        },
-    )
+    return _file_response(result)
 
 
 @router.post("/stock-analysis")
@@ -251,10 +292,7 @@ async def export_stock_analysis(
     
     Best exported as JSON due to nested structure.
     """
-    try:
-        export_format = ExportFormat(format.lower())
-    except ValueError:
-        raise HTTPException(status_code=400, detail=f"Invalid format: {format}")
+    export_format = _parse_format(format)
     
     result = await export_service.export_stock_analysis(
         ticker=data.ticker,
@@ -262,14 +300,7 @@ async def export_stock_analysis(
         format=export_format,
     )
     
-    return Response(
-        content=result.content,
-        media_type=result.content_type,
-        headers={
-            "Content-Disposition": f"attachment; filename={result.filename}",
-            "X-Row-Count": str(result.row_count),
-        },
-    )
+    return _file_response(result)
 
 
 # ============================================
@@ -288,13 +319,14 @@ async def get_export_formats(
             "formats": [
                 {"value": "csv", "label": "CSV (Spreadsheet)", "extension": ".csv"},
                 {"value": "json", "label": "JSON (Data)", "extension": ".json"},
+                {"value": "parquet", "label": "Parquet (Analytics)", "extension": ".parquet"},
             ],
             "export_types": [
-                {"value": "portfolio", "label": "Portfolio", "formats": ["csv", "json"]},
-                {"value": "watchlist", "label": "Watchlist", "formats": ["csv", "json"]},
-                {"value": "screening_results", "label": "Screening Results", "formats": ["csv", "json"]},
-                {"value": "tax_report", "label": "Tax Report", "formats": ["csv"]},
-                {"value": "trade_journal", "label": "Trade Journal", "formats": ["csv", "json"]},
+                {"value": "portfolio", "label": "Portfolio", "formats": ["csv", "json", "parquet"]},
+                {"value": "watchlist", "label": "Watchlist", "formats": ["csv", "json", "parquet"]},
+                {"value": "screening_results", "label": "Screening Results", "formats": ["csv", "json", "parquet"]},
+                {"value": "tax_report", "label": "Tax Report", "formats": ["csv", "parquet"]},
+                {"value": "trade_journal", "label": "Trade Journal", "formats": ["csv", "json", "parquet"]},
                 {"value": "stock_analysis", "label": "Stock Analysis", "formats": ["json"]},
             ],
         },
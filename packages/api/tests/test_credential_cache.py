@@ -0,0 +1,310 @@
+"""Tests for the in-process credential cache."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from maverick_api.auth.api_key import APIKeyAuthStrategy
+from maverick_api.auth.credential_cache import (
+    MISSING,
+    CredentialCache,
+    CredentialCacheSync,
+    UsageRecorder,
+    api_key_tag,
+)
+from maverick_api.auth.jwt import JWTAuthStrategy
+from maverick_schemas.base import Tier
+
+
+class FakePubSub:
+    def __init__(self, redis):
+        self.redis = redis
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    async def subscribe(self, channel):
+        self.redis.subscribers.append(self)
+
+    async def get_message(self, ignore_subscribe_messages=True, timeout=1.0):
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def unsubscribe(self, channel):
+        self.redis.subscribers.remove(self)
+
+    async def reset(self):
+        pass
+
+
+class FakeRedis:
+    """Minimal async Redis that records every round trip."""
+
+    def __init__(self):
+        self.hashes: dict[str, dict[bytes, bytes]] = {}
+        self.values: dict[str, bytes] = {}
+        self.counters: dict[str, int] = {}
+        self.subscribers: list[FakePubSub] = []
+        self.calls: list[str] = []
+
+    async def hgetall(self, key):
+        self.calls.append("hgetall")
+        return dict(self.hashes.get(key, {}))
+
+    async def hset(self, key, field=None, value=None, mapping=None):
+        self.calls.append("hset")
+        self._hset(key, field, value, mapping)
+
+    def _hset(self, key, field=None, value=None, mapping=None):
+        mapping = mapping or {field: value}
+        self.hashes.setdefault(key, {}).update(
+            {str(f).encode(): str(v).encode() for f, v in mapping.items()}
+        )
+
+    async def exists(self, key):
+        self.calls.append("exists")
+        return int(key in self.hashes)
+
+    async def sadd(self, key, *members):
+        self.calls.append("sadd")
+
+    async def get(self, key):
+        self.calls.append("get")
+        return self.values.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.calls.append("setex")
+        self.values[key] = str(value).encode()
+
+    async def publish(self, channel, message):
+        self.calls.append("publish")
+        for subscriber in self.subscribers:
+            subscriber.queue.put_nowait({"type": "message", "data": message.encode()})
+
+    def pubsub(self):
+        return FakePubSub(self)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    def hset(self, key, field, value):
+        self.ops.append(lambda: self.redis._hset(key, field, value))
+
+    def incrby(self, key, amount):
+        def op():
+            self.redis.counters[key] = self.redis.counters.get(key, 0) + amount
+        self.ops.append(op)
+
+    def expire(self, key, ttl):
+        self.ops.append(lambda: None)
+
+    async def execute(self):
+        self.redis.calls.append("pipeline")
+        return [op() for op in self.ops]
+
+
+def request_with(header: str, value: str):
+    request = MagicMock()
+    request.headers.get.side_effect = lambda name: value if name == header else None
+    return request
+
+
+@pytest.fixture
+def cache():
+    cache = CredentialCache()
+    cache.subscribed = True
+    return cache
+
+
+class TestCredentialCache:
+    """Test bounded, tagged, TTL'd entries."""
+
+    def test_lru_bound_and_tag_invalidation(self, cache):
+        cache.max_entries = 2
+        cache.set("a", 1, tags=("user:1",))
+        cache.set("b", 2, tags=("user:1",))
+        cache.get("a")
+        cache.set("c", 3, tags=("user:2",))
+
+        assert cache.get("b") is MISSING
+        assert cache.invalidate("user:1") == 1
+        assert cache.get("a") is MISSING and cache.get("c") == 3
+
+    def test_short_lifetime_without_subscription(self, monkeypatch):
+        cache = CredentialCache(ttl=60.0)
+        now = [1000.0]
+        monkeypatch.setattr(
+            "maverick_api.auth.credential_cache.time.monotonic", lambda: now[0]
+        )
+        cache.set("a", 1)
+        now[0] += 1.5
+        assert cache.get("a") is MISSING
+
+
+    def test_invalidation_during_load_discards_result(self, cache):
+        generation = cache.generation()
+        cache.invalidate("user:1")
+
+        cache.set("a", 1, tags=("user:1",), generation=generation)
+        cache.set("b", 2, tags=("user:2",), generation=generation)
+        assert cache.get("a") is MISSING and cache.get("b") == 2
+
+    def test_pruned_invalidations_discard_older_loads(self, cache):
+        cache.max_entries = 2
+        generation = cache.generation()
+        cache.invalidate("user:1", "user:2", "user:3")
+
+        cache.set("a", 1, tags=("user:9",), generation=generation)
+        cache.set("b", 2, tags=("user:9",), generation=cache.generation())
+        assert cache.get("a") is MISSING and cache.get("b") == 2
+
+
+class SlowRedis(FakeRedis):
+    """FakeRedis whose reads wait until released."""
+
+    def __init__(self):
+        super().__init__()
+        self.reading = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def _pause(self):
+        self.reading.set()
+        await self.release.wait()
+
+    async def hgetall(self, key):
+        result = await super().hgetall(key)
+        await self._pause()
+        return result
+
+    async def get(self, key):
+        result = await super().get(key)
+        await self._pause()
+        return result
+
+
+class TestAPIKeyHotPath:
+    """Test warm API keys skip Redis entirely."""
+
+    @pytest.mark.asyncio
+    async def test_warm_key_makes_no_redis_calls(self, cache):
+        redis = FakeRedis()
+        usage = UsageRecorder()
+        usage.scheduled = True
+        strategy = APIKeyAuthStrategy(redis=redis, cache=cache, usage=usage)
+        key, _ = await strategy.create_key("u1", "bot", tier=Tier.PRO, rate_limit=500)
+
+        request = request_with(strategy.HEADER_NAME, key)
+        first = await strategy.authenticate(request)
+        redis.calls.clear()
+        for _ in range(10):
+            user = await strategy.authenticate(request)
+
+        assert user == first and user.rate_limit == 500
+        assert redis.calls == []
+
+        assert await usage.flush(redis) == 11
+        assert redis.calls == ["pipeline"]
+        assert sum(redis.counters.values()) == 11
+        assert b"last_used" in redis.hashes[f"api_key:{key}"]
+
+    @pytest.mark.asyncio
+    async def test_revoke_invalidates_cached_key(self, cache):
+        redis = FakeRedis()
+        strategy = APIKeyAuthStrategy(redis=redis, cache=cache)
+        key, _ = await strategy.create_key("u1", "bot")
+        request = request_with(strategy.HEADER_NAME, key)
+
+        assert await strategy.authenticate(request) is not None
+        assert await strategy.revoke_key(key)
+        assert "publish" in redis.calls
+        assert await strategy.authenticate(request) is None
+
+
+    @pytest.mark.asyncio
+    async def test_revocation_during_load_is_not_overwritten(self, cache):
+        redis = SlowRedis()
+        strategy = APIKeyAuthStrategy(redis=redis, cache=cache)
+        key, _ = await strategy.create_key("u1", "bot")
+        request = request_with(strategy.HEADER_NAME, key)
+
+        pending = asyncio.create_task(strategy.authenticate(request))
+        await redis.reading.wait()
+        await strategy.revoke_key(key)
+        redis.release.set()
+        await pending
+
+        assert cache.get(api_key_tag(key)) is MISSING
+        assert await strategy.authenticate(request) is None
+
+
+class TestJWTBlockState:
+    """Test the per-user block flag is cached and invalidated."""
+
+    @pytest.mark.asyncio
+    async def test_block_flag_cached_until_user_blocked(self, cache):
+        from fastapi import HTTPException
+
+        redis = FakeRedis()
+        strategy = JWTAuthStrategy(secret_key="secret", redis=redis, cache=cache)
+        token = strategy.create_tokens("u1").access_token
+        request = request_with(strategy.HEADER_NAME, f"Bearer {token}")
+
+        await strategy.authenticate(request)
+        redis.calls.clear()
+        await strategy.authenticate(request)
+        assert redis.calls == []
+
+        await strategy._revoke_all_user_tokens("u1")
+        with pytest.raises(HTTPException):
+            await strategy.authenticate(request)
+
+
+    @pytest.mark.asyncio
+    async def test_block_during_load_is_not_overwritten(self, cache):
+        redis = SlowRedis()
+        redis.release.set()
+        strategy = JWTAuthStrategy(secret_key="secret", redis=redis, cache=cache)
+        redis.release.clear()
+
+        pending = asyncio.create_task(strategy._is_blocked("u1"))
+        await redis.reading.wait()
+        await strategy._revoke_all_user_tokens("u1")
+        redis.release.set()
+
+        assert await pending is False
+        assert await strategy._is_blocked("u1") is True
+
+
+class TestCredentialCacheSync:
+    """Test invalidations published by another process reach this one."""
+
+    @pytest.mark.asyncio
+    async def test_remote_invalidation_applied(self):
+        redis = FakeRedis()
+        local, remote = CredentialCache(), CredentialCache()
+        sync = CredentialCacheSync(redis, cache=local, recorder=UsageRecorder())
+        await sync.start()
+        for _ in range(50):
+            if local.subscribed:
+                break
+            await asyncio.sleep(0.01)
+
+        tag = api_key_tag("mav_live_x")
+        local.set(tag, "user", tags=(tag,))
+        assert local.get(tag) == "user"
+
+        remote_strategy = APIKeyAuthStrategy(redis=redis, cache=remote)
+        redis.hashes["api_key:mav_live_x"] = {b"user_id": b"u1"}
+        await remote_strategy.revoke_key("mav_live_x")
+        await asyncio.sleep(0.05)
+
+        assert local.get(tag) is MISSING
+        await sync.stop()
+        assert not local.subscribed and not redis.subscribers
@@ -0,0 +1,24 @@
+"""Tests for export request validation."""
+
+import pytest
+from fastapi import HTTPException
+
+from maverick_api.routers.v1 import export
+from maverick_services import ExportFormat
+
+
+class TestParseFormat:
+    """Test formats are rejected before any export starts."""
+
+    def test_known_formats(self):
+        assert export._parse_format("CSV") == ExportFormat.CSV
+        with pytest.raises(HTTPException) as exc:
+            export._parse_format("xlsx")
+        assert exc.value.status_code == 400
+
+    def test_parquet_without_pyarrow_is_bad_request(self, monkeypatch):
+        monkeypatch.setattr(export, "HAS_PYARROW", False)
+        with pytest.raises(HTTPException) as exc:
+            export._parse_format("parquet")
+        assert exc.value.status_code == 400
+        assert "pyarrow" in exc.value.detail
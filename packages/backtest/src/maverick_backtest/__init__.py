@@ -11,10 +11,11 @@ Modules:
     - visualization: Chart generation for backtest results
     - persistence: Database persistence for backtest results
     - batch: Parallel batch processing for multiple backtests
+    - timeseries: Compact columnar encoding and LTTB downsampling of series
 """
 
 # Engine
-from maverick_backtest.engine import IDataProvider, VectorBTEngine
+from maverick_backtest.engine import BacktestResultCache, IDataProvider, VectorBTEngine
 
 # Strategies
 from maverick_backtest.strategies import (
@@ -81,6 +82,14 @@ from maverick_backtest.batch import (
 # Parser
 from maverick_backtest.parser import ParsedStrategy, StrategyParser
 
+# Time series encoding
+from maverick_backtest.timeseries import (
+    DEFAULT_DISPLAY_POINTS,
+    decode_series,
+    encode_series,
+    lttb_downsample,
+)
+
 # Workflows (optional - requires langchain/langgraph)
 try:
     from maverick_backtest.workflows import (
@@ -104,6 +113,7 @@ __all__ = [
     # Engine
     "VectorBTEngine",
     "IDataProvider",
+    "BacktestResultCache",
     # Strategies - Base
     "Strategy",
     "SimpleMovingAverageStrategy",
@@ -161,4 +171,9 @@ __all__ = [
     # Parser
     "StrategyParser",
     "ParsedStrategy",
+    # Time series encoding
+    "DEFAULT_DISPLAY_POINTS",
+    "encode_series",
+    "decode_series",
+    "lttb_downsample",
 ]
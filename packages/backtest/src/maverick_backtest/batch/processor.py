@@ -216,6 +216,8 @@ class BatchProcessor:
             if all_results
             else 0.0,
         }
+        if hasattr(self.engine, "get_cache_stats"):
+            summary["result_cache"] = self.engine.get_cache_stats()
 
         logger.info(f"Batch backtest {batch_id} completed: {summary}")
 
@@ -254,6 +256,8 @@ class BatchProcessor:
                 start_date=context.start_date,
                 end_date=context.end_date,
                 initial_capital=context.initial_capital,
+                fees=context.fees,
+                slippage=context.slippage,
             )
 
             return ExecutionResult(
@@ -6,11 +6,20 @@ VectorBT-powered backtesting engine with support for:
 - Parameter optimization
 - Walk-forward analysis
 - Monte Carlo simulation
+- Content-addressed result caching
 """
 
+from maverick_backtest.engine.result_cache import (
+    BacktestResultCache,
+    backtest_cache_key,
+    data_fingerprint,
+)
 from maverick_backtest.engine.vectorbt_engine import IDataProvider, VectorBTEngine
 
 __all__ = [
     "VectorBTEngine",
     "IDataProvider",
+    "BacktestResultCache",
+    "backtest_cache_key",
+    "data_fingerprint",
 ]
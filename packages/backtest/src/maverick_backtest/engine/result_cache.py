@@ -0,0 +1,278 @@
+"""
+Content-Addressed Backtest Result Cache.
+
+A backtest is deterministic given its strategy, parameters, date range,
+engine settings and input prices. Results are cached under a hash of all
+of these, where the prices enter as a fingerprint of the OHLCV frame
+(row count, last timestamp and a checksum of the values). When the data
+changes the fingerprint and therefore the key change, so stale results
+are never served; old entries simply expire.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+import inspect
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+logger = logging.getLogger(__name__)
+
+# Configuration
+RESULT_CACHE_ENABLED = os.getenv("BACKTEST_RESULT_CACHE_ENABLED", "true").lower() == "true"
+RESULT_CACHE_TTL = int(os.getenv("BACKTEST_RESULT_CACHE_TTL", "86400"))
+RESULT_CACHE_MAX_ENTRIES = int(os.getenv("BACKTEST_RESULT_CACHE_MAX_ENTRIES", "256"))
+
+# Bump when the result layout changes
+RESULT_CACHE_VERSION = 1
+RESULT_CACHE_PREFIX = "backtest_result"
+
+
+def data_fingerprint(data: DataFrame) -> str:
+    """
+    Fingerprint an OHLCV frame.
+
+    Args:
+        data: Price data used for the backtest
+
+    Returns:
+        "<rows>:<last timestamp>:<checksum of index and values>"
+    """
+    if data.empty:
+        return "0::"
+    digest = hashlib.blake2b(
+        pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes(),
+        digest_size=16,
+    ).hexdigest()
+    return f"{len(data)}:{pd.Timestamp(data.index[-1]).isoformat()}:{digest}"
+
+
+def normalize_parameters(value: Any) -> Any:
+    """
+    Normalize strategy parameters for hashing.
+
+    Mappings are key-sorted, numpy scalars become Python numbers, integral
+    floats become ints (``2.0`` and ``2`` hash alike) and tuples become lists.
+    """
+    if isinstance(value, dict):
+        return {
+            str(k): normalize_parameters(v)
+            for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))
+        }
+    if isinstance(value, (list, tuple)):
+        return [normalize_parameters(v) for v in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def backtest_cache_key(
+    symbol: str,
+    strategy_type: str,
+    parameters: dict[str, Any],
+    start_date: str,
+    end_date: str,
+    config: dict[str, Any],
+    fingerprint: str,
+) -> str:
+    """
+    Build the content-addressed key of a backtest.
+
+    Args:
+        symbol: Stock symbol
+        strategy_type: Strategy name
+        parameters: Strategy parameters
+        start_date: Start date
+        end_date: End date
+        config: Engine settings that affect the result (capital, fees,
+            slippage, output format)
+        fingerprint: data_fingerprint() of the input frame
+
+    Returns:
+        Cache key
+    """
+    payload = json.dumps(
+        {
+            "version": RESULT_CACHE_VERSION,
+            "symbol": symbol.upper(),
+            "strategy": strategy_type,
+            "parameters": normalize_parameters(parameters),
+            "start_date": start_date,
+            "end_date": end_date,
+            "config": normalize_parameters(config),
+            "data": fingerprint,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return f"{RESULT_CACHE_PREFIX}:{hashlib.sha256(payload.encode()).hexdigest()}"
+
+
+class BacktestResultCache:
+    """
+    Result cache with hit/miss metrics.
+
+    Entries are stored in the given cache provider with a TTL. Both the
+    async ICacheProvider interface and sync cache managers (such as
+    maverick_data's CacheManager) are supported. Without a provider a
+    bounded in-process LRU is used.
+
+    Concurrent requests for the same key are coalesced so the backtest is
+    computed once.
+    """
+
+    def __init__(
+        self,
+        cache: Any | None = None,
+        ttl: int = RESULT_CACHE_TTL,
+        max_entries: int = RESULT_CACHE_MAX_ENTRIES,
+    ):
+        """
+        Initialize result cache.
+
+        Args:
+            cache: Cache provider with get(key) and set(key, value, ttl=...)
+            ttl: Entry time-to-live in seconds
+            max_entries: Capacity of the in-process fallback
+        """
+        self.cache = cache
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._local: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "stores": 0,
+            "errors": 0,
+        }
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Get a cached result (a private copy), or None."""
+        try:
+            if self.cache is None:
+                value = self._local_get(key)
+            else:
+                value = await _maybe_await(self.cache.get(key))
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.warning(f"Backtest result cache read failed: {e}")
+            value = None
+
+        if isinstance(value, dict):
+            self._stats["hits"] += 1
+            return copy.deepcopy(value)
+        self._stats["misses"] += 1
+        return None
+
+    async def set(self, key: str, result: dict[str, Any]) -> None:
+        """Store a result."""
+        value = copy.deepcopy(result)
+        try:
+            if self.cache is None:
+                self._local_set(key, value)
+            else:
+                await _maybe_await(self.cache.set(key, value, ttl=self.ttl))
+            self._stats["stores"] += 1
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.warning(f"Backtest result cache write failed: {e}")
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], dict[str, Any] | Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        """
+        Return the cached result for a key, computing and storing it on a miss.
+
+        Args:
+            key: backtest_cache_key()
+            compute: Produces the result (sync or async)
+
+        Returns:
+            Backtest result
+        """
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self._stats["coalesced"] += 1
+            return copy.deepcopy(await asyncio.shield(pending))
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self.get(key)
+            if result is None:
+                result = await _maybe_await(compute())
+                await self.set(key, result)
+            # Waiters copy from a snapshot the caller cannot mutate
+            future.set_result(copy.deepcopy(result))
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters re-raise it; don't warn about an unretrieved exception
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+            "backend": type(self.cache).__name__ if self.cache is not None else "local",
+            "local_size": len(self._local),
+            "ttl_seconds": self.ttl,
+        }
+
+    def _local_get(self, key: str) -> dict[str, Any] | None:
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires < time.monotonic():
+            del self._local[key]
+            return None
+        self._local.move_to_end(key)
+        return value
+
+    def _local_set(self, key: str, value: dict[str, Any]) -> None:
+        self._local[key] = (time.monotonic() + self.ttl, value)
+        self._local.move_to_end(key)
+        while len(self._local) > self.max_entries:
+            self._local.popitem(last=False)
+
+
+async def _maybe_await(value: Any) -> Any:
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+__all__ = [
+    "BacktestResultCache",
+    "RESULT_CACHE_ENABLED",
+    "RESULT_CACHE_TTL",
+    "backtest_cache_key",
+    "data_fingerprint",
+    "normalize_parameters",
+]
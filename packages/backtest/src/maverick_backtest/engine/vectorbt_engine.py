@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import gc
 import logging
 from datetime import datetime
@@ -12,6 +13,14 @@ import pandas as pd
 import vectorbt as vbt
 from pandas import DataFrame, Series
 
+from maverick_backtest.engine.result_cache import (
+    RESULT_CACHE_ENABLED,
+    BacktestResultCache,
+    backtest_cache_key,
+    data_fingerprint,
+)
+from maverick_backtest.timeseries import encode_series
+
 if TYPE_CHECKING:
     from maverick_core.interfaces import ICacheProvider
 
@@ -40,6 +49,7 @@ class VectorBTEngine:
     - Parameter optimization with grid search
     - Memory-efficient processing
     - Comprehensive performance metrics
+    - Content-addressed result cache for repeated backtests
     """
 
     def __init__(
@@ -47,6 +57,8 @@ class VectorBTEngine:
         data_provider: IDataProvider | None = None,
         cache: ICacheProvider | None = None,
         enable_memory_optimization: bool = True,
+        result_cache: BacktestResultCache | None = None,
+        enable_result_cache: bool = RESULT_CACHE_ENABLED,
     ):
         """Initialize VectorBT engine.
 
@@ -54,10 +66,15 @@ class VectorBTEngine:
             data_provider: Stock data provider instance
             cache: Cache provider for data persistence
             enable_memory_optimization: Enable memory optimization features
+            result_cache: Result cache to use (default: one backed by ``cache``)
+            enable_result_cache: Cache run_backtest results
         """
         self.data_provider = data_provider
         self.cache = cache
         self.enable_memory_optimization = enable_memory_optimization
+        self.result_cache = result_cache
+        if self.result_cache is None and enable_result_cache:
+            self.result_cache = BacktestResultCache(cache)
 
         # Configure VectorBT settings for optimal performance
         try:
@@ -112,7 +129,10 @@ class VectorBTEngine:
         if self.data_provider is None:
             raise ValueError("No data provider configured")
 
-        data = self.data_provider.get_stock_data(
+        # Providers are synchronous; keep the event loop free so that
+        # concurrent fetches (e.g. run_portfolio_backtest) overlap
+        data = await asyncio.to_thread(
+            self.data_provider.get_stock_data,
             symbol=symbol,
             start_date=start_date,
             end_date=end_date,
@@ -145,6 +165,8 @@ class VectorBTEngine:
         initial_capital: float = 10000.0,
         fees: float = 0.001,
         slippage: float = 0.001,
+        series_format: str = "columnar",
+        max_points: int | None = None,
     ) -> dict[str, Any]:
         """Run a vectorized backtest.
 
@@ -157,6 +179,11 @@ class VectorBTEngine:
             initial_capital: Starting capital
             fees: Trading fees (percentage)
             slippage: Slippage (percentage)
+            series_format: Encoding of equity_curve and drawdown_series:
+                "columnar", "packed" (base64 arrays) or "dict" (legacy
+                timestamp -> value mapping). See maverick_backtest.timeseries.
+            max_points: LTTB point budget for the series (e.g.
+                DEFAULT_DISPLAY_POINTS for charts); None keeps full resolution
 
         Returns:
             Dictionary with backtest results
@@ -164,6 +191,55 @@ class VectorBTEngine:
         # Fetch data
         data = await self.get_historical_data(symbol, start_date, end_date)
 
+        def simulate() -> dict[str, Any]:
+            return self._simulate(
+                data, symbol, strategy_type, parameters, start_date, end_date,
+                initial_capital, fees, slippage, series_format, max_points,
+            )
+
+        if self.result_cache is None:
+            return simulate()
+
+        key = backtest_cache_key(
+            symbol,
+            strategy_type,
+            parameters,
+            start_date,
+            end_date,
+            {
+                "initial_capital": initial_capital,
+                "fees": fees,
+                "slippage": slippage,
+                "series_format": series_format,
+                "max_points": max_points,
+            },
+            data_fingerprint(data),
+        )
+        result = await self.result_cache.get_or_compute(key, simulate)
+        result["parameters"] = parameters
+        return result
+
+    def get_cache_stats(self) -> dict[str, Any]:
+        """Get result cache hit/miss statistics."""
+        if self.result_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.result_cache.get_stats()}
+
+    def _simulate(
+        self,
+        data: DataFrame,
+        symbol: str,
+        strategy_type: str,
+        parameters: dict[str, Any],
+        start_date: str,
+        end_date: str,
+        initial_capital: float,
+        fees: float,
+        slippage: float,
+        series_format: str,
+        max_points: int | None,
+    ) -> dict[str, Any]:
+        """Generate signals and simulate the portfolio for run_backtest."""
         # Generate signals based on strategy
         entries, exits = self._generate_signals(data, strategy_type, parameters)
 
@@ -196,12 +272,8 @@ class VectorBTEngine:
         trades = self._extract_trades(portfolio)
 
         # Get equity curve
-        equity_curve = {
-            str(k): float(v) for k, v in portfolio.value().to_dict().items()
-        }
-        drawdown_series = {
-            str(k): float(v) for k, v in portfolio.drawdown().to_dict().items()
-        }
+        equity_curve = encode_series(portfolio.value(), series_format, max_points)
+        drawdown_series = encode_series(portfolio.drawdown(), series_format, max_points)
 
         if self.enable_memory_optimization:
             del portfolio, close_prices, entries, exits
@@ -220,6 +292,235 @@ class VectorBTEngine:
             "initial_capital": initial_capital,
         }
 
+    async def run_portfolio_backtest(
+        self,
+        symbols: list[str],
+        start_date: str,
+        end_date: str,
+        strategy_type: str | None = None,
+        parameters: dict[str, Any] | None = None,
+        weights: dict[str, float] | None = None,
+        rebalance: str | None = None,
+        initial_capital: float = 10000.0,
+        fees: float | dict[str, float] = 0.001,
+        slippage: float = 0.001,
+        series_format: str = "columnar",
+        max_points: int | None = None,
+    ) -> dict[str, Any]:
+        """Run one cash-sharing backtest over several symbols.
+
+        All symbols draw on a single cash balance and are simulated in one
+        vectorized run. Orders target a percentage of the total portfolio
+        value, so gains compound across holdings.
+
+        With a strategy, each symbol is bought to its target weight when its
+        entry signal fires and sold when its exit signal fires; idle weight
+        stays in cash. Without a strategy the portfolio holds the target
+        weights. In both modes a rebalance schedule resets the held symbols
+        to their target weights at the start of every period.
+
+        Args:
+            symbols: Stock symbols
+            start_date: Start date
+            end_date: End date
+            strategy_type: Optional strategy type (sma_cross, rsi, etc.)
+            parameters: Strategy parameters, shared by all symbols
+            weights: Target weight per symbol (default: equal weights);
+                must sum to at most 1
+            rebalance: Rebalance schedule ("daily", "weekly", "monthly",
+                "quarterly", "yearly" or a pandas period alias); None
+                trades only on the initial allocation and signals
+            initial_capital: Starting capital
+            fees: Trading fees (percentage), or a per-symbol mapping
+            slippage: Slippage (percentage)
+            series_format: Encoding of equity_curve and drawdown_series
+            max_points: LTTB point budget for the series
+
+        Returns:
+            Dictionary with portfolio metrics, per-asset metrics and trades
+        """
+        if not symbols:
+            raise ValueError("At least one symbol is required")
+        if len(set(symbols)) != len(symbols):
+            raise ValueError(f"Duplicate symbols: {symbols}")
+        weight_vector = self._portfolio_weights(symbols, weights)
+        fee_vector = self._portfolio_fees(symbols, fees)
+
+        frames = await asyncio.gather(
+            *(self.get_historical_data(s, start_date, end_date) for s in symbols)
+        )
+        data = dict(zip(symbols, frames))
+        # Fill gaps only within each symbol's own history; dropna then trims
+        # to the common date range instead of carrying stale prices forward
+        closes = (
+            pd.concat({s: df["close"] for s, df in data.items()}, axis=1)
+            .sort_index()
+            .ffill(limit_area="inside")
+            .dropna()
+            .astype(np.float64)
+        )
+        if len(closes) < 2:
+            raise ValueError(f"Not enough overlapping data for {symbols}")
+
+        targets = self._portfolio_targets(
+            closes, data, weight_vector, strategy_type, parameters or {}, rebalance
+        )
+
+        portfolio = vbt.Portfolio.from_orders(
+            close=closes,
+            size=targets,
+            size_type="targetpercent",
+            init_cash=initial_capital,
+            fees=fee_vector,
+            slippage=slippage,
+            freq="D",
+            cash_sharing=True,
+            group_by=True,
+            call_seq="auto",
+        )
+
+        metrics = self._extract_metrics(portfolio)
+        assets = self._extract_asset_metrics(portfolio, closes, weight_vector, initial_capital)
+        trades = self._extract_trades(portfolio, include_symbol=True)
+        equity_curve = encode_series(portfolio.value(), series_format, max_points)
+        drawdown_series = encode_series(portfolio.drawdown(), series_format, max_points)
+
+        if self.enable_memory_optimization:
+            del portfolio, data, frames
+            gc.collect()
+
+        return {
+            "symbols": symbols,
+            "strategy": strategy_type,
+            "parameters": parameters or {},
+            "weights": dict(zip(symbols, weight_vector.tolist())),
+            "rebalance": rebalance,
+            "metrics": metrics,
+            "assets": assets,
+            "trades": trades,
+            "equity_curve": equity_curve,
+            "drawdown_series": drawdown_series,
+            "start_date": start_date,
+            "end_date": end_date,
+            "initial_capital": initial_capital,
+            "data_points": len(closes),
+        }
+
+    def _portfolio_weights(
+        self, symbols: list[str], weights: dict[str, float] | None
+    ) -> np.ndarray:
+        """Validate target weights and order them like ``symbols``."""
+        if weights is None:
+            return np.full(len(symbols), 1.0 / len(symbols))
+
+        unknown = set(weights) - set(symbols)
+        if unknown:
+            raise ValueError(f"Weights given for unknown symbols: {sorted(unknown)}")
+        vector = np.array([float(weights.get(s, 0.0)) for s in symbols])
+        if (vector < 0).any():
+            raise ValueError("Weights must be non-negative")
+        if vector.sum() > 1 + 1e-9:
+            raise ValueError(f"Weights sum to {vector.sum():.4f}, must be at most 1")
+        return vector
+
+    def _portfolio_fees(
+        self, symbols: list[str], fees: float | dict[str, float]
+    ) -> np.ndarray:
+        """Per-symbol fee vector."""
+        if not isinstance(fees, dict):
+            return np.full(len(symbols), float(fees))
+
+        missing = [s for s in symbols if s not in fees]
+        if missing:
+            raise ValueError(f"Missing fees for symbols: {missing}")
+        return np.array([float(fees[s]) for s in symbols])
+
+    def _portfolio_targets(
+        self,
+        closes: DataFrame,
+        data: dict[str, DataFrame],
+        weights: np.ndarray,
+        strategy_type: str | None,
+        parameters: dict[str, Any],
+        rebalance: str | None,
+    ) -> DataFrame:
+        """Build target-percent orders; NaN means no order on that bar."""
+        index = closes.index
+        shape = closes.shape
+
+        if strategy_type is None:
+            held = np.ones(shape, dtype=bool)
+            changed = np.zeros(shape, dtype=bool)
+            changed[0] = True
+        else:
+            state = np.full(shape, np.nan)
+            for j, symbol in enumerate(closes.columns):
+                entries, exits = self._generate_signals(data[symbol], strategy_type, parameters)
+                entries = _aligned_signal(entries, data[symbol].index, index)
+                exits = _aligned_signal(exits, data[symbol].index, index)
+                # Conflicting signals on the same bar leave the position as is
+                state[entries & ~exits, j] = 1.0
+                state[exits & ~entries, j] = 0.0
+            held = pd.DataFrame(state).ffill().fillna(0.0).to_numpy() > 0
+            previous = np.vstack([np.zeros((1, shape[1]), dtype=bool), held[:-1]])
+            changed = held != previous
+
+        orders = changed | self._rebalance_mask(index, rebalance)[:, None]
+        targets = np.where(held, weights, 0.0)
+        return pd.DataFrame(np.where(orders, targets, np.nan), index=index, columns=closes.columns)
+
+    def _rebalance_mask(self, index: pd.DatetimeIndex, rebalance: str | None) -> np.ndarray:
+        """True on the first bar of each rebalance period."""
+        mask = np.zeros(len(index), dtype=bool)
+        if rebalance is None:
+            return mask
+
+        aliases = {
+            "daily": "D",
+            "weekly": "W",
+            "monthly": "M",
+            "quarterly": "Q",
+            "yearly": "Y",
+            "annually": "Y",
+        }
+        periods = index.to_period(aliases.get(rebalance.lower(), rebalance)).asi8
+        mask[0] = True
+        mask[1:] = periods[1:] != periods[:-1]
+        return mask
+
+    def _extract_asset_metrics(
+        self,
+        portfolio: vbt.Portfolio,
+        closes: DataFrame,
+        weights: np.ndarray,
+        initial_capital: float,
+    ) -> dict[str, dict[str, Any]]:
+        """Per-asset breakdown of a cash-sharing portfolio."""
+        trades = portfolio.trades
+        pnl = trades.pnl.sum(group_by=False).fillna(0.0)
+        count = trades.count(group_by=False)
+        win_rate = trades.win_rate(group_by=False)
+        fees_paid = portfolio.orders.fees.sum(group_by=False).fillna(0.0)
+        final_weight = portfolio.asset_value(group_by=False).iloc[-1] / portfolio.value().iloc[-1]
+        buy_hold = closes.iloc[-1] / closes.iloc[0] - 1
+
+        def clean(value: float) -> float:
+            return 0.0 if value is None or not np.isfinite(value) else float(value)
+
+        return {
+            symbol: {
+                "target_weight": float(weights[j]),
+                "final_weight": clean(final_weight[symbol]),
+                "pnl": clean(pnl[symbol]),
+                "contribution": clean(pnl[symbol] / initial_capital),
+                "total_trades": int(count[symbol]),
+                "win_rate": clean(win_rate[symbol]),
+                "fees_paid": clean(fees_paid[symbol]),
+                "buy_and_hold_return": clean(buy_hold[symbol]),
+            }
+            for j, symbol in enumerate(closes.columns)
+        }
+
     def _generate_signals(
         self,
         data: DataFrame,
@@ -569,8 +870,16 @@ class VectorBTEngine:
             "risk_reward_ratio": self._calculate_risk_reward(portfolio),
         }
 
-    def _extract_trades(self, portfolio: vbt.Portfolio) -> list:
-        """Extract trade records from portfolio."""
+    def _extract_trades(
+        self, portfolio: vbt.Portfolio, include_symbol: bool = False
+    ) -> list:
+        """Extract trade records from portfolio.
+
+        Args:
+            portfolio: Simulated portfolio
+            include_symbol: Add each trade's column (symbol) for multi-asset
+                portfolios
+        """
         if portfolio.trades.count() == 0:
             return []
 
@@ -578,6 +887,7 @@ class VectorBTEngine:
 
         return [
             {
+                **({"symbol": str(trade.get("Column"))} if include_symbol else {}),
                 "entry_date": str(trade.get("Entry Timestamp", "")),
                 "exit_date": str(trade.get("Exit Timestamp", "")),
                 "entry_price": float(trade.get("Avg Entry Price", 0)),
@@ -797,4 +1107,10 @@ class VectorBTEngine:
             return 0.0
 
 
+def _aligned_signal(signal: Any, source: pd.Index, index: pd.Index) -> np.ndarray:
+    """Boolean signal array reindexed onto ``index`` (missing bars are False)."""
+    series = pd.Series(np.asarray(signal), index=source).fillna(False).astype(bool)
+    return series.reindex(index, fill_value=False).to_numpy(dtype=bool)
+
+
 __all__ = ["VectorBTEngine", "IDataProvider"]
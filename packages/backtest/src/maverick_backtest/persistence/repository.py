@@ -17,6 +17,7 @@ from maverick_backtest.persistence.protocols import (
     BacktestPersistenceRepository,
     DatabaseSessionProtocol,
 )
+from maverick_backtest.timeseries import series_length
 
 logger = logging.getLogger(__name__)
 
@@ -152,7 +153,7 @@ class SQLAlchemyBacktestRepository(BacktestPersistenceRepository):
                 execution_time_seconds=Decimal(str(execution_time))
                 if execution_time
                 else None,
-                data_points=len(vectorbt_results.get("equity_curve", [])),
+                data_points=series_length(vectorbt_results.get("equity_curve")),
                 # Status
                 status="completed",
                 notes=notes,
@@ -0,0 +1,281 @@
+"""
+Compact Time Series Encoding.
+
+Backtest series (equity curve, drawdown) are returned as a columnar
+envelope instead of one ``{timestamp: value}`` entry per bar:
+
+    {
+        "format": "columnar",
+        "start": "2015-01-02T00:00:00",   # first timestamp (ISO 8601)
+        "step": 86400,                     # seconds per index unit
+        "index": [1, 1, 1, 1, 3, ...],     # deltas in steps; omitted if all 1
+        "values": [10000.0, 10012.5, ...], # float32 precision
+        "dtype": "float32",
+        "length": 2520,
+        "source_length": 2520,             # bars before downsampling
+        "packed": False,
+    }
+
+The "packed" format stores the index deltas and values as little-endian
+binary arrays in base64 (``index_dtype`` names the delta width). Timestamps
+have one-second resolution; for timezone-aware series "start" is in UTC
+and "tz" names the zone. Non-finite values are encoded as ``null`` (NaN
+when packed).
+
+For display, ``lttb_downsample`` reduces a series to a point budget with the
+Largest-Triangle-Three-Buckets algorithm, which keeps peaks and troughs that
+plain decimation drops.
+"""
+
+from __future__ import annotations
+
+import base64
+import logging
+import math
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+SERIES_FORMAT = "columnar"
+
+# Point budget for charts and other display contexts
+DEFAULT_DISPLAY_POINTS = 500
+
+# Output formats accepted by encode_series
+SERIES_FORMATS = ("columnar", "packed", "dict")
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Select points with Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept. The points in between are
+    split into ``max_points - 2`` buckets, and from each bucket the point
+    forming the largest triangle with the previously selected point and the
+    average of the next bucket is kept.
+
+    Args:
+        x: Monotonic x coordinates
+        y: Values
+        max_points: Number of points to keep
+
+    Returns:
+        Sorted positions of the selected points
+    """
+    n = len(y)
+    if max_points >= n or n <= 2:
+        return np.arange(n)
+    if max_points < 3:
+        return np.array([0, n - 1])[:max(max_points, 1)]
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.nan_to_num(np.asarray(y, dtype=np.float64), nan=0.0, posinf=0.0, neginf=0.0)
+    # Bucket i covers interior points edges[i]:edges[i + 1]; the bucket after
+    # the last one is the final point
+    edges = np.floor(np.linspace(1, n - 1, max_points - 1)).astype(np.int64)
+    counts = np.diff(np.append(edges, n))
+    avg_x = (np.add.reduceat(x, edges) / counts)[1:].tolist()
+    avg_y = (np.add.reduceat(y, edges) / counts)[1:].tolist()
+
+    # Only the choice of the anchor point is sequential; run it on floats
+    xs, ys, bounds = x.tolist(), y.tolist(), edges.tolist()
+    selected = [0]
+    a = 0
+    for i in range(max_points - 2):
+        ax, ay, nx, ny = xs[a], ys[a], avg_x[i], avg_y[i]
+        dx, dy = ax - nx, ny - ay
+        best, best_area = bounds[i], -1.0
+        for j in range(bounds[i], bounds[i + 1]):
+            area = abs(dx * (ys[j] - ay) - (ax - xs[j]) * dy)
+            if area > best_area:
+                best, best_area = j, area
+        a = best
+        selected.append(a)
+    selected.append(n - 1)
+
+    return np.array(selected, dtype=np.int64)
+
+
+def lttb_downsample(series: pd.Series, max_points: int) -> pd.Series:
+    """
+    Downsample a series to at most ``max_points`` points with LTTB.
+
+    Args:
+        series: Series indexed by timestamps (or any monotonic index)
+        max_points: Point budget
+
+    Returns:
+        The selected rows of ``series`` (unchanged if already within budget)
+    """
+    if len(series) <= max_points:
+        return series
+    index = series.index
+    if isinstance(index, pd.DatetimeIndex):
+        x = index.asi8.astype(np.float64)
+    else:
+        x = np.arange(len(series), dtype=np.float64)
+    return series.iloc[lttb_indices(x, series.to_numpy(dtype=np.float64), max_points)]
+
+
+def encode_series(
+    series: pd.Series,
+    series_format: str = "columnar",
+    max_points: int | None = None,
+) -> dict[str, Any]:
+    """
+    Encode a time series for a response or for persistence.
+
+    Args:
+        series: Series with a DatetimeIndex
+        series_format: "columnar", "packed" (columnar with base64 arrays) or
+            "dict" (legacy ``{str(timestamp): value}`` mapping)
+        max_points: Optional LTTB point budget; None keeps full resolution
+
+    Returns:
+        Encoded series
+    """
+    if series_format not in SERIES_FORMATS:
+        raise ValueError(
+            f"Unknown series format: {series_format}. Use one of {SERIES_FORMATS}"
+        )
+
+    source_length = len(series)
+    if max_points is not None:
+        series = lttb_downsample(series, max_points)
+
+    if series_format == "dict":
+        return {str(k): float(v) for k, v in series.items()}
+
+    index = pd.DatetimeIndex(series.index)
+    values = series.to_numpy(dtype=np.float32)
+    packed = series_format == "packed"
+    envelope: dict[str, Any] = {
+        "format": SERIES_FORMAT,
+        "start": _utc(index)[0].isoformat() if len(index) else None,
+        "step": 1,
+        "dtype": "float32",
+        "length": len(values),
+        "source_length": source_length,
+        "packed": packed,
+    }
+    if index.tz is not None:
+        envelope["tz"] = str(index.tz)
+
+    # Delta-encode the index in units of the largest common step
+    seconds = index.asi8 // 1_000_000_000
+    deltas = np.diff(seconds)
+    if len(deltas):
+        step = math.gcd(*(int(d) for d in np.unique(deltas))) or 1
+        deltas = deltas // step
+        envelope["step"] = step
+        if not np.all(deltas == 1):
+            if packed:
+                index_dtype = _delta_dtype(int(deltas.max()))
+                envelope["index"] = _pack(deltas.astype(index_dtype))
+                envelope["index_dtype"] = np.dtype(index_dtype).name
+            else:
+                envelope["index"] = deltas.tolist()
+
+    if packed:
+        envelope["values"] = _pack(values)
+    else:
+        envelope["values"] = _float32_list(values)
+    return envelope
+
+
+def decode_series(data: dict[str, Any] | pd.Series | None) -> pd.Series:
+    """
+    Decode a series encoded by ``encode_series``.
+
+    Legacy ``{timestamp: value}`` mappings are accepted as well.
+
+    Args:
+        data: Columnar envelope, legacy mapping or Series
+
+    Returns:
+        float64 Series indexed by timestamps
+    """
+    if data is None:
+        return pd.Series(dtype=np.float64)
+    if isinstance(data, pd.Series):
+        return data
+    if data.get("format") != SERIES_FORMAT:
+        series = pd.Series(data, dtype=np.float64)
+        try:
+            series.index = pd.to_datetime(series.index)
+        except (ValueError, TypeError):
+            pass
+        return series
+
+    length = data["length"]
+    if not length:
+        return pd.Series(dtype=np.float64, index=pd.DatetimeIndex([]))
+
+    if data.get("packed"):
+        values = np.frombuffer(
+            base64.b64decode(data["values"]), dtype=np.dtype(data["dtype"]).newbyteorder("<")
+        )
+    else:
+        values = np.array(
+            [np.nan if v is None else v for v in data["values"]], dtype=data["dtype"]
+        )
+
+    if "index" in data:
+        raw = data["index"]
+        if data.get("packed"):
+            dtype = np.dtype(data["index_dtype"]).newbyteorder("<")
+            deltas = np.frombuffer(base64.b64decode(raw), dtype=dtype)
+        else:
+            deltas = np.asarray(raw)
+        offsets = np.concatenate([[0], np.cumsum(deltas, dtype=np.int64)])
+    else:
+        offsets = np.arange(length, dtype=np.int64)
+
+    start = pd.Timestamp(data["start"])
+    index = start + pd.to_timedelta(offsets * data["step"], unit="s")
+    if "tz" in data:
+        index = index.tz_convert(data["tz"])
+    return pd.Series(values.astype(np.float64), index=index)
+
+
+def series_length(data: dict[str, Any] | None) -> int:
+    """Number of points in an encoded series (columnar or legacy mapping)."""
+    if not data:
+        return 0
+    if data.get("format") == SERIES_FORMAT:
+        return int(data["length"])
+    return len(data)
+
+
+def _float32_list(values: np.ndarray) -> list[float | None]:
+    """float32 values as the shortest decimals that round-trip, NaN as None."""
+    return [float(s) if s not in ("nan", "inf", "-inf") else None for s in map(str, values)]
+
+
+def _utc(index: pd.DatetimeIndex) -> pd.DatetimeIndex:
+    return index.tz_convert("UTC") if index.tz is not None else index
+
+
+def _pack(array: np.ndarray) -> str:
+    return base64.b64encode(array.astype(array.dtype.newbyteorder("<")).tobytes()).decode("ascii")
+
+
+def _delta_dtype(max_delta: int) -> type:
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if max_delta <= np.iinfo(dtype).max:
+            return dtype
+    return np.int64
+
+
+__all__ = [
+    "DEFAULT_DISPLAY_POINTS",
+    "SERIES_FORMATS",
+    "decode_series",
+    "encode_series",
+    "lttb_downsample",
+    "lttb_indices",
+    "series_length",
+]
@@ -22,6 +22,12 @@ import seaborn as sns
 from matplotlib.colors import LinearSegmentedColormap
 from matplotlib.figure import Figure
 
+from maverick_backtest.timeseries import (
+    DEFAULT_DISPLAY_POINTS,
+    decode_series,
+    lttb_downsample,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -87,19 +93,22 @@ def image_to_base64(fig: Figure, dpi: int = 100, max_width: int = 800) -> str:
 
 
 def generate_equity_curve(
-    returns: pd.Series,
-    drawdown: pd.Series | None = None,
+    returns: pd.Series | dict[str, Any],
+    drawdown: pd.Series | dict[str, Any] | None = None,
     title: str = "Equity Curve",
     theme: str = "light",
+    max_points: int | None = DEFAULT_DISPLAY_POINTS,
 ) -> str:
     """
     Generate equity curve with optional drawdown subplot.
 
     Args:
-        returns: Cumulative returns series
-        drawdown: Optional drawdown series
+        returns: Cumulative returns series, or an encoded series from a
+            backtest result (e.g. ``result["equity_curve"]``)
+        drawdown: Optional drawdown series (Series or encoded)
         title: Chart title
         theme: Chart theme ('light' or 'dark')
+        max_points: LTTB point budget per line; None plots every point
 
     Returns:
         Base64 encoded image string
@@ -107,6 +116,14 @@ def generate_equity_curve(
     set_chart_style(theme)
 
     try:
+        returns = decode_series(returns)
+        if drawdown is not None:
+            drawdown = decode_series(drawdown)
+        if max_points is not None:
+            returns = lttb_downsample(returns, max_points)
+            if drawdown is not None:
+                drawdown = lttb_downsample(drawdown, max_points)
+
         fig, (ax1, ax2) = plt.subplots(
             2, 1, figsize=(10, 6), gridspec_kw={"height_ratios": [3, 1]}
         )
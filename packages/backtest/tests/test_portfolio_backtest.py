@@ -0,0 +1,132 @@
+"""Tests for multi-asset cash-sharing portfolio backtests."""
+
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+import vectorbt as vbt
+
+from maverick_backtest import VectorBTEngine
+from maverick_backtest.timeseries import decode_series
+
+SYMBOLS = ["AAA", "BBB", "CCC"]
+WEIGHTS = {"AAA": 0.5, "BBB": 0.3, "CCC": 0.2}
+
+
+class Provider:
+    """Random-walk prices seeded by symbol."""
+
+    def get_stock_data(self, symbol, start_date, end_date, interval="1d"):
+        rng = np.random.default_rng(sum(map(ord, symbol)))
+        index = pd.bdate_range("2020-01-01", periods=500)
+        close = 100 * np.exp(np.cumsum(rng.normal(0.0003, 0.015, len(index))))
+        return pd.DataFrame({"Close": close, "Volume": 1e6}, index=index)
+
+
+class StaggeredProvider(Provider):
+    """Prices where CCC stops trading early; fetches wait for each other."""
+
+    def __init__(self):
+        self.barrier = threading.Barrier(len(SYMBOLS), timeout=5)
+
+    def get_stock_data(self, symbol, start_date, end_date, interval="1d"):
+        self.barrier.wait()
+        data = super().get_stock_data(symbol, start_date, end_date, interval)
+        return data.iloc[:400] if symbol == "CCC" else data
+
+
+def closes() -> pd.DataFrame:
+    provider = Provider()
+    return pd.DataFrame({s: provider.get_stock_data(s, "", "")["Close"] for s in SYMBOLS})
+
+
+@pytest.fixture
+def engine():
+    return VectorBTEngine(data_provider=Provider())
+
+
+class TestPortfolioBacktest:
+    """Test shared-cash simulation against closed-form references."""
+
+    @pytest.mark.asyncio
+    async def test_buy_and_hold_compounds_weighted_holdings(self, engine):
+        result = await engine.run_portfolio_backtest(
+            SYMBOLS, "2020-01-01", "2021-12-31", weights=WEIGHTS, fees=0.0, slippage=0.0
+        )
+
+        prices = closes()
+        expected = (prices / prices.iloc[0] * pd.Series(WEIGHTS) * 10000).sum(axis=1)
+        equity = decode_series(result["equity_curve"])
+        np.testing.assert_allclose(equity.to_numpy(), expected.to_numpy(), rtol=1e-6)
+        assert result["metrics"]["total_return"] == pytest.approx(expected.iloc[-1] / 10000 - 1, rel=1e-6)
+        contributions = sum(a["contribution"] for a in result["assets"].values())
+        assert contributions == pytest.approx(result["metrics"]["total_return"], rel=1e-6)
+
+    @pytest.mark.asyncio
+    async def test_monthly_rebalance_matches_manual(self, engine):
+        result = await engine.run_portfolio_backtest(
+            SYMBOLS, "2020-01-01", "2021-12-31", weights=WEIGHTS, rebalance="monthly",
+            fees=0.0, slippage=0.0,
+        )
+
+        prices = closes()
+        weights = pd.Series(WEIGHTS)
+        shares, expected = None, []
+        for _, month in prices.groupby(prices.index.to_period("M")):
+            value = 10000.0 if shares is None else (shares * month.iloc[0]).sum()
+            shares = weights * value / month.iloc[0]
+            expected.extend((month * shares).sum(axis=1))
+        np.testing.assert_allclose(decode_series(result["equity_curve"]), expected, rtol=1e-6)
+
+    @pytest.mark.asyncio
+    async def test_signals_share_cash_in_one_simulation(self, engine, monkeypatch):
+        calls = []
+        from_orders = vbt.Portfolio.from_orders
+
+        def counting(*args, **kwargs):
+            calls.append(kwargs)
+            return from_orders(*args, **kwargs)
+
+        monkeypatch.setattr(vbt.Portfolio, "from_orders", counting)
+        result = await engine.run_portfolio_backtest(
+            SYMBOLS, "2020-01-01", "2021-12-31", strategy_type="sma_cross",
+            parameters={"fast_period": 5, "slow_period": 20},
+            fees={"AAA": 0.001, "BBB": 0.002, "CCC": 0.0},
+        )
+
+        assert len(calls) == 1 and calls[0]["cash_sharing"] and calls[0]["group_by"]
+        assert result["metrics"]["total_trades"] == len(result["trades"]) > 0
+        assert {t["symbol"] for t in result["trades"]} == set(SYMBOLS)
+        assert result["assets"]["CCC"]["fees_paid"] == 0.0
+        assert result["assets"]["BBB"]["fees_paid"] > result["assets"]["AAA"]["fees_paid"] > 0
+        assert sum(a["total_trades"] for a in result["assets"].values()) == len(result["trades"])
+
+    @pytest.mark.asyncio
+    async def test_invalid_inputs(self, engine):
+        with pytest.raises(ValueError, match="at most 1"):
+            await engine.run_portfolio_backtest(
+                SYMBOLS, "2020-01-01", "2021-12-31", weights={"AAA": 0.8, "BBB": 0.5}
+            )
+        with pytest.raises(ValueError, match="Missing fees"):
+            await engine.run_portfolio_backtest(
+                SYMBOLS, "2020-01-01", "2021-12-31", fees={"AAA": 0.001}
+            )
+        with pytest.raises(ValueError, match="unknown symbols"):
+            await engine.run_portfolio_backtest(
+                SYMBOLS, "2020-01-01", "2021-12-31", weights={"ZZZ": 0.1}
+            )
+
+    @pytest.mark.asyncio
+    async def test_concurrent_fetch_trims_to_common_range(self):
+        # The barrier only releases if all three fetches run at the same time
+        provider = StaggeredProvider()
+        engine = VectorBTEngine(data_provider=provider, enable_result_cache=False)
+        result = await engine.run_portfolio_backtest(
+            SYMBOLS, "2020-01-01", "2021-12-31", weights=WEIGHTS
+        )
+
+        last_ccc = Provider().get_stock_data("CCC", "", "").index[399]
+        equity = decode_series(result["equity_curve"])
+        assert result["data_points"] == 400
+        assert equity.index[-1] == last_ccc
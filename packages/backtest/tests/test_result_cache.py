@@ -0,0 +1,175 @@
+"""Tests for the content-addressed backtest result cache."""
+
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from maverick_backtest import BatchProcessor, VectorBTEngine
+from maverick_backtest.engine import BacktestResultCache, data_fingerprint
+
+ARGS = ("AAPL", "sma_cross", {"fast_period": 5, "slow_period": 20}, "2020-01-01", "2022-12-31")
+
+
+class Provider:
+    """Deterministic daily prices; ``shock`` changes the last close."""
+
+    def __init__(self):
+        self.shock = 0.0
+
+    def get_stock_data(self, symbol, start_date, end_date, interval="1d"):
+        rng = np.random.default_rng(7)
+        index = pd.bdate_range("2020-01-01", periods=750)
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, len(index))))
+        close[-1] += self.shock
+        return pd.DataFrame({"Close": close, "Volume": 1e6}, index=index)
+
+
+class DictCacheManager:
+    """Sync cache manager recording TTLs."""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = []
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ttl=None):
+        self.data[key] = value
+        self.ttls.append(ttl)
+        return True
+
+
+class AsyncDictCache(DictCacheManager):
+    """Async cache provider that yields to the event loop on reads."""
+
+    async def get(self, key):
+        await asyncio.sleep(0)
+        return super().get(key)
+
+    async def set(self, key, value, ttl=None):
+        return super().set(key, value, ttl)
+
+
+@pytest.fixture
+def engine():
+    engine = VectorBTEngine(data_provider=Provider())
+    generate = engine._generate_signals
+    engine.signal_calls = 0
+
+    def counting(*args, **kwargs):
+        engine.signal_calls += 1
+        return generate(*args, **kwargs)
+
+    engine._generate_signals = counting
+    return engine
+
+
+class TestResultCache:
+    """Test repeated backtests are served from the cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_run_skips_signal_generation(self, engine):
+        first = await engine.run_backtest(*ARGS)
+        first["metrics"]["sharpe_ratio"] = None
+        second = await engine.run_backtest(*ARGS)
+
+        assert engine.signal_calls == 1
+        assert second["metrics"]["sharpe_ratio"] is not None
+        stats = engine.get_cache_stats()
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+    @pytest.mark.asyncio
+    async def test_equivalent_parameters_share_an_entry(self, engine):
+        await engine.run_backtest(*ARGS)
+        params = {"slow_period": np.int64(20), "fast_period": 5.0}
+        result = await engine.run_backtest("aapl", "sma_cross", params, *ARGS[3:])
+
+        assert engine.signal_calls == 1
+        assert result["parameters"] is params
+
+    @pytest.mark.asyncio
+    async def test_config_or_data_change_misses(self, engine):
+        await engine.run_backtest(*ARGS)
+        await engine.run_backtest(*ARGS, fees=0.002)
+        assert engine.signal_calls == 2
+
+        engine.data_provider.shock = 1.0
+        await engine.run_backtest(*ARGS)
+        assert engine.signal_calls == 3
+        assert engine.get_cache_stats()["hits"] == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_runs_compute_once(self, engine):
+        engine.result_cache = BacktestResultCache(AsyncDictCache())
+        results = await asyncio.gather(*(engine.run_backtest(*ARGS) for _ in range(4)))
+
+        assert engine.signal_calls == 1
+        assert all(r["metrics"] == results[0]["metrics"] for r in results)
+        # Fetches run in threads, so a late run may find the stored result
+        stats = engine.get_cache_stats()
+        assert stats["coalesced"] + stats["hits"] == 3
+        assert stats["stores"] == 1
+
+    @pytest.mark.asyncio
+    async def test_coalesced_waiters_do_not_share_the_winners_result(self):
+        cache = BacktestResultCache()
+
+        async def compute():
+            await asyncio.sleep(0.01)
+            return {"metrics": {"sharpe": 1.0}}
+
+        async def mutating_winner():
+            result = await cache.get_or_compute("k", compute)
+            result["metrics"]["sharpe"] = -1.0
+            return result
+
+        winner = asyncio.create_task(mutating_winner())
+        await asyncio.sleep(0)
+        waiter = await cache.get_or_compute("k", compute)
+
+        assert (await winner)["metrics"]["sharpe"] == -1.0
+        assert waiter["metrics"]["sharpe"] == 1.0
+        assert cache.get_stats()["coalesced"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stored_in_cache_manager_with_ttl(self):
+        manager = DictCacheManager()
+        engine = VectorBTEngine(
+            data_provider=Provider(), result_cache=BacktestResultCache(manager, ttl=600)
+        )
+        await engine.run_backtest(*ARGS)
+
+        (key,) = manager.data
+        assert key.startswith("backtest_result:") and manager.ttls == [600]
+        assert engine.get_cache_stats()["backend"] == "DictCacheManager"
+
+    @pytest.mark.asyncio
+    async def test_batch_duplicates_run_once(self, engine):
+        config = dict(zip(
+            ("symbol", "strategy_type", "parameters", "start_date", "end_date"), ARGS
+        ))
+        result = await BatchProcessor(engine).run_batch_backtest([config] * 3)
+
+        assert result["summary"]["successful"] == 3
+        assert engine.signal_calls == 1
+        assert result["summary"]["result_cache"]["misses"] == 1
+
+    def test_fingerprint_tracks_values_and_rows(self):
+        data = Provider().get_stock_data("AAPL", "", "")
+        changed = data.copy()
+        changed.iloc[100, 0] += 0.01
+
+        assert data_fingerprint(data) == data_fingerprint(data.copy())
+        assert data_fingerprint(changed) != data_fingerprint(data)
+        assert data_fingerprint(data.iloc[:-1]).startswith("749:")
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_always_recomputes(self):
+        engine = VectorBTEngine(data_provider=Provider(), enable_result_cache=False)
+        await engine.run_backtest(*ARGS)
+
+        assert engine.result_cache is None
+        assert engine.get_cache_stats() == {"enabled": False}
@@ -0,0 +1,136 @@
+"""Tests for columnar time series encoding and LTTB downsampling."""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from maverick_backtest import VectorBTEngine, generate_equity_curve
+from maverick_backtest.timeseries import (
+    decode_series,
+    encode_series,
+    lttb_downsample,
+    lttb_indices,
+    series_length,
+)
+
+
+def equity_series(periods: int = 2520, seed: int = 0) -> pd.Series:
+    """Ten years of business-day equity values."""
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range("2015-01-01", periods=periods)
+    return pd.Series(10000 * np.exp(np.cumsum(rng.normal(0, 0.01, periods))), index=index)
+
+
+def reference_lttb(x, y, threshold):
+    """Straightforward LTTB, one bucket at a time."""
+    n = len(y)
+    every = (n - 2) / (threshold - 2)
+    selected, a = [0], 0
+    for i in range(threshold - 2):
+        start, end = int(np.floor(i * every)) + 1, int(np.floor((i + 1) * every)) + 1
+        next_end = min(int(np.floor((i + 2) * every)) + 1, n)
+        avg_x, avg_y = x[end:next_end].mean(), y[end:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        selected.append(a)
+    return np.array(selected + [n - 1])
+
+
+class TestEncoding:
+    """Test the columnar envelope round-trips."""
+
+    def test_business_days_are_delta_encoded(self):
+        series = equity_series()
+        envelope = json.loads(json.dumps(encode_series(series)))
+
+        assert envelope["step"] == 86400 and envelope["length"] == len(series)
+        assert set(envelope["index"]) == {1, 3}
+        decoded = decode_series(envelope)
+        assert decoded.index.equals(series.index)
+        np.testing.assert_allclose(decoded.to_numpy(), series.to_numpy(), rtol=1e-7)
+
+    def test_regular_index_omits_deltas(self):
+        series = pd.Series([1.0, 2.0, 3.0], index=pd.date_range("2024-01-01", periods=3, freq="h"))
+        envelope = encode_series(series)
+
+        assert "index" not in envelope and envelope["step"] == 3600
+        assert envelope["values"] == [1.0, 2.0, 3.0]
+        pd.testing.assert_series_equal(decode_series(envelope), series, check_freq=False)
+
+    def test_packed_round_trip_with_nan_and_timezone(self):
+        series = equity_series(100)
+        series.index = series.index.tz_localize("America/New_York")
+        series.iloc[5] = np.nan
+        envelope = encode_series(series, "packed")
+
+        assert envelope["packed"] and envelope["index_dtype"] == "uint8"
+        decoded = decode_series(json.loads(json.dumps(envelope)))
+        assert decoded.index.equals(series.index)
+        assert np.isnan(decoded.iloc[5])
+        np.testing.assert_allclose(decoded.dropna(), series.dropna(), rtol=1e-7)
+        assert encode_series(series)["values"][5] is None
+
+    def test_legacy_mapping_still_decodes(self):
+        series = equity_series(10)
+        legacy = encode_series(series, "dict")
+
+        assert legacy == {str(k): float(v) for k, v in series.items()}
+        assert series_length(legacy) == 10
+        pd.testing.assert_series_equal(decode_series(legacy), series, check_freq=False)
+
+    def test_payload_size_for_long_backtest(self):
+        series = equity_series()
+        legacy = len(json.dumps({str(k): float(v) for k, v in series.items()}))
+
+        assert legacy / len(json.dumps(encode_series(series))) > 3
+        assert legacy / len(json.dumps(encode_series(series, "packed"))) > 6
+        assert legacy / len(json.dumps(encode_series(series, "columnar", max_points=500))) > 10
+
+
+class TestLTTB:
+    """Test Largest-Triangle-Three-Buckets downsampling."""
+
+    @pytest.mark.parametrize("threshold", [3, 50, 500, 1999])
+    def test_matches_reference(self, threshold):
+        y = equity_series(2000, seed=threshold).to_numpy()
+        x = np.arange(2000, dtype=float)
+        np.testing.assert_array_equal(lttb_indices(x, y, threshold), reference_lttb(x, y, threshold))
+
+    def test_keeps_endpoints_and_extremes(self):
+        series = equity_series()
+        sampled = lttb_downsample(series, 200)
+
+        assert len(sampled) == 200 and sampled.index.is_monotonic_increasing
+        assert sampled.index[0] == series.index[0] and sampled.index[-1] == series.index[-1]
+        assert series.idxmax() in sampled.index and series.idxmin() in sampled.index
+        assert lttb_downsample(series, 5000) is series
+
+
+class TestEngineSeries:
+    """Test run_backtest series output."""
+
+    @pytest.fixture
+    def engine(self):
+        close = equity_series(1000, seed=4) / 100
+
+        class Provider:
+            def get_stock_data(self, symbol, start_date, end_date, interval="1d"):
+                return pd.DataFrame({"Close": close, "Volume": 1e6})
+
+        return VectorBTEngine(data_provider=Provider())
+
+    @pytest.mark.asyncio
+    async def test_full_resolution_and_display_budget(self, engine):
+        args = ("AAPL", "sma_cross", {"fast_period": 5, "slow_period": 20}, "2015-01-01", "2018-12-31")
+        full = await engine.run_backtest(*args)
+        legacy = await engine.run_backtest(*args, series_format="dict")
+        display = await engine.run_backtest(*args, series_format="packed", max_points=250)
+
+        equity = decode_series(full["equity_curve"])
+        assert len(equity) == 1000
+        np.testing.assert_allclose(equity, decode_series(legacy["equity_curve"]), rtol=1e-6)
+        assert display["equity_curve"]["length"] == 250
+        assert display["drawdown_series"]["source_length"] == 1000
+        assert generate_equity_curve(full["equity_curve"], full["drawdown_series"])
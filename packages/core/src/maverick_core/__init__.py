@@ -195,6 +195,14 @@ from maverick_core.http import (
     http_client_context,
 )
 
+# Caching
+from maverick_core.caching import (
+    LLMResponseCache,
+    get_llm_cache,
+    make_llm_cache_key,
+    reset_llm_cache,
+)
+
 __version__ = "0.1.0"
 
 __all__ = [
@@ -392,6 +400,11 @@ __all__ = [
     "get_http_client",
     "close_http_client",
     "http_client_context",
+    # Caching
+    "LLMResponseCache",
+    "get_llm_cache",
+    "make_llm_cache_key",
+    "reset_llm_cache",
     # Version
     "__version__",
 ]
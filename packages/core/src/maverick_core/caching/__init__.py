@@ -0,0 +1,30 @@
+"""
+Caching utilities shared across maverick packages.
+
+Provides a content-addressed LLM response cache with local and Redis tiers,
+and the Redis client factories used by shared cache tiers and stores.
+"""
+
+from maverick_core.caching.llm_cache import (
+    LLMResponseCache,
+    get_llm_cache,
+    get_llm_model_id,
+    make_llm_cache_key,
+    normalize_llm_content,
+    reset_llm_cache,
+)
+from maverick_core.caching.redis_client import (
+    create_async_redis_client,
+    create_redis_client,
+)
+
+__all__ = [
+    "create_async_redis_client",
+    "create_redis_client",
+    "LLMResponseCache",
+    "get_llm_cache",
+    "get_llm_model_id",
+    "make_llm_cache_key",
+    "normalize_llm_content",
+    "reset_llm_cache",
+]
@@ -0,0 +1,424 @@
+"""
+Content-addressed LLM response cache.
+
+Caches raw LLM response text keyed on a hash of (model id, prompt template
+version, normalized content, persona), so repeated analyses of the same
+article or transcript are served without another LLM call.
+
+Tiers:
+    - Local: bounded in-process LRU with TTL and byte-size eviction
+    - Shared: optional Redis tier (``redis.asyncio``) so replicas share results
+
+Concurrent misses for the same key are coalesced: within a process only one
+caller computes while the rest await its result, and across processes a
+Redis ``SET NX`` lock makes other replicas wait for the shared entry instead
+of issuing duplicate LLM calls.
+
+Usage:
+    from maverick_core.caching import get_llm_cache, make_llm_cache_key
+
+    cache = get_llm_cache()
+    key = make_llm_cache_key(
+        model_id="openai/gpt-4o-mini",
+        prompt_version="content_analysis:v1",
+        content=article_text,
+        persona="moderate",
+    )
+    text = await cache.get_or_compute(key, call_llm)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from maverick_core.caching.redis_client import create_async_redis_client
+from maverick_core.config.base import get_env_bool, get_env_int
+
+logger = logging.getLogger(__name__)
+
+# Default configuration
+DEFAULT_LLM_CACHE_TTL = get_env_int("LLM_CACHE_TTL_SECONDS", 86400)
+DEFAULT_LLM_CACHE_MAX_ENTRIES = get_env_int("LLM_CACHE_MAX_ENTRIES", 2048)
+DEFAULT_LLM_CACHE_MAX_MB = get_env_int("LLM_CACHE_MAX_MB", 64)
+LLM_CACHE_KEY_PREFIX = "llm:v1:"
+
+# Release the distributed lock only if we still own it
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+def normalize_llm_content(content: str) -> str:
+    """Normalize content so whitespace-only differences share a cache entry."""
+    return " ".join(content.split())
+
+
+def get_llm_model_id(llm: Any) -> str:
+    """Best-effort model identifier for an LLM client, used in cache keys."""
+    for attr in ("model_name", "model", "model_id"):
+        value = getattr(llm, attr, None)
+        if isinstance(value, str) and value:
+            return value
+    return type(llm).__name__
+
+
+def make_llm_cache_key(
+    model_id: str | None,
+    prompt_version: str,
+    content: str,
+    persona: str | None = None,
+) -> str:
+    """
+    Build a content-addressed cache key for an LLM call.
+
+    Args:
+        model_id: Model identifier the prompt is sent to
+        prompt_version: Prompt template name and version, e.g. "summary:v2".
+            Bump the version whenever the template changes.
+        content: Content (or fully rendered prompt) sent to the model
+        persona: Investor persona the analysis is written for
+
+    Returns:
+        Cache key string
+    """
+    payload = json.dumps(
+        [
+            model_id or "default",
+            prompt_version,
+            (persona or "").lower(),
+            normalize_llm_content(content),
+        ],
+        ensure_ascii=False,
+    )
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return f"{LLM_CACHE_KEY_PREFIX}{digest}"
+
+
+class LLMResponseCache:
+    """
+    Two-tier cache of LLM response text with stampede protection.
+
+    The local tier is always available. The Redis tier is used when a client
+    is supplied; Redis errors disable it for a short cooldown rather than
+    failing the LLM call path.
+    """
+
+    def __init__(
+        self,
+        redis_client: Any | None = None,
+        default_ttl: int = DEFAULT_LLM_CACHE_TTL,
+        max_entries: int = DEFAULT_LLM_CACHE_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_LLM_CACHE_MAX_MB * 1024 * 1024,
+        lock_timeout: float = 60.0,
+        remote_cooldown: float = 30.0,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            redis_client: Optional ``redis.asyncio.Redis`` client for the shared tier
+            default_ttl: Default entry TTL in seconds
+            max_entries: Maximum entries in the local tier
+            max_bytes: Maximum total size of cached text in the local tier
+            lock_timeout: Seconds to wait for another replica's in-flight result
+            remote_cooldown: Seconds to skip Redis after a connection error
+        """
+        self._redis = redis_client
+        self._default_ttl = default_ttl
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._lock_timeout = lock_timeout
+        self._remote_cooldown = remote_cooldown
+        self._remote_disabled_until = 0.0
+
+        # key -> (expires_at monotonic, value)
+        self._local: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._local_bytes = 0
+        self._inflight: dict[str, asyncio.Future[str | None]] = {}
+        self._stats = {
+            "local_hits": 0,
+            "remote_hits": 0,
+            "misses": 0,
+            "computes": 0,
+            "coalesced": 0,
+            "evictions": 0,
+            "remote_errors": 0,
+        }
+
+    # Local tier
+
+    def _local_get(self, key: str) -> str | None:
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._local_delete(key)
+            return None
+        self._local.move_to_end(key)
+        return value
+
+    def _local_set(self, key: str, value: str, ttl: int) -> None:
+        self._local_delete(key)
+        self._local[key] = (time.monotonic() + ttl, value)
+        self._local_bytes += len(value)
+
+        while self._local and (
+            len(self._local) > self._max_entries or self._local_bytes > self._max_bytes
+        ):
+            oldest_key = next(iter(self._local))
+            self._local_delete(oldest_key)
+            self._stats["evictions"] += 1
+
+    def _local_delete(self, key: str) -> bool:
+        entry = self._local.pop(key, None)
+        if entry is None:
+            return False
+        self._local_bytes -= len(entry[1])
+        return True
+
+    # Shared tier
+
+    def _remote_available(self) -> bool:
+        return (
+            self._redis is not None
+            and time.monotonic() >= self._remote_disabled_until
+        )
+
+    def _remote_failed(self, operation: str, error: Exception) -> None:
+        self._stats["remote_errors"] += 1
+        self._remote_disabled_until = time.monotonic() + self._remote_cooldown
+        logger.warning(
+            f"LLM cache Redis {operation} failed, using local tier for "
+            f"{self._remote_cooldown:.0f}s: {error}"
+        )
+
+    async def _remote_get(self, key: str) -> str | None:
+        if not self._remote_available():
+            return None
+        try:
+            value = await self._redis.get(key)
+        except Exception as e:
+            self._remote_failed("get", e)
+            return None
+        if isinstance(value, bytes):
+            value = value.decode("utf-8")
+        return value
+
+    async def _remote_set(self, key: str, value: str, ttl: int) -> None:
+        if not self._remote_available():
+            return
+        try:
+            await self._redis.set(key, value, ex=ttl)
+        except Exception as e:
+            self._remote_failed("set", e)
+
+    async def _acquire_remote_lock(self, key: str) -> str | None:
+        """Try to take the cross-process compute lock; return its token."""
+        if not self._remote_available():
+            return None
+        token = uuid.uuid4().hex
+        try:
+            acquired = await self._redis.set(
+                f"{key}:lock", token, nx=True, px=int(self._lock_timeout * 1000)
+            )
+        except Exception as e:
+            self._remote_failed("lock", e)
+            return None
+        return token if acquired else ""
+
+    async def _release_remote_lock(self, key: str, token: str) -> None:
+        try:
+            await self._redis.eval(_RELEASE_LOCK_SCRIPT, 1, f"{key}:lock", token)
+        except Exception as e:
+            self._remote_failed("unlock", e)
+
+    async def _wait_for_remote(self, key: str) -> str | None:
+        """Wait for another replica to publish the value for ``key``."""
+        deadline = time.monotonic() + self._lock_timeout
+        delay = 0.05
+        while time.monotonic() < deadline and self._remote_available():
+            await asyncio.sleep(delay)
+            value = await self._remote_get(key)
+            if value is not None:
+                return value
+            delay = min(delay * 2, 1.0)
+        return None
+
+    # Public API
+
+    async def get(self, key: str) -> str | None:
+        """Get a cached response, checking the local tier before Redis."""
+        value = self._local_get(key)
+        if value is not None:
+            self._stats["local_hits"] += 1
+            return value
+
+        value = await self._remote_get(key)
+        if value is not None:
+            self._stats["remote_hits"] += 1
+            self._local_set(key, value, self._default_ttl)
+            return value
+
+        self._stats["misses"] += 1
+        return None
+
+    async def set(self, key: str, value: str, ttl: int | None = None) -> None:
+        """Store a response in both tiers."""
+        resolved_ttl = ttl if ttl is not None else self._default_ttl
+        self._local_set(key, value, resolved_ttl)
+        await self._remote_set(key, value, resolved_ttl)
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[str | None]],
+        ttl: int | None = None,
+    ) -> str | None:
+        """
+        Return the cached response for ``key`` or compute and cache it.
+
+        Only one caller per key runs ``compute`` at a time. ``compute`` may
+        return None to signal an unusable response, which is not cached.
+
+        Args:
+            key: Cache key from ``make_llm_cache_key``
+            compute: Coroutine factory performing the LLM call
+            ttl: Entry TTL in seconds (defaults to the cache default)
+
+        Returns:
+            Response text, or None if ``compute`` produced nothing cacheable
+        """
+        value = await self.get(key)
+        if value is not None:
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self._stats["coalesced"] += 1
+            value = await asyncio.shield(inflight)
+            if value is not None:
+                return value
+            return await compute()
+
+        future: asyncio.Future[str | None] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._inflight[key] = future
+        value = None
+        try:
+            token = await self._acquire_remote_lock(key)
+            if token == "":
+                # Another replica is computing this entry
+                value = await self._wait_for_remote(key)
+                if value is not None:
+                    self._stats["remote_hits"] += 1
+                    self._local_set(key, value, ttl or self._default_ttl)
+                    return value
+
+            try:
+                self._stats["computes"] += 1
+                value = await compute()
+                if value is not None:
+                    await self.set(key, value, ttl)
+            finally:
+                if token:
+                    await self._release_remote_lock(key, token)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+            if not future.done():
+                future.set_result(value)
+
+    async def delete(self, key: str) -> bool:
+        """Delete a response from both tiers."""
+        deleted = self._local_delete(key)
+        if self._remote_available():
+            try:
+                deleted = bool(await self._redis.delete(key)) or deleted
+            except Exception as e:
+                self._remote_failed("delete", e)
+        return deleted
+
+    def clear_local(self) -> int:
+        """Clear the local tier and return the number of entries removed."""
+        count = len(self._local)
+        self._local.clear()
+        self._local_bytes = 0
+        return count
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        hits = self._stats["local_hits"] + self._stats["remote_hits"]
+        total_requests = hits + self._stats["misses"]
+        hit_rate = (hits / total_requests * 100) if total_requests > 0 else 0
+
+        return {
+            **self._stats,
+            "local_size": len(self._local),
+            "local_max_entries": self._max_entries,
+            "local_bytes": self._local_bytes,
+            "local_max_bytes": self._max_bytes,
+            "remote_enabled": self._redis is not None,
+            "remote_available": self._remote_available(),
+            "hit_rate_percent": round(hit_rate, 2),
+        }
+
+
+def _create_redis_client() -> Any | None:
+    """Create an async Redis client for the shared tier, if configured."""
+    if not get_env_bool("LLM_CACHE_REDIS_ENABLED", True):
+        return None
+    return create_async_redis_client(os.getenv("LLM_CACHE_REDIS_URL"))
+
+
+# Global cache instance with thread-safe initialization
+_llm_cache: LLMResponseCache | None = None
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResponseCache | None:
+    """
+    Get or create the global LLM response cache.
+
+    Returns None when disabled with ``LLM_CACHE_ENABLED=false``.
+    """
+    global _llm_cache
+
+    if not get_env_bool("LLM_CACHE_ENABLED", True):
+        return None
+
+    if _llm_cache is not None:
+        return _llm_cache
+
+    with _llm_cache_lock:
+        if _llm_cache is None:
+            redis_client = None
+            try:
+                redis_client = _create_redis_client()
+            except Exception as e:
+                logger.warning(f"LLM cache Redis tier unavailable: {e}")
+            _llm_cache = LLMResponseCache(redis_client=redis_client)
+
+    return _llm_cache
+
+
+def reset_llm_cache() -> None:
+    """Reset the global LLM response cache (for testing)."""
+    global _llm_cache
+
+    with _llm_cache_lock:
+        _llm_cache = None
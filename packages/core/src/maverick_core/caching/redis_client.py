@@ -0,0 +1,73 @@
+"""
+Redis client factories for shared cache tiers.
+
+Redis is an optional dependency of maverick-core; callers get None when the
+client library is missing so caches can run local-only.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def create_async_redis_client(
+    url: str | None = None, decode_responses: bool = True
+) -> Any | None:
+    """
+    Create a ``redis.asyncio`` client from settings.
+
+    Args:
+        url: Redis URL (defaults to the configured Redis settings)
+        decode_responses: Return ``str`` instead of ``bytes`` values
+
+    Returns:
+        Async Redis client, or None if redis is not installed
+    """
+    try:
+        import redis.asyncio as aioredis
+    except ImportError:
+        logger.debug("redis not installed, shared cache tier disabled")
+        return None
+
+    from maverick_core.config import get_settings
+
+    redis_settings = get_settings().redis
+    return aioredis.Redis.from_url(
+        url or redis_settings.url,
+        decode_responses=decode_responses,
+        socket_timeout=redis_settings.socket_timeout,
+        socket_connect_timeout=redis_settings.socket_timeout,
+    )
+
+
+def create_redis_client(
+    url: str | None = None, decode_responses: bool = True
+) -> Any | None:
+    """
+    Create a synchronous ``redis`` client from settings.
+
+    Args:
+        url: Redis URL (defaults to the configured Redis settings)
+        decode_responses: Return ``str`` instead of ``bytes`` values
+
+    Returns:
+        Redis client, or None if redis is not installed
+    """
+    try:
+        import redis
+    except ImportError:
+        logger.debug("redis not installed, shared store disabled")
+        return None
+
+    from maverick_core.config import get_settings
+
+    redis_settings = get_settings().redis
+    return redis.Redis.from_url(
+        url or redis_settings.url,
+        decode_responses=decode_responses,
+        socket_timeout=redis_settings.socket_timeout,
+        socket_connect_timeout=redis_settings.socket_timeout,
+    )
@@ -139,6 +139,26 @@ class AsyncHTTPClient:
             timeout=timeout,
         )
 
+    async def head(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> httpx.Response:
+        """
+        Make HEAD request.
+
+        Args:
+            url: Request URL
+            headers: Additional headers
+            timeout: Override default timeout
+
+        Returns:
+            HTTP response
+        """
+        client = await self._ensure_client()
+        return await client.head(url, headers=headers, timeout=timeout)
+
     async def post(
         self,
         url: str,
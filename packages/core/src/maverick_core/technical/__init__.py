@@ -2,9 +2,14 @@
 Technical analysis utilities.
 
 Pure functions for calculating technical indicators.
-No external dependencies beyond numpy/pandas.
+No external dependencies beyond numpy/pandas; kernels use Numba when installed.
 """
 
+from maverick_core.technical.graph import (
+    INDICATORS,
+    IndicatorGraph,
+    compute_indicators,
+)
 from maverick_core.technical.indicators import (
     calculate_atr,
     calculate_bollinger_bands,
@@ -42,4 +47,8 @@ __all__ = [
     "calculate_obv",
     # Support/Resistance
     "calculate_support_resistance",
+    # Multi-indicator computation
+    "INDICATORS",
+    "IndicatorGraph",
+    "compute_indicators",
 ]
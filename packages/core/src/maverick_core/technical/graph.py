@@ -0,0 +1,329 @@
+"""
+Shared indicator computation graph.
+
+Most indicators are built from a few intermediates: EMAs, Wilder averages,
+rolling extremes and moments of a column, and the true range. An
+``IndicatorGraph`` memoizes every intermediate it computes for one OHLCV
+frame, so indicators evaluated on the same graph share them (Bollinger Bands
+reuse the SMA's rolling mean, Stochastic and Williams %R the rolling
+High/Low extremes, MACD the EMAs).
+
+``compute_indicators`` evaluates a requested set in one pass and returns a
+single float64 column block:
+
+    compute_indicators(df, ["rsi", "macd", "bbands_20_2", "atr_14", "stoch"])
+
+Specs are an indicator name optionally followed by its parameters, separated
+by underscores, in the order of the corresponding ``IndicatorGraph`` method.
+"""
+
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from maverick_core.technical import kernels
+
+# Indicators available to compute_indicators (IndicatorGraph method names)
+INDICATORS = (
+    "sma",
+    "ema",
+    "rsi",
+    "macd",
+    "bbands",
+    "atr",
+    "stoch",
+    "williams_r",
+    "obv",
+)
+
+
+class IndicatorGraph:
+    """
+    Memoized indicator intermediates over one OHLCV frame.
+
+    Indicator methods return float64 arrays aligned with the frame (or dicts
+    of arrays for multi-line indicators).
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        """
+        Initialize graph.
+
+        Args:
+            data: OHLCV DataFrame
+        """
+        self.data = data
+        self._nodes: dict[tuple, Any] = {}
+
+    def _node(self, key: tuple, compute: Callable[[], Any]) -> Any:
+        if key not in self._nodes:
+            self._nodes[key] = compute()
+        return self._nodes[key]
+
+    # -------------------------------------------------------------------------
+    # Intermediates
+    # -------------------------------------------------------------------------
+
+    def column(self, name: str) -> np.ndarray:
+        """Column values as float64 (raises KeyError if missing)."""
+        return self._node(
+            ("column", name), lambda: self.data[name].to_numpy(dtype=np.float64)
+        )
+
+    def diff(self, column: str = "Close") -> np.ndarray:
+        """First difference of a column."""
+
+        def compute() -> np.ndarray:
+            values = self.column(column)
+            out = np.empty_like(values)
+            out[:1] = np.nan
+            np.subtract(values[1:], values[:-1], out=out[1:])
+            return out
+
+        return self._node(("diff", column), compute)
+
+    def ewm(self, column: str, alpha: float, min_periods: int = 0) -> np.ndarray:
+        """Exponentially weighted mean of a column (adjust=False)."""
+        return self._node(
+            ("ewm", column, alpha, min_periods),
+            lambda: kernels.ewm_mean(self.column(column), alpha, min_periods),
+        )
+
+    def rolling_moments(
+        self, column: str, window: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Rolling mean and sample standard deviation of a column."""
+        return self._node(
+            ("moments", column, window),
+            lambda: kernels.rolling_mean_std(self.column(column), window),
+        )
+
+    def rolling_min(self, column: str, window: int) -> np.ndarray:
+        """Rolling minimum of a column."""
+        return self._node(
+            ("min", column, window),
+            lambda: kernels.rolling_min(self.column(column), window),
+        )
+
+    def rolling_max(self, column: str, window: int) -> np.ndarray:
+        """Rolling maximum of a column."""
+        return self._node(
+            ("max", column, window),
+            lambda: kernels.rolling_max(self.column(column), window),
+        )
+
+    def true_range(self) -> np.ndarray:
+        """True range from High, Low and Close."""
+        return self._node(
+            ("true_range",),
+            lambda: kernels.true_range(
+                self.column("High"), self.column("Low"), self.column("Close")
+            ),
+        )
+
+    def pivots(self, column: str, window: int, find_max: bool) -> np.ndarray:
+        """Pivot mask of a column (see kernels.pivot_mask)."""
+        return self._node(
+            ("pivots", column, window, find_max),
+            lambda: kernels.pivot_mask(self.column(column), window, find_max),
+        )
+
+    # -------------------------------------------------------------------------
+    # Indicators
+    # -------------------------------------------------------------------------
+
+    def sma(self, period: int = 20, column: str = "Close") -> np.ndarray:
+        """Simple Moving Average."""
+        _check_period(period)
+        return self.rolling_moments(column, period)[0]
+
+    def ema(self, period: int = 20, column: str = "Close") -> np.ndarray:
+        """Exponential Moving Average (span ``period``)."""
+        _check_period(period)
+        return self.ewm(column, 2.0 / (period + 1))
+
+    def rsi(self, period: int = 14, column: str = "Close") -> np.ndarray:
+        """Relative Strength Index with Wilder's smoothing."""
+        _check_period(period)
+
+        def compute() -> np.ndarray:
+            delta = self.diff(column)
+            gains = np.where(delta > 0, delta, 0.0)
+            losses = np.where(delta < 0, -delta, 0.0)
+            avg_gain = kernels.ewm_mean(gains, 1.0 / period, period)
+            avg_loss = kernels.ewm_mean(losses, 1.0 / period, period)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+            rsi[np.isinf(rsi)] = 100
+            return rsi
+
+        return self._node(("rsi", column, period), compute)
+
+    def macd(
+        self,
+        fast_period: int = 12,
+        slow_period: int = 26,
+        signal_period: int = 9,
+        column: str = "Close",
+    ) -> dict[str, np.ndarray]:
+        """MACD line, signal line and histogram."""
+        if fast_period < 1 or slow_period < 1 or signal_period < 1:
+            raise ValueError("All periods must be >= 1")
+        if fast_period >= slow_period:
+            raise ValueError(
+                f"Fast period ({fast_period}) must be < slow period ({slow_period})"
+            )
+
+        def compute() -> dict[str, np.ndarray]:
+            macd_line = self.ema(fast_period, column) - self.ema(slow_period, column)
+            signal_line = kernels.ewm_mean(macd_line, 2.0 / (signal_period + 1))
+            return {
+                "macd": macd_line,
+                "signal": signal_line,
+                "histogram": macd_line - signal_line,
+            }
+
+        return self._node(
+            ("macd", column, fast_period, slow_period, signal_period), compute
+        )
+
+    def bbands(
+        self, period: int = 20, std_dev: float = 2.0, column: str = "Close"
+    ) -> dict[str, np.ndarray]:
+        """Bollinger Bands and bandwidth."""
+        _check_period(period)
+        if std_dev < 0:
+            raise ValueError(f"Standard deviation must be >= 0, got {std_dev}")
+
+        def compute() -> dict[str, np.ndarray]:
+            middle, rolling_std = self.rolling_moments(column, period)
+            upper = middle + std_dev * rolling_std
+            lower = middle - std_dev * rolling_std
+            with np.errstate(divide="ignore", invalid="ignore"):
+                bandwidth = (upper - lower) / middle * 100
+            return {
+                "upper": upper,
+                "middle": middle,
+                "lower": lower,
+                "bandwidth": bandwidth,
+            }
+
+        return self._node(("bbands", column, period, std_dev), compute)
+
+    def atr(self, period: int = 14) -> np.ndarray:
+        """Average True Range with Wilder's smoothing."""
+        _check_period(period)
+        return self._node(
+            ("atr", period),
+            lambda: kernels.ewm_mean(self.true_range(), 1.0 / period, period),
+        )
+
+    def stoch(self, k_period: int = 14, d_period: int = 3) -> dict[str, np.ndarray]:
+        """Stochastic Oscillator %K and %D."""
+        if k_period < 1 or d_period < 1:
+            raise ValueError("All periods must be >= 1")
+
+        def compute() -> dict[str, np.ndarray]:
+            lowest_low = self.rolling_min("Low", k_period)
+            highest_high = self.rolling_max("High", k_period)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                k = (self.column("Close") - lowest_low) / (highest_high - lowest_low) * 100
+            d = kernels.rolling_mean_std(k, d_period)[0]
+            return {"k": k, "d": d}
+
+        return self._node(("stoch", k_period, d_period), compute)
+
+    def williams_r(self, period: int = 14) -> np.ndarray:
+        """Williams %R."""
+        _check_period(period)
+
+        def compute() -> np.ndarray:
+            highest_high = self.rolling_max("High", period)
+            lowest_low = self.rolling_min("Low", period)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return (
+                    (highest_high - self.column("Close"))
+                    / (highest_high - lowest_low)
+                    * -100
+                )
+
+        return self._node(("williams_r", period), compute)
+
+    def obv(self) -> np.ndarray:
+        """On-Balance Volume."""
+
+        def compute() -> np.ndarray:
+            flow = self.column("Volume") * np.sign(self.diff("Close"))
+            obv = np.nancumsum(flow)
+            obv[np.isnan(flow)] = np.nan
+            return obv
+
+        return self._node(("obv",), compute)
+
+
+def compute_indicators(
+    data: pd.DataFrame,
+    indicators: Sequence[str],
+    graph: IndicatorGraph | None = None,
+) -> pd.DataFrame:
+    """
+    Compute a set of indicators over shared intermediates.
+
+    Single-line indicators become one column named after the spec;
+    multi-line indicators one column per line, named ``<spec>_<line>``
+    (MACD's own line keeps the spec name).
+
+    Args:
+        data: OHLCV DataFrame
+        indicators: Specs such as "rsi", "sma_50", "macd_12_26_9",
+            "bbands_20_2", "stoch_14_3" or "williams_r_14"
+        graph: Graph over ``data`` to reuse across calls
+
+    Returns:
+        DataFrame indexed like ``data`` with one float64 block of columns
+
+    Raises:
+        ValueError: If a spec is unknown or its parameters are invalid
+    """
+    graph = graph or IndicatorGraph(data)
+    columns: list[str] = []
+    arrays: list[np.ndarray] = []
+
+    for spec in dict.fromkeys(indicators):
+        name, params = _parse_spec(spec)
+        result = getattr(graph, name)(*params)
+        if isinstance(result, dict):
+            for line, values in result.items():
+                columns.append(spec if line == name else f"{spec}_{line}")
+                arrays.append(values)
+        else:
+            columns.append(spec)
+            arrays.append(result)
+
+    block = np.empty((len(data), len(arrays)), dtype=np.float64)
+    for i, values in enumerate(arrays):
+        block[:, i] = values
+    return pd.DataFrame(block, index=data.index, columns=columns)
+
+
+def _parse_spec(spec: str) -> tuple[str, list[int | float]]:
+    """Split "bbands_20_2.5" into ("bbands", [20, 2.5])."""
+    for name in sorted(INDICATORS, key=len, reverse=True):
+        if spec == name or spec.startswith(f"{name}_"):
+            tokens = spec[len(name) + 1 :].split("_") if spec != name else []
+            try:
+                params = [float(t) if "." in t else int(t) for t in tokens]
+            except ValueError:
+                break
+            return name, params
+    raise ValueError(f"Unknown indicator: {spec}. Available: {', '.join(INDICATORS)}")
+
+
+def _check_period(period: int) -> None:
+    if period < 1:
+        raise ValueError(f"Period must be >= 1, got {period}")
+
+
+__all__ = ["INDICATORS", "IndicatorGraph", "compute_indicators"]
@@ -2,10 +2,13 @@
 Pure technical analysis indicator functions.
 
 All functions in this module are pure - they take data and return computed values
-without side effects. No external dependencies beyond numpy/pandas.
+without side effects. No external dependencies beyond numpy/pandas; the array
+kernels are compiled with Numba when it is installed (see kernels.py).
 
 These functions implement standard technical analysis formulas and can be used
-by any package that needs technical indicator calculations.
+by any package that needs technical indicator calculations. To compute several
+indicators for the same data, use compute_indicators() (graph.py), which shares
+intermediates such as EMAs, rolling extremes and the true range between them.
 """
 
 from typing import Any
@@ -13,6 +16,8 @@ from typing import Any
 import numpy as np
 import pandas as pd
 
+from maverick_core.technical.graph import IndicatorGraph
+
 
 def calculate_sma(
     data: pd.DataFrame,
@@ -36,10 +41,7 @@ def calculate_sma(
         KeyError: If column doesn't exist in DataFrame
         ValueError: If period < 1
     """
-    if period < 1:
-        raise ValueError(f"Period must be >= 1, got {period}")
-
-    return data[column].rolling(window=period).mean()
+    return _series(data, IndicatorGraph(data).sma(period, column), column)
 
 
 def calculate_ema(
@@ -66,10 +68,7 @@ def calculate_ema(
         KeyError: If column doesn't exist in DataFrame
         ValueError: If period < 1
     """
-    if period < 1:
-        raise ValueError(f"Period must be >= 1, got {period}")
-
-    return data[column].ewm(span=period, adjust=False).mean()
+    return _series(data, IndicatorGraph(data).ema(period, column), column)
 
 
 def calculate_rsi(
@@ -95,28 +94,7 @@ def calculate_rsi(
     Raises:
         ValueError: If period < 1
     """
-    if period < 1:
-        raise ValueError(f"Period must be >= 1, got {period}")
-
-    # Calculate price changes
-    delta = data[column].diff()
-
-    # Separate gains and losses
-    gains = delta.where(delta > 0, 0.0)
-    losses = (-delta).where(delta < 0, 0.0)
-
-    # Calculate average gains and losses using Wilder's smoothing
-    avg_gain = gains.ewm(alpha=1 / period, min_periods=period, adjust=False).mean()
-    avg_loss = losses.ewm(alpha=1 / period, min_periods=period, adjust=False).mean()
-
-    # Calculate RS and RSI
-    rs = avg_gain / avg_loss
-    rsi = 100 - (100 / (1 + rs))
-
-    # Handle division by zero (when avg_loss is 0)
-    rsi = rsi.replace([np.inf, -np.inf], 100)
-
-    return rsi
+    return _series(data, IndicatorGraph(data).rsi(period, column), column)
 
 
 def calculate_macd(
@@ -146,29 +124,8 @@ def calculate_macd(
     Raises:
         ValueError: If fast_period >= slow_period or any period < 1
     """
-    if fast_period < 1 or slow_period < 1 or signal_period < 1:
-        raise ValueError("All periods must be >= 1")
-    if fast_period >= slow_period:
-        raise ValueError(f"Fast period ({fast_period}) must be < slow period ({slow_period})")
-
-    # Calculate EMAs
-    fast_ema = calculate_ema(data, fast_period, column)
-    slow_ema = calculate_ema(data, slow_period, column)
-
-    # MACD line
-    macd_line = fast_ema - slow_ema
-
-    # Signal line (EMA of MACD)
-    signal_line = macd_line.ewm(span=signal_period, adjust=False).mean()
-
-    # Histogram
-    histogram = macd_line - signal_line
-
-    return {
-        "macd": macd_line,
-        "signal": signal_line,
-        "histogram": histogram,
-    }
+    lines = IndicatorGraph(data).macd(fast_period, slow_period, signal_period, column)
+    return {name: _series(data, values, column) for name, values in lines.items()}
 
 
 def calculate_bollinger_bands(
@@ -196,30 +153,8 @@ def calculate_bollinger_bands(
     Raises:
         ValueError: If period < 1 or std_dev < 0
     """
-    if period < 1:
-        raise ValueError(f"Period must be >= 1, got {period}")
-    if std_dev < 0:
-        raise ValueError(f"Standard deviation must be >= 0, got {std_dev}")
-
-    # Middle band (SMA)
-    middle = calculate_sma(data, period, column)
-
-    # Standard deviation
-    rolling_std = data[column].rolling(window=period).std()
-
-    # Upper and lower bands
-    upper = middle + (std_dev * rolling_std)
-    lower = middle - (std_dev * rolling_std)
-
-    # Bandwidth (measures volatility)
-    bandwidth = (upper - lower) / middle * 100
-
-    return {
-        "upper": upper,
-        "middle": middle,
-        "lower": lower,
-        "bandwidth": bandwidth,
-    }
+    bands = IndicatorGraph(data).bbands(period, std_dev, column)
+    return {name: _series(data, values, column) for name, values in bands.items()}
 
 
 def calculate_atr(
@@ -247,25 +182,7 @@ def calculate_atr(
         ValueError: If period < 1
         KeyError: If required columns are missing
     """
-    if period < 1:
-        raise ValueError(f"Period must be >= 1, got {period}")
-
-    high = data["High"]
-    low = data["Low"]
-    close = data["Close"]
-
-    # Calculate True Range components
-    tr1 = high - low
-    tr2 = (high - close.shift()).abs()
-    tr3 = (low - close.shift()).abs()
-
-    # True Range is the maximum of the three
-    true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-
-    # ATR using Wilder's smoothing
-    atr = true_range.ewm(alpha=1 / period, min_periods=period, adjust=False).mean()
-
-    return atr
+    return _series(data, IndicatorGraph(data).atr(period))
 
 
 def calculate_stochastic(
@@ -290,23 +207,8 @@ def calculate_stochastic(
     Raises:
         ValueError: If periods < 1
     """
-    if k_period < 1 or d_period < 1:
-        raise ValueError("All periods must be >= 1")
-
-    # Lowest low and highest high over K period
-    lowest_low = data["Low"].rolling(window=k_period).min()
-    highest_high = data["High"].rolling(window=k_period).max()
-
-    # %K
-    k = ((data["Close"] - lowest_low) / (highest_high - lowest_low)) * 100
-
-    # %D (SMA of %K)
-    d = k.rolling(window=d_period).mean()
-
-    return {
-        "k": k,
-        "d": d,
-    }
+    lines = IndicatorGraph(data).stoch(k_period, d_period)
+    return {name: _series(data, values) for name, values in lines.items()}
 
 
 def calculate_support_resistance(
@@ -334,20 +236,13 @@ def calculate_support_resistance(
         raise ValueError(f"Window must be >= 1, got {window}")
 
     close = data["Close"]
-    high = data["High"]
-    low = data["Low"]
+    graph = IndicatorGraph(data)
 
-    # Find local minima (support levels)
-    support_levels = []
-    for i in range(window, len(low) - window):
-        if low.iloc[i] == low.iloc[i - window : i + window + 1].min():
-            support_levels.append(float(low.iloc[i]))
-
-    # Find local maxima (resistance levels)
-    resistance_levels = []
-    for i in range(window, len(high) - window):
-        if high.iloc[i] == high.iloc[i - window : i + window + 1].max():
-            resistance_levels.append(float(high.iloc[i]))
+    # Local minima of the lows (support) and maxima of the highs (resistance)
+    low = graph.column("Low")
+    high = graph.column("High")
+    support_levels = low[graph.pivots("Low", window, find_max=False)].tolist()
+    resistance_levels = high[graph.pivots("High", window, find_max=True)].tolist()
 
     # Filter out levels too close together
     current_price = float(close.iloc[-1])
@@ -546,15 +441,7 @@ def calculate_williams_r(
     Raises:
         ValueError: If period < 1
     """
-    if period < 1:
-        raise ValueError(f"Period must be >= 1, got {period}")
-
-    highest_high = data["High"].rolling(window=period).max()
-    lowest_low = data["Low"].rolling(window=period).min()
-
-    williams_r = ((highest_high - data["Close"]) / (highest_high - lowest_low)) * -100
-
-    return williams_r
+    return _series(data, IndicatorGraph(data).williams_r(period))
 
 
 def calculate_obv(data: pd.DataFrame) -> pd.Series:
@@ -571,16 +458,13 @@ def calculate_obv(data: pd.DataFrame) -> pd.Series:
     Returns:
         Series with OBV values
     """
-    close = data["Close"]
-    volume = data["Volume"]
-
-    # Direction of price change
-    direction = np.sign(close.diff())
+    return _series(data, IndicatorGraph(data).obv())
 
-    # OBV is cumulative sum of volume * direction
-    obv = (volume * direction).cumsum()
 
-    return obv
+def _series(
+    data: pd.DataFrame, values: np.ndarray, name: str | None = None
+) -> pd.Series:
+    return pd.Series(values, index=data.index, name=name)
 
 
 __all__ = [
@@ -0,0 +1,350 @@
+"""
+Indicator kernels.
+
+Low-level array kernels shared by the technical indicators: exponential
+moving averages (EMA and Wilder's RMA), rolling extremes, rolling mean and
+standard deviation, true range and pivot detection. Each kernel takes and
+returns float64 numpy arrays and reproduces the corresponding pandas
+computation, including its NaN handling.
+
+When Numba is installed the kernels are compiled with ``@njit`` and run as
+single loops over the data. Otherwise (or with MAVERICK_NUMBA_ENABLED=false)
+the same results are computed with pandas.
+"""
+
+import logging
+import os
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.debug("numba not installed, indicator kernels use pandas")
+
+# Dispatch to the compiled kernels (tests toggle this to compare both paths)
+USE_NUMBA = (
+    NUMBA_AVAILABLE
+    and os.getenv("MAVERICK_NUMBA_ENABLED", "true").lower() == "true"
+)
+
+
+# =============================================================================
+# Loop implementations (compiled with Numba when available)
+# =============================================================================
+
+
+def _ewm_mean_loop(values, alpha, min_periods):
+    # Mirrors pandas ewm(alpha=alpha, adjust=False).mean(): gaps decay the
+    # weight of the running average instead of resetting it
+    n = values.shape[0]
+    out = np.empty(n)
+    if n == 0:
+        return out
+    minp = max(min_periods, 1)
+    old_wt_factor = 1.0 - alpha
+    weighted = values[0]
+    nobs = 1 if weighted == weighted else 0
+    out[0] = weighted if nobs >= minp else np.nan
+    old_wt = 1.0
+    for i in range(1, n):
+        cur = values[i]
+        is_observation = cur == cur
+        if is_observation:
+            nobs += 1
+        if weighted == weighted:
+            old_wt *= old_wt_factor
+            if is_observation:
+                if weighted != cur:
+                    weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+                old_wt = 1.0
+        elif is_observation:
+            weighted = cur
+        out[i] = weighted if nobs >= minp else np.nan
+    return out
+
+
+def _rolling_extreme_loop(values, window, min_periods, find_max):
+    # Monotonic deque of candidate positions; NaNs are skipped
+    n = values.shape[0]
+    out = np.empty(n)
+    queue = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+    count = 0
+    for i in range(n):
+        v = values[i]
+        if v == v:
+            if find_max:
+                while tail > head and values[queue[tail - 1]] <= v:
+                    tail -= 1
+            else:
+                while tail > head and values[queue[tail - 1]] >= v:
+                    tail -= 1
+            queue[tail] = i
+            tail += 1
+            count += 1
+        if i >= window:
+            old = values[i - window]
+            if old == old:
+                count -= 1
+        while tail > head and queue[head] <= i - window:
+            head += 1
+        if count >= min_periods and tail > head:
+            out[i] = values[queue[head]]
+        else:
+            out[i] = np.nan
+    return out
+
+
+def _rolling_mean_std_loop(values, window, min_periods, ddof):
+    # Welford's online update with removal, as in pandas' rolling var
+    n = values.shape[0]
+    mean_out = np.empty(n)
+    std_out = np.empty(n)
+    nobs = 0
+    mean = 0.0
+    ssqdm = 0.0
+    for i in range(n):
+        v = values[i]
+        if v == v:
+            nobs += 1
+            delta = v - mean
+            mean += delta / nobs
+            ssqdm += ((nobs - 1) * delta * delta) / nobs
+        if i >= window:
+            old = values[i - window]
+            if old == old:
+                nobs -= 1
+                if nobs:
+                    delta = old - mean
+                    mean -= delta / nobs
+                    ssqdm -= ((nobs + 1) * delta * delta) / nobs
+                else:
+                    mean = 0.0
+                    ssqdm = 0.0
+        if nobs >= min_periods and nobs > 0:
+            mean_out[i] = mean
+            if nobs > ddof:
+                std_out[i] = np.sqrt(max(ssqdm, 0.0) / (nobs - ddof)) if nobs > 1 else 0.0
+            else:
+                std_out[i] = np.nan
+        else:
+            mean_out[i] = np.nan
+            std_out[i] = np.nan
+    return mean_out, std_out
+
+
+def _true_range_loop(high, low, close):
+    n = high.shape[0]
+    out = np.empty(n)
+    for i in range(n):
+        tr = high[i] - low[i]
+        if i > 0:
+            prev = close[i - 1]
+            for candidate in (abs(high[i] - prev), abs(low[i] - prev)):
+                if candidate == candidate and (tr != tr or candidate > tr):
+                    tr = candidate
+        out[i] = tr
+    return out
+
+
+def _pivot_mask_loop(values, window, find_max):
+    n = values.shape[0]
+    out = np.zeros(n, dtype=np.bool_)
+    for i in range(window, n - window):
+        v = values[i]
+        if v != v:
+            continue
+        is_pivot = True
+        for j in range(i - window, i + window + 1):
+            other = values[j]
+            if (other > v) if find_max else (other < v):
+                is_pivot = False
+                break
+        out[i] = is_pivot
+    return out
+
+
+if NUMBA_AVAILABLE:
+    _ewm_mean_loop = njit(cache=True)(_ewm_mean_loop)
+    _rolling_extreme_loop = njit(cache=True)(_rolling_extreme_loop)
+    _rolling_mean_std_loop = njit(cache=True)(_rolling_mean_std_loop)
+    _true_range_loop = njit(cache=True)(_true_range_loop)
+    _pivot_mask_loop = njit(cache=True)(_pivot_mask_loop)
+
+
+# =============================================================================
+# Kernels
+# =============================================================================
+
+
+def ewm_mean(values: np.ndarray, alpha: float, min_periods: int = 0) -> np.ndarray:
+    """
+    Exponentially weighted mean without adjustment.
+
+    EMA of span n uses alpha = 2 / (n + 1); Wilder's RMA uses alpha = 1 / n.
+
+    Args:
+        values: Input values
+        alpha: Smoothing factor in (0, 1]
+        min_periods: Observations required before a value is emitted
+
+    Returns:
+        Same as ``Series.ewm(alpha=alpha, min_periods=min_periods,
+        adjust=False).mean()``
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if USE_NUMBA:
+        return _ewm_mean_loop(values, float(alpha), int(min_periods))
+    return (
+        pd.Series(values)
+        .ewm(alpha=alpha, min_periods=min_periods, adjust=False)
+        .mean()
+        .to_numpy()
+    )
+
+
+def rolling_min(
+    values: np.ndarray, window: int, min_periods: int | None = None
+) -> np.ndarray:
+    """
+    Rolling minimum, same as ``Series.rolling(window, min_periods).min()``.
+
+    Args:
+        values: Input values
+        window: Window length
+        min_periods: Observations required (defaults to the window length)
+
+    Returns:
+        Rolling minimum
+    """
+    return _rolling_extreme(values, window, min_periods, find_max=False)
+
+
+def rolling_max(
+    values: np.ndarray, window: int, min_periods: int | None = None
+) -> np.ndarray:
+    """
+    Rolling maximum, same as ``Series.rolling(window, min_periods).max()``.
+
+    Args:
+        values: Input values
+        window: Window length
+        min_periods: Observations required (defaults to the window length)
+
+    Returns:
+        Rolling maximum
+    """
+    return _rolling_extreme(values, window, min_periods, find_max=True)
+
+
+def rolling_mean_std(
+    values: np.ndarray,
+    window: int,
+    min_periods: int | None = None,
+    ddof: int = 1,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Rolling mean and standard deviation in one pass.
+
+    Args:
+        values: Input values
+        window: Window length
+        min_periods: Observations required (defaults to the window length)
+        ddof: Delta degrees of freedom of the standard deviation
+
+    Returns:
+        Tuple of rolling mean and rolling standard deviation
+    """
+    values = np.asarray(values, dtype=np.float64)
+    min_periods = window if min_periods is None else min_periods
+    if USE_NUMBA:
+        return _rolling_mean_std_loop(values, int(window), int(min_periods), int(ddof))
+    rolling = pd.Series(values).rolling(window=window, min_periods=min_periods)
+    return rolling.mean().to_numpy(), rolling.std(ddof=ddof).to_numpy()
+
+
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """
+    True range: the largest of High - Low, |High - previous Close| and
+    |Low - previous Close|, ignoring missing terms.
+
+    Args:
+        high: High prices
+        low: Low prices
+        close: Close prices
+
+    Returns:
+        True range
+    """
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
+    if USE_NUMBA:
+        return _true_range_loop(high, low, close)
+    high_s, low_s = pd.Series(high), pd.Series(low)
+    prev_close = pd.Series(close).shift()
+    return (
+        pd.concat(
+            [high_s - low_s, (high_s - prev_close).abs(), (low_s - prev_close).abs()],
+            axis=1,
+        )
+        .max(axis=1)
+        .to_numpy()
+    )
+
+
+def pivot_mask(values: np.ndarray, window: int, find_max: bool) -> np.ndarray:
+    """
+    Mark local extrema.
+
+    Position i is a pivot if it is the minimum (or maximum) of the
+    ``2 * window + 1`` values centred on it. The first and last ``window``
+    positions are never pivots.
+
+    Args:
+        values: Input values
+        window: Number of values on each side
+        find_max: Detect maxima instead of minima
+
+    Returns:
+        Boolean mask of pivot positions
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if USE_NUMBA:
+        return _pivot_mask_loop(values, int(window), bool(find_max))
+    rolling = pd.Series(values).rolling(window=2 * window + 1, center=True, min_periods=1)
+    extreme = (rolling.max() if find_max else rolling.min()).to_numpy()
+    mask = values == extreme
+    mask[:window] = False
+    mask[max(len(values) - window, 0) :] = False
+    return mask
+
+
+def _rolling_extreme(
+    values: np.ndarray, window: int, min_periods: int | None, find_max: bool
+) -> np.ndarray:
+    values = np.asarray(values, dtype=np.float64)
+    min_periods = window if min_periods is None else min_periods
+    if USE_NUMBA:
+        return _rolling_extreme_loop(values, int(window), int(min_periods), bool(find_max))
+    rolling = pd.Series(values).rolling(window=window, min_periods=min_periods)
+    return (rolling.max() if find_max else rolling.min()).to_numpy()
+
+
+__all__ = [
+    "NUMBA_AVAILABLE",
+    "ewm_mean",
+    "pivot_mask",
+    "rolling_max",
+    "rolling_mean_std",
+    "rolling_min",
+    "true_range",
+]
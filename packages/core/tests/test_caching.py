@@ -0,0 +1,183 @@
+"""
+Tests for the LLM response cache.
+"""
+
+import asyncio
+
+import pytest
+
+from maverick_core.caching import (
+    LLMResponseCache,
+    get_llm_model_id,
+    make_llm_cache_key,
+)
+
+
+class FakeAsyncRedis:
+    """Minimal async Redis stand-in supporting the commands the cache uses."""
+
+    def __init__(self):
+        self.data: dict[str, str] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None, px=None, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def delete(self, key):
+        return 1 if self.data.pop(key, None) is not None else 0
+
+    async def eval(self, script, numkeys, key, token):
+        if self.data.get(key) == token:
+            del self.data[key]
+            return 1
+        return 0
+
+
+class TestLLMCacheKey:
+    """Test content-addressed key generation."""
+
+    def test_whitespace_is_normalized(self):
+        key1 = make_llm_cache_key("m", "v1", "Revenue  grew\n10%", "moderate")
+        key2 = make_llm_cache_key("m", "v1", " Revenue grew 10% ", "Moderate")
+        assert key1 == key2
+
+    def test_key_components_are_distinct(self):
+        base = make_llm_cache_key("m", "v1", "content", "moderate")
+        assert base != make_llm_cache_key("other", "v1", "content", "moderate")
+        assert base != make_llm_cache_key("m", "v2", "content", "moderate")
+        assert base != make_llm_cache_key("m", "v1", "content", "aggressive")
+        assert base != make_llm_cache_key("m", "v1", "different", "moderate")
+
+    def test_model_id_resolution(self):
+        class FakeLLM:
+            model_name = "openai/gpt-4o-mini"
+
+        assert get_llm_model_id(FakeLLM()) == "openai/gpt-4o-mini"
+        assert get_llm_model_id(object()) == "object"
+
+
+class TestLLMResponseCache:
+    """Test local and shared tiers, eviction and stampede protection."""
+
+    @pytest.mark.asyncio
+    async def test_get_or_compute_caches_result(self):
+        cache = LLMResponseCache()
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            return "response"
+
+        assert await cache.get_or_compute("k", compute) == "response"
+        assert await cache.get_or_compute("k", compute) == "response"
+        assert calls == 1
+        assert cache.get_stats()["local_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_none_result_is_not_cached(self):
+        cache = LLMResponseCache()
+
+        async def compute():
+            return None
+
+        assert await cache.get_or_compute("k", compute) is None
+        assert await cache.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_compute_once(self):
+        cache = LLMResponseCache()
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return "response"
+
+        results = await asyncio.gather(
+            *[cache.get_or_compute("k", compute) for _ in range(5)]
+        )
+
+        assert results == ["response"] * 5
+        assert calls == 1
+        assert cache.get_stats()["coalesced"] == 4
+
+    @pytest.mark.asyncio
+    async def test_lru_and_size_eviction(self):
+        cache = LLMResponseCache(max_entries=2, max_bytes=10)
+
+        await cache.set("a", "1111")
+        await cache.set("b", "2222")
+        assert await cache.get("a") == "1111"  # a becomes most recently used
+        await cache.set("c", "3333")
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") == "1111"
+
+        await cache.set("d", "x" * 10)
+        assert cache.get_stats()["local_bytes"] <= 10
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry(self):
+        cache = LLMResponseCache()
+        await cache.set("k", "v", ttl=0)
+        assert await cache.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_remote_tier_shared_between_instances(self):
+        redis = FakeAsyncRedis()
+        first = LLMResponseCache(redis_client=redis)
+        second = LLMResponseCache(redis_client=redis)
+
+        async def compute():
+            return "response"
+
+        await first.get_or_compute("k", compute)
+
+        async def fail():
+            raise AssertionError("should be served from Redis")
+
+        assert await second.get_or_compute("k", fail) == "response"
+        assert second.get_stats()["remote_hits"] == 1
+        assert "k:lock" not in redis.data
+
+    @pytest.mark.asyncio
+    async def test_waits_for_other_replica_lock(self):
+        redis = FakeAsyncRedis()
+        redis.data["k:lock"] = "other-replica"
+        cache = LLMResponseCache(redis_client=redis, lock_timeout=2.0)
+
+        async def publish():
+            await asyncio.sleep(0.1)
+            redis.data["k"] = "from-replica"
+
+        async def fail():
+            raise AssertionError("should wait for the replica's result")
+
+        publisher = asyncio.create_task(publish())
+        assert await cache.get_or_compute("k", fail) == "from-replica"
+        await publisher
+
+    @pytest.mark.asyncio
+    async def test_remote_errors_fall_back_to_local(self):
+        class BrokenRedis:
+            async def get(self, key):
+                raise ConnectionError("down")
+
+            async def set(self, *args, **kwargs):
+                raise ConnectionError("down")
+
+        cache = LLMResponseCache(redis_client=BrokenRedis())
+
+        async def compute():
+            return "response"
+
+        assert await cache.get_or_compute("k", compute) == "response"
+        assert await cache.get("k") == "response"
+        assert cache.get_stats()["remote_available"] is False
@@ -0,0 +1,232 @@
+"""Tests for indicator kernels and the shared indicator graph."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from maverick_core.technical import (
+    calculate_atr,
+    calculate_bollinger_bands,
+    calculate_ema,
+    calculate_macd,
+    calculate_obv,
+    calculate_rsi,
+    calculate_sma,
+    calculate_stochastic,
+    calculate_support_resistance,
+    calculate_williams_r,
+    compute_indicators,
+    kernels,
+)
+
+BACKENDS = [
+    pytest.param(True, id="numba", marks=pytest.mark.skipif(
+        not kernels.NUMBA_AVAILABLE, reason="numba not installed"
+    )),
+    pytest.param(False, id="pandas"),
+]
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request, monkeypatch):
+    monkeypatch.setattr(kernels, "USE_NUMBA", request.param)
+    return request.param
+
+
+@pytest.fixture
+def ohlcv() -> pd.DataFrame:
+    """Random-walk OHLCV data with missing values."""
+    rng = np.random.default_rng(11)
+    n = 600
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    high = close * (1 + np.abs(rng.normal(0, 0.01, n)))
+    low = close * (1 - np.abs(rng.normal(0, 0.01, n)))
+    data = pd.DataFrame(
+        {
+            "Open": close,
+            "High": high,
+            "Low": low,
+            "Close": close,
+            "Volume": rng.integers(1_000_000, 10_000_000, n),
+        },
+        index=pd.bdate_range("2022-01-03", periods=n),
+    )
+    data.iloc[[0, 57, 58, 300], :4] = np.nan
+    return data
+
+
+def assert_series_equal(actual, expected):
+    pd.testing.assert_series_equal(
+        actual, expected, rtol=1e-9, atol=1e-9
+    )
+
+
+class TestKernelParity:
+    """Test every backend reproduces the pandas computations."""
+
+    def test_ewm_mean(self, backend, ohlcv):
+        close = ohlcv["Close"]
+        for alpha, min_periods in [(2 / 13, 0), (1 / 14, 14), (1.0, 0)]:
+            expected = close.ewm(alpha=alpha, min_periods=min_periods, adjust=False)
+            np.testing.assert_allclose(
+                kernels.ewm_mean(close.to_numpy(), alpha, min_periods),
+                expected.mean().to_numpy(),
+                rtol=1e-12,
+            )
+
+    def test_rolling_extremes_and_moments(self, backend, ohlcv):
+        close = ohlcv["Close"]
+        values = close.to_numpy()
+        for window, min_periods in [(14, None), (20, 5), (1, None)]:
+            rolling = close.rolling(window, min_periods=min_periods)
+            np.testing.assert_array_equal(
+                kernels.rolling_min(values, window, min_periods), rolling.min()
+            )
+            np.testing.assert_array_equal(
+                kernels.rolling_max(values, window, min_periods), rolling.max()
+            )
+            mean, std = kernels.rolling_mean_std(values, window, min_periods)
+            np.testing.assert_allclose(mean, rolling.mean(), rtol=1e-12)
+            np.testing.assert_allclose(std, rolling.std(), rtol=1e-9, atol=1e-9)
+
+    def test_true_range(self, backend, ohlcv):
+        high, low, prev = ohlcv["High"], ohlcv["Low"], ohlcv["Close"].shift()
+        expected = pd.concat(
+            [high - low, (high - prev).abs(), (low - prev).abs()], axis=1
+        ).max(axis=1)
+        np.testing.assert_array_equal(
+            kernels.true_range(high, low, ohlcv["Close"]), expected
+        )
+
+    def test_pivot_mask_matches_window_scan(self, backend, ohlcv):
+        low = ohlcv["Low"]
+        window = 10
+        expected = np.zeros(len(low), dtype=bool)
+        for i in range(window, len(low) - window):
+            expected[i] = low.iloc[i] == low.iloc[i - window : i + window + 1].min()
+        np.testing.assert_array_equal(kernels.pivot_mask(low, window, False), expected)
+
+
+class TestIndicatorParity:
+    """Test indicators against their reference pandas formulas."""
+
+    def test_moving_averages(self, backend, ohlcv):
+        close = ohlcv["Close"]
+        assert_series_equal(calculate_sma(ohlcv, 20), close.rolling(20).mean())
+        assert_series_equal(
+            calculate_ema(ohlcv, 20), close.ewm(span=20, adjust=False).mean()
+        )
+
+    def test_rsi(self, backend, ohlcv):
+        delta = ohlcv["Close"].diff()
+        avg_gain = delta.where(delta > 0, 0.0).ewm(
+            alpha=1 / 14, min_periods=14, adjust=False
+        ).mean()
+        avg_loss = (-delta).where(delta < 0, 0.0).ewm(
+            alpha=1 / 14, min_periods=14, adjust=False
+        ).mean()
+        expected = (100 - 100 / (1 + avg_gain / avg_loss)).replace(np.inf, 100)
+        assert_series_equal(calculate_rsi(ohlcv, 14), expected)
+
+    def test_macd_and_bollinger(self, backend, ohlcv):
+        close = ohlcv["Close"]
+        line = close.ewm(span=12, adjust=False).mean() - close.ewm(
+            span=26, adjust=False
+        ).mean()
+        signal = line.ewm(span=9, adjust=False).mean()
+        macd = calculate_macd(ohlcv)
+        assert_series_equal(macd["macd"], line)
+        assert_series_equal(macd["histogram"], line - signal)
+
+        bands = calculate_bollinger_bands(ohlcv, 20, 2.0)
+        middle, std = close.rolling(20).mean(), close.rolling(20).std()
+        assert_series_equal(bands["upper"], middle + 2 * std)
+        assert_series_equal(bands["bandwidth"], 4 * std / middle * 100)
+
+    def test_range_indicators(self, backend, ohlcv):
+        high, low, close = ohlcv["High"], ohlcv["Low"], ohlcv["Close"]
+        true_range = pd.concat(
+            [high - low, (high - close.shift()).abs(), (low - close.shift()).abs()],
+            axis=1,
+        ).max(axis=1)
+        assert_series_equal(
+            calculate_atr(ohlcv, 14),
+            true_range.ewm(alpha=1 / 14, min_periods=14, adjust=False).mean(),
+        )
+
+        lowest, highest = low.rolling(14).min(), high.rolling(14).max()
+        k = (close - lowest) / (highest - lowest) * 100
+        stoch = calculate_stochastic(ohlcv, 14, 3)
+        assert_series_equal(stoch["k"], k)
+        assert_series_equal(stoch["d"], k.rolling(3).mean())
+        assert_series_equal(
+            calculate_williams_r(ohlcv, 14),
+            (highest - close) / (highest - lowest) * -100,
+        )
+
+    def test_obv(self, backend, ohlcv):
+        expected = (ohlcv["Volume"] * np.sign(ohlcv["Close"].diff())).cumsum()
+        assert_series_equal(calculate_obv(ohlcv), expected)
+
+    def test_support_resistance_backends_agree(self, ohlcv, monkeypatch):
+        data = ohlcv.dropna()
+        levels = calculate_support_resistance(data, window=5, threshold=0.01)
+        monkeypatch.setattr(kernels, "USE_NUMBA", False)
+
+        assert levels["support"] or levels["resistance"]
+        assert calculate_support_resistance(data, window=5, threshold=0.01) == levels
+
+
+class TestComputeIndicators:
+    """Test the multi-indicator column block."""
+
+    def test_block_matches_individual_indicators(self, backend, ohlcv):
+        block = compute_indicators(
+            ohlcv, ["sma_20", "rsi", "macd_12_26_9", "bbands_20_2.5", "stoch", "obv"]
+        )
+
+        assert list(block.columns) == [
+            "sma_20", "rsi",
+            "macd_12_26_9", "macd_12_26_9_signal", "macd_12_26_9_histogram",
+            "bbands_20_2.5_upper", "bbands_20_2.5_middle",
+            "bbands_20_2.5_lower", "bbands_20_2.5_bandwidth",
+            "stoch_k", "stoch_d", "obv",
+        ]
+        assert block.index.equals(ohlcv.index)
+        assert block.dtypes.eq(np.float64).all()
+        assert_series_equal(block["rsi"], calculate_rsi(ohlcv).rename("rsi"))
+        assert_series_equal(
+            block["bbands_20_2.5_upper"],
+            calculate_bollinger_bands(ohlcv, 20, 2.5)["upper"].rename(
+                "bbands_20_2.5_upper"
+            ),
+        )
+        assert_series_equal(
+            block["stoch_d"], calculate_stochastic(ohlcv)["d"].rename("stoch_d")
+        )
+
+    def test_intermediates_computed_once(self, ohlcv, monkeypatch):
+        calls = []
+        for name in ("ewm_mean", "rolling_mean_std", "rolling_min", "rolling_max"):
+            kernel = getattr(kernels, name)
+            monkeypatch.setattr(
+                kernels, name,
+                lambda *a, _k=kernel, _n=name, **kw: calls.append(_n) or _k(*a, **kw),
+            )
+
+        compute_indicators(
+            ohlcv, ["ema_12", "macd", "sma_20", "bbands_20_2", "stoch_14_1", "williams_r_14"]
+        )
+
+        # EMA 12 and 26 + MACD signal; one SMA/band window; %D; shared High/Low extremes
+        assert calls.count("ewm_mean") == 3
+        assert calls.count("rolling_mean_std") == 2
+        assert calls.count("rolling_min") == calls.count("rolling_max") == 1
+
+    def test_invalid_specs(self, ohlcv):
+        with pytest.raises(ValueError, match="Unknown indicator"):
+            compute_indicators(ohlcv, ["vwap"])
+        with pytest.raises(ValueError, match="Unknown indicator"):
+            compute_indicators(ohlcv, ["rsi_fast"])
+        with pytest.raises(ValueError, match="Fast period.*must be < slow period"):
+            compute_indicators(ohlcv, ["macd_26_12_9"])
@@ -8,6 +8,7 @@ cryptocurrency markets with proper handling of 24/7 trading.
 from __future__ import annotations
 
 import logging
+import os
 from datetime import date, datetime, timedelta
 from typing import Any
 
@@ -25,6 +26,11 @@ except ImportError:
     HAS_VECTORBT = False
     vbt = None
 
+# Grid optimization: memory per simulation chunk, and a rough per-cell cost
+# of vectorbt's order, cash, position and stats arrays
+OPTIMIZE_MEMORY_BUDGET_MB = float(os.getenv("CRYPTO_OPTIMIZE_MEMORY_MB", "256"))
+OPTIMIZE_BYTES_PER_CELL = 256
+
 
 class CryptoBacktestEngine:
     """
@@ -101,10 +107,10 @@ class CryptoBacktestEngine:
         Returns:
             DataFrame with OHLCV data
         """
-        # Use provided data provider or create default
+        # Use provided data provider or the shared default
         if self.data_provider is None:
-            from maverick_crypto.providers import CryptoDataProvider
-            self.data_provider = CryptoDataProvider()
+            from maverick_crypto.providers import get_provider_registry
+            self.data_provider = get_provider_registry().crypto_data()
         
         df = await self.data_provider.get_crypto_data(
             symbol=symbol,
@@ -218,28 +224,9 @@ class CryptoBacktestEngine:
                         "pnl": float(trade.get("PnL", 0)),
                     })
             
-            # Helper to safely get numeric values
-            def safe_float(val, default=0.0):
-                """Safely convert to float, handling NaN."""
-                if val is None or (isinstance(val, float) and np.isnan(val)):
-                    return default
-                try:
-                    return float(val)
-                except (TypeError, ValueError):
-                    return default
-            
-            def safe_int(val, default=0):
-                """Safely convert to int, handling NaN."""
-                if val is None or (isinstance(val, float) and np.isnan(val)):
-                    return default
-                try:
-                    return int(val)
-                except (TypeError, ValueError):
-                    return default
-            
             # Build result
-            total_trades = safe_int(stats.get("Total Trades", 0))
-            win_rate = safe_float(stats.get("Win Rate [%]", 0))
+            total_trades = _safe_int(stats.get("Total Trades", 0))
+            win_rate = _safe_float(stats.get("Win Rate [%]", 0))
             
             result = {
                 "symbol": symbol,
@@ -251,27 +238,17 @@ class CryptoBacktestEngine:
                     "days": len(data),
                 },
                 "initial_capital": initial_capital,
-                "final_value": safe_float(stats.get("End Value", initial_capital), initial_capital),
-                "total_return": safe_float(stats.get("Total Return", 0)),
-                "total_return_pct": safe_float(stats.get("Total Return", 0)) * 100,
-                "sharpe_ratio": safe_float(stats.get("Sharpe Ratio"), None),
-                "sortino_ratio": safe_float(stats.get("Sortino Ratio"), None),
-                "max_drawdown": safe_float(stats.get("Max Drawdown [%]", 0)),
-                "win_rate": win_rate,
-                "num_trades": total_trades,
-                "avg_trade_return": (safe_float(stats.get("Avg Winning Trade [%]", 0)) + safe_float(stats.get("Avg Losing Trade [%]", 0))) / 2 if total_trades > 0 else 0,
-                "profit_factor": safe_float(stats.get("Profit Factor"), None),
-                "fees_paid": fees * initial_capital * total_trades * 2,  # Estimate
+                **_summarize_stats(stats, initial_capital, fees),
                 "trades": trades_list[-20:],  # Last 20 trades
                 "metrics": {
                     "total_trades": total_trades,
-                    "winning_trades": safe_int(win_rate * total_trades / 100) if total_trades > 0 else 0,
-                    "losing_trades": total_trades - safe_int(win_rate * total_trades / 100) if total_trades > 0 else 0,
-                    "best_trade": safe_float(stats.get("Best Trade [%]", 0)),
-                    "worst_trade": safe_float(stats.get("Worst Trade [%]", 0)),
-                    "avg_winning_trade": safe_float(stats.get("Avg Winning Trade [%]", 0)),
-                    "avg_losing_trade": safe_float(stats.get("Avg Losing Trade [%]", 0)),
-                    "exposure_time": safe_float(stats.get("Exposure Time [%]", 0)),
+                    "winning_trades": _safe_int(win_rate * total_trades / 100) if total_trades > 0 else 0,
+                    "losing_trades": total_trades - _safe_int(win_rate * total_trades / 100) if total_trades > 0 else 0,
+                    "best_trade": _safe_float(stats.get("Best Trade [%]", 0)),
+                    "worst_trade": _safe_float(stats.get("Worst Trade [%]", 0)),
+                    "avg_winning_trade": _safe_float(stats.get("Avg Winning Trade [%]", 0)),
+                    "avg_losing_trade": _safe_float(stats.get("Avg Losing Trade [%]", 0)),
+                    "exposure_time": _safe_float(stats.get("Exposure Time [%]", 0)),
                 },
             }
             
@@ -356,10 +333,16 @@ class CryptoBacktestEngine:
         days: int = 90,
         initial_capital: float = DEFAULT_CAPITAL,
         metric: str = "sharpe_ratio",
+        memory_budget_mb: float = OPTIMIZE_MEMORY_BUDGET_MB,
     ) -> dict[str, Any]:
         """
         Optimize strategy parameters using grid search.
         
+        Price history is fetched once. Signals for every combination are
+        generated together from shared indicator families, and the grid is
+        simulated as columns of a single vectorbt portfolio, split into
+        chunks that fit the memory budget.
+        
         Args:
             symbol: Crypto symbol
             strategy: Strategy name
@@ -367,12 +350,21 @@ class CryptoBacktestEngine:
             days: Number of days for backtest
             initial_capital: Starting capital
             metric: Metric to optimize (sharpe_ratio, total_return, etc.)
+            memory_budget_mb: Approximate memory per simulation chunk
             
         Returns:
             Dictionary with optimization results
         """
         import itertools
         
+        if not HAS_VECTORBT:
+            return {
+                "error": "VectorBT not installed",
+                "help": "Install with: pip install vectorbt",
+            }
+        
+        from maverick_crypto.backtesting.strategies import get_crypto_strategy
+        
         # Generate all parameter combinations
         keys = list(param_grid.keys())
         values = list(param_grid.values())
@@ -380,29 +372,59 @@ class CryptoBacktestEngine:
         
         logger.info(f"Optimizing {strategy} with {len(combinations)} parameter combinations")
         
+        try:
+            strategy_cls = type(get_crypto_strategy(strategy))
+            data = await self.get_data(symbol=symbol, days=days)
+        except Exception as e:
+            logger.error(f"Optimization failed for {symbol}: {e}")
+            return {"error": str(e), "symbol": symbol, "strategy": strategy}
+        
+        if data.empty:
+            return {"error": f"No data available for {symbol}"}
+        
+        grid = [dict(zip(keys, combo)) for combo in combinations]
+        param_sets = [strategy_cls(params).parameters for params in grid]
+        
+        try:
+            entries, exits = strategy_cls.generate_signal_grid(data, param_sets)
+            valid = list(range(len(grid)))
+        except Exception as e:
+            logger.warning(f"Vectorized signals failed for {strategy}, generating per combination: {e}")
+            entries, exits, valid = _signal_grid_by_combination(strategy_cls, data, grid)
+        
+        close = data["Close"] if "Close" in data.columns else data["close"]
+        chunk_size = _grid_chunk_size(len(close), memory_budget_mb)
+        
         results = []
-        for combo in combinations:
-            params = dict(zip(keys, combo))
+        for start in range(0, len(valid), chunk_size):
+            columns = valid[start:start + chunk_size]
             try:
-                result = await self.run_backtest(
-                    symbol=symbol,
-                    strategy=strategy,
-                    parameters=params,
-                    days=days,
-                    initial_capital=initial_capital,
+                portfolio = vbt.Portfolio.from_signals(
+                    close=close,
+                    entries=pd.DataFrame(entries[:, columns], index=close.index),
+                    exits=pd.DataFrame(exits[:, columns], index=close.index),
+                    init_cash=initial_capital,
+                    fees=self.fees,
+                    slippage=self.slippage,
+                    freq="D",
                 )
-                if metric in result:
+                chunk_stats = portfolio.stats(agg_func=None)
+            except Exception as e:
+                logger.warning(f"Failed to simulate {len(columns)} combinations: {e}")
+                continue
+            
+            for position, combo_index in enumerate(columns):
+                summary = _summarize_stats(chunk_stats.iloc[position], initial_capital, self.fees)
+                if metric in summary:
                     results.append({
-                        "parameters": params,
-                        "metric_value": result.get(metric),
-                        "total_return_pct": result.get("total_return_pct"),
-                        "sharpe_ratio": result.get("sharpe_ratio"),
-                        "max_drawdown": result.get("max_drawdown"),
-                        "win_rate": result.get("win_rate"),
-                        "num_trades": result.get("num_trades"),
+                        "parameters": grid[combo_index],
+                        "metric_value": summary.get(metric),
+                        "total_return_pct": summary.get("total_return_pct"),
+                        "sharpe_ratio": summary.get("sharpe_ratio"),
+                        "max_drawdown": summary.get("max_drawdown"),
+                        "win_rate": summary.get("win_rate"),
+                        "num_trades": summary.get("num_trades"),
                     })
-            except Exception as e:
-                logger.warning(f"Failed with params {params}: {e}")
         
         if not results:
             return {"error": "No valid results from optimization"}
@@ -420,3 +442,80 @@ class CryptoBacktestEngine:
             "top_10_results": results[:10],
         }
 
+
+# ==================== Helpers ====================
+
+
+def _safe_float(val, default=0.0):
+    """Safely convert to float, handling NaN."""
+    if val is None or (isinstance(val, float) and np.isnan(val)):
+        return default
+    try:
+        return float(val)
+    except (TypeError, ValueError):
+        return default
+
+
+def _safe_int(val, default=0):
+    """Safely convert to int, handling NaN."""
+    if val is None or (isinstance(val, float) and np.isnan(val)):
+        return default
+    try:
+        return int(val)
+    except (TypeError, ValueError):
+        return default
+
+
+def _summarize_stats(stats: Series, initial_capital: float, fees: float) -> dict[str, Any]:
+    """
+    Headline metrics of one portfolio column.
+    
+    Args:
+        stats: vectorbt stats for a single column
+        initial_capital: Starting capital
+        fees: Trading fees per transaction
+        
+    Returns:
+        Dictionary of rankable metrics shared by backtests and optimization
+    """
+    total_trades = _safe_int(stats.get("Total Trades", 0))
+    return {
+        "final_value": _safe_float(stats.get("End Value", initial_capital), initial_capital),
+        "total_return": _safe_float(stats.get("Total Return", 0)),
+        "total_return_pct": _safe_float(stats.get("Total Return", 0)) * 100,
+        "sharpe_ratio": _safe_float(stats.get("Sharpe Ratio"), None),
+        "sortino_ratio": _safe_float(stats.get("Sortino Ratio"), None),
+        "max_drawdown": _safe_float(stats.get("Max Drawdown [%]", 0)),
+        "win_rate": _safe_float(stats.get("Win Rate [%]", 0)),
+        "num_trades": total_trades,
+        "avg_trade_return": (_safe_float(stats.get("Avg Winning Trade [%]", 0)) + _safe_float(stats.get("Avg Losing Trade [%]", 0))) / 2 if total_trades > 0 else 0,
+        "profit_factor": _safe_float(stats.get("Profit Factor"), None),
+        "fees_paid": fees * initial_capital * total_trades * 2,  # Estimate
+    }
+
+
+def _signal_grid_by_combination(
+    strategy_cls: type,
+    data: DataFrame,
+    grid: list[dict[str, Any]],
+) -> tuple[np.ndarray, np.ndarray, list[int]]:
+    """Per-combination signals, skipping combinations that fail."""
+    entries = np.zeros((len(data), len(grid)), dtype=bool)
+    exits = np.zeros_like(entries)
+    valid = []
+    for j, params in enumerate(grid):
+        try:
+            entry, exit_ = strategy_cls(params).generate_signals(data)
+        except Exception as e:
+            logger.warning(f"Failed with params {params}: {e}")
+            continue
+        entries[:, j] = entry.to_numpy(dtype=bool)
+        exits[:, j] = exit_.to_numpy(dtype=bool)
+        valid.append(j)
+    return entries, exits, valid
+
+
+def _grid_chunk_size(num_rows: int, memory_budget_mb: float) -> int:
+    """Number of grid columns to simulate per vectorbt call."""
+    column_bytes = max(num_rows, 1) * OPTIMIZE_BYTES_PER_CELL
+    return max(1, int(memory_budget_mb * 1024 * 1024 // column_bytes))
@@ -20,7 +20,7 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Callable
 
 import numpy as np
 import pandas as pd
@@ -81,6 +81,35 @@ class CryptoStrategy(ABC):
         """Get default parameters for the strategy."""
         pass
     
+    @classmethod
+    def generate_signal_grid(
+        cls,
+        data: DataFrame,
+        param_sets: list[dict[str, Any]],
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Generate signals for many parameter sets at once.
+        
+        Column j of the returned arrays holds the signals of
+        ``cls(param_sets[j]).generate_signals(data)``. Strategies override
+        this to compute each indicator once per distinct parameter value
+        as a 2-D array; the default simply runs every parameter set.
+        
+        Args:
+            data: OHLCV DataFrame with columns: Open, High, Low, Close, Volume
+            param_sets: Full parameter dicts (defaults already merged)
+            
+        Returns:
+            Tuple of (entries, exits) boolean arrays of shape (len(data), len(param_sets))
+        """
+        entries = np.zeros((len(data), len(param_sets)), dtype=bool)
+        exits = np.zeros_like(entries)
+        for j, params in enumerate(param_sets):
+            entry, exit_ = cls(params).generate_signals(data)
+            entries[:, j] = entry.to_numpy(dtype=bool)
+            exits[:, j] = exit_.to_numpy(dtype=bool)
+        return entries, exits
+    
     def to_dict(self) -> dict[str, Any]:
         """Convert strategy to dictionary representation."""
         return {
@@ -135,6 +164,21 @@ class CryptoMomentumStrategy(CryptoStrategy):
         exits = (fast_sma < slow_sma) & (fast_sma.shift(1) >= slow_sma.shift(1))
         
         return entries.fillna(False), exits.fillna(False)
+    
+    @classmethod
+    def generate_signal_grid(cls, data, param_sets):
+        """Generate momentum signals from one SMA family."""
+        close = _close(data)
+        fast_sma, slow_sma = _indicator_family(
+            lambda window: close.rolling(window=window).mean(),
+            [p["fast_period"] for p in param_sets],
+            [p["slow_period"] for p in param_sets],
+        )
+        fast_prev, slow_prev = _shift(fast_sma), _shift(slow_sma)
+        
+        entries = (fast_sma > slow_sma) & (fast_prev <= slow_prev)
+        exits = (fast_sma < slow_sma) & (fast_prev >= slow_prev)
+        return entries, exits
 
 
 class CryptoMeanReversionStrategy(CryptoStrategy):
@@ -188,6 +232,24 @@ class CryptoMeanReversionStrategy(CryptoStrategy):
             exits = close > upper
         
         return entries.fillna(False), exits.fillna(False)
+    
+    @classmethod
+    def generate_signal_grid(cls, data, param_sets):
+        """Generate mean reversion signals from shared band families."""
+        close = _close(data)
+        periods = [p["period"] for p in param_sets]
+        (middle,) = _indicator_family(lambda w: close.rolling(window=w).mean(), periods)
+        (std,) = _indicator_family(lambda w: close.rolling(window=w).std(), periods)
+        std_dev = _row([p["std_dev"] for p in param_sets])
+        exit_at_middle = _row([bool(p["exit_at_middle"]) for p in param_sets])
+        
+        upper = middle + (std_dev * std)
+        lower = middle - (std_dev * std)
+        price = close.to_numpy(dtype=float)[:, None]
+        
+        entries = price < lower
+        exits = np.where(exit_at_middle, price > middle, price > upper)
+        return entries, exits
 
 
 class CryptoBreakoutStrategy(CryptoStrategy):
@@ -250,6 +312,27 @@ class CryptoBreakoutStrategy(CryptoStrategy):
         exits = close < recent_low.shift(1)
         
         return entries.fillna(False), exits.fillna(False)
+    
+    @classmethod
+    def generate_signal_grid(cls, data, param_sets):
+        """Generate breakout signals from shared channel and volume families."""
+        close = _close(data)
+        high = data["High"] if "High" in data.columns else data["high"]
+        low = data["Low"] if "Low" in data.columns else data["low"]
+        volume = data["Volume"] if "Volume" in data.columns else data.get("volume", pd.Series(1, index=data.index))
+        
+        lookbacks = [p["lookback"] for p in param_sets]
+        (recent_high,) = _indicator_family(lambda w: high.rolling(window=w).max(), lookbacks)
+        (recent_low,) = _indicator_family(lambda w: low.rolling(window=w).min(), lookbacks)
+        (avg_volume,) = _indicator_family(lambda w: volume.rolling(window=w).mean(), lookbacks)
+        volume_threshold = _row([p["volume_threshold"] for p in param_sets])
+        price = close.to_numpy(dtype=float)[:, None]
+        
+        entries = (price > _shift(recent_high)) & (
+            volume.to_numpy(dtype=float)[:, None] > avg_volume * volume_threshold
+        )
+        exits = price < _shift(recent_low)
+        return entries, exits
 
 
 class CryptoRSIStrategy(CryptoStrategy):
@@ -287,13 +370,7 @@ class CryptoRSIStrategy(CryptoStrategy):
         oversold = self.parameters.get("oversold", 25)
         overbought = self.parameters.get("overbought", 75)
         
-        # Calculate RSI
-        delta = close.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-        
-        rs = gain / loss.replace(0, np.inf)
-        rsi = 100 - (100 / (1 + rs))
+        rsi = _rsi(close, period)
         
         # Entry: RSI crosses below oversold
         entries = (rsi < oversold) & (rsi.shift(1) >= oversold)
@@ -302,6 +379,21 @@ class CryptoRSIStrategy(CryptoStrategy):
         exits = (rsi > overbought) & (rsi.shift(1) <= overbought)
         
         return entries.fillna(False), exits.fillna(False)
+    
+    @classmethod
+    def generate_signal_grid(cls, data, param_sets):
+        """Generate RSI signals from one RSI family."""
+        close = _close(data)
+        (rsi,) = _indicator_family(
+            lambda period: _rsi(close, period), [p["period"] for p in param_sets]
+        )
+        rsi_prev = _shift(rsi)
+        oversold = _row([p["oversold"] for p in param_sets])
+        overbought = _row([p["overbought"] for p in param_sets])
+        
+        entries = (rsi < oversold) & (rsi_prev >= oversold)
+        exits = (rsi > overbought) & (rsi_prev <= overbought)
+        return entries, exits
 
 
 class CryptoMACDStrategy(CryptoStrategy):
@@ -356,6 +448,31 @@ class CryptoMACDStrategy(CryptoStrategy):
         exits = (macd_line < signal_line) & (macd_line.shift(1) >= signal_line.shift(1))
         
         return entries.fillna(False), exits.fillna(False)
+    
+    @classmethod
+    def generate_signal_grid(cls, data, param_sets):
+        """Generate MACD signals from one EMA family."""
+        close = _close(data)
+        fast_ema, slow_ema = _indicator_family(
+            lambda span: close.ewm(span=span, adjust=False).mean(),
+            [p["fast_period"] for p in param_sets],
+            [p["slow_period"] for p in param_sets],
+        )
+        macd_line = fast_ema - slow_ema
+        
+        # Signal lines: one EWM pass per distinct signal span over all its columns
+        signal_line = np.empty_like(macd_line)
+        signal_periods = np.array([p["signal_period"] for p in param_sets])
+        for span in np.unique(signal_periods):
+            cols = np.flatnonzero(signal_periods == span)
+            signal_line[:, cols] = (
+                pd.DataFrame(macd_line[:, cols]).ewm(span=span, adjust=False).mean().to_numpy()
+            )
+        macd_prev, signal_prev = _shift(macd_line), _shift(signal_line)
+        
+        entries = (macd_line > signal_line) & (macd_prev <= signal_prev)
+        exits = (macd_line < signal_line) & (macd_prev >= signal_prev)
+        return entries, exits
 
 
 class CryptoBollingerStrategy(CryptoStrategy):
@@ -404,6 +521,76 @@ class CryptoBollingerStrategy(CryptoStrategy):
         exits = (close > upper) & (close.shift(1) <= upper.shift(1))
         
         return entries.fillna(False), exits.fillna(False)
+    
+    @classmethod
+    def generate_signal_grid(cls, data, param_sets):
+        """Generate Bollinger Band signals from shared band families."""
+        close = _close(data)
+        periods = [p["period"] for p in param_sets]
+        (middle,) = _indicator_family(lambda w: close.rolling(window=w).mean(), periods)
+        (std,) = _indicator_family(lambda w: close.rolling(window=w).std(), periods)
+        std_dev = _row([p["std_dev"] for p in param_sets])
+        
+        upper = middle + (std_dev * std)
+        lower = middle - (std_dev * std)
+        price = close.to_numpy(dtype=float)[:, None]
+        price_prev = _shift(price)
+        
+        entries = (price < lower) & (price_prev >= _shift(lower))
+        exits = (price > upper) & (price_prev <= _shift(upper))
+        return entries, exits
+
+
+# ==================== Vectorized Helpers ====================
+
+
+def _close(data: DataFrame) -> Series:
+    return data["Close"] if "Close" in data.columns else data["close"]
+
+
+def _rsi(close: Series, period: int) -> Series:
+    """Simple-average RSI used by CryptoRSIStrategy."""
+    delta = close.diff()
+    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+    
+    rs = gain / loss.replace(0, np.inf)
+    return 100 - (100 / (1 + rs))
+
+
+def _indicator_family(
+    compute: Callable[[Any], Series],
+    *param_columns: list[Any],
+) -> list[np.ndarray]:
+    """
+    Compute an indicator once per distinct parameter value.
+    
+    Args:
+        compute: Builds the indicator Series for one parameter value
+        *param_columns: Per-parameter-set values, one list per role
+            (e.g., fast and slow periods sharing one SMA family)
+            
+    Returns:
+        One (rows, len(param_set)) float array per role, gathered from
+        the shared family
+    """
+    distinct = sorted(set().union(*param_columns))
+    family = np.column_stack([compute(value).to_numpy(dtype=float) for value in distinct])
+    position = {value: i for i, value in enumerate(distinct)}
+    return [family[:, [position[v] for v in values]] for values in param_columns]
+
+
+def _shift(values: np.ndarray) -> np.ndarray:
+    """Shift a (rows, columns) float array down one row, NaN-filling the first."""
+    shifted = np.empty_like(values, dtype=float)
+    shifted[0] = np.nan
+    shifted[1:] = values[:-1]
+    return shifted
+
+
+def _row(values: list[Any]) -> np.ndarray:
+    """Per-parameter-set scalars as a row that broadcasts across time."""
+    return np.asarray(values)[None, :]
 
 
 # Strategy registry
@@ -46,7 +46,11 @@ class DefiLlamaProvider:
     COINS_URL = "https://coins.llama.fi"
     STABLECOINS_URL = "https://stablecoins.llama.fi"
 
-    def __init__(self, timeout: float = 30.0, http_client: AsyncHTTPClient | None = None):
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        http_client: AsyncHTTPClient | httpx.AsyncClient | None = None,
+    ):
         """
         Initialize DefiLlama provider.
 
@@ -59,7 +63,7 @@ class DefiLlamaProvider:
         self._owns_client = http_client is None
         logger.info("DefiLlamaProvider initialized")
 
-    async def _get_client(self) -> AsyncHTTPClient:
+    async def _get_client(self) -> AsyncHTTPClient | httpx.AsyncClient:
         """Get or create HTTP client."""
         if self._http_client is None:
             self._http_client = AsyncHTTPClient(timeout=self.timeout)
@@ -19,6 +19,8 @@ from typing import Any
 
 import httpx
 
+from maverick_crypto.providers.coingecko_provider import get_host_rate_limiter
+
 logger = logging.getLogger(__name__)
 
 
@@ -78,6 +80,9 @@ class OnChainProvider:
         else:
             self.base_url = self.BASE_URL
 
+        # Shares the CoinGecko budget with CoinGeckoProvider
+        self.rate_limiter = get_host_rate_limiter(httpx.URL(self.base_url).host)
+
         logger.info(f"OnChainProvider initialized (API key: {'yes' if api_key else 'no'})")
 
     async def _get_client(self) -> httpx.AsyncClient:
@@ -109,6 +114,7 @@ class OnChainProvider:
             params["x_cg_demo_api_key"] = self.api_key
 
         try:
+            await self.rate_limiter.acquire()
             client = await self._get_client()
             response = await client.get(
                 url,
@@ -312,14 +312,19 @@ class NewsAggregator:
         >>> news = await aggregator.get_all_news(["BTC"])
     """
     
-    def __init__(self, cryptopanic_key: str | None = None):
+    def __init__(
+        self,
+        cryptopanic_key: str | None = None,
+        cryptopanic: CryptoPanicProvider | None = None,
+    ):
         """
         Initialize news aggregator.
         
         Args:
             cryptopanic_key: Optional CryptoPanic API key
+            cryptopanic: Optional shared CryptoPanic provider (overrides the key)
         """
-        self.cryptopanic = CryptoPanicProvider(api_key=cryptopanic_key)
+        self.cryptopanic = cryptopanic or CryptoPanicProvider(api_key=cryptopanic_key)
     
     async def get_all_news(
         self,
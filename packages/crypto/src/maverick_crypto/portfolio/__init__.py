@@ -10,6 +10,10 @@ from maverick_crypto.portfolio.mixed_portfolio import (
     AssetType,
     PortfolioAsset,
 )
+from maverick_crypto.portfolio.frontier import (
+    EfficientFrontierSolver,
+    FrontierPortfolio,
+)
 from maverick_crypto.portfolio.optimizer import (
     PortfolioOptimizer,
     OptimizationObjective,
@@ -17,13 +21,19 @@ from maverick_crypto.portfolio.optimizer import (
 from maverick_crypto.portfolio.correlation import (
     CorrelationAnalyzer,
 )
+from maverick_crypto.portfolio.returns_panel import (
+    ReturnsPanel,
+)
 
 __all__ = [
     "MixedPortfolioService",
     "AssetType",
     "PortfolioAsset",
     "PortfolioOptimizer",
+    "EfficientFrontierSolver",
+    "FrontierPortfolio",
     "OptimizationObjective",
     "CorrelationAnalyzer",
+    "ReturnsPanel",
 ]
 
@@ -8,7 +8,7 @@ to help with diversification and risk management.
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import pandas as pd
@@ -20,8 +20,14 @@ from maverick_crypto.portfolio.mixed_portfolio import (
     PortfolioAsset,
 )
 
+if TYPE_CHECKING:
+    from maverick_crypto.portfolio.returns_panel import ReturnsPanel
+
 logger = logging.getLogger(__name__)
 
+# Number of most and least correlated pairs reported
+NUM_EXTREME_PAIRS = 5
+
 
 class CorrelationAnalyzer:
     """
@@ -33,12 +39,19 @@ class CorrelationAnalyzer:
         - Asset class correlation (stocks vs crypto)
         - Diversification score
     
+    All analyses read from a ReturnsPanel. Pass the same panel to several
+    methods (or reuse one analyzer) and each symbol is fetched only once.
+    
     Example:
         >>> analyzer = CorrelationAnalyzer()
-        >>> correlation = await analyzer.calculate_correlation(
-        ...     stocks=["AAPL", "MSFT", "GOOGL"],
+        >>> panel = await analyzer.returns_panel(["AAPL", "MSFT"], ["BTC", "ETH"], days=90)
+        >>> correlation = await analyzer.calculate_correlation_matrix(
+        ...     stocks=["AAPL", "MSFT"],
         ...     cryptos=["BTC", "ETH"],
-        ...     days=90,
+        ...     panel=panel,
+        ... )
+        >>> comparison = await analyzer.asset_class_comparison(
+        ...     ["AAPL", "MSFT"], ["BTC", "ETH"], panel=panel
         ... )
     """
     
@@ -46,24 +59,23 @@ class CorrelationAnalyzer:
         """Initialize correlation analyzer."""
         self.portfolio_service = MixedPortfolioService()
     
-    async def calculate_correlation_matrix(
+    async def returns_panel(
         self,
         stocks: list[str],
         cryptos: list[str],
         days: int = 90,
-    ) -> dict[str, Any]:
+    ) -> ReturnsPanel:
         """
-        Calculate correlation matrix between all assets.
+        Get the aligned returns panel for stocks and cryptos.
         
         Args:
-            stocks: List of stock symbols
-            cryptos: List of crypto symbols
-            days: Number of days for analysis
+            stocks: Stock symbols
+            cryptos: Crypto symbols
+            days: Number of days of history
             
         Returns:
-            Dictionary with correlation matrix and analysis
+            ReturnsPanel memoized for this analyzer
         """
-        # Create portfolio assets
         assets = [
             PortfolioAsset(symbol=s, asset_type=AssetType.STOCK, weight=0)
             for s in stocks
@@ -71,9 +83,32 @@ class CorrelationAnalyzer:
             PortfolioAsset(symbol=c, asset_type=AssetType.CRYPTO, weight=0)
             for c in cryptos
         ]
+        return await self.portfolio_service.get_returns_panel(assets, days)
+    
+    async def calculate_correlation_matrix(
+        self,
+        stocks: list[str],
+        cryptos: list[str],
+        days: int = 90,
+        panel: ReturnsPanel | None = None,
+    ) -> dict[str, Any]:
+        """
+        Calculate correlation matrix between all assets.
         
-        # Get returns
-        returns_df = await self.portfolio_service.calculate_returns(assets, days)
+        Args:
+            stocks: List of stock symbols
+            cryptos: List of crypto symbols
+            days: Number of days for analysis
+            panel: Optional pre-built panel containing these assets
+            
+        Returns:
+            Dictionary with correlation matrix and analysis
+        """
+        if panel is None:
+            panel = await self.returns_panel(stocks, cryptos, days)
+        else:
+            days = panel.days
+        returns_df = panel.subset(stocks + cryptos).returns
         
         if returns_df.empty:
             return {"error": "No data available for correlation analysis"}
@@ -91,22 +126,29 @@ class CorrelationAnalyzer:
             crypto_returns = returns_df[crypto_symbols].mean(axis=1)
             stock_crypto_corr = stock_returns.corr(crypto_returns)
         
+        # Upper-triangle pairs (i < j)
+        symbols = list(corr_matrix.columns)
+        rows, cols = np.triu_indices(len(symbols), k=1)
+        pair_corr = corr_matrix.to_numpy()[rows, cols]
+        
+        def pairs(indices) -> list[dict[str, Any]]:
+            return [
+                {
+                    "asset1": symbols[rows[k]],
+                    "asset2": symbols[cols[k]],
+                    "correlation": round(float(pair_corr[k]), 3),
+                }
+                for k in indices
+            ]
+        
         # Diversification score (lower avg correlation = better diversification)
-        avg_correlation = corr_matrix.values[np.triu_indices_from(corr_matrix.values, k=1)].mean()
+        avg_correlation = pair_corr.mean()
         diversification_score = 1 - abs(avg_correlation)
         
-        # Identify highly correlated pairs
-        high_corr_pairs = []
-        for i, col1 in enumerate(corr_matrix.columns):
-            for j, col2 in enumerate(corr_matrix.columns):
-                if i < j:
-                    corr_val = corr_matrix.iloc[i, j]
-                    if abs(corr_val) > 0.7:
-                        high_corr_pairs.append({
-                            "asset1": col1,
-                            "asset2": col2,
-                            "correlation": round(corr_val, 3),
-                        })
+        # Identify highly correlated pairs, plus the extremes
+        high_corr_pairs = pairs(np.flatnonzero(np.abs(pair_corr) > 0.7))
+        valid = np.flatnonzero(np.isfinite(pair_corr))
+        order = valid[np.argsort(pair_corr[valid], kind="stable")]
         
         return {
             "correlation_matrix": corr_matrix.round(3).to_dict(),
@@ -114,6 +156,8 @@ class CorrelationAnalyzer:
             "average_correlation": round(avg_correlation, 3),
             "diversification_score": round(diversification_score, 3),
             "high_correlation_pairs": high_corr_pairs,
+            "most_correlated_pairs": pairs(order[::-1][:NUM_EXTREME_PAIRS]),
+            "least_correlated_pairs": pairs(order[:NUM_EXTREME_PAIRS]),
             "interpretation": self._interpret_correlation(stock_crypto_corr, diversification_score),
             "assets_analyzed": {
                 "stocks": stock_symbols,
@@ -163,6 +207,7 @@ class CorrelationAnalyzer:
         asset2_type: str,
         days: int = 365,
         window: int = 30,
+        panel: ReturnsPanel | None = None,
     ) -> dict[str, Any]:
         """
         Calculate rolling correlation between two assets.
@@ -174,16 +219,19 @@ class CorrelationAnalyzer:
             asset2_type: "stock" or "crypto"
             days: Total days of data
             window: Rolling window size
+            panel: Optional pre-built panel containing both assets
             
         Returns:
             Dictionary with rolling correlation data
         """
-        assets = [
-            PortfolioAsset(symbol=asset1, asset_type=AssetType(asset1_type), weight=0),
-            PortfolioAsset(symbol=asset2, asset_type=AssetType(asset2_type), weight=0),
-        ]
+        if panel is None:
+            assets = [
+                PortfolioAsset(symbol=asset1, asset_type=AssetType(asset1_type), weight=0),
+                PortfolioAsset(symbol=asset2, asset_type=AssetType(asset2_type), weight=0),
+            ]
+            panel = await self.portfolio_service.get_returns_panel(assets, days)
         
-        returns_df = await self.portfolio_service.calculate_returns(assets, days)
+        returns_df = panel.subset([asset1, asset2]).returns
         
         if returns_df.empty or len(returns_df.columns) < 2:
             return {"error": "Insufficient data for rolling correlation"}
@@ -219,18 +267,28 @@ class CorrelationAnalyzer:
         stocks: list[str],
         cryptos: list[str],
         days: int = 90,
+        panel: ReturnsPanel | None = None,
     ) -> dict[str, Any]:
         """
         Compare performance of stocks vs crypto as asset classes.
         
+        Each class is measured on its own calendar (exchange days for
+        stocks, every day for crypto).
+        
         Args:
             stocks: Stock symbols
             cryptos: Crypto symbols
             days: Analysis period
+            panel: Optional pre-built panel containing these assets
             
         Returns:
             Asset class comparison
         """
+        if panel is None:
+            panel = await self.returns_panel(stocks, cryptos, days)
+        else:
+            days = panel.days
+        
         # Create equal-weighted portfolios for each class
         stock_assets = [
             PortfolioAsset(symbol=s, asset_type=AssetType.STOCK, weight=1/len(stocks))
@@ -242,8 +300,9 @@ class CorrelationAnalyzer:
         ]
         
         # Calculate performance
-        stock_perf = await self.portfolio_service.calculate_performance(stock_assets, days)
-        crypto_perf = await self.portfolio_service.calculate_performance(crypto_assets, days)
+        service = self.portfolio_service
+        stock_perf = service.performance_from_returns(panel.subset(stocks).returns, stock_assets)
+        crypto_perf = service.performance_from_returns(panel.subset(cryptos).returns, crypto_assets)
         
         # Extract metrics
         stock_return = stock_perf.get("portfolio", {}).get("total_return_pct", 0)
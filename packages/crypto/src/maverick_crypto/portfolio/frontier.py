@@ -0,0 +1,508 @@
+"""
+Efficient Frontier Solver.
+
+Exact mean-variance frontier for long-only or bounded portfolios with
+asset-class limits. Every point is the solution of a convex quadratic
+program solved with a primal active-set method:
+
+    - Minimum variance: min w'Σw  s.t. sum(w) = 1, bounds, groups
+    - Frontier point:   same, plus w'μ = target return
+    - Maximum Sharpe:   min y'Σy  s.t. (μ - rf)'y = 1 and the homogenized
+      bounds/groups, with w = y / sum(y)
+
+The covariance matrix is factorized once per solver and reused by every
+solve, and each frontier point warm-starts from its neighbour, so sweeping
+the frontier costs little more than a single solve.
+
+Singular or ill-conditioned covariances (duplicated or perfectly correlated
+assets, more assets than observations) are regularized with a relative
+ridge before factorizing. Every solution is checked for convergence and
+feasibility; if the active-set method fails, the same program is solved
+with SLSQP instead.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Check for scipy
+try:
+    from scipy.linalg import cho_factor, cho_solve
+    from scipy.optimize import linprog, minimize
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+    cho_factor = cho_solve = linprog = minimize = None
+
+
+@dataclass
+class FrontierPortfolio:
+    """
+    A portfolio on the efficient frontier.
+
+    Attributes:
+        weights: Asset weights (sum to 1)
+        expected_return: Annualized expected return
+        volatility: Annualized volatility
+        sharpe_ratio: (return - risk-free rate) / volatility
+    """
+    weights: np.ndarray
+    expected_return: float
+    volatility: float
+    sharpe_ratio: float
+
+    def to_dict(self, symbols: list[str], decimals: int = 3) -> dict[str, Any]:
+        """Convert to the optimizer's point format."""
+        return {
+            "return_pct": round(self.expected_return * 100, 2),
+            "volatility_pct": round(self.volatility * 100, 2),
+            "sharpe_ratio": round(self.sharpe_ratio, 3),
+            "weights": {s: round(float(w), decimals) for s, w in zip(symbols, self.weights)},
+        }
+
+
+class EfficientFrontierSolver:
+    """
+    Mean-variance optimizer over a fixed asset universe.
+
+    Example:
+        >>> solver = EfficientFrontierSolver(mu, cov, upper=0.4, risk_free_rate=0.05)
+        >>> tangency = solver.max_sharpe()
+        >>> frontier = solver.frontier(num_points=50)
+    """
+
+    MAX_ITERATIONS = 1000
+    TOLERANCE = 1e-10
+    # Constraint violation accepted in a solution
+    FEASIBILITY_TOLERANCE = 1e-8
+    # Ridge always added to Σ, relative to its largest eigenvalue
+    RIDGE = 1e-12
+    # Smallest eigenvalue of the regularized Σ, relative to the largest
+    MIN_EIGENVALUE_RATIO = 1e-8
+
+    def __init__(
+        self,
+        expected_returns: Any,
+        cov_matrix: Any,
+        lower: float | Any = 0.0,
+        upper: float | Any = 1.0,
+        groups: list[tuple[list[int], float, float]] | None = None,
+        risk_free_rate: float = 0.0,
+    ):
+        """
+        Initialize the solver and factorize the covariance matrix.
+
+        Args:
+            expected_returns: Annualized expected returns, one per asset
+            cov_matrix: Annualized covariance matrix
+            lower: Minimum weight per asset (scalar or per-asset)
+            upper: Maximum weight per asset (scalar or per-asset)
+            groups: Optional (asset indices, min total, max total) limits,
+                e.g. a cap on the combined crypto weight
+            risk_free_rate: Annual risk-free rate for Sharpe ratios
+
+        Raises:
+            ImportError: If scipy is not installed
+            ValueError: If the bounds cannot sum to 1 or the covariance
+                matrix is not positive semi-definite
+        """
+        if not HAS_SCIPY:
+            raise ImportError("scipy is required. Install with: pip install scipy")
+
+        self.mu = np.asarray(expected_returns, dtype=float)
+        self.cov = np.asarray(cov_matrix, dtype=float)
+        n = len(self.mu)
+        self.n_assets = n
+        self.lower = np.broadcast_to(np.asarray(lower, dtype=float), (n,)).copy()
+        self.upper = np.broadcast_to(np.asarray(upper, dtype=float), (n,)).copy()
+        self.groups = groups or []
+        self.risk_free_rate = risk_free_rate
+
+        if self.cov.shape != (n, n):
+            raise ValueError(f"Covariance matrix must be {n}x{n}")
+        if np.any(self.lower > self.upper) or self.lower.sum() > 1 + 1e-12 or self.upper.sum() < 1 - 1e-12:
+            raise ValueError("Per-asset weight bounds cannot sum to 1")
+
+        # Inequality rows G w <= h: upper bounds, lower bounds, group limits
+        rows, limits = [np.eye(n), -np.eye(n)], [self.upper, -self.lower]
+        for indices, group_min, group_max in self.groups:
+            member = np.zeros(n)
+            member[list(indices)] = 1.0
+            rows += [member[None, :], -member[None, :]]
+            limits += [np.array([group_max]), np.array([-group_min])]
+        self._G = np.vstack(rows)
+        self._h = np.concatenate(limits)
+
+        self._factorize()
+        self._cov_inv_G = cho_solve(self._chol, self._G.T)
+        self._min_variance: FrontierPortfolio | None = None
+        self._max_return: FrontierPortfolio | None = None
+
+    def _factorize(self) -> None:
+        """
+        Cholesky-factorize a regularized Σ.
+
+        A relative ridge is always added. When Σ is singular or
+        ill-conditioned the ridge is raised until the smallest eigenvalue
+        is MIN_EIGENVALUE_RATIO times the largest; otherwise the Schur
+        complements of the active-set steps lose all precision and the
+        solves return infeasible points.
+        """
+        cov = (self.cov + self.cov.T) / 2
+        eigenvalues = np.linalg.eigvalsh(cov)
+        largest = float(eigenvalues[-1])
+        if largest <= 0:
+            largest = 1.0
+        if eigenvalues[0] < -1e-4 * largest:
+            raise ValueError("Covariance matrix is not positive semi-definite")
+
+        ridge = max(self.RIDGE * largest, self.MIN_EIGENVALUE_RATIO * largest - eigenvalues[0])
+        if ridge > self.RIDGE * largest:
+            logger.debug(
+                f"Covariance ill-conditioned (eigenvalues {eigenvalues[0]:.2e} to "
+                f"{largest:.2e}); regularized with ridge {ridge:.2e}"
+            )
+        self._cov_reg = cov + ridge * np.eye(self.n_assets)
+        self._chol = cho_factor(self._cov_reg)
+
+    # ==================== Key Portfolios ====================
+
+    def max_return(self) -> FrontierPortfolio:
+        """
+        Highest-return portfolio (lowest variance among ties).
+
+        Raises:
+            ValueError: If the constraints are infeasible
+        """
+        if self._max_return is None:
+            n = self.n_assets
+            group_rows = self._G[2 * n:]
+            result = linprog(
+                -self.mu,
+                A_ub=group_rows if len(group_rows) else None,
+                b_ub=self._h[2 * n:] if len(group_rows) else None,
+                A_eq=np.ones((1, n)),
+                b_eq=[1.0],
+                bounds=list(zip(self.lower, self.upper)),
+                method="highs",
+            )
+            if not result.success:
+                raise ValueError(f"Portfolio constraints are infeasible: {result.message}")
+
+            weights = np.clip(result.x, self.lower, self.upper)
+            if self._has_tied_optima(weights):
+                # Several portfolios reach the top return; take the least risky
+                weights = self._solve_weights(weights, float(self.mu @ weights))
+            self._max_return = self._portfolio(weights)
+        return self._max_return
+
+    def _has_tied_optima(self, weights: np.ndarray) -> bool:
+        """Whether a held asset shares its expected return with another asset."""
+        held = self.mu[weights > 1e-9]
+        gaps = np.abs(self.mu[:, None] - held[None, :])
+        return bool(np.sum(gaps <= 1e-12 * (1 + np.abs(self.mu).max())) > len(held))
+
+    def min_variance(self) -> FrontierPortfolio:
+        """Global minimum-variance portfolio."""
+        if self._min_variance is None:
+            start = self.max_return().weights
+            weights = self._solve_weights(start, target=None)
+            self._min_variance = self._portfolio(weights)
+        return self._min_variance
+
+    def max_sharpe(self) -> FrontierPortfolio:
+        """
+        Maximum Sharpe ratio (tangency) portfolio.
+
+        If no portfolio beats the risk-free rate, the frontier point with
+        the highest (least negative) Sharpe ratio is returned instead.
+
+        Raises:
+            ValueError: If no feasible tangency portfolio is found
+        """
+        best = self.max_return()
+        excess = self.mu - self.risk_free_rate
+        if excess @ best.weights <= self.TOLERANCE:
+            logger.debug("No portfolio beats the risk-free rate; using frontier scan")
+            return max(self.frontier(50), key=lambda p: p.sharpe_ratio)
+
+        # Homogenize w = y / sum(y): a lower/upper bound l <= w_i <= u becomes
+        # l * sum(y) - y_i <= 0 and y_i - u * sum(y) <= 0, groups likewise.
+        ones = np.ones(self.n_assets)
+        G = self._G - self._h[:, None] * ones[None, :]
+        G = np.vstack([G, -ones[None, :]])
+        A = excess[None, :]
+        start = best.weights / (excess @ best.weights)
+
+        h = np.zeros(len(G))
+        y, _, converged = self._active_set(start, A, G, h, cho_solve(self._chol, G.T), [])
+        if not (converged and y.sum() > 0 and self._is_feasible(y / y.sum())):
+            logger.warning("Active-set QP failed for the tangency portfolio; using SLSQP")
+            y = self._solve_fallback(start, A, np.ones(1), G, h)
+            if not (y.sum() > 0 and self._is_feasible(y / y.sum())):
+                raise ValueError("Could not find a feasible maximum Sharpe portfolio")
+        return self._portfolio(y / y.sum())
+
+    # ==================== Frontier ====================
+
+    def portfolio_for_return(self, target: float) -> FrontierPortfolio:
+        """
+        Minimum-variance portfolio with a given expected return.
+
+        Args:
+            target: Target annualized return between the minimum-variance
+                and maximum-return portfolios' returns
+
+        Raises:
+            ValueError: If the target is outside the efficient range
+        """
+        low, high = self.min_variance(), self.max_return()
+        span = high.expected_return - low.expected_return
+        slack = 1e-9 * (1 + abs(high.expected_return))
+        if not low.expected_return - slack <= target <= high.expected_return + slack:
+            raise ValueError(
+                f"Target return {target:.4f} outside efficient range "
+                f"[{low.expected_return:.4f}, {high.expected_return:.4f}]"
+            )
+        if span <= slack:
+            return low
+
+        alpha = np.clip((target - low.expected_return) / span, 0.0, 1.0)
+        start = (1 - alpha) * low.weights + alpha * high.weights
+        weights = self._solve_weights(start, target)
+        return self._portfolio(weights)
+
+    def frontier(self, num_points: int = 50) -> list[FrontierPortfolio]:
+        """
+        Sweep the efficient frontier over evenly spaced target returns.
+
+        Each point starts from the previous solution moved just far enough
+        toward the max-return portfolio, so most points converge in a
+        handful of iterations.
+
+        Args:
+            num_points: Number of frontier points (including both ends)
+
+        Returns:
+            Frontier portfolios ordered by increasing return
+        """
+        low, high = self.min_variance(), self.max_return()
+        span = high.expected_return - low.expected_return
+        if num_points < 2 or span <= 1e-9 * (1 + abs(high.expected_return)):
+            return [low]
+
+        points = [low]
+        previous = low
+        for target in np.linspace(low.expected_return, high.expected_return, num_points)[1:-1]:
+            alpha = (target - previous.expected_return) / (high.expected_return - previous.expected_return)
+            start = (1 - alpha) * previous.weights + alpha * high.weights
+            weights = self._solve_weights(start, target)
+            previous = self._portfolio(weights)
+            points.append(previous)
+        points.append(high)
+        return points
+
+    # ==================== Active-Set QP ====================
+
+    def _solve_weights(
+        self,
+        start: np.ndarray,
+        target: float | None,
+    ) -> np.ndarray:
+        """
+        Minimum-variance weights from a feasible start, optionally at a target return.
+
+        Raises:
+            ValueError: If neither the active-set method nor SLSQP finds a
+                feasible solution
+        """
+        A = np.ones((1, self.n_assets)) if target is None else np.vstack([np.ones(self.n_assets), self.mu])
+        working = self._active_bounds(start, A)
+        weights, _, converged = self._active_set(start, A, self._G, self._h, self._cov_inv_G, working)
+        if converged and self._is_feasible(weights, target):
+            return weights
+
+        logger.warning("Active-set QP failed; using SLSQP")
+        b = np.ones(1) if target is None else np.array([1.0, target])
+        weights = self._solve_fallback(start, A, b, self._G, self._h)
+        if not self._is_feasible(weights, target):
+            raise ValueError("Could not find a feasible portfolio")
+        return weights
+
+    def _is_feasible(self, weights: np.ndarray, target: float | None = None) -> bool:
+        """Whether weights sum to 1 and respect the bounds, groups and target return."""
+        tol = self.FEASIBILITY_TOLERANCE
+        if not np.all(np.isfinite(weights)):
+            return False
+        if abs(weights.sum() - 1.0) > tol or np.max(self._G @ weights - self._h) > tol:
+            return False
+        return target is None or abs(self.mu @ weights - target) <= tol * (1 + abs(target))
+
+    def _solve_fallback(
+        self,
+        x: np.ndarray,
+        A: np.ndarray,
+        b: np.ndarray,
+        G: np.ndarray,
+        h: np.ndarray,
+    ) -> np.ndarray:
+        """Solve min x'Σx s.t. Ax = b, Gx <= h with SLSQP, starting from x."""
+        cov = self._cov_reg
+        result = minimize(
+            lambda v: v @ cov @ v,
+            x,
+            jac=lambda v: 2 * cov @ v,
+            method="SLSQP",
+            constraints=[
+                {"type": "eq", "fun": lambda v: A @ v - b, "jac": lambda v: A},
+                {"type": "ineq", "fun": lambda v: h - G @ v, "jac": lambda v: -G},
+            ],
+            options={"maxiter": self.MAX_ITERATIONS, "ftol": 1e-15},
+        )
+        if not result.success:
+            logger.warning(f"SLSQP did not converge: {result.message}")
+        return result.x
+
+    def _active_bounds(self, x: np.ndarray, A: np.ndarray) -> list[int]:
+        """
+        Bound rows active at x, as a starting working set.
+
+        Assets pinned at a bound are kept in the working set only while
+        the equality rows restricted to the remaining free assets keep
+        full rank, so the set stays linearly independent.
+        """
+        n = self.n_assets
+        at_upper = np.flatnonzero(self.upper - x <= self.TOLERANCE)
+        at_lower = np.setdiff1d(np.flatnonzero(x - self.lower <= self.TOLERANCE), at_upper)
+        pinned = np.concatenate([at_upper, at_lower])
+        rows = np.concatenate([at_upper, n + at_lower])
+
+        free = np.ones(n, dtype=bool)
+        free[pinned] = False
+        rank = np.linalg.matrix_rank(A[:, free]) if free.any() else 0
+        keep = np.ones(len(pinned), dtype=bool)
+        for k, asset in enumerate(pinned):
+            if rank == len(A):
+                break
+            trial = free.copy()
+            trial[asset] = True
+            trial_rank = np.linalg.matrix_rank(A[:, trial])
+            if trial_rank > rank:
+                free, rank, keep[k] = trial, trial_rank, False
+        return rows[keep].tolist()
+
+    def _active_set(
+        self,
+        x: np.ndarray,
+        A: np.ndarray,
+        G: np.ndarray,
+        h: np.ndarray,
+        cov_inv_G: np.ndarray,
+        working: list[int],
+    ) -> tuple[np.ndarray, list[int], bool]:
+        """
+        Primal active-set method for min x'Σx s.t. Ax = b, Gx <= h.
+
+        Each step solves the equality-constrained subproblem on the
+        working set with the range-space method, using the cached Σ
+        factorization (Σ⁻¹G' is precomputed, so a step costs only a small
+        dense solve in the number of active constraints).
+
+        Args:
+            x: Feasible starting point
+            A: Equality rows (the right-hand side is implied by x)
+            G: Inequality rows
+            h: Inequality limits
+            cov_inv_G: Σ⁻¹G'
+            working: Inequality rows active at x, linearly independent of A
+
+        Returns:
+            Tuple of (solution, final working set, whether it converged)
+        """
+        x = x.copy()
+        working = list(working)
+        cov_inv_A = cho_solve(self._chol, A.T)
+        n_eq = len(A)
+        stalled = False
+        # x minimizes over the working set after a full, unblocked step
+        minimized = False
+
+        for _ in range(self.MAX_ITERATIONS):
+            rows = np.vstack([A, G[working]])
+            cov_inv_rows = np.hstack([cov_inv_A, cov_inv_G[:, working]])
+
+            # Step p minimizing (x+p)'Σ(x+p) with rows·p = 0; Σ⁻¹ times the gradient is x itself
+            M = rows @ cov_inv_rows
+            nu = self._solve_small(M, -(rows @ x))
+            p = -(x + cov_inv_rows @ nu)
+            # One round of iterative refinement keeps p on the working rows
+            # when Σ is ill-conditioned
+            correction = self._solve_small(M, rows @ p)
+            nu += correction
+            p -= cov_inv_rows @ correction
+
+            if minimized or np.max(np.abs(p)) <= self.TOLERANCE * (1 + np.max(np.abs(x))):
+                minimized = False
+                multipliers = nu[n_eq:]
+                if not working or multipliers.min() >= -self.TOLERANCE:
+                    return x, working, True
+                if stalled:
+                    # Degenerate vertex: Bland's rule (lowest row index) to avoid cycling
+                    negative = [(row, k) for k, row in enumerate(working) if multipliers[k] < -self.TOLERANCE]
+                    working.pop(min(negative)[1])
+                else:
+                    working.pop(int(np.argmin(multipliers)))
+                continue
+
+            # Ratio test against inactive constraints the step moves toward
+            Gp = G @ p
+            moving = Gp > self.TOLERANCE * np.max(np.abs(p))
+            moving[working] = False
+            alpha, blocking = 1.0, None
+            if moving.any():
+                candidates = np.flatnonzero(moving)
+                slack = np.maximum(h[candidates] - G[candidates] @ x, 0.0)
+                ratios = slack / Gp[candidates]
+                k = int(np.argmin(ratios))
+                if ratios[k] < 1.0:
+                    alpha, blocking = float(ratios[k]), int(candidates[k])
+
+            x = x + alpha * p
+            stalled = alpha <= self.TOLERANCE
+            minimized = blocking is None
+            if blocking is not None:
+                working.append(blocking)
+
+        logger.debug("Active-set QP did not converge")
+        return x, working, False
+
+    @staticmethod
+    def _solve_small(M: np.ndarray, rhs: np.ndarray) -> np.ndarray:
+        try:
+            return np.linalg.solve(M, rhs)
+        except np.linalg.LinAlgError:
+            return np.linalg.lstsq(M, rhs, rcond=None)[0]
+
+    def _portfolio(self, weights: np.ndarray) -> FrontierPortfolio:
+        weights = np.clip(weights, self.lower, self.upper)
+        ret = float(self.mu @ weights)
+        vol = float(np.sqrt(max(weights @ self.cov @ weights, 0.0)))
+        sharpe = (ret - self.risk_free_rate) / vol if vol > 0 else 0.0
+        return FrontierPortfolio(
+            weights=weights,
+            expected_return=ret,
+            volatility=vol,
+            sharpe_ratio=sharpe,
+        )
+
+
+__all__ = [
+    "EfficientFrontierSolver",
+    "FrontierPortfolio",
+]
@@ -11,11 +11,13 @@ import logging
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
-import pandas as pd
-from pandas import DataFrame
+from pandas import DataFrame, Series
+
+if TYPE_CHECKING:
+    from maverick_crypto.portfolio.returns_panel import ReturnsPanel
 
 logger = logging.getLogger(__name__)
 
@@ -71,10 +73,14 @@ class MixedPortfolioService:
     
     Features:
         - Unified data fetching for stocks and crypto
+        - Calendar-aligned returns panels, memoized per (symbols, days)
         - Performance calculation across asset types
         - Risk metrics for mixed portfolios
         - Rebalancing recommendations
     
+    Fetched closes and panels are kept for the life of the service, so
+    create one service per request or analysis session.
+    
     Example:
         >>> service = MixedPortfolioService()
         >>> portfolio = await service.create_portfolio([
@@ -90,6 +96,8 @@ class MixedPortfolioService:
         """Initialize the mixed portfolio service."""
         self._stock_provider = None
         self._crypto_provider = None
+        self._closes: dict[tuple[str, AssetType, int], Series | None] = {}
+        self._panels: dict[tuple[tuple[tuple[str, AssetType], ...], int], ReturnsPanel] = {}
         logger.info("MixedPortfolioService initialized")
     
     async def _get_stock_provider(self):
@@ -107,8 +115,8 @@ class MixedPortfolioService:
     async def _get_crypto_provider(self):
         """Lazy load crypto data provider."""
         if self._crypto_provider is None:
-            from maverick_crypto.providers import CryptoDataProvider
-            self._crypto_provider = CryptoDataProvider()
+            from maverick_crypto.providers import get_provider_registry
+            self._crypto_provider = get_provider_registry().crypto_data()
         return self._crypto_provider
     
     async def fetch_asset_data(
@@ -208,42 +216,77 @@ class MixedPortfolioService:
         
         return portfolio
     
-    async def calculate_returns(
+    async def get_returns_panel(
         self,
         assets: list[PortfolioAsset],
         days: int = 90,
-    ) -> DataFrame:
+    ) -> ReturnsPanel:
         """
-        Calculate daily returns for portfolio assets.
+        Get the calendar-aligned returns panel for portfolio assets.
+        
+        Panels are memoized per (symbols, days) and each symbol's closes
+        are fetched at most once per service, so several analyses over
+        overlapping assets share the same downloads.
         
         Args:
             assets: Portfolio assets
             days: Number of days of history
             
         Returns:
-            DataFrame with daily returns for each asset
+            ReturnsPanel over the assets that returned data
         """
-        data = await self.fetch_portfolio_data(assets, days)
+        from maverick_crypto.portfolio.returns_panel import ReturnsPanel
         
-        returns = {}
-        for symbol, df in data.items():
-            # Normalize timezone to UTC then remove timezone info
-            if df.index.tz is not None:
-                df.index = df.index.tz_convert("UTC").tz_localize(None)
-            
-            # Normalize to date only (remove time component)
-            df.index = pd.to_datetime(df.index.date)
-            
-            close = df["Close"] if "Close" in df.columns else df["close"]
-            returns[symbol] = close.pct_change()
-        
-        # Combine and align by date
-        returns_df = pd.DataFrame(returns)
+        key = (tuple((a.symbol, a.asset_type) for a in assets), days)
+        panel = self._panels.get(key)
+        if panel is None:
+            closes = {}
+            for asset in assets:
+                close = await self._get_closes(asset, days)
+                if close is not None:
+                    closes[asset.symbol] = close
+            panel = ReturnsPanel(
+                closes=closes,
+                asset_types={a.symbol: a.asset_type for a in assets if a.symbol in closes},
+                days=days,
+            )
+            self._panels[key] = panel
+        return panel
+    
+    async def _get_closes(self, asset: PortfolioAsset, days: int) -> Series | None:
+        """Fetch (once) an asset's daily closes; None if unavailable."""
+        from maverick_crypto.portfolio.returns_panel import daily_closes
         
-        # Drop rows where ANY asset has NaN (first row + misaligned dates)
-        returns_df = returns_df.dropna()
+        key = (asset.symbol, asset.asset_type, days)
+        if key not in self._closes:
+            close = None
+            try:
+                df = await self.fetch_asset_data(asset.symbol, asset.asset_type, days)
+                if not df.empty:
+                    close = daily_closes(df)
+            except Exception as e:
+                logger.warning(f"Failed to fetch {asset.symbol}: {e}")
+            self._closes[key] = close
+        return self._closes[key]
+    
+    async def calculate_returns(
+        self,
+        assets: list[PortfolioAsset],
+        days: int = 90,
+    ) -> DataFrame:
+        """
+        Calculate daily returns for portfolio assets.
         
-        return returns_df
+        Args:
+            assets: Portfolio assets
+            days: Number of days of history
+            
+        Returns:
+            DataFrame with daily returns for each asset, aligned on the
+            stock trading calendar when stocks are present
+        """
+        panel = await self.get_returns_panel(assets, days)
+        return panel.returns
     
     async def calculate_performance(
         self,
@@ -263,7 +306,25 @@ class MixedPortfolioService:
             Dictionary with performance metrics
         """
         returns_df = await self.calculate_returns(assets, days)
+        return self.performance_from_returns(returns_df, assets, initial_capital)
+    
+    def performance_from_returns(
+        self,
+        returns_df: DataFrame,
+        assets: list[PortfolioAsset],
+        initial_capital: float = 10000.0,
+    ) -> dict[str, Any]:
+        """
+        Calculate portfolio performance metrics from precomputed returns.
         
+        Args:
+            returns_df: Daily returns per symbol (e.g., ReturnsPanel.returns)
+            assets: Portfolio assets with weights
+            initial_capital: Starting capital
+            
+        Returns:
+            Dictionary with performance metrics
+        """
         if returns_df.empty:
             return {"error": "No data available for portfolio"}
         
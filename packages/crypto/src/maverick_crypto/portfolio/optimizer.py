@@ -1,8 +1,9 @@
 """
 Portfolio Optimizer for Mixed Stock + Crypto Portfolios.
 
-Provides mean-variance optimization using scipy.
-Supports multiple optimization objectives.
+Provides mean-variance optimization with an exact quadratic-programming
+efficient frontier (see frontier.py). Supports multiple optimization
+objectives.
 """
 
 from __future__ import annotations
@@ -15,6 +16,11 @@ import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
+from maverick_crypto.portfolio.frontier import (
+    HAS_SCIPY,
+    EfficientFrontierSolver,
+    FrontierPortfolio,
+)
 from maverick_crypto.portfolio.mixed_portfolio import (
     AssetType,
     MixedPortfolioService,
@@ -23,14 +29,6 @@ from maverick_crypto.portfolio.mixed_portfolio import (
 
 logger = logging.getLogger(__name__)
 
-# Check for scipy
-try:
-    from scipy.optimize import minimize
-    HAS_SCIPY = True
-except ImportError:
-    HAS_SCIPY = False
-    minimize = None
-
 
 class OptimizationObjective(Enum):
     """Portfolio optimization objectives."""
@@ -149,86 +147,41 @@ class PortfolioOptimizer:
         stock_indices = [i for i, s in enumerate(symbols) if symbol_to_type.get(s) == "stock"]
         crypto_indices = [i for i, s in enumerate(symbols) if symbol_to_type.get(s) == "crypto"]
         
-        # Objective functions
-        def portfolio_return(weights):
-            return np.sum(expected_returns * weights)
-        
-        def portfolio_volatility(weights):
-            return np.sqrt(np.dot(weights.T, np.dot(cov_matrix, weights)))
-        
-        def neg_sharpe_ratio(weights):
-            ret = portfolio_return(weights)
-            vol = portfolio_volatility(weights)
-            return -(ret - self.RISK_FREE_RATE) / vol if vol > 0 else float('inf')
-        
-        # Select objective
-        objective_enum = OptimizationObjective(objective)
-        if objective_enum == OptimizationObjective.MAX_SHARPE:
-            obj_func = neg_sharpe_ratio
-        elif objective_enum == OptimizationObjective.MIN_VOLATILITY:
-            obj_func = portfolio_volatility
-        elif objective_enum == OptimizationObjective.MAX_RETURN:
-            obj_func = lambda w: -portfolio_return(w)
-        else:
-            obj_func = neg_sharpe_ratio
-        
-        # Constraints
-        constraints = [
-            {"type": "eq", "fun": lambda w: np.sum(w) - 1},  # Weights sum to 1
+        # Asset class limits (only those that constrain anything)
+        groups = [
+            (indices, lo, hi)
+            for indices, lo, hi in (
+                (stock_indices, min_stock_weight, max_stock_weight),
+                (crypto_indices, min_crypto_weight, max_crypto_weight),
+            )
+            if indices and (lo > 0 or hi < 1)
         ]
         
-        # Stock allocation constraint
-        if stock_indices:
-            constraints.append({
-                "type": "ineq",
-                "fun": lambda w, idx=stock_indices: np.sum(w[idx]) - min_stock_weight
-            })
-            constraints.append({
-                "type": "ineq",
-                "fun": lambda w, idx=stock_indices: max_stock_weight - np.sum(w[idx])
-            })
-        
-        # Crypto allocation constraint
-        if crypto_indices:
-            constraints.append({
-                "type": "ineq",
-                "fun": lambda w, idx=crypto_indices: np.sum(w[idx]) - min_crypto_weight
-            })
-            constraints.append({
-                "type": "ineq",
-                "fun": lambda w, idx=crypto_indices: max_crypto_weight - np.sum(w[idx])
-            })
-        
-        # Bounds for individual weights
-        bounds = tuple((min_weight, max_weight) for _ in range(n_symbols))
-        
-        # Initial guess (equal weight)
-        init_weights = np.array([1/n_symbols] * n_symbols)
-        
         # Optimize
         try:
-            result = minimize(
-                obj_func,
-                init_weights,
-                method="SLSQP",
-                bounds=bounds,
-                constraints=constraints,
-                options={"maxiter": 1000},
+            solver = EfficientFrontierSolver(
+                expected_returns,
+                cov_matrix,
+                lower=min_weight,
+                upper=max_weight,
+                groups=groups,
+                risk_free_rate=self.RISK_FREE_RATE,
             )
-            
-            if not result.success:
-                logger.warning(f"Optimization may not have converged: {result.message}")
-            
-            optimal_weights = result.x
-            
+            objective_enum = OptimizationObjective(objective)
+            if objective_enum == OptimizationObjective.MIN_VOLATILITY:
+                optimal = solver.min_variance()
+            elif objective_enum == OptimizationObjective.MAX_RETURN:
+                optimal = solver.max_return()
+            else:
+                optimal = solver.max_sharpe()
         except Exception as e:
             logger.error(f"Optimization failed: {e}")
             return {"error": str(e)}
         
-        # Calculate metrics for optimal portfolio
-        opt_return = portfolio_return(optimal_weights)
-        opt_volatility = portfolio_volatility(optimal_weights)
-        opt_sharpe = (opt_return - self.RISK_FREE_RATE) / opt_volatility if opt_volatility > 0 else 0
+        optimal_weights = optimal.weights
+        opt_return = optimal.expected_return
+        opt_volatility = optimal.volatility
+        opt_sharpe = optimal.sharpe_ratio
         
         # Build result
         weights_dict = {
@@ -275,6 +228,9 @@ class PortfolioOptimizer:
         num_portfolios: int = 50,
         min_crypto_weight: float = 0.0,
         max_crypto_weight: float = 1.0,
+        min_weight: float = 0.0,
+        max_weight: float = 1.0,
+        method: str = "qp",
     ) -> dict[str, Any]:
         """
         Calculate efficient frontier points.
@@ -286,6 +242,10 @@ class PortfolioOptimizer:
             num_portfolios: Number of frontier points
             min_crypto_weight: Min crypto allocation
             max_crypto_weight: Max crypto allocation
+            min_weight: Minimum weight per asset
+            max_weight: Maximum weight per asset
+            method: "qp" for the exact frontier, or "sampling" for a
+                random-portfolio cloud (visualization only)
             
         Returns:
             Efficient frontier data
@@ -314,43 +274,44 @@ class PortfolioOptimizer:
         symbols = list(returns_df.columns)
         expected_returns = returns_df.mean() * self.ANNUALIZATION_FACTOR
         cov_matrix = returns_df.cov() * self.ANNUALIZATION_FACTOR
+        crypto_indices = [symbols.index(c) for c in cryptos if c in symbols]
         
-        # Generate random portfolios
-        frontier_points = []
-        np.random.seed(42)
-        
-        for _ in range(num_portfolios * 10):  # Generate extra, filter to frontier
-            weights = np.random.random(len(symbols))
-            weights /= weights.sum()
-            
-            # Apply crypto constraint
-            crypto_symbols = [c for c in cryptos if c in symbols]
-            crypto_weight = sum(weights[symbols.index(c)] for c in crypto_symbols)
-            
-            if crypto_weight < min_crypto_weight or crypto_weight > max_crypto_weight:
-                continue
-            
-            ret = np.sum(expected_returns * weights)
-            vol = np.sqrt(np.dot(weights.T, np.dot(cov_matrix, weights)))
-            sharpe = (ret - self.RISK_FREE_RATE) / vol if vol > 0 else 0
-            
-            frontier_points.append({
-                "return_pct": round(ret * 100, 2),
-                "volatility_pct": round(vol * 100, 2),
-                "sharpe_ratio": round(sharpe, 3),
-                "weights": {symbols[i]: round(weights[i], 3) for i in range(len(symbols))},
-            })
-        
-        # Sort by Sharpe ratio and keep best
-        frontier_points.sort(key=lambda x: x["sharpe_ratio"], reverse=True)
-        frontier_points = frontier_points[:num_portfolios]
+        if method == "sampling":
+            frontier_points = self._sample_portfolios(
+                symbols, expected_returns, cov_matrix, crypto_indices,
+                num_portfolios, min_crypto_weight, max_crypto_weight,
+            )
+            if not frontier_points:
+                return {"error": "No sampled portfolio satisfies the constraints"}
+        else:
+            groups = []
+            if crypto_indices and (min_crypto_weight > 0 or max_crypto_weight < 1):
+                groups.append((crypto_indices, min_crypto_weight, max_crypto_weight))
+            try:
+                solver = EfficientFrontierSolver(
+                    expected_returns,
+                    cov_matrix,
+                    lower=min_weight,
+                    upper=max_weight,
+                    groups=groups,
+                    risk_free_rate=self.RISK_FREE_RATE,
+                )
+                frontier = solver.frontier(num_portfolios)
+                frontier_points = [p.to_dict(symbols) for p in frontier]
+                tangency = solver.max_sharpe().to_dict(symbols)
+            except Exception as e:
+                logger.error(f"Efficient frontier failed: {e}")
+                return {"error": str(e)}
         
         # Find key portfolios
         max_sharpe = max(frontier_points, key=lambda x: x["sharpe_ratio"])
+        if method != "sampling" and tangency["sharpe_ratio"] >= max_sharpe["sharpe_ratio"]:
+            max_sharpe = tangency
         min_vol = min(frontier_points, key=lambda x: x["volatility_pct"])
         max_ret = max(frontier_points, key=lambda x: x["return_pct"])
         
         return {
+            "method": method,
             "frontier_points": frontier_points,
             "key_portfolios": {
                 "max_sharpe": max_sharpe,
@@ -364,6 +325,34 @@ class PortfolioOptimizer:
             "period_days": days,
         }
     
+    def _sample_portfolios(
+        self,
+        symbols: list[str],
+        expected_returns: pd.Series,
+        cov_matrix: DataFrame,
+        crypto_indices: list[int],
+        num_portfolios: int,
+        min_crypto_weight: float,
+        max_crypto_weight: float,
+    ) -> list[dict[str, Any]]:
+        """Random long-only portfolios, best Sharpe first (for scatter plots)."""
+        rng = np.random.default_rng(42)
+        weights = rng.random((num_portfolios * 10, len(symbols)))
+        weights /= weights.sum(axis=1, keepdims=True)
+        
+        crypto_weight = weights[:, crypto_indices].sum(axis=1)
+        weights = weights[(crypto_weight >= min_crypto_weight) & (crypto_weight <= max_crypto_weight)]
+        
+        rets = weights @ expected_returns.to_numpy()
+        vols = np.sqrt(np.einsum("ij,jk,ik->i", weights, cov_matrix.to_numpy(), weights))
+        sharpes = np.where(vols > 0, (rets - self.RISK_FREE_RATE) / np.where(vols > 0, vols, 1), 0.0)
+        
+        best = np.argsort(-sharpes, kind="stable")[:num_portfolios]
+        return [
+            FrontierPortfolio(weights[i], float(rets[i]), float(vols[i]), float(sharpes[i])).to_dict(symbols)
+            for i in best
+        ]
+    
     async def suggest_allocation(
         self,
         stocks: list[str],
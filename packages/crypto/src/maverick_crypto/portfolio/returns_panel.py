@@ -0,0 +1,127 @@
+"""
+Aligned Returns Panel for Mixed Portfolios.
+
+Stocks trade on exchange days while crypto trades 24/7. A panel keeps
+each asset's daily closes and aligns them on one calendar: the days every
+stock in the panel traded, or every calendar day for a crypto-only panel.
+Crypto closes are sampled on that calendar before returns are taken, so a
+Monday crypto return spans the weekend just like the stock return it is
+compared with.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from functools import cached_property, reduce
+
+import pandas as pd
+from pandas import DataFrame, Series
+
+from maverick_crypto.portfolio.mixed_portfolio import AssetType
+
+logger = logging.getLogger(__name__)
+
+# Longest gap a crypto close is carried forward onto the calendar
+MAX_CARRY_FORWARD = pd.Timedelta(days=3)
+
+
+@dataclass
+class ReturnsPanel:
+    """
+    Daily closes for a set of assets, aligned on a common calendar.
+
+    Attributes:
+        closes: Symbol -> daily close Series indexed by date (insertion
+            order is the column order)
+        asset_types: Symbol -> asset type
+        days: Lookback the closes were fetched with
+    """
+    closes: dict[str, Series]
+    asset_types: dict[str, AssetType]
+    days: int
+
+    @property
+    def symbols(self) -> list[str]:
+        """Symbols with data, in column order."""
+        return list(self.closes)
+
+    @property
+    def stocks(self) -> list[str]:
+        """Stock symbols with data."""
+        return [s for s in self.closes if self.asset_types[s] == AssetType.STOCK]
+
+    @property
+    def cryptos(self) -> list[str]:
+        """Crypto symbols with data."""
+        return [s for s in self.closes if self.asset_types[s] == AssetType.CRYPTO]
+
+    @cached_property
+    def calendar(self) -> pd.DatetimeIndex:
+        """Days all stocks traded, or every crypto day if there are no stocks."""
+        stock_days = [self.closes[s].index for s in self.stocks]
+        if stock_days:
+            return reduce(pd.Index.intersection, stock_days)
+        if not self.closes:
+            return pd.DatetimeIndex([])
+        return reduce(pd.Index.union, (c.index for c in self.closes.values()))
+
+    @cached_property
+    def prices(self) -> DataFrame:
+        """Closes sampled on the panel calendar."""
+        calendar = self.calendar
+        return pd.DataFrame(
+            {
+                symbol: close.reindex(calendar, method="ffill", tolerance=MAX_CARRY_FORWARD)
+                for symbol, close in self.closes.items()
+            },
+            index=calendar,
+        )
+
+    @cached_property
+    def returns(self) -> DataFrame:
+        """Daily returns on the panel calendar; dates missing any asset are dropped."""
+        return self.prices.pct_change(fill_method=None).dropna()
+
+    def subset(self, symbols: list[str]) -> ReturnsPanel:
+        """
+        Panel over some of this panel's symbols, re-aligned for that set.
+
+        A crypto-only subset goes back to the 24/7 calendar.
+
+        Args:
+            symbols: Symbols to keep (unknown symbols are ignored)
+
+        Returns:
+            This panel if the symbols are unchanged, otherwise a new panel
+            sharing the same close series
+        """
+        keep = [s for s in symbols if s in self.closes]
+        if keep == self.symbols:
+            return self
+        return ReturnsPanel(
+            closes={s: self.closes[s] for s in keep},
+            asset_types={s: self.asset_types[s] for s in keep},
+            days=self.days,
+        )
+
+
+def daily_closes(df: DataFrame) -> Series:
+    """
+    Extract a close Series indexed by calendar date.
+
+    Timezone-aware indexes are converted to UTC first, matching the UTC
+    day boundary of crypto candles.
+    """
+    index = df.index
+    if getattr(index, "tz", None) is not None:
+        index = index.tz_convert("UTC").tz_localize(None)
+    close = df["Close"] if "Close" in df.columns else df["close"]
+    close = pd.Series(close.to_numpy(dtype=float), index=pd.to_datetime(index.date))
+    return close[~close.index.duplicated(keep="last")].sort_index()
+
+
+__all__ = [
+    "ReturnsPanel",
+    "daily_closes",
+]
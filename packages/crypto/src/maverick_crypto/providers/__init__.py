@@ -7,12 +7,24 @@ Providers:
     - CryptoDataProvider: Primary provider using yfinance (default)
     - CoinGeckoProvider: Optional provider for broader coverage (6000+ coins)
     - FearGreedProvider: Crypto Fear & Greed Index (always available)
+
+Shared instances and connection pools: see get_provider_registry().
 """
 
 from maverick_crypto.providers.crypto_provider import CryptoDataProvider
+from maverick_crypto.providers.price_store import CryptoPriceStore
+from maverick_crypto.providers.registry import (
+    CryptoProviderRegistry,
+    close_provider_registry,
+    get_provider_registry,
+)
 
 __all__ = [
     "CryptoDataProvider",
+    "CryptoPriceStore",
+    "CryptoProviderRegistry",
+    "close_provider_registry",
+    "get_provider_registry",
 ]
 
 # Optional CoinGecko provider
@@ -20,6 +20,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import threading
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -42,7 +43,9 @@ class RateLimiter:
     Token bucket rate limiter for API calls.
     
     Implements a sliding window rate limiter to ensure
-    we don't exceed CoinGecko's free tier limits.
+    we don't exceed CoinGecko's free tier limits. The window is guarded by
+    a thread lock rather than an asyncio lock, so one limiter can be shared
+    by callers on different event loops.
     """
     
     def __init__(self, calls_per_minute: int = 10):
@@ -55,7 +58,7 @@ class RateLimiter:
         self.calls_per_minute = calls_per_minute
         self.window_seconds = 60
         self.call_times: list[datetime] = []
-        self._lock = asyncio.Lock()
+        self._lock = threading.Lock()
     
     async def acquire(self) -> None:
         """
@@ -63,31 +66,32 @@ class RateLimiter:
         
         Blocks if rate limit would be exceeded.
         """
-        async with self._lock:
+        wait_seconds = self._reserve()
+        if wait_seconds > 0:
+            logger.debug(f"Rate limit reached, waiting {wait_seconds:.1f}s")
+            await asyncio.sleep(wait_seconds)
+    
+    def _reserve(self) -> float:
+        """Book the next free slot in the window; return seconds until it."""
+        with self._lock:
             now = datetime.now()
             window_start = now - timedelta(seconds=self.window_seconds)
             
             # Remove old calls outside window
             self.call_times = [t for t in self.call_times if t > window_start]
             
-            # Check if we need to wait
+            # Slot opens when the call that many places back leaves the window
+            slot = now
             if len(self.call_times) >= self.calls_per_minute:
-                # Calculate wait time
-                oldest_call = self.call_times[0]
-                wait_until = oldest_call + timedelta(seconds=self.window_seconds)
-                wait_seconds = (wait_until - now).total_seconds()
-                
-                if wait_seconds > 0:
-                    logger.debug(f"Rate limit reached, waiting {wait_seconds:.1f}s")
-                    await asyncio.sleep(wait_seconds)
-                    
-                    # Clean up after waiting
-                    now = datetime.now()
-                    window_start = now - timedelta(seconds=self.window_seconds)
-                    self.call_times = [t for t in self.call_times if t > window_start]
+                slot = max(
+                    now,
+                    self.call_times[-self.calls_per_minute]
+                    + timedelta(seconds=self.window_seconds),
+                )
             
             # Record this call
-            self.call_times.append(datetime.now())
+            self.call_times.append(slot)
+            return (slot - now).total_seconds()
     
     @property
     def remaining_calls(self) -> int:
@@ -98,6 +102,38 @@ class RateLimiter:
         return max(0, self.calls_per_minute - recent_calls)
 
 
+# Per-minute budgets for upstream hosts. Limiters are shared by host so the
+# budget holds across every provider instance and tool call in the process.
+HOST_RATE_LIMITS: dict[str, int] = {
+    "api.coingecko.com": 10,
+    "pro-api.coingecko.com": 500,
+    "api.alternative.me": 30,
+}
+
+_host_limiters: dict[str, RateLimiter] = {}
+
+
+def get_host_rate_limiter(host: str, calls_per_minute: int | None = None) -> RateLimiter:
+    """
+    Get the process-wide rate limiter for an upstream host.
+
+    The first caller fixes the budget; later callers share it.
+
+    Args:
+        host: Upstream hostname (e.g., "api.coingecko.com")
+        calls_per_minute: Budget if the host has no limiter yet
+            (default: HOST_RATE_LIMITS entry, else 60)
+
+    Returns:
+        Shared RateLimiter for the host
+    """
+    limiter = _host_limiters.get(host)
+    if limiter is None:
+        budget = calls_per_minute or HOST_RATE_LIMITS.get(host, 60)
+        limiter = _host_limiters.setdefault(host, RateLimiter(budget))
+    return limiter
+
+
 class CoinGeckoProvider:
     """
     CoinGecko API provider with rate limiting.
@@ -150,12 +186,16 @@ class CoinGeckoProvider:
         "AAVE": "aave",
     }
     
-    def __init__(self, calls_per_minute: int = 10):
+    API_HOST = "api.coingecko.com"
+    
+    def __init__(self, calls_per_minute: int | None = None):
         """
         Initialize CoinGecko provider.
         
         Args:
-            calls_per_minute: Rate limit (default: 10 for free tier)
+            calls_per_minute: Rate limit if the CoinGecko host budget has not
+                been set yet (default: 10 for free tier). The limiter is
+                shared with every other client of the same host.
             
         Raises:
             ImportError: If pycoingecko is not installed
@@ -167,12 +207,15 @@ class CoinGeckoProvider:
             )
         
         self.cg = CoinGeckoAPI()
-        self.rate_limiter = RateLimiter(calls_per_minute)
+        self.rate_limiter = get_host_rate_limiter(self.API_HOST, calls_per_minute)
         self._coin_list_cache: dict[str, str] | None = None
         self._cache_time: datetime | None = None
         self._cache_ttl = timedelta(hours=24)
         
-        logger.info(f"CoinGeckoProvider initialized (rate limit: {calls_per_minute}/min)")
+        logger.info(
+            f"CoinGeckoProvider initialized "
+            f"(rate limit: {self.rate_limiter.calls_per_minute}/min)"
+        )
     
     async def _rate_limited_call(self, func, *args, **kwargs) -> Any:
         """
@@ -477,10 +520,11 @@ class FearGreedProvider:
     """
 
     API_URL = "https://api.alternative.me/fng/"
+    API_HOST = "api.alternative.me"
 
     def __init__(self, http_client: httpx.AsyncClient | None = None):
         """Initialize Fear & Greed provider."""
-        self.rate_limiter = RateLimiter(calls_per_minute=30)
+        self.rate_limiter = get_host_rate_limiter(self.API_HOST)
         self._http_client = http_client
         self._owns_client = http_client is None
 
@@ -9,6 +9,7 @@ Features:
     - Async interface for consistency with other providers
     - Technical indicator integration via pandas-ta
     - Compatible with maverick backtesting infrastructure
+    - Daily candles persisted in CryptoPriceCache; only missing days are downloaded
 """
 
 from __future__ import annotations
@@ -22,6 +23,12 @@ from typing import Any
 import pandas as pd
 import yfinance as yf
 
+from maverick_crypto.providers.price_store import (
+    CRYPTO_PRICE_STORE_ENABLED,
+    CryptoPriceStore,
+    utc_today,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -49,14 +56,27 @@ class CryptoDataProvider:
     # Common alternative suffixes to normalize
     KNOWN_SUFFIXES = ("-USD", "-USDT", "-BUSD", "-BTC", "-ETH", ".NS", ".BO")
     
-    def __init__(self, max_workers: int = 4):
+    def __init__(
+        self,
+        max_workers: int = 4,
+        price_store: CryptoPriceStore | None = None,
+        use_price_store: bool = CRYPTO_PRICE_STORE_ENABLED,
+    ):
         """
         Initialize the crypto data provider.
         
         Args:
             max_workers: Maximum thread pool workers for parallel fetching
+            price_store: Store for daily candles (default: CryptoPriceStore())
+            use_price_store: Serve daily data through the store
         """
         self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        if price_store is None and use_price_store:
+            price_store = CryptoPriceStore()
+        self._price_store = price_store
+        self._pending_writes: set[asyncio.Future] = set()
+        # First date yfinance has for a symbol, once a backfill came up short
+        self._listing_start: dict[str, date] = {}
         logger.info("CryptoDataProvider initialized")
     
     def normalize_symbol(self, symbol: str) -> str:
@@ -143,11 +163,11 @@ class CryptoDataProvider:
         
         # Calculate date range
         if days is not None:
-            end_date = date.today()
+            end_date = utc_today()
             start_date = end_date - timedelta(days=days)
         elif start_date is None:
             # Default to 1 year
-            end_date = date.today()
+            end_date = utc_today()
             start_date = end_date - timedelta(days=365)
         
         # Convert dates to strings if needed
@@ -156,16 +176,19 @@ class CryptoDataProvider:
         if isinstance(end_date, date):
             end_date = end_date.isoformat()
         
-        # Fetch data in thread pool (yfinance is sync)
-        loop = asyncio.get_event_loop()
-        df = await loop.run_in_executor(
-            self._executor,
-            self._fetch_data_sync,
-            yf_symbol,
-            start_date,
-            end_date,
-            interval,
-        )
+        if interval == "1d" and self._price_store is not None:
+            df = await self._get_daily_data(yf_symbol, start_date, end_date)
+        else:
+            # Fetch data in thread pool (yfinance is sync)
+            loop = asyncio.get_event_loop()
+            df = await loop.run_in_executor(
+                self._executor,
+                self._fetch_data_sync,
+                yf_symbol,
+                start_date,
+                end_date,
+                interval,
+            )
         
         if df.empty:
             logger.warning(f"No data returned for {yf_symbol}")
@@ -174,6 +197,107 @@ class CryptoDataProvider:
         logger.info(f"Fetched {len(df)} rows for {yf_symbol}")
         return df
     
+    async def _get_daily_data(
+        self,
+        yf_symbol: str,
+        start_date: str,
+        end_date: str | None,
+    ) -> pd.DataFrame:
+        """
+        Serve daily candles from the price store, downloading only missing days.
+        
+        The stored range is kept contiguous: an older window is backfilled up
+        to the first stored day and newer data is fetched from the day after
+        the last stored one. New candles are written back in the background.
+        
+        Args:
+            yf_symbol: yfinance symbol (e.g., "BTC-USD")
+            start_date: Inclusive start date (YYYY-MM-DD)
+            end_date: Exclusive end date (YYYY-MM-DD), None for up to now
+            
+        Returns:
+            DataFrame with OHLCV data indexed by UTC day
+        """
+        store = self._price_store
+        base = yf_symbol.removesuffix("-USD")
+        start = date.fromisoformat(start_date)
+        end = date.fromisoformat(end_date) if end_date else utc_today() + timedelta(days=1)
+        loop = asyncio.get_running_loop()
+        
+        try:
+            first, last = await loop.run_in_executor(self._executor, store.coverage, base)
+        except Exception as e:
+            logger.warning(f"Price store unavailable, fetching {yf_symbol} directly: {e}")
+            return await loop.run_in_executor(
+                self._executor, self._fetch_data_sync, yf_symbol, start_date, end_date, "1d"
+            )
+        
+        ranges: list[tuple[date, date]] = []
+        if first is None:
+            ranges.append((start, end))
+        else:
+            head_start = max(start, self._listing_start.get(base, start))
+            if head_start < first:
+                ranges.append((head_start, first))
+            tail_start = last + timedelta(days=1)
+            if tail_start < end:
+                ranges.append((tail_start, end))
+        
+        fetched = await asyncio.gather(*(
+            loop.run_in_executor(
+                self._executor,
+                self._fetch_data_sync,
+                yf_symbol,
+                range_start.isoformat(),
+                range_end.isoformat(),
+                "1d",
+            )
+            for range_start, range_end in ranges
+        ))
+        fetched = [_utc_daily_index(df) for df in fetched]
+        
+        if first is not None and ranges and ranges[0][1] == first:
+            head = fetched[0]
+            if head.empty or head.index[0].date() > ranges[0][0]:
+                self._listing_start[base] = head.index[0].date() if not head.empty else first
+        
+        for df in fetched:
+            if not df.empty:
+                self._write_behind(base, df)
+        
+        stored = (
+            await loop.run_in_executor(self._executor, store.read, base, start, end)
+            if first is not None
+            else pd.DataFrame()
+        )
+        frames = [df for df in (stored, *fetched) if not df.empty]
+        if not frames:
+            return pd.DataFrame()
+        
+        df = pd.concat(frames)
+        df = df[~df.index.duplicated(keep="last")].sort_index()
+        window = (df.index.date >= start) & (df.index.date < end)
+        return df[window]
+    
+    def _write_behind(self, base_symbol: str, df: pd.DataFrame) -> None:
+        """Persist fetched candles without blocking the caller."""
+        future = asyncio.get_running_loop().run_in_executor(
+            self._executor, self._price_store.write, base_symbol, df
+        )
+        self._pending_writes.add(future)
+        
+        def _done(fut: asyncio.Future) -> None:
+            self._pending_writes.discard(fut)
+            if not fut.cancelled() and fut.exception() is not None:
+                logger.warning(f"Failed to store candles for {base_symbol}: {fut.exception()}")
+        
+        future.add_done_callback(_done)
+    
+    async def flush_writes(self) -> None:
+        """Wait for background price store writes to finish."""
+        if self._pending_writes:
+            await asyncio.gather(*self._pending_writes, return_exceptions=True)
+    
     def _fetch_data_sync(
         self,
         symbol: str,
@@ -340,3 +464,13 @@ class CryptoDataProvider:
         """Cleanup thread pool on deletion."""
         self._executor.shutdown(wait=False)
 
+
+def _utc_daily_index(df: pd.DataFrame) -> pd.DataFrame:
+    """Index daily candles by UTC midnight so fetched and stored rows align."""
+    if df.empty:
+        return df
+    index = pd.DatetimeIndex(df.index)
+    index = index.tz_localize("UTC") if index.tz is None else index.tz_convert("UTC")
+    df = df.copy()
+    df.index = index.normalize().rename("Date")
+    return df
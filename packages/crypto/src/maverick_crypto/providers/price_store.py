@@ -0,0 +1,251 @@
+"""
+Persistent Crypto OHLCV Store.
+
+Read-through storage for daily crypto candles on top of the CryptoPriceCache
+model. The provider serves requests from the store and only downloads the
+part of the window the store does not cover yet; new candles are written
+back with bulk upserts.
+
+Only completed daily candles are stored. Crypto trades 24/7, so every
+calendar day before today (UTC) is a closed candle.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from datetime import UTC, date, datetime
+from pathlib import Path
+
+import pandas as pd
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from maverick_crypto.models import Crypto, CryptoPriceCache
+
+logger = logging.getLogger(__name__)
+
+# Configuration
+CRYPTO_PRICE_DB_URL = os.getenv(
+    "CRYPTO_PRICE_DB_URL",
+    f"sqlite:///{Path.home() / '.cache' / 'maverick' / 'crypto_prices.db'}",
+)
+CRYPTO_PRICE_STORE_ENABLED = os.getenv("CRYPTO_PRICE_STORE_ENABLED", "true").lower() == "true"
+
+# Rows per INSERT statement (keeps SQLite under its bound-parameter limit)
+UPSERT_BATCH_SIZE = 500
+
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+
+def utc_today() -> date:
+    """Current date in UTC, the day boundary of crypto daily candles."""
+    return datetime.now(UTC).date()
+
+
+class CryptoPriceStore:
+    """
+    Range-queryable store of daily OHLCV candles.
+
+    Candles are keyed by (crypto_id, price_date); the Crypto row for a symbol
+    is created on first write. Symbols are stored in base form ("BTC").
+    """
+
+    def __init__(self, database_url: str | None = None, engine: Engine | None = None):
+        """
+        Initialize the store.
+
+        Tables are created on first use.
+
+        Args:
+            database_url: SQLAlchemy URL (default: CRYPTO_PRICE_DB_URL)
+            engine: Optional pre-built engine (overrides database_url)
+        """
+        self.database_url = database_url or CRYPTO_PRICE_DB_URL
+        self._engine = engine
+        self._sessions: sessionmaker[Session] | None = None
+        self._crypto_ids: dict[str, object] = {}
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    def _session(self) -> Session:
+        if self._sessions is None:
+            with self._lock:
+                if self._sessions is None:
+                    engine = self._engine or self._create_engine()
+                    tables = [Crypto.__table__, CryptoPriceCache.__table__]
+                    Crypto.metadata.create_all(engine, tables=tables)
+                    self._engine = engine
+                    self._sessions = sessionmaker(bind=engine, expire_on_commit=False)
+        return self._sessions()
+
+    def _create_engine(self) -> Engine:
+        url = self.database_url
+        if not url.startswith("sqlite"):
+            return create_engine(url, pool_pre_ping=True)
+        if url in ("sqlite://", "sqlite:///:memory:"):
+            return create_engine(
+                url, connect_args={"check_same_thread": False}, poolclass=StaticPool
+            )
+        Path(url.split("///", 1)[1]).parent.mkdir(parents=True, exist_ok=True)
+        return create_engine(url, connect_args={"check_same_thread": False})
+
+    def read(self, symbol: str, start: date, end: date) -> pd.DataFrame:
+        """
+        Read stored candles.
+
+        Args:
+            symbol: Base symbol (e.g., "BTC")
+            start: Inclusive start date
+            end: Exclusive end date
+
+        Returns:
+            OHLCV DataFrame indexed by UTC midnight timestamps
+        """
+        query = (
+            select(
+                CryptoPriceCache.price_date,
+                CryptoPriceCache.open_price,
+                CryptoPriceCache.high_price,
+                CryptoPriceCache.low_price,
+                CryptoPriceCache.close_price,
+                CryptoPriceCache.volume,
+            )
+            .where(
+                CryptoPriceCache.symbol == symbol,
+                CryptoPriceCache.price_date >= start,
+                CryptoPriceCache.price_date < end,
+            )
+            .order_by(CryptoPriceCache.price_date)
+        )
+        with self._session() as session:
+            rows = session.execute(query).all()
+
+        index = pd.DatetimeIndex([r[0] for r in rows], name="Date").tz_localize(UTC)
+        return pd.DataFrame(
+            [r[1:] for r in rows], index=index, columns=OHLCV_COLUMNS, dtype=float
+        )
+
+    def coverage(self, symbol: str) -> tuple[date | None, date | None]:
+        """
+        Get the first and last stored dates for a symbol.
+
+        Returns:
+            Tuple of (first date, last date), (None, None) if nothing is stored
+        """
+        query = select(
+            func.min(CryptoPriceCache.price_date), func.max(CryptoPriceCache.price_date)
+        ).where(CryptoPriceCache.symbol == symbol)
+        with self._session() as session:
+            first, last = session.execute(query).one()
+        return first, last
+
+    def write(self, symbol: str, df: pd.DataFrame, source: str = "yfinance") -> int:
+        """
+        Upsert completed daily candles.
+
+        Rows dated today (UTC) or later are skipped since the candle is
+        still open.
+
+        Args:
+            symbol: Base symbol (e.g., "BTC")
+            df: OHLCV DataFrame with a DatetimeIndex
+            source: Data provider name
+
+        Returns:
+            Number of rows written
+        """
+        today = utc_today()
+        now = datetime.now(UTC)
+        frame = df.dropna(subset=["Close"])
+        candles = [
+            (day, row)
+            for day, row in zip(_index_dates(frame.index), frame.itertuples())
+            if day < today
+        ]
+        if not candles:
+            return 0
+
+        with self._write_lock, self._session() as session:
+            crypto_id = self._get_crypto_id(session, symbol)
+            records = [
+                {
+                    "crypto_id": crypto_id,
+                    "symbol": symbol,
+                    "price_date": day,
+                    "open_price": float(row.Open),
+                    "high_price": float(row.High),
+                    "low_price": float(row.Low),
+                    "close_price": float(row.Close),
+                    "volume": 0 if pd.isna(row.Volume) else int(row.Volume),
+                    "source": source,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for day, row in candles
+            ]
+
+            insert = _dialect_insert(session)
+            for i in range(0, len(records), UPSERT_BATCH_SIZE):
+                stmt = insert(CryptoPriceCache).values(records[i:i + UPSERT_BATCH_SIZE])
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["crypto_id", "price_date"],
+                    set_={
+                        column: stmt.excluded[column]
+                        for column in (
+                            "open_price",
+                            "high_price",
+                            "low_price",
+                            "close_price",
+                            "volume",
+                            "source",
+                            "updated_at",
+                        )
+                    },
+                )
+                session.execute(stmt)
+            session.commit()
+            self._crypto_ids[symbol] = crypto_id
+
+        logger.debug(f"Stored {len(records)} daily candles for {symbol}")
+        return len(records)
+
+    def _get_crypto_id(self, session: Session, symbol: str):
+        crypto_id = self._crypto_ids.get(symbol)
+        if crypto_id is None:
+            crypto_id = session.execute(
+                select(Crypto.crypto_id).where(Crypto.symbol == symbol)
+            ).scalar_one_or_none()
+            if crypto_id is None:
+                crypto = Crypto(symbol=symbol, name=symbol, yfinance_symbol=f"{symbol}-USD")
+                session.add(crypto)
+                session.flush()
+                crypto_id = crypto.crypto_id
+        return crypto_id
+
+
+def _index_dates(index: pd.Index) -> list[date]:
+    """Calendar dates of a candle index, in UTC for tz-aware indexes."""
+    stamps = pd.DatetimeIndex(index)
+    if stamps.tz is not None:
+        stamps = stamps.tz_convert(UTC)
+    return [ts.date() for ts in stamps]
+
+
+def _dialect_insert(session: Session):
+    if session.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert
+
+
+__all__ = [
+    "CRYPTO_PRICE_DB_URL",
+    "CRYPTO_PRICE_STORE_ENABLED",
+    "CryptoPriceStore",
+    "utc_today",
+]
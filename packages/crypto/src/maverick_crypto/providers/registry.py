@@ -0,0 +1,252 @@
+"""
+Process-wide Crypto Provider Registry.
+
+Holds one instance of each crypto provider and a single bounded
+httpx connection pool shared by all of them, so consecutive tool calls
+reuse warm TCP/TLS connections and the yfinance thread pool instead of
+building fresh ones per call. Upstream rate limits are enforced per host
+(see get_host_rate_limiter), independent of how many providers exist.
+
+Example:
+    >>> registry = get_provider_registry()
+    >>> provider = registry.defillama()
+    >>> protocols = await provider.get_top_protocols(10)
+
+    # At shutdown
+    >>> await close_provider_registry()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+from typing import Any, Callable
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Configuration
+CRYPTO_HTTP_MAX_CONNECTIONS = int(os.getenv("CRYPTO_HTTP_MAX_CONNECTIONS", "50"))
+CRYPTO_HTTP_MAX_KEEPALIVE = int(os.getenv("CRYPTO_HTTP_MAX_KEEPALIVE", "20"))
+CRYPTO_HTTP_TIMEOUT = float(os.getenv("CRYPTO_HTTP_TIMEOUT", "30"))
+CRYPTO_DATA_WORKERS = int(os.getenv("CRYPTO_DATA_WORKERS", "4"))
+
+
+class CryptoProviderRegistry:
+    """
+    Lazily built, shared crypto providers.
+
+    HTTP-based providers are tied to the event loop their connection pool
+    was opened on; if the registry is used from a different loop, the pool
+    and those providers are rebuilt. The yfinance-backed provider is
+    loop-independent and kept for the life of the registry.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = CRYPTO_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections: int = CRYPTO_HTTP_MAX_KEEPALIVE,
+        timeout: float = CRYPTO_HTTP_TIMEOUT,
+        data_workers: int = CRYPTO_DATA_WORKERS,
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            max_connections: Connection pool size across all upstream hosts
+            max_keepalive_connections: Idle connections kept open
+            timeout: Default request timeout in seconds
+            data_workers: Thread pool size of the yfinance-backed provider
+        """
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.timeout = timeout
+        self.data_workers = data_workers
+
+        self._lock = threading.Lock()
+        self._providers: dict[str, Any] = {}
+        self._http_providers: dict[str, Any] = {}
+        self._http_client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+        # Clients replaced for a new loop whose own loop could not close them
+        self._retired_clients: list[httpx.AsyncClient] = []
+
+    def _get(self, cache: dict[str, Any], name: str, factory: Callable[[], Any]) -> Any:
+        provider = cache.get(name)
+        if provider is None:
+            with self._lock:
+                provider = cache.get(name)
+                if provider is None:
+                    provider = factory()
+                    cache[name] = provider
+        return provider
+
+    def http_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if not self._client_usable(loop):
+            with self._lock:
+                if not self._client_usable(loop):
+                    self._retire_client()
+                    self._http_client = httpx.AsyncClient(
+                        timeout=httpx.Timeout(self.timeout),
+                        limits=httpx.Limits(
+                            max_connections=self.max_connections,
+                            max_keepalive_connections=self.max_keepalive_connections,
+                        ),
+                        follow_redirects=True,
+                    )
+                    self._client_loop = loop
+                    self._http_providers.clear()
+                    logger.debug("Created shared crypto HTTP client")
+        return self._http_client
+
+    def _retire_client(self) -> None:
+        """Close the current client on its own loop, or keep it for aclose()."""
+        client, loop = self._http_client, self._client_loop
+        if client is None or client.is_closed:
+            return
+        if loop is not None and loop.is_running() and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(self._close_client(client), loop)
+        else:
+            self._retired_clients.append(client)
+
+    @staticmethod
+    async def _close_client(client: httpx.AsyncClient) -> None:
+        if client.is_closed:
+            return
+        try:
+            await client.aclose()
+        except RuntimeError as e:
+            # Pool was opened on a loop that has since closed
+            logger.debug(f"Could not close crypto HTTP client: {e}")
+
+    def _client_usable(self, loop: asyncio.AbstractEventLoop) -> bool:
+        return (
+            self._http_client is not None
+            and not self._http_client.is_closed
+            and self._client_loop is loop
+        )
+
+    def _get_http(self, name: str, factory: Callable[[httpx.AsyncClient], Any]) -> Any:
+        client = self.http_client()
+        return self._get(self._http_providers, name, lambda: factory(client))
+
+    # ==================== Providers ====================
+
+    def crypto_data(self):
+        """Shared yfinance-backed CryptoDataProvider."""
+        from maverick_crypto.providers.crypto_provider import CryptoDataProvider
+
+        return self._get(
+            self._providers,
+            "crypto_data",
+            lambda: CryptoDataProvider(max_workers=self.data_workers),
+        )
+
+    def coingecko(self):
+        """
+        Shared CoinGeckoProvider.
+
+        Raises:
+            ImportError: If pycoingecko is not installed
+        """
+        from maverick_crypto.providers.coingecko_provider import CoinGeckoProvider
+
+        return self._get(self._providers, "coingecko", CoinGeckoProvider)
+
+    def fear_greed(self):
+        """Shared FearGreedProvider."""
+        from maverick_crypto.providers.coingecko_provider import FearGreedProvider
+
+        return self._get_http(
+            "fear_greed", lambda client: FearGreedProvider(http_client=client)
+        )
+
+    def defillama(self):
+        """Shared DefiLlamaProvider."""
+        from maverick_crypto.defi.defillama import DefiLlamaProvider
+
+        return self._get_http(
+            "defillama",
+            lambda client: DefiLlamaProvider(timeout=self.timeout, http_client=client),
+        )
+
+    def onchain(self):
+        """Shared OnChainProvider."""
+        from maverick_crypto.defi.onchain import OnChainProvider
+
+        return self._get_http(
+            "onchain",
+            lambda client: OnChainProvider(timeout=self.timeout, http_client=client),
+        )
+
+    def cryptopanic(self):
+        """Shared CryptoPanicProvider."""
+        from maverick_crypto.news.providers import CryptoPanicProvider
+
+        return self._get_http(
+            "cryptopanic",
+            lambda client: CryptoPanicProvider(timeout=self.timeout, http_client=client),
+        )
+
+    def news_aggregator(self):
+        """Shared NewsAggregator over the shared CryptoPanicProvider."""
+        from maverick_crypto.news.providers import NewsAggregator
+
+        cryptopanic = self.cryptopanic()
+        return self._get_http(
+            "news_aggregator", lambda client: NewsAggregator(cryptopanic=cryptopanic)
+        )
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and release all providers."""
+        with self._lock:
+            clients = [*self._retired_clients, self._http_client]
+            self._retired_clients = []
+            self._http_client = None
+            data_provider = self._providers.get("crypto_data")
+            self._providers.clear()
+            self._http_providers.clear()
+            self._client_loop = None
+
+        for client in clients:
+            if client is not None:
+                await self._close_client(client)
+        if data_provider is not None:
+            data_provider._executor.shutdown(wait=False)
+
+
+# Global registry
+_registry: CryptoProviderRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_provider_registry() -> CryptoProviderRegistry:
+    """Get or create the process-wide provider registry."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = CryptoProviderRegistry()
+    return _registry
+
+
+async def close_provider_registry() -> None:
+    """Close the process-wide provider registry. Call at shutdown."""
+    global _registry
+    with _registry_lock:
+        registry, _registry = _registry, None
+    if registry is not None:
+        await registry.aclose()
+        logger.info("Closed crypto provider registry")
+
+
+__all__ = [
+    "CryptoProviderRegistry",
+    "close_provider_registry",
+    "get_provider_registry",
+]
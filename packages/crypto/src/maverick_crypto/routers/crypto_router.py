@@ -59,9 +59,9 @@ def register_crypto_tools(mcp: Any) -> None:
             - "Fetch ETH data for 90 days with daily interval"
             - "Show me Solana OHLCV data"
         """
-        from maverick_crypto.providers import CryptoDataProvider
+        from maverick_crypto.providers import get_provider_registry
 
-        provider = CryptoDataProvider()
+        provider = get_provider_registry().crypto_data()
 
         try:
             df = await provider.get_crypto_data(symbol, days=days, interval=interval)
@@ -108,9 +108,9 @@ def register_crypto_tools(mcp: Any) -> None:
             - "Get ETH price and market cap"
             - "Show me Solana's current trading data"
         """
-        from maverick_crypto.providers import CryptoDataProvider
+        from maverick_crypto.providers import get_provider_registry
 
-        provider = CryptoDataProvider()
+        provider = get_provider_registry().crypto_data()
 
         try:
             price_data = await provider.get_realtime_price(symbol)
@@ -165,10 +165,10 @@ def register_crypto_tools(mcp: Any) -> None:
             - "Get RSI and MACD for Ethereum"
             - "Technical analysis for SOL"
         """
-        from maverick_crypto.providers import CryptoDataProvider
+        from maverick_crypto.providers import get_provider_registry
         from maverick_crypto.calendar import CryptoCalendarService
 
-        provider = CryptoDataProvider()
+        provider = get_provider_registry().crypto_data()
         calendar = CryptoCalendarService()
 
         try:
@@ -304,10 +304,10 @@ def register_crypto_tools(mcp: Any) -> None:
             - "Which performed better: Bitcoin or Ethereum?"
             - "Compare top 5 cryptos over 90 days"
         """
-        from maverick_crypto.providers import CryptoDataProvider
+        from maverick_crypto.providers import get_provider_registry
         import numpy as np
 
-        provider = CryptoDataProvider()
+        provider = get_provider_registry().crypto_data()
 
         try:
             # Fetch data for all symbols
@@ -428,7 +428,7 @@ def register_crypto_tools(mcp: Any) -> None:
             - "What's hot in crypto right now?"
         """
         try:
-            from maverick_crypto.providers import CoinGeckoProvider, HAS_COINGECKO
+            from maverick_crypto.providers import HAS_COINGECKO, get_provider_registry
         except ImportError:
             return {"error": "CoinGecko provider not available"}
 
@@ -439,7 +439,7 @@ def register_crypto_tools(mcp: Any) -> None:
             }
 
         try:
-            provider = CoinGeckoProvider()
+            provider = get_provider_registry().coingecko()
             return await provider.get_trending()
         except Exception as e:
             logger.error(f"Error fetching trending cryptos: {e}")
@@ -469,12 +469,12 @@ def register_crypto_tools(mcp: Any) -> None:
             - "What's the crypto sentiment right now?"
         """
         try:
-            from maverick_crypto.providers.coingecko_provider import FearGreedProvider
+            from maverick_crypto.providers import get_provider_registry
         except ImportError:
             return {"error": "Fear & Greed provider not available"}
 
         try:
-            provider = FearGreedProvider()
+            provider = get_provider_registry().fear_greed()
             return await provider.get_fear_greed_index()
         except Exception as e:
             logger.error(f"Error fetching fear/greed index: {e}")
@@ -505,7 +505,7 @@ def register_crypto_tools(mcp: Any) -> None:
             - "What's the global crypto market data?"
         """
         try:
-            from maverick_crypto.providers import CoinGeckoProvider, HAS_COINGECKO
+            from maverick_crypto.providers import HAS_COINGECKO, get_provider_registry
         except ImportError:
             return {"error": "CoinGecko provider not available"}
 
@@ -516,7 +516,7 @@ def register_crypto_tools(mcp: Any) -> None:
             }
 
         try:
-            provider = CoinGeckoProvider()
+            provider = get_provider_registry().coingecko()
             return await provider.get_global_data()
         except Exception as e:
             logger.error(f"Error fetching global data: {e}")
@@ -548,7 +548,7 @@ def register_crypto_tools(mcp: Any) -> None:
             - "List top 50 crypto coins"
         """
         try:
-            from maverick_crypto.providers import CoinGeckoProvider, HAS_COINGECKO
+            from maverick_crypto.providers import HAS_COINGECKO, get_provider_registry
         except ImportError:
             return {"error": "CoinGecko provider not available"}
 
@@ -560,7 +560,7 @@ def register_crypto_tools(mcp: Any) -> None:
 
         try:
             limit = min(limit, 100)  # Cap at 100
-            provider = CoinGeckoProvider()
+            provider = get_provider_registry().coingecko()
             coins = await provider.get_top_coins(limit=limit)
 
             return {
@@ -597,7 +597,7 @@ def register_crypto_tools(mcp: Any) -> None:
             - "Search for layer 2 tokens"
         """
         try:
-            from maverick_crypto.providers import CoinGeckoProvider, HAS_COINGECKO
+            from maverick_crypto.providers import HAS_COINGECKO, get_provider_registry
         except ImportError:
             return {"error": "CoinGecko provider not available"}
 
@@ -608,7 +608,7 @@ def register_crypto_tools(mcp: Any) -> None:
             }
 
         try:
-            provider = CoinGeckoProvider()
+            provider = get_provider_registry().coingecko()
             coins = await provider.search_coins(query)
 
             return {
@@ -647,7 +647,7 @@ def register_crypto_tools(mcp: Any) -> None:
             - "What's the max supply of Solana?"
         """
         try:
-            from maverick_crypto.providers import CoinGeckoProvider, HAS_COINGECKO
+            from maverick_crypto.providers import HAS_COINGECKO, get_provider_registry
         except ImportError:
             return {"error": "CoinGecko provider not available"}
 
@@ -658,7 +658,7 @@ def register_crypto_tools(mcp: Any) -> None:
             }
 
         try:
-            provider = CoinGeckoProvider()
+            provider = get_provider_registry().coingecko()
 
             # Get CoinGecko ID from symbol
             coin_id = await provider.get_coin_id(symbol)
@@ -1160,8 +1160,8 @@ def register_crypto_tools(mcp: Any) -> None:
             - "List top 10 protocols by locked value"
         """
         try:
-            from maverick_crypto.defi import DefiLlamaProvider
-            provider = DefiLlamaProvider()
+            from maverick_crypto.providers import get_provider_registry
+            provider = get_provider_registry().defillama()
             protocols = await provider.get_top_protocols(limit)
             return {"protocols": protocols, "count": len(protocols)}
         except Exception as e:
@@ -1189,8 +1189,8 @@ def register_crypto_tools(mcp: Any) -> None:
             - "Top DeFi chains by locked value"
         """
         try:
-            from maverick_crypto.defi import DefiLlamaProvider
-            provider = DefiLlamaProvider()
+            from maverick_crypto.providers import get_provider_registry
+            provider = get_provider_registry().defillama()
             chains = await provider.get_top_chains(limit)
             return {"chains": chains, "count": len(chains)}
         except Exception as e:
@@ -1216,8 +1216,8 @@ def register_crypto_tools(mcp: Any) -> None:
             - "Show me Lido protocol details"
         """
         try:
-            from maverick_crypto.defi import DefiLlamaProvider
-            provider = DefiLlamaProvider()
+            from maverick_crypto.providers import get_provider_registry
+            provider = get_provider_registry().defillama()
             data = await provider.get_protocol(protocol.lower())
 
             if not data:
@@ -1257,8 +1257,8 @@ def register_crypto_tools(mcp: Any) -> None:
             - "Top staking rewards in DeFi"
         """
         try:
-            from maverick_crypto.defi import DefiLlamaProvider
-            provider = DefiLlamaProvider()
+            from maverick_crypto.providers import get_provider_registry
+            provider = get_provider_registry().defillama()
             yields = await provider.get_yields(limit)
             return {"pools": yields, "count": len(yields)}
         except Exception as e:
@@ -1283,8 +1283,8 @@ def register_crypto_tools(mcp: Any) -> None:
             - "Show stablecoin market overview"
         """
         try:
-            from maverick_crypto.defi import DefiLlamaProvider
-            provider = DefiLlamaProvider()
+            from maverick_crypto.providers import get_provider_registry
+            provider = get_provider_registry().defillama()
             stables = await provider.get_stablecoins()
             total_mcap = sum(s.get("circulating", 0) or 0 for s in stables)
             return {
@@ -1315,8 +1315,8 @@ def register_crypto_tools(mcp: Any) -> None:
             - "DeFi market summary"
         """
         try:
-            from maverick_crypto.defi import DefiLlamaProvider
-            provider = DefiLlamaProvider()
+            from maverick_crypto.providers import get_provider_registry
+            provider = get_provider_registry().defillama()
             summary = await provider.get_defi_summary()
             return summary
         except Exception as e:
@@ -1345,8 +1345,8 @@ def register_crypto_tools(mcp: Any) -> None:
             - "Hot pools on Ethereum DEXs"
         """
         try:
-            from maverick_crypto.defi import OnChainProvider
-            provider = OnChainProvider()
+            from maverick_crypto.providers import get_provider_registry
+            provider = get_provider_registry().onchain()
             pools = await provider.get_trending_pools(network)
             return {"pools": pools, "network": network or "all", "count": len(pools)}
         except Exception as e:
@@ -1374,8 +1374,8 @@ def register_crypto_tools(mcp: Any) -> None:
             - "Latest DEX pool launches"
         """
         try:
-            from maverick_crypto.defi import OnChainProvider
-            provider = OnChainProvider()
+            from maverick_crypto.providers import get_provider_registry
+            provider = get_provider_registry().onchain()
             pools = await provider.get_new_pools(network)
             return {"pools": pools, "network": network or "all", "count": len(pools)}
         except Exception as e:
@@ -1399,8 +1399,8 @@ def register_crypto_tools(mcp: Any) -> None:
             - "Search Bonk DEX pools"
         """
         try:
-            from maverick_crypto.defi import OnChainProvider
-            provider = OnChainProvider()
+            from maverick_crypto.providers import get_provider_registry
+            provider = get_provider_registry().onchain()
             pools = await provider.search_pools(query)
             return {"pools": pools, "query": query, "count": len(pools)}
         except Exception as e:
@@ -1436,8 +1436,8 @@ def register_crypto_tools(mcp: Any) -> None:
             - "Show me ETH and SOL news"
         """
         try:
-            from maverick_crypto.news import NewsAggregator
-            aggregator = NewsAggregator()
+            from maverick_crypto.providers import get_provider_registry
+            aggregator = get_provider_registry().news_aggregator()
             articles = await aggregator.get_all_news(currencies=currencies, limit=limit)
             return {"articles": articles, "count": len(articles)}
         except Exception as e:
@@ -1468,9 +1468,10 @@ def register_crypto_tools(mcp: Any) -> None:
             - "Analyze ETH news sentiment"
         """
         try:
-            from maverick_crypto.news import NewsAggregator, CryptoSentimentAnalyzer
+            from maverick_crypto.news import CryptoSentimentAnalyzer
+            from maverick_crypto.providers import get_provider_registry
 
-            aggregator = NewsAggregator()
+            aggregator = get_provider_registry().news_aggregator()
             summary = await aggregator.get_news_summary(currencies=currencies)
 
             # Also analyze with keyword analyzer
@@ -1505,8 +1506,8 @@ def register_crypto_tools(mcp: Any) -> None:
             - "Hot crypto stories"
         """
         try:
-            from maverick_crypto.news import CryptoPanicProvider
-            provider = CryptoPanicProvider()
+            from maverick_crypto.providers import get_provider_registry
+            provider = get_provider_registry().cryptopanic()
             articles = await provider.get_trending(limit=15)
 
             return {
@@ -1567,8 +1568,8 @@ def register_crypto_tools(mcp: Any) -> None:
             - "Good news in crypto market"
         """
         try:
-            from maverick_crypto.news import CryptoPanicProvider
-            provider = CryptoPanicProvider()
+            from maverick_crypto.providers import get_provider_registry
+            provider = get_provider_registry().cryptopanic()
             articles = await provider.get_bullish_news(limit=limit)
             return {"articles": [a.to_dict() for a in articles], "sentiment": "bullish"}
         except Exception as e:
@@ -1594,8 +1595,8 @@ def register_crypto_tools(mcp: Any) -> None:
             - "What are the crypto concerns?"
         """
         try:
-            from maverick_crypto.news import CryptoPanicProvider
-            provider = CryptoPanicProvider()
+            from maverick_crypto.providers import get_provider_registry
+            provider = get_provider_registry().cryptopanic()
             articles = await provider.get_bearish_news(limit=limit)
             return {"articles": [a.to_dict() for a in articles], "sentiment": "bearish"}
         except Exception as e:
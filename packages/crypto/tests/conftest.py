@@ -11,6 +11,17 @@ if str(package_path) not in sys.path:
     sys.path.insert(0, str(package_path))
 
 
+@pytest.fixture(autouse=True)
+def isolated_price_store(tmp_path, monkeypatch):
+    """Keep the default crypto price store out of the home directory."""
+    from maverick_crypto.providers import price_store
+
+    url = f"sqlite:///{tmp_path / 'crypto_prices.db'}"
+    monkeypatch.setenv("CRYPTO_PRICE_DB_URL", url)
+    monkeypatch.setattr(price_store, "CRYPTO_PRICE_DB_URL", url)
+    return url
+
+
 @pytest.fixture
 def crypto_provider():
     """Create a CryptoDataProvider instance."""
@@ -219,6 +219,81 @@ class TestCryptoBacktestEngine:
         assert "best_strategy" in result
 
 
+class TestOptimizeStrategy:
+    """Test the fetch-once, vectorized parameter grid."""
+    
+    GRIDS = {
+        "crypto_momentum": {"fast_period": [3, 5, 10], "slow_period": [10, 20, 30]},
+        "crypto_mean_reversion": {"period": [10, 20], "std_dev": [1.0, 2.0], "exit_at_middle": [True, False]},
+        "crypto_breakout": {"lookback": [5, 10, 20], "volume_threshold": [0.8, 1.2]},
+        "crypto_rsi": {"period": [7, 14], "oversold": [30, 40], "overbought": [60, 70]},
+        "crypto_macd": {"fast_period": [5, 8], "slow_period": [13, 21], "signal_period": [5, 9]},
+        "crypto_bollinger": {"period": [10, 20], "std_dev": [1.0, 1.5, 2.0]},
+    }
+    
+    @pytest.fixture
+    def provider(self):
+        """Mock data provider serving a fixed random walk."""
+        from unittest.mock import AsyncMock
+        
+        rng = np.random.default_rng(7)
+        dates = pd.date_range(start="2024-01-01", periods=200, freq="D")
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.03, 200)))
+        data = pd.DataFrame({
+            "Open": close * (1 + rng.normal(0, 0.005, 200)),
+            "High": close * (1 + rng.uniform(0, 0.03, 200)),
+            "Low": close * (1 - rng.uniform(0, 0.03, 200)),
+            "Close": close,
+            "Volume": rng.integers(1000, 10000, 200),
+        }, index=dates)
+        
+        provider = AsyncMock()
+        provider.get_crypto_data.return_value = data
+        return provider
+    
+    @pytest.mark.asyncio
+    async def test_fetches_price_history_once(self, provider):
+        """Test the whole grid is evaluated from a single fetch."""
+        from maverick_crypto.backtesting import CryptoBacktestEngine
+        
+        engine = CryptoBacktestEngine(data_provider=provider)
+        result = await engine.optimize_strategy(
+            symbol="BTC",
+            strategy="crypto_momentum",
+            param_grid={"fast_period": [3, 5, 8, 10, 12], "slow_period": [15, 20, 25, 30, 40], "stop_loss": [0.1, 0.15, 0.2, 0.25]},
+            days=200,
+        )
+        
+        assert result["combinations_tested"] == 100
+        assert provider.get_crypto_data.await_count == 1
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("strategy", list(GRIDS))
+    async def test_ranking_matches_per_combination_backtests(self, provider, strategy):
+        """Test the vectorized grid ranks exactly like one backtest per combination."""
+        import itertools
+        
+        from maverick_crypto.backtesting import CryptoBacktestEngine
+        
+        engine = CryptoBacktestEngine(data_provider=provider)
+        grid = self.GRIDS[strategy]
+        result = await engine.optimize_strategy(
+            symbol="BTC", strategy=strategy, param_grid=grid, days=200, memory_budget_mb=0.1
+        )
+        
+        expected = []
+        for combo in itertools.product(*grid.values()):
+            params = dict(zip(grid, combo))
+            backtest = await engine.run_backtest("BTC", strategy, parameters=params, days=200)
+            expected.append((params, backtest["sharpe_ratio"], backtest["num_trades"]))
+        expected.sort(key=lambda x: x[1] or float("-inf"), reverse=True)
+        
+        ranked = [(r["parameters"], r["metric_value"], r["num_trades"]) for r in result["top_10_results"]]
+        assert [r[0] for r in ranked] == [e[0] for e in expected[:10]]
+        assert [r[2] for r in ranked] == [e[2] for e in expected[:10]]
+        assert [r[1] for r in ranked] == pytest.approx([e[1] for e in expected[:10]], nan_ok=True)
+
+
 class TestCryptoSpecificAdjustments:
     """Test that crypto strategies have correct volatility adjustments."""
     
@@ -0,0 +1,263 @@
+"""Tests for the quadratic-programming efficient frontier."""
+
+import time
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from maverick_crypto.portfolio import EfficientFrontierSolver, PortfolioOptimizer
+
+
+def random_universe(n: int, seed: int = 0):
+    """Factor-model covariance and expected returns for n assets."""
+    rng = np.random.default_rng(seed)
+    loadings = rng.normal(size=(n, 5))
+    cov = loadings @ loadings.T * 0.01 + np.diag(rng.uniform(0.01, 0.09, n))
+    return rng.uniform(0.0, 0.3, n), cov
+
+
+def assert_feasible(solver, portfolio, tol=1e-8):
+    """Weights sum to 1 and respect the bounds and group limits."""
+    w = portfolio.weights
+    assert w.sum() == pytest.approx(1.0, abs=tol)
+    assert np.all(w >= solver.lower - tol) and np.all(w <= solver.upper + tol)
+    for indices, group_min, group_max in solver.groups:
+        assert group_min - tol <= w[indices].sum() <= group_max + tol
+
+
+def slsqp_min_variance(cov, upper, groups=(), mu=None, target=None):
+    """Reference minimum variance from SLSQP."""
+    from scipy.optimize import minimize
+
+    n = len(cov)
+    constraints = [{"type": "eq", "fun": lambda w: w.sum() - 1}]
+    if target is not None:
+        constraints.append({"type": "eq", "fun": lambda w: mu @ w - target})
+    for indices, group_min, group_max in groups:
+        constraints += [
+            {"type": "ineq", "fun": lambda w, i=indices, lo=group_min: w[i].sum() - lo},
+            {"type": "ineq", "fun": lambda w, i=indices, hi=group_max: hi - w[i].sum()},
+        ]
+    result = minimize(
+        lambda w: w @ cov @ w, np.full(n, 1 / n), jac=lambda w: 2 * cov @ w, method="SLSQP",
+        bounds=[(0, upper)] * n, constraints=constraints,
+        options={"maxiter": 1000, "ftol": 1e-15},
+    )
+    return result.fun
+
+
+class TestAnalyticSolutions:
+    """Test optimality against closed-form mean-variance solutions."""
+
+    def test_two_asset_min_variance_and_tangency(self):
+        s1, s2, rho = 0.2, 0.3, 0.25
+        c = rho * s1 * s2
+        cov = np.array([[s1**2, c], [c, s2**2]])
+        mu = np.array([0.08, 0.14])
+        solver = EfficientFrontierSolver(mu, cov, risk_free_rate=0.03)
+
+        w1 = (s2**2 - c) / (s1**2 + s2**2 - 2 * c)
+        np.testing.assert_allclose(solver.min_variance().weights, [w1, 1 - w1], atol=1e-9)
+
+        tangency = np.linalg.solve(cov, mu - 0.03)
+        np.testing.assert_allclose(solver.max_sharpe().weights, tangency / tangency.sum(), atol=1e-9)
+
+    def test_three_asset_frontier_matches_closed_form(self):
+        rng = np.random.default_rng(1)
+        b = rng.normal(size=(3, 3))
+        cov = b @ b.T / 10 + 0.02 * np.eye(3)
+        mu = np.array([0.05, 0.10, 0.15])
+        solver = EfficientFrontierSolver(mu, cov, lower=-5, upper=5, risk_free_rate=0.02)
+
+        inv, ones = np.linalg.inv(cov), np.ones(3)
+        a, b_, c = ones @ inv @ ones, ones @ inv @ mu, mu @ inv @ mu
+        np.testing.assert_allclose(solver.min_variance().weights, inv @ ones / a, atol=1e-9)
+
+        tangency = inv @ (mu - 0.02)
+        np.testing.assert_allclose(solver.max_sharpe().weights, tangency / tangency.sum(), atol=1e-9)
+
+        # Two-fund theorem: w(r) = Σ⁻¹(λ1 + γμ)
+        target = 0.2
+        d = a * c - b_**2
+        lam, gamma = (c - b_ * target) / d, (a * target - b_) / d
+        expected = inv @ (lam * ones + gamma * mu)
+        np.testing.assert_allclose(solver.portfolio_for_return(target).weights, expected, atol=1e-9)
+
+    def test_long_only_drops_shorted_asset(self):
+        """The unconstrained tangency shorts asset 0; long-only reduces to two assets."""
+        cov = np.array([[0.04, 0.018, 0.0], [0.018, 0.09, 0.0], [0.0, 0.0, 0.16]])
+        mu = np.array([0.02, 0.12, 0.15])
+        assert np.linalg.solve(cov, mu - 0.01)[0] < 0
+
+        weights = EfficientFrontierSolver(mu, cov, risk_free_rate=0.01).max_sharpe().weights
+
+        sub = np.linalg.solve(cov[1:, 1:], mu[1:] - 0.01)
+        np.testing.assert_allclose(weights, [0.0, *(sub / sub.sum())], atol=1e-9)
+
+    def test_tied_max_return_takes_least_risky_mix(self):
+        mu = np.array([0.1, 0.1, 0.05])
+        solver = EfficientFrontierSolver(mu, np.diag([0.04, 0.01, 0.02]))
+
+        np.testing.assert_allclose(solver.max_return().weights, [0.2, 0.8, 0.0], atol=1e-9)
+
+
+class TestConstraintsAndScaling:
+    """Test bounded, grouped frontiers on large universes."""
+
+    def test_bounds_and_groups_match_slsqp(self):
+        from scipy.optimize import minimize
+
+        n = 30
+        mu, cov = random_universe(n)
+        crypto = list(range(10))
+        solver = EfficientFrontierSolver(mu, cov, upper=0.15, groups=[(crypto, 0.05, 0.25)])
+        point = solver.frontier(11)[5]
+
+        constraints = [
+            {"type": "eq", "fun": lambda w: w.sum() - 1},
+            {"type": "eq", "fun": lambda w: mu @ w - point.expected_return},
+            {"type": "ineq", "fun": lambda w: w[crypto].sum() - 0.05},
+            {"type": "ineq", "fun": lambda w: 0.25 - w[crypto].sum()},
+        ]
+        reference = minimize(
+            lambda w: w @ cov @ w, np.full(n, 1 / n), method="SLSQP",
+            bounds=[(0, 0.15)] * n, constraints=constraints,
+            options={"maxiter": 1000, "ftol": 1e-14},
+        )
+
+        assert point.volatility**2 <= reference.fun + 1e-10
+        assert point.weights.max() <= 0.15 + 1e-12
+        assert 0.05 - 1e-12 <= point.weights[crypto].sum() <= 0.25 + 1e-12
+        assert point.weights.sum() == pytest.approx(1.0)
+
+    @pytest.mark.parametrize("n", [100, 200])
+    def test_frontier_scales_to_large_universes(self, n):
+        mu, cov = random_universe(n, seed=n)
+
+        start = time.perf_counter()
+        solver = EfficientFrontierSolver(mu, cov, upper=0.1, risk_free_rate=0.05)
+        frontier = solver.frontier(50)
+        tangency = solver.max_sharpe()
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 10
+        assert len(frontier) == 50
+        returns = [p.expected_return for p in frontier]
+        vols = [p.volatility for p in frontier]
+        assert np.all(np.diff(returns) > 0) and np.all(np.diff(vols) >= -1e-12)
+        assert tangency.sharpe_ratio >= max(p.sharpe_ratio for p in frontier) - 1e-9
+
+
+class TestIllConditionedCovariance:
+    """Test singular and near-singular covariance matrices."""
+
+    def test_duplicated_assets_match_deduplicated_universe(self):
+        mu, cov = random_universe(5, seed=4)
+        duplicated = [0, 1, 2, 2, 3, 4, 4]
+        solver = EfficientFrontierSolver(
+            mu[duplicated], cov[np.ix_(duplicated, duplicated)], risk_free_rate=0.02
+        )
+        reference = EfficientFrontierSolver(mu, cov, risk_free_rate=0.02)
+
+        def merged(weights):
+            return np.bincount(duplicated, weights=weights)
+
+        target = (reference.min_variance().expected_return + reference.max_return().expected_return) / 2
+        for name, args in [("min_variance", ()), ("max_sharpe", ()), ("portfolio_for_return", (target,))]:
+            point = getattr(solver, name)(*args)
+            expected = getattr(reference, name)(*args)
+            assert_feasible(solver, point)
+            np.testing.assert_allclose(merged(point.weights), expected.weights, atol=1e-6)
+            assert point.volatility == pytest.approx(expected.volatility, rel=1e-6)
+
+    def test_perfectly_correlated_assets(self):
+        rng = np.random.default_rng(5)
+        loadings = rng.normal(size=(6, 3)) * 0.2
+        cov = loadings @ loadings.T  # rank 3
+        mu = rng.uniform(0.0, 0.3, 6)
+        groups = [([0, 1, 2], 0.1, 0.5)]
+        solver = EfficientFrontierSolver(mu, cov, upper=0.4, groups=groups, risk_free_rate=0.02)
+
+        for point in [*solver.frontier(10), solver.max_sharpe()]:
+            assert_feasible(solver, point)
+        assert solver.min_variance().volatility**2 <= slsqp_min_variance(cov, 0.4, groups) + 1e-9
+
+    def test_more_assets_than_observations(self):
+        rng = np.random.default_rng(6)
+        n = 40
+        returns = rng.normal(0.001, 0.02, size=(15, n))
+        cov = np.cov(returns, rowvar=False) * 252
+        mu = rng.uniform(0.0, 0.3, n)
+        groups = [(list(range(10)), 0.05, 0.3)]
+        solver = EfficientFrontierSolver(mu, cov, upper=0.2, groups=groups, risk_free_rate=0.05)
+
+        frontier = solver.frontier(10)
+        for point in [*frontier, solver.max_sharpe()]:
+            assert_feasible(solver, point)
+        assert np.all(np.diff([p.expected_return for p in frontier]) > 0)
+
+        point = frontier[5]
+        reference = slsqp_min_variance(cov, 0.2, groups, mu, point.expected_return)
+        assert point.volatility**2 <= reference + 1e-9
+
+    def test_falls_back_to_slsqp(self, monkeypatch):
+        mu, cov = random_universe(8, seed=7)
+        groups = [([0, 1, 2], 0.1, 0.4)]
+        expected = EfficientFrontierSolver(mu, cov, upper=0.3, groups=groups, risk_free_rate=0.02)
+        solver = EfficientFrontierSolver(mu, cov, upper=0.3, groups=groups, risk_free_rate=0.02)
+        monkeypatch.setattr(
+            solver, "_active_set", lambda x, *args: (x + 0.01, [], False)
+        )
+
+        for name in ("min_variance", "max_sharpe"):
+            point = getattr(solver, name)()
+            assert_feasible(solver, point)
+            np.testing.assert_allclose(point.weights, getattr(expected, name)().weights, atol=1e-5)
+
+
+class TestOptimizerFrontier:
+    """Test PortfolioOptimizer on the QP frontier."""
+
+    @pytest.fixture
+    def optimizer(self):
+        rng = np.random.default_rng(3)
+        returns = pd.DataFrame(
+            rng.normal([0.0004, 0.0006, 0.0012, 0.0015], [0.01, 0.012, 0.04, 0.05], size=(365, 4)),
+            columns=["AAPL", "MSFT", "BTC", "ETH"],
+        )
+        optimizer = PortfolioOptimizer()
+        optimizer.portfolio_service.calculate_returns = AsyncMock(return_value=returns)
+        return optimizer
+
+    @pytest.mark.asyncio
+    async def test_qp_frontier_respects_crypto_cap(self, optimizer):
+        result = await optimizer.efficient_frontier(
+            stocks=["AAPL", "MSFT"], cryptos=["BTC", "ETH"], num_portfolios=20, max_crypto_weight=0.3,
+        )
+
+        points = result["frontier_points"]
+        assert result["method"] == "qp" and len(points) == 20
+        assert [p["return_pct"] for p in points] == sorted(p["return_pct"] for p in points)
+        for point in points:
+            assert point["weights"]["BTC"] + point["weights"]["ETH"] <= 0.3 + 1e-3
+        sampled = await optimizer.efficient_frontier(
+            stocks=["AAPL", "MSFT"], cryptos=["BTC", "ETH"], max_crypto_weight=0.3, method="sampling",
+        )
+        assert (
+            result["key_portfolios"]["max_sharpe"]["sharpe_ratio"]
+            >= sampled["key_portfolios"]["max_sharpe"]["sharpe_ratio"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_optimize_objectives(self, optimizer):
+        kwargs = dict(stocks=["AAPL", "MSFT"], cryptos=["BTC", "ETH"], max_weight=0.6, max_crypto_weight=0.4)
+        min_vol = await optimizer.optimize(objective="min_volatility", **kwargs)
+        max_sharpe = await optimizer.optimize(objective="max_sharpe", **kwargs)
+        max_ret = await optimizer.optimize(objective="max_return", **kwargs)
+
+        assert min_vol["metrics"]["volatility_pct"] <= max_sharpe["metrics"]["volatility_pct"]
+        assert max_sharpe["metrics"]["sharpe_ratio"] >= min_vol["metrics"]["sharpe_ratio"]
+        assert max_ret["metrics"]["expected_return_pct"] >= max_sharpe["metrics"]["expected_return_pct"]
+        assert max_ret["allocation"]["crypto_weight_pct"] <= 40.01
@@ -0,0 +1,127 @@
+"""Tests for the persistent crypto OHLCV store behind CryptoDataProvider."""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from maverick_crypto.providers import CryptoDataProvider, CryptoPriceStore
+from maverick_crypto.providers.price_store import utc_today
+
+
+class FakeYahoo:
+    """Daily candles from a fixed listing date up to now, recording each request."""
+
+    def __init__(self, listed: date):
+        self.listed = listed
+        self.calls: list[tuple[str, str, str | None]] = []
+
+    def __call__(self, symbol, start_date, end_date, interval):
+        self.calls.append((symbol, start_date, end_date))
+        start = max(date.fromisoformat(start_date), self.listed)
+        end = date.fromisoformat(end_date) if end_date else utc_today() + timedelta(days=1)
+        end = min(end, utc_today() + timedelta(days=1))
+        index = pd.date_range(start, end - timedelta(days=1), freq="D", tz="UTC")
+        close = np.array([float(d.toordinal() % 1000) for d in index])
+        return pd.DataFrame(
+            {"Open": close, "High": close + 1, "Low": close - 1, "Close": close, "Volume": 1e9},
+            index=index,
+        )
+
+
+@pytest.fixture
+def provider():
+    provider = CryptoDataProvider(price_store=CryptoPriceStore("sqlite://"))
+    provider._fetch_data_sync = FakeYahoo(listed=utc_today() - timedelta(days=1000))
+    return provider
+
+
+class TestCryptoPriceStore:
+    """Test bulk upserts and range reads."""
+
+    def test_upsert_skips_open_candle_and_overwrites(self):
+        store = CryptoPriceStore("sqlite://")
+        today = utc_today()
+        index = pd.date_range(today - timedelta(days=3), today, freq="D", tz="UTC")
+        df = pd.DataFrame(
+            {"Open": 1.0, "High": 2.0, "Low": 0.5, "Close": [1.0, 2.0, 3.0, 4.0], "Volume": 10},
+            index=index,
+        )
+
+        assert store.write("BTC", df) == 3
+        df["Close"] = 9.0
+        assert store.write("BTC", df) == 3
+
+        stored = store.read("BTC", today - timedelta(days=10), today + timedelta(days=1))
+        assert len(stored) == 3 and (stored["Close"] == 9.0).all()
+        assert store.coverage("BTC") == (today - timedelta(days=3), today - timedelta(days=1))
+        assert store.coverage("ETH") == (None, None)
+
+
+class TestReadThrough:
+    """Test the provider only downloads days the store is missing."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_request_served_from_store(self, provider):
+        first = await provider.get_crypto_data("BTC", days=365)
+        await provider.flush_writes()
+        second = await provider.get_crypto_data("BTC", days=365)
+
+        assert len(provider._fetch_data_sync.calls) == 1
+        assert len(second) == 365
+        pd.testing.assert_frame_equal(first, second, check_dtype=False, check_freq=False)
+
+    @pytest.mark.asyncio
+    async def test_fetches_only_missing_head_and_tail(self, provider):
+        today = utc_today()
+        await provider.get_crypto_data(
+            "ETH", start_date=today - timedelta(days=100), end_date=today - timedelta(days=10)
+        )
+        await provider.flush_writes()
+        calls = provider._fetch_data_sync.calls
+        calls.clear()
+
+        df = await provider.get_crypto_data("ETH", days=200)
+
+        assert sorted(calls) == sorted([
+            ("ETH-USD", (today - timedelta(days=200)).isoformat(), (today - timedelta(days=100)).isoformat()),
+            ("ETH-USD", (today - timedelta(days=10)).isoformat(), today.isoformat()),
+        ])
+        assert len(df) == 200 and df.index.is_monotonic_increasing
+
+    @pytest.mark.asyncio
+    async def test_listing_date_not_probed_again(self, provider):
+        await provider.get_crypto_data("SOL", days=30)
+        await provider.flush_writes()
+        await provider.get_crypto_data("SOL", days=3000)
+        await provider.flush_writes()
+        calls = provider._fetch_data_sync.calls
+        calls.clear()
+
+        df = await provider.get_crypto_data("SOL", days=3000)
+        assert calls == []
+        assert len(df) == 1000
+
+    @pytest.mark.asyncio
+    async def test_intraday_interval_bypasses_store(self, provider):
+        await provider.get_crypto_data("BTC", days=5, interval="1h")
+        await provider.get_crypto_data("BTC", days=5, interval="1h")
+        assert len(provider._fetch_data_sync.calls) == 2
+        assert provider._price_store.coverage("BTC") == (None, None)
+
+    @pytest.mark.asyncio
+    async def test_days_window_ends_on_utc_date(self, provider, monkeypatch):
+        from maverick_crypto.providers import crypto_provider
+
+        utc_date = utc_today() - timedelta(days=5)
+        monkeypatch.setattr(crypto_provider, "utc_today", lambda: utc_date)
+        df = await provider.get_crypto_data("BTC", days=30)
+
+        assert df.index[0].date() == utc_date - timedelta(days=30)
+        assert df.index[-1].date() == utc_date - timedelta(days=1)
+
+
+def test_default_store_is_isolated(isolated_price_store):
+    provider = CryptoDataProvider()
+    assert provider._price_store.database_url == isolated_price_store
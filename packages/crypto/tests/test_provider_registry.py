@@ -0,0 +1,114 @@
+"""Tests for the shared crypto provider registry and per-host rate limits."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from maverick_crypto.defi import DefiLlamaProvider, OnChainProvider
+from maverick_crypto.providers import coingecko_provider
+from maverick_crypto.providers.coingecko_provider import (
+    FearGreedProvider,
+    get_host_rate_limiter,
+)
+from maverick_crypto.providers.registry import CryptoProviderRegistry
+
+
+@pytest.fixture
+def fresh_limiters(monkeypatch):
+    monkeypatch.setattr(coingecko_provider, "_host_limiters", {})
+
+
+class TestHostRateLimiters:
+    """Test rate limiters are shared by upstream host."""
+
+    def test_same_host_shares_limiter(self, fresh_limiters):
+        first, second = OnChainProvider(), OnChainProvider()
+        assert first.rate_limiter is second.rate_limiter
+        assert first.rate_limiter is get_host_rate_limiter("api.coingecko.com")
+        assert first.rate_limiter.calls_per_minute == 10
+        assert FearGreedProvider().rate_limiter is not first.rate_limiter
+
+    @pytest.mark.asyncio
+    async def test_budget_is_global_across_instances(self, fresh_limiters):
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"data": []}))
+        async with httpx.AsyncClient(transport=transport) as client:
+            providers = [OnChainProvider(http_client=client) for _ in range(3)]
+            await asyncio.gather(*(p._request("/onchain/networks") for p in providers))
+
+        assert get_host_rate_limiter("api.coingecko.com").remaining_calls == 7
+
+
+class TestCryptoProviderRegistry:
+    """Test provider and connection pool reuse."""
+
+    @pytest.mark.asyncio
+    async def test_providers_are_singletons_sharing_one_pool(self):
+        registry = CryptoProviderRegistry(max_connections=5)
+        try:
+            defillama = registry.defillama()
+            assert registry.defillama() is defillama
+            assert registry.crypto_data() is registry.crypto_data()
+
+            client = registry.http_client()
+            assert isinstance(defillama, DefiLlamaProvider)
+            assert defillama._http_client is client
+            assert registry.onchain()._http_client is client
+            assert registry.news_aggregator().cryptopanic is registry.cryptopanic()
+            assert not defillama._owns_client
+        finally:
+            await registry.aclose()
+
+        assert client.is_closed
+
+    def test_http_providers_rebuilt_for_new_event_loop(self):
+        registry = CryptoProviderRegistry()
+
+        async def snapshot():
+            return registry.http_client(), registry.fear_greed(), registry.crypto_data()
+
+        first = asyncio.run(snapshot())
+        second = asyncio.run(snapshot())
+
+        assert first[0] is not second[0]
+        assert first[1] is not second[1]
+        assert first[2] is second[2]
+        asyncio.run(registry.aclose())
+        assert first[0].is_closed and second[0].is_closed
+
+    def test_client_replaced_while_its_loop_runs_is_closed(self):
+        import threading
+
+        registry = CryptoProviderRegistry()
+        old_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=old_loop.run_forever)
+        thread.start()
+        try:
+            old = asyncio.run_coroutine_threadsafe(
+                _get_client(registry), old_loop
+            ).result()
+            new = asyncio.run(_get_client(registry))
+            for _ in range(100):
+                if old.is_closed:
+                    break
+                asyncio.run_coroutine_threadsafe(asyncio.sleep(0.01), old_loop).result()
+
+            assert new is not old
+            assert old.is_closed and not new.is_closed
+            assert registry._retired_clients == []
+        finally:
+            old_loop.call_soon_threadsafe(old_loop.stop)
+            thread.join()
+            old_loop.close()
+            asyncio.run(registry.aclose())
+
+    def test_rate_limiter_shared_across_event_loops(self, fresh_limiters):
+        limiter = get_host_rate_limiter("api.example.com", calls_per_minute=5)
+        asyncio.run(limiter.acquire())
+        asyncio.run(limiter.acquire())
+
+        assert limiter.remaining_calls == 3
+
+
+async def _get_client(registry):
+    return registry.http_client()
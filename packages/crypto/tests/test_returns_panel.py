@@ -0,0 +1,99 @@
+"""Tests for the aligned returns panel shared by the correlation analyses."""
+
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from maverick_crypto.portfolio import AssetType, CorrelationAnalyzer, ReturnsPanel
+
+STOCKS = ["AAPL", "MSFT", "SPY"]
+CRYPTOS = ["BTC", "ETH", "SOL"]
+
+
+def synthetic_closes(symbol: str, asset_type: AssetType, days: int) -> pd.DataFrame:
+    """Random-walk closes: weekdays only for stocks, every day for crypto."""
+    index = pd.date_range("2024-01-01", periods=days, freq="D", tz="UTC")
+    rng = np.random.default_rng(sum(map(ord, symbol)))
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, days)))
+    df = pd.DataFrame({"Close": close}, index=index)
+    if asset_type == AssetType.STOCK:
+        df = df[df.index.dayofweek < 5]
+    return df
+
+
+@pytest.fixture
+def analyzer():
+    analyzer = CorrelationAnalyzer()
+    calls = Counter()
+
+    async def fetch_asset_data(symbol, asset_type, days=90):
+        calls[symbol] += 1
+        return synthetic_closes(symbol, asset_type, days)
+
+    analyzer.portfolio_service.fetch_asset_data = fetch_asset_data
+    analyzer.calls = calls
+    return analyzer
+
+
+class TestReturnsPanel:
+    """Test calendar alignment of stocks and crypto."""
+
+    @pytest.mark.asyncio
+    async def test_monday_crypto_return_spans_weekend(self, analyzer):
+        panel = await analyzer.returns_panel(["AAPL"], ["BTC"], days=60)
+        btc = panel.closes["BTC"]
+
+        assert (panel.returns.index.dayofweek < 5).all()
+        monday = panel.returns.index[panel.returns.index.dayofweek == 0][0]
+        friday = monday - pd.Timedelta(days=3)
+        assert panel.returns.loc[monday, "BTC"] == pytest.approx(btc[monday] / btc[friday] - 1)
+
+    @pytest.mark.asyncio
+    async def test_crypto_subset_uses_every_day(self, analyzer):
+        panel = await analyzer.returns_panel(STOCKS, CRYPTOS, days=60)
+        crypto = panel.subset(CRYPTOS)
+
+        assert isinstance(crypto, ReturnsPanel)
+        assert len(crypto.returns) == 59
+        assert panel.subset(STOCKS + CRYPTOS) is panel
+
+
+class TestSharedPanel:
+    """Test the correlation analyses reuse one fetch per symbol."""
+
+    @pytest.mark.asyncio
+    async def test_each_symbol_fetched_once(self, analyzer):
+        panel = await analyzer.returns_panel(STOCKS, CRYPTOS, days=120)
+        matrix = await analyzer.calculate_correlation_matrix(STOCKS, CRYPTOS, panel=panel)
+        rolling = await analyzer.rolling_correlation("SPY", "stock", "BTC", "crypto", panel=panel)
+        comparison = await analyzer.asset_class_comparison(STOCKS, CRYPTOS, panel=panel)
+        await analyzer.calculate_correlation_matrix(STOCKS, CRYPTOS, days=120)
+
+        assert "error" not in matrix and "error" not in rolling and "error" not in comparison
+        assert analyzer.calls == Counter({s: 1 for s in STOCKS + CRYPTOS})
+
+    @pytest.mark.asyncio
+    async def test_pairs_match_nested_loop(self, analyzer):
+        panel = await analyzer.returns_panel(STOCKS, CRYPTOS, days=120)
+        result = await analyzer.calculate_correlation_matrix(STOCKS, CRYPTOS, panel=panel)
+
+        corr = panel.returns.corr()
+        expected = [
+            (a, b, corr.loc[a, b])
+            for i, a in enumerate(corr.columns)
+            for j, b in enumerate(corr.columns)
+            if i < j
+        ]
+        ranked = sorted(expected, key=lambda p: p[2])
+        assert result["average_correlation"] == round(np.mean([p[2] for p in expected]), 3)
+        assert [(p["asset1"], p["asset2"]) for p in result["high_correlation_pairs"]] == [
+            (a, b) for a, b, c in expected if abs(c) > 0.7
+        ]
+        assert [(p["asset1"], p["asset2"]) for p in result["most_correlated_pairs"]] == [
+            (a, b) for a, b, _ in ranked[::-1][:5]
+        ]
+        assert [(p["asset1"], p["asset2"]) for p in result["least_correlated_pairs"]] == [
+            (a, b) for a, b, _ in ranked[:5]
+        ]
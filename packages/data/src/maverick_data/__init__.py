@@ -75,6 +75,7 @@ from maverick_data.providers import (
     EnhancedStockDataProvider,
     MarketDataProvider,
     MacroDataProvider,
+    FredSeriesStore,
     MARKET_INDICES,
     SECTOR_ETFS,
 )
@@ -154,6 +155,7 @@ __all__ = [
     "EnhancedStockDataProvider",
     "MarketDataProvider",
     "MacroDataProvider",
+    "FredSeriesStore",
     "MARKET_INDICES",
     "SECTOR_ETFS",
     # Services
@@ -10,14 +10,19 @@ Providers:
     - YFinancePool: Thread-safe connection pooling for yfinance
     - MarketDataProvider: Market indices, gainers, losers, sectors
     - MacroDataProvider: Macroeconomic data from FRED API
+    - FredSeriesStore: Local store of FRED observations
 """
 
 from maverick_data.providers.base import BaseStockProvider
+from maverick_data.providers.fred_store import FredSeriesStore
 from maverick_data.providers.macro_data import MacroDataProvider
 from maverick_data.providers.market_data import (
     MARKET_INDICES,
     SECTOR_ETFS,
     MarketDataProvider,
+    MarketSnapshot,
+    clear_market_snapshot,
+    get_market_snapshot,
 )
 from maverick_data.providers.stock_data import (
     EnhancedStockDataProvider,
@@ -42,8 +47,12 @@ __all__ = [
     "cleanup_yfinance_pool",
     # Market data
     "MarketDataProvider",
+    "MarketSnapshot",
+    "get_market_snapshot",
+    "clear_market_snapshot",
     "MARKET_INDICES",
     "SECTOR_ETFS",
     # Macro data
     "MacroDataProvider",
+    "FredSeriesStore",
 ]
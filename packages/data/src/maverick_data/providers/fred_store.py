@@ -0,0 +1,191 @@
+"""
+Local FRED Series Store.
+
+Persists FRED observations in a SQLite file so macro series are downloaded
+once and then updated incrementally: a refresh only requests observations
+newer than the last stored date. Reads are served from the store.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from datetime import date, timedelta
+from pathlib import Path
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Configuration
+FRED_STORE_PATH = os.getenv(
+    "FRED_STORE_PATH", str(Path.home() / ".cache" / "maverick" / "fred_series.db")
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS observations (
+    series_id TEXT NOT NULL,
+    date TEXT NOT NULL,
+    value REAL,
+    PRIMARY KEY (series_id, date)
+);
+CREATE TABLE IF NOT EXISTS series_meta (
+    series_id TEXT PRIMARY KEY,
+    history_start TEXT NOT NULL,
+    last_refreshed REAL NOT NULL
+);
+"""
+
+
+class FredSeriesStore:
+    """
+    SQLite-backed store of FRED observations.
+
+    Observations are keyed by (series_id, date). Each series also records the
+    earliest date it has been backfilled from and when it was last refreshed,
+    which is what the provider uses to decide whether to hit the FRED API.
+    """
+
+    def __init__(self, path: str | Path | None = None):
+        """
+        Initialize the store.
+
+        The database file is created on first use.
+
+        Args:
+            path: SQLite file path, or ":memory:" (default: FRED_STORE_PATH)
+        """
+        self.path = str(path or FRED_STORE_PATH)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def read(
+        self, series_id: str, start_date: str | None = None, end_date: str | None = None
+    ) -> pd.Series:
+        """
+        Read stored observations.
+
+        Args:
+            series_id: FRED series identifier
+            start_date: Inclusive start date in YYYY-MM-DD format
+            end_date: Inclusive end date in YYYY-MM-DD format
+
+        Returns:
+            Series indexed by observation date (missing values as NaN)
+        """
+        query = "SELECT date, value FROM observations WHERE series_id = ?"
+        params: list[str] = [series_id]
+        if start_date:
+            query += " AND date >= ?"
+            params.append(start_date)
+        if end_date:
+            query += " AND date <= ?"
+            params.append(end_date)
+        query += " ORDER BY date"
+
+        with self._lock:
+            rows = self._connection().execute(query, params).fetchall()
+
+        index = pd.DatetimeIndex([r[0] for r in rows])
+        return pd.Series([r[1] for r in rows], index=index, dtype=float, name=series_id)
+
+    def write_many(
+        self,
+        updates: dict[str, pd.Series],
+        history_start: dict[str, str] | None = None,
+        refreshed_at: float | None = None,
+    ):
+        """
+        Upsert observations for several series in one transaction.
+
+        Args:
+            updates: Newly fetched observations keyed by series ID
+            history_start: Date each series is now stored from, if backfilled
+            refreshed_at: Refresh timestamp to record (default: now)
+        """
+        history_start = history_start or {}
+        refreshed_at = refreshed_at or time.time()
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                for series_id, series in updates.items():
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO observations (series_id, date, value)"
+                        " VALUES (?, ?, ?)",
+                        _rows(series_id, series),
+                    )
+                    start = history_start.get(series_id) or (
+                        pd.Timestamp(series.index.min()).strftime("%Y-%m-%d")
+                        if len(series)
+                        else date.today().isoformat()
+                    )
+                    conn.execute(
+                        "INSERT INTO series_meta (series_id, history_start, last_refreshed)"
+                        " VALUES (?, ?, ?) ON CONFLICT(series_id) DO UPDATE SET"
+                        " history_start = MIN(history_start, excluded.history_start),"
+                        " last_refreshed = excluded.last_refreshed",
+                        (series_id, start, refreshed_at),
+                    )
+
+    def write(self, series_id: str, series: pd.Series, history_start: str | None = None):
+        """Upsert observations for one series."""
+        self.write_many(
+            {series_id: series}, {series_id: history_start} if history_start else None
+        )
+
+    def status(self, series_id: str) -> tuple[str | None, str | None, float]:
+        """
+        Get the stored extent of a series.
+
+        Args:
+            series_id: FRED series identifier
+
+        Returns:
+            Tuple of (history_start, last stored date, last refresh timestamp)
+        """
+        with self._lock:
+            conn = self._connection()
+            meta = conn.execute(
+                "SELECT history_start, last_refreshed FROM series_meta WHERE series_id = ?",
+                (series_id,),
+            ).fetchone()
+            last = conn.execute(
+                "SELECT MAX(date) FROM observations WHERE series_id = ?", (series_id,)
+            ).fetchone()
+
+        if meta is None:
+            return None, last[0], 0.0
+        return meta[0], last[0], meta[1]
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def _rows(series_id: str, series: pd.Series) -> Iterable[tuple[str, str, float | None]]:
+    for ts, value in series.items():
+        day = pd.Timestamp(ts).strftime("%Y-%m-%d")
+        yield series_id, day, None if pd.isna(value) else float(value)
+
+
+def next_day(day: str) -> str:
+    """The date after a YYYY-MM-DD date, in the same format."""
+    return (date.fromisoformat(day) + timedelta(days=1)).isoformat()
+
+
+__all__ = ["FRED_STORE_PATH", "FredSeriesStore"]
@@ -9,21 +9,44 @@ Provides macroeconomic indicators using FRED API including:
 - VIX
 - USD momentum
 - Sentiment scoring
+
+Observations are kept in a local FredSeriesStore and updated incrementally,
+so FRED is only asked for data newer than what is already stored.
 """
 
 from __future__ import annotations
 
 import logging
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import pandas as pd
 
+from maverick_data.providers.fred_store import FredSeriesStore, next_day
+
 logger = logging.getLogger(__name__)
 
 # Configuration
 FRED_API_KEY = os.getenv("FRED_API_KEY", "")
+FRED_REFRESH_INTERVAL_SECONDS = int(os.getenv("FRED_REFRESH_INTERVAL_SECONDS", "21600"))
+
+# Every FRED series the provider reads
+MACRO_SERIES = (
+    "SP500",
+    "NASDAQ100",
+    "NASDAQCOM",
+    "VIXCLS",
+    "DTWEXBGS",
+    "A191RL1Q225SBEA",
+    "UNRATE",
+    "CPILFESL",
+)
+
+# History stored on first fetch (covers the 5-year CPI window)
+STORE_HISTORY_DAYS = 6 * 365
 
 
 class MacroDataProvider:
@@ -43,17 +66,30 @@ class MacroDataProvider:
 
     MAX_WINDOW_DAYS = 365
 
-    def __init__(self, window_days: int = MAX_WINDOW_DAYS):
+    def __init__(
+        self,
+        window_days: int = MAX_WINDOW_DAYS,
+        store: FredSeriesStore | None = None,
+        refresh_interval: int = FRED_REFRESH_INTERVAL_SECONDS,
+    ):
         """
         Initialize macro data provider.
 
+        Historical bounds are computed from the store on first use rather than
+        at construction.
+
         Args:
             window_days: Number of days for historical bounds calculation
+            store: Local series store (default: FredSeriesStore at FRED_STORE_PATH)
+            refresh_interval: Seconds before a stored series is checked for updates
         """
         self._fred = None
         self._scaler = None
+        self.store = store or FredSeriesStore()
+        self.refresh_interval = refresh_interval
         self.window_days = window_days
         self.historical_data_bounds: dict[str, dict[str, Any]] = {}
+        self._bounds_updated_at = 0.0
         self.lookback_days = 30
         self.previous_sentiment_score: float | None = None
 
@@ -83,7 +119,6 @@ class MacroDataProvider:
 
             self._fred = Fred(api_key=FRED_API_KEY)
             self._scaler = MinMaxScaler()
-            self.update_historical_bounds()
         except ImportError:
             logger.warning(
                 "fredapi or sklearn not installed. Macro data will be limited."
@@ -102,7 +137,7 @@ class MacroDataProvider:
         self, series_id: str, start_date: str, end_date: str
     ) -> pd.Series:
         """
-        Get FRED series data.
+        Get FRED series data from the local store, updating it first if stale.
 
         Args:
             series_id: FRED series identifier
@@ -112,9 +147,103 @@ class MacroDataProvider:
         Returns:
             Pandas Series with the data
         """
+        try:
+            update = self._fetch_update(series_id, start_date)
+            if update is not None:
+                self.store.write(series_id, *update)
+        except Exception as e:
+            logger.warning(f"Error updating FRED series {series_id}, using stored data: {e}")
+        return self.store.read(series_id, start_date, end_date)
+
+    def _fetch_update(
+        self, series_id: str, start_date: str | None = None, force: bool = False
+    ) -> tuple[pd.Series, str] | None:
+        """
+        Fetch the observations missing from the store for a series.
+
+        Only observations newer than the last stored date are requested, plus
+        a one-off backfill when ``start_date`` predates the stored history.
+
+        Args:
+            series_id: FRED series identifier
+            start_date: Earliest date the caller needs
+            force: Check for new observations even if refreshed recently
+
+        Returns:
+            Tuple of (new observations, history start), or None if up to date
+        """
+        history_start, last_date, refreshed_at = self.store.status(series_id)
+        default_start = (
+            datetime.now(UTC) - timedelta(days=STORE_HISTORY_DAYS)
+        ).strftime("%Y-%m-%d")
+        wanted_start = min(start_date or default_start, default_start)
+
+        needs_backfill = history_start is None or wanted_start < history_start
+        stale = force or time.time() - refreshed_at >= self.refresh_interval
+        if not needs_backfill and not stale:
+            return None
+        if self.fred is None:
+            return None
+
+        parts = []
+        if needs_backfill:
+            backfill_end = None
+            if history_start is not None:
+                backfill_end = (
+                    pd.Timestamp(history_start) - timedelta(days=1)
+                ).strftime("%Y-%m-%d")
+            parts.append(
+                self.fred.get_series(
+                    series_id, observation_start=wanted_start, observation_end=backfill_end
+                )
+            )
+            history_start = wanted_start
+        if last_date is not None and stale:
+            parts.append(
+                self.fred.get_series(series_id, observation_start=next_day(last_date))
+            )
+
+        fetched = [p for p in parts if isinstance(p, pd.Series) and not p.empty]
+        observations = pd.concat(fetched) if fetched else pd.Series(dtype=float)
+        return observations, history_start
+
+    def refresh_all_series(
+        self, series_ids: tuple[str, ...] = MACRO_SERIES, max_workers: int = 4
+    ) -> dict[str, int]:
+        """
+        Bring every stored macro series up to date in one batch.
+
+        New observations are fetched concurrently and written to the store in
+        a single transaction, then historical bounds are recomputed. Intended
+        to run as a scheduled job so request paths only read the store.
+
+        Args:
+            series_ids: FRED series to refresh
+            max_workers: Concurrent FRED requests
+
+        Returns:
+            Number of new observations stored per series
+        """
         if self.fred is None:
-            return pd.Series(dtype=float)
-        return self.fred.get_series(series_id, start_date, end_date)
+            return {}
+
+        def fetch(series_id: str):
+            try:
+                return series_id, self._fetch_update(series_id, force=True)
+            except Exception as e:
+                logger.error(f"Error refreshing FRED series {series_id}: {e}")
+                return series_id, None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = dict(executor.map(fetch, series_ids))
+
+        updates = {sid: r[0] for sid, r in results.items() if r is not None}
+        history_start = {sid: r[1] for sid, r in results.items() if r is not None}
+        self.store.write_many(updates, history_start)
+        self.update_historical_bounds()
+
+        logger.info(f"Refreshed {len(updates)} FRED series")
+        return {sid: len(series) for sid, series in updates.items()}
 
     def _calculate_weighted_rolling_performance(
         self, series_id: str, lookbacks: list[int], weights: list[float]
@@ -283,10 +412,10 @@ class MacroDataProvider:
             end_date = datetime.now(UTC)
             start_date = end_date - timedelta(days=5 * 365)
 
-            series_data = self.fred.get_series(
+            series_data = self._get_fred_series(
                 "CPILFESL",
-                observation_start=start_date.strftime("%Y-%m-%d"),
-                observation_end=end_date.strftime("%Y-%m-%d"),
+                start_date.strftime("%Y-%m-%d"),
+                end_date.strftime("%Y-%m-%d"),
             )
 
             if not isinstance(series_data, pd.Series):
@@ -396,7 +525,7 @@ class MacroDataProvider:
             if self.fred is not None:
                 end_date = datetime.now(UTC)
                 start_date = end_date - timedelta(days=7)
-                series_data = self.fred.get_series(
+                series_data = self._get_fred_series(
                     "VIXCLS",
                     start_date.strftime("%Y-%m-%d"),
                     end_date.strftime("%Y-%m-%d"),
@@ -431,7 +560,7 @@ class MacroDataProvider:
 
             for days in lookbacks:
                 start_date = end_date - timedelta(days=days)
-                series_data = self.fred.get_series(
+                series_data = self._get_fred_series(
                     "SP500",
                     start_date.strftime("%Y-%m-%d"),
                     end_date.strftime("%Y-%m-%d"),
@@ -477,7 +606,7 @@ class MacroDataProvider:
 
             for days in lookbacks:
                 start_date = end_date - timedelta(days=days + 5)
-                series_data = self.fred.get_series(
+                series_data = self._get_fred_series(
                     "NASDAQ100",
                     start_date.strftime("%Y-%m-%d"),
                     end_date.strftime("%Y-%m-%d"),
@@ -523,7 +652,7 @@ class MacroDataProvider:
 
             for days in lookbacks:
                 start_date = end_date - timedelta(days=days + 5)
-                df = self.fred.get_series(
+                df = self._get_fred_series(
                     "DTWEXBGS",
                     start_date.strftime("%Y-%m-%d"),
                     end_date.strftime("%Y-%m-%d"),
@@ -557,8 +686,10 @@ class MacroDataProvider:
         """
         Update historical bounds for normalization.
 
-        Fetches min/max values for each indicator over the window period.
+        Computes min/max values for each indicator over the window period
+        from the local series store.
         """
+        self._bounds_updated_at = time.time()
         if self.fred is None:
             for key in self.weights.keys():
                 self.historical_data_bounds[key] = self.default_bounds(key)
@@ -581,12 +712,12 @@ class MacroDataProvider:
         for key, series_id in indicators.items():
             try:
                 if key == "gdp_growth_rate":
-                    data = self.fred.get_series(series_id, start_date_str, end_date_str)
+                    data = self._get_fred_series(series_id, start_date_str, end_date_str)
                 elif key == "inflation_rate":
                     wider_start = (end_date - timedelta(days=5 * 365)).strftime(
                         "%Y-%m-%d"
                     )
-                    cpi = self.fred.get_series(series_id, wider_start, end_date_str)
+                    cpi = self._get_fred_series(series_id, wider_start, end_date_str)
                     cpi = cpi.dropna()
 
                     if len(cpi) > 13:
@@ -605,7 +736,7 @@ class MacroDataProvider:
                     else:
                         data = pd.Series([], dtype=float)
                 elif key in ["sp500_momentum", "nasdaq_momentum"]:
-                    df = self.fred.get_series(series_id, start_date_str, end_date_str)
+                    df = self._get_fred_series(series_id, start_date_str, end_date_str)
                     df = df.dropna()
                     df = df.rolling(window=2).mean().dropna()
                     if not df.empty:
@@ -616,7 +747,7 @@ class MacroDataProvider:
                     else:
                         data = pd.Series([], dtype=float)
                 else:
-                    data = self.fred.get_series(series_id, start_date_str, end_date_str)
+                    data = self._get_fred_series(series_id, start_date_str, end_date_str)
 
                 if not data.empty:
                     min_val = data.min()
@@ -630,6 +761,11 @@ class MacroDataProvider:
                 logger.error(f"Error updating historical bounds for {key}: {e}")
                 self.historical_data_bounds[key] = self.default_bounds(key)
 
+    def _ensure_historical_bounds(self):
+        """Compute historical bounds from the store if missing or stale."""
+        if time.time() - self._bounds_updated_at >= self.refresh_interval:
+            self.update_historical_bounds()
+
     def default_bounds(self, key: str) -> dict[str, float]:
         """
         Get default bounds for an indicator.
@@ -663,6 +799,7 @@ class MacroDataProvider:
         Returns:
             Normalized indicator values
         """
+        self._ensure_historical_bounds()
         normalized = {}
         for key, value in indicators.items():
             if value is None:
@@ -708,7 +845,7 @@ class MacroDataProvider:
         end_date_str = end_date.strftime("%Y-%m-%d")
 
         try:
-            sp500_data = self.fred.get_series("SP500", start_date_str, end_date_str)
+            sp500_data = self._get_fred_series("SP500", start_date_str, end_date_str)
             sp500_performance = []
             if not sp500_data.empty:
                 first_value = sp500_data.iloc[0]
@@ -716,7 +853,7 @@ class MacroDataProvider:
                     (x - first_value) / first_value * 100 for x in sp500_data
                 ]
 
-            nasdaq_data = self.fred.get_series(
+            nasdaq_data = self._get_fred_series(
                 "NASDAQ100", start_date_str, end_date_str
             )
             nasdaq_performance = []
@@ -726,22 +863,22 @@ class MacroDataProvider:
                     (x - first_value) / first_value * 100 for x in nasdaq_data
                 ]
 
-            vix_data = self.fred.get_series("VIXCLS", start_date_str, end_date_str)
+            vix_data = self._get_fred_series("VIXCLS", start_date_str, end_date_str)
             vix_values = vix_data.tolist() if not vix_data.empty else []
 
-            gdp_data = self.fred.get_series(
+            gdp_data = self._get_fred_series(
                 "A191RL1Q225SBEA", start_date_str, end_date_str
             )
             gdp_values = gdp_data.tolist() if not gdp_data.empty else []
 
-            unemployment_data = self.fred.get_series(
+            unemployment_data = self._get_fred_series(
                 "UNRATE", start_date_str, end_date_str
             )
             unemployment_values = (
                 unemployment_data.tolist() if not unemployment_data.empty else []
             )
 
-            cpi_data = self.fred.get_series("CPILFESL", start_date_str, end_date_str)
+            cpi_data = self._get_fred_series("CPILFESL", start_date_str, end_date_str)
             inflation_values = []
             if not cpi_data.empty and len(cpi_data) > 12:
                 inflation_values = [
@@ -778,7 +915,7 @@ class MacroDataProvider:
             Dictionary with all macro indicators and sentiment score
         """
         try:
-            self.update_historical_bounds()
+            self._ensure_historical_bounds()
 
             # Get individual indicators
             inflation_data = self.get_inflation_rate()
@@ -852,4 +989,4 @@ class MacroDataProvider:
             }
 
 
-__all__ = ["MacroDataProvider"]
+__all__ = ["MACRO_SERIES", "MacroDataProvider"]
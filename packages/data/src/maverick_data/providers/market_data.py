@@ -3,6 +3,9 @@ Market Data Provider.
 
 Provides market-wide data including top gainers, losers, market indices,
 sector performance, and earnings calendar.
+
+Indices, sector ETFs and market movers are downloaded together into a
+shared MarketSnapshot that is cached for MARKET_SNAPSHOT_TTL_SECONDS.
 """
 
 from __future__ import annotations
@@ -10,6 +13,9 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import threading
+import time
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import Any, cast
 
@@ -114,44 +120,237 @@ def _get_finviz_movers(mover_type: str = "gainers", limit: int = 50) -> list[str
         return []
 
 
-def _get_finviz_stock_data(symbols: list[str]) -> list[dict[str, Any]]:
+# Minimum movers fetched from finviz per category; larger limits widen it
+MOVER_UNIVERSE_SIZE = 50
+
+MARKET_SNAPSHOT_TTL_SECONDS = int(os.getenv("MARKET_SNAPSHOT_TTL_SECONDS", "60"))
+
+
+@dataclass
+class MarketSnapshot:
+    """
+    Point-in-time view of the market built from one batched download.
+
+    Attributes:
+        indices: Market summary keyed by index symbol
+        sectors: Daily change percent keyed by sector name
+        quotes: Price, change and volume keyed by mover symbol
+        gainers: Finviz gainer symbols, best first
+        losers: Finviz loser symbols, worst first
+        active: Finviz most-active symbols, busiest first
+        universe_size: Movers requested from finviz per category
+        built_at: Build time (epoch seconds)
+    """
+
+    indices: dict[str, dict[str, Any]] = field(default_factory=dict)
+    sectors: dict[str, float] = field(default_factory=dict)
+    quotes: dict[str, dict[str, Any]] = field(default_factory=dict)
+    gainers: list[str] = field(default_factory=list)
+    losers: list[str] = field(default_factory=list)
+    active: list[str] = field(default_factory=list)
+    universe_size: int = MOVER_UNIVERSE_SIZE
+    built_at: float = field(default_factory=time.time)
+
+    def movers(
+        self, symbols: list[str], key: str, reverse: bool, limit: int
+    ) -> list[dict[str, Any]]:
+        """
+        Rank quotes for a list of symbols.
+
+        Args:
+            symbols: Candidate symbols
+            key: Quote field to sort by
+            reverse: Sort descending
+            limit: Maximum number of quotes to return
+
+        Returns:
+            Ranked quote dictionaries
+        """
+        results = [self.quotes[s] for s in dict.fromkeys(symbols) if s in self.quotes]
+        results.sort(key=lambda x: x[key], reverse=reverse)
+        return [dict(r) for r in results[:limit]]
+
+
+def _download_quotes(symbols: list[str]) -> dict[str, dict[str, Any]]:
+    """
+    Download two days of prices for all symbols in one yfinance request.
+
+    Args:
+        symbols: Ticker symbols
+
+    Returns:
+        Quote dictionaries keyed by symbol (symbols without data are omitted)
     """
-    Get stock data for symbols using yfinance.
+    if not symbols:
+        return {}
+
+    data = yf.download(
+        " ".join(symbols),
+        period="2d",
+        group_by="ticker",
+        threads=True,
+        progress=False,
+    )
+    if data is None or data.empty:
+        logger.warning("No data available from yfinance")
+        return {}
+
+    if not isinstance(data.columns, pd.MultiIndex):
+        data = pd.concat({symbols[0]: data}, axis=1)
+
+    closes = data.xs("Close", axis=1, level=1)
+    volumes = data.xs("Volume", axis=1, level=1)
+    prev_close = closes.iloc[0]
+    current = closes.iloc[-1]
+    change = current - prev_close
+    change_percent = change / prev_close.where(prev_close != 0) * 100
+    volume = volumes.iloc[-1]
+
+    quotes = {}
+    for symbol in closes.columns:
+        if pd.isna(current[symbol]) or pd.isna(prev_close[symbol]):
+            continue
+        quotes[symbol] = {
+            "symbol": symbol,
+            "price": round(float(current[symbol]), 2),
+            "change": round(float(change[symbol]), 2),
+            "change_percent": round(float(change_percent[symbol]), 2)
+            if pd.notna(change_percent[symbol])
+            else 0.0,
+            "volume": int(volume[symbol]) if pd.notna(volume[symbol]) else 0,
+            "rows": len(closes[symbol].dropna()),
+        }
+    return quotes
+
+
+def mover_universe_size(limit: int) -> int:
+    """
+    Movers to fetch per category so that ``limit`` rows survive filtering.
 
     Args:
-        symbols: List of ticker symbols
+        limit: Number of movers the caller wants
 
     Returns:
-        List of dictionaries with stock data
+        Finviz fetch size (twice the limit, at least MOVER_UNIVERSE_SIZE)
     """
-    results = []
+    return max(MOVER_UNIVERSE_SIZE, limit * 2)
 
-    for symbol in symbols[:20]:
-        try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
-
-            if info and "currentPrice" in info:
-                price = info.get("currentPrice", 0)
-                prev_close = info.get("previousClose", price)
-                change = price - prev_close if prev_close else 0
-                change_percent = (change / prev_close * 100) if prev_close else 0
-                volume = info.get("volume", 0)
-
-                results.append(
-                    {
-                        "symbol": symbol,
-                        "price": round(price, 2),
-                        "change": round(change, 2),
-                        "change_percent": round(change_percent, 2),
-                        "volume": volume,
-                    }
-                )
-        except Exception as e:
-            logger.debug(f"Error fetching data for {symbol}: {e}")
+
+def build_market_snapshot(universe_size: int = MOVER_UNIVERSE_SIZE) -> MarketSnapshot:
+    """
+    Build a market snapshot.
+
+    Scrapes the finviz mover lists once, then downloads indices, sector ETFs
+    and every mover in a single yfinance request.
+
+    Args:
+        universe_size: Movers to fetch from finviz per category
+
+    Returns:
+        MarketSnapshot
+    """
+    gainers = _get_finviz_movers("gainers", limit=universe_size)
+    losers = _get_finviz_movers("losers", limit=universe_size)
+    active = _get_finviz_movers("active", limit=universe_size)
+
+    symbols = list(
+        dict.fromkeys([*MARKET_INDICES, *SECTOR_ETFS.values(), *gainers, *losers, *active])
+    )
+    quotes = _download_quotes(symbols)
+
+    indices = {}
+    for index, name in MARKET_INDICES.items():
+        quote = quotes.get(index)
+        if quote is None:
             continue
+        indices[index] = {
+            "name": name,
+            "symbol": index,
+            "price": quote["price"],
+            "change": quote["change"],
+            "change_percent": quote["change_percent"],
+        }
+
+    sectors = {}
+    for sector, etf in SECTOR_ETFS.items():
+        quote = quotes.get(etf)
+        if quote is not None and quote["rows"] >= 2:
+            sectors[sector] = quote["change_percent"]
+
+    mover_quotes = {}
+    for symbol in dict.fromkeys([*gainers, *losers, *active]):
+        quote = quotes.get(symbol)
+        if quote is not None and quote["rows"] >= 2:
+            mover_quotes[symbol] = {k: v for k, v in quote.items() if k != "rows"}
+
+    logger.info(f"Built market snapshot from {len(symbols)} symbols")
+    return MarketSnapshot(
+        indices=indices,
+        sectors=sectors,
+        quotes=mover_quotes,
+        gainers=gainers,
+        losers=losers,
+        active=active,
+        universe_size=universe_size,
+    )
+
+
+_snapshot: MarketSnapshot | None = None
+_snapshot_lock = threading.Lock()
+
+
+def get_market_snapshot(
+    ttl_seconds: int = MARKET_SNAPSHOT_TTL_SECONDS,
+    force_refresh: bool = False,
+    universe_size: int = MOVER_UNIVERSE_SIZE,
+) -> MarketSnapshot:
+    """
+    Get the shared market snapshot, rebuilding it at most once per TTL.
+
+    Concurrent callers wait for an in-flight rebuild instead of starting
+    their own. A snapshot built with fewer movers than ``universe_size`` is
+    rebuilt at the larger size, which later callers then reuse.
+
+    Args:
+        ttl_seconds: Maximum snapshot age before it is rebuilt
+        force_refresh: Rebuild even if the snapshot is fresh
+        universe_size: Minimum movers per category the snapshot must cover
+
+    Returns:
+        MarketSnapshot
+    """
+    global _snapshot
 
-    return results
+    seen = _snapshot
+    if not force_refresh and _is_fresh(seen, ttl_seconds, universe_size):
+        return cast(MarketSnapshot, seen)
+
+    with _snapshot_lock:
+        current = _snapshot
+        # Another caller rebuilt the snapshot while this one waited
+        if _is_fresh(current, ttl_seconds, universe_size) and (
+            not force_refresh or current is not seen
+        ):
+            return cast(MarketSnapshot, current)
+        _snapshot = build_market_snapshot(universe_size)
+        return _snapshot
+
+
+def _is_fresh(
+    snapshot: MarketSnapshot | None, ttl_seconds: int, universe_size: int
+) -> bool:
+    return (
+        snapshot is not None
+        and snapshot.universe_size >= universe_size
+        and time.time() - snapshot.built_at < ttl_seconds
+    )
+
+
+def clear_market_snapshot() -> None:
+    """Drop the cached market snapshot."""
+    global _snapshot
+    with _snapshot_lock:
+        _snapshot = None
 
 
 class MarketDataProvider:
@@ -168,10 +367,19 @@ class MarketDataProvider:
     - Sector performance (via sector ETFs)
     - Earnings calendar
     - Async support for parallel fetching
+
+    Overview data is projected from a shared MarketSnapshot that is rebuilt
+    from one batched download at most once per snapshot TTL.
     """
 
-    def __init__(self):
-        """Initialize market data provider."""
+    def __init__(self, snapshot_ttl: int = MARKET_SNAPSHOT_TTL_SECONDS):
+        """
+        Initialize market data provider.
+
+        Args:
+            snapshot_ttl: Seconds a market snapshot is reused before rebuilding
+        """
+        self.snapshot_ttl = snapshot_ttl
         self.session = requests.Session()
         retry_strategy = Retry(
             total=3,
@@ -225,6 +433,23 @@ class MarketDataProvider:
             logger.error(f"Unknown error fetching data from {url}: {str(e)}")
             return {}
 
+    def get_market_snapshot(
+        self, force_refresh: bool = False, universe_size: int = MOVER_UNIVERSE_SIZE
+    ) -> MarketSnapshot:
+        """
+        Get the shared market snapshot backing the overview methods.
+
+        Args:
+            force_refresh: Rebuild even if the cached snapshot is fresh
+            universe_size: Minimum movers per category the snapshot must cover
+
+        Returns:
+            MarketSnapshot
+        """
+        return get_market_snapshot(
+            self.snapshot_ttl, force_refresh=force_refresh, universe_size=universe_size
+        )
+
     def get_market_summary(self) -> dict[str, Any]:
         """
         Get a summary of major market indices.
@@ -233,32 +458,8 @@ class MarketDataProvider:
             Dictionary with market summary data
         """
         try:
-            data = {}
-            for index, name in MARKET_INDICES.items():
-                ticker = yf.Ticker(index)
-                history = ticker.history(period="2d")
-
-                if history.empty:
-                    continue
-
-                prev_close = (
-                    history["Close"].iloc[0]
-                    if len(history) > 1
-                    else history["Close"].iloc[0]
-                )
-                current = history["Close"].iloc[-1]
-                change = current - prev_close
-                change_percent = (change / prev_close) * 100 if prev_close != 0 else 0
-
-                data[index] = {
-                    "name": name,
-                    "symbol": index,
-                    "price": round(current, 2),
-                    "change": round(change, 2),
-                    "change_percent": round(change_percent, 2),
-                }
-
-            return data
+            snapshot = self.get_market_snapshot()
+            return {symbol: dict(data) for symbol, data in snapshot.indices.items()}
         except Exception as e:
             logger.error(f"Error fetching market summary: {str(e)}")
             return {}
@@ -267,6 +468,9 @@ class MarketDataProvider:
         """
         Get top gaining stocks in the market.
 
+        Falls back to ranking the most active stocks when finviz has no
+        gainers.
+
         Args:
             limit: Maximum number of stocks to return
 
@@ -274,78 +478,14 @@ class MarketDataProvider:
             List of dictionaries with stock data
         """
         try:
-            # Try to get gainers from finvizfinance
-            symbols = _get_finviz_movers("gainers", limit=limit * 2)
-
-            if symbols:
-                results = _get_finviz_stock_data(symbols[:limit])
-                if results:
-                    results.sort(key=lambda x: x["change_percent"], reverse=True)
-                    return results[:limit]
-
-            # Fallback to yfinance with active stocks
-            if not symbols:
-                symbols = _get_finviz_movers("active", limit=50)
-
+            snapshot = self.get_market_snapshot(
+                universe_size=mover_universe_size(limit)
+            )
+            symbols = snapshot.gainers or snapshot.active
             if not symbols:
                 logger.warning("No symbols available for gainers calculation")
                 return []
-
-            # Fetch data using yfinance batch
-            results = []
-            batch_str = " ".join(symbols[:50])
-
-            data = yf.download(
-                batch_str,
-                period="2d",
-                group_by="ticker",
-                threads=True,
-                progress=False,
-            )
-
-            if data is None or data.empty:
-                logger.warning("No data available from yfinance")
-                return []
-
-            for symbol in symbols[:50]:
-                try:
-                    if len(symbols) == 1:
-                        ticker_data = data
-                    else:
-                        if symbol not in data.columns.get_level_values(0):
-                            continue
-                        ticker_data = data[symbol]
-
-                    if len(ticker_data) < 2:
-                        continue
-
-                    prev_close = ticker_data["Close"].iloc[0]
-                    current = ticker_data["Close"].iloc[-1]
-
-                    if pd.isna(prev_close) or pd.isna(current) or prev_close == 0:
-                        continue
-
-                    change = current - prev_close
-                    change_percent = (change / prev_close) * 100
-                    volume = ticker_data["Volume"].iloc[-1]
-
-                    if pd.notna(change_percent) and pd.notna(volume):
-                        results.append(
-                            {
-                                "symbol": symbol,
-                                "price": round(current, 2),
-                                "change": round(change, 2),
-                                "change_percent": round(change_percent, 2),
-                                "volume": int(volume),
-                            }
-                        )
-                except Exception as e:
-                    logger.debug(f"Error processing {symbol}: {str(e)}")
-                    continue
-
-            results.sort(key=lambda x: x["change_percent"], reverse=True)
-            return results[:limit]
-
+            return snapshot.movers(symbols, "change_percent", True, limit)
         except Exception as e:
             logger.error(f"Error fetching top gainers: {str(e)}")
             return []
@@ -354,6 +494,9 @@ class MarketDataProvider:
         """
         Get top losing stocks in the market.
 
+        Falls back to ranking the most active stocks when finviz has no
+        losers.
+
         Args:
             limit: Maximum number of stocks to return
 
@@ -361,78 +504,14 @@ class MarketDataProvider:
             List of dictionaries with stock data
         """
         try:
-            # Try to get losers from finvizfinance
-            symbols = _get_finviz_movers("losers", limit=limit * 2)
-
-            if symbols:
-                results = _get_finviz_stock_data(symbols[:limit])
-                if results:
-                    results.sort(key=lambda x: x["change_percent"])
-                    return results[:limit]
-
-            # Fallback to yfinance with active stocks
-            if not symbols:
-                symbols = _get_finviz_movers("active", limit=50)
-
+            snapshot = self.get_market_snapshot(
+                universe_size=mover_universe_size(limit)
+            )
+            symbols = snapshot.losers or snapshot.active
             if not symbols:
                 logger.warning("No symbols available for losers calculation")
                 return []
-
-            # Fetch data using yfinance batch
-            results = []
-            batch_str = " ".join(symbols[:50])
-
-            data = yf.download(
-                batch_str,
-                period="2d",
-                group_by="ticker",
-                threads=True,
-                progress=False,
-            )
-
-            if data is None or data.empty:
-                logger.warning("No data available from yfinance")
-                return []
-
-            for symbol in symbols[:50]:
-                try:
-                    if len(symbols) == 1:
-                        ticker_data = data
-                    else:
-                        if symbol not in data.columns.get_level_values(0):
-                            continue
-                        ticker_data = data[symbol]
-
-                    if len(ticker_data) < 2:
-                        continue
-
-                    prev_close = ticker_data["Close"].iloc[0]
-                    current = ticker_data["Close"].iloc[-1]
-
-                    if pd.isna(prev_close) or pd.isna(current) or prev_close == 0:
-                        continue
-
-                    change = current - prev_close
-                    change_percent = (change / prev_close) * 100
-                    volume = ticker_data["Volume"].iloc[-1]
-
-                    if pd.notna(change_percent) and pd.notna(volume):
-                        results.append(
-                            {
-                                "symbol": symbol,
-                                "price": round(current, 2),
-                                "change": round(change, 2),
-                                "change_percent": round(change_percent, 2),
-                                "volume": int(volume),
-                            }
-                        )
-                except Exception as e:
-                    logger.debug(f"Error processing {symbol}: {str(e)}")
-                    continue
-
-            results.sort(key=lambda x: x["change_percent"])
-            return results[:limit]
-
+            return snapshot.movers(symbols, "change_percent", False, limit)
         except Exception as e:
             logger.error(f"Error fetching top losers: {str(e)}")
             return []
@@ -448,78 +527,13 @@ class MarketDataProvider:
             List of dictionaries with stock data
         """
         try:
-            symbols = _get_finviz_movers("active", limit=limit * 2)
-
-            if symbols:
-                results = _get_finviz_stock_data(symbols[:limit])
-                if results:
-                    results.sort(key=lambda x: x["volume"], reverse=True)
-                    return results[:limit]
-
-            if not symbols:
-                logger.warning("No most active stocks data available")
-                return []
-
-            # Fetch data using yfinance batch
-            batch_str = " ".join(symbols[: limit * 2])
-
-            data = yf.download(
-                batch_str,
-                period="2d",
-                group_by="ticker",
-                threads=True,
-                progress=False,
+            snapshot = self.get_market_snapshot(
+                universe_size=mover_universe_size(limit)
             )
-
-            if data is None or data.empty:
-                logger.warning("No data available from yfinance")
+            if not snapshot.active:
+                logger.warning("No most active stocks data available")
                 return []
-
-            results = []
-            for symbol in symbols[: limit * 2]:
-                try:
-                    if len(symbols) == 1:
-                        ticker_data = data
-                    else:
-                        if symbol not in data.columns.get_level_values(0):
-                            continue
-                        ticker_data = data[symbol]
-
-                    if len(ticker_data) < 2:
-                        continue
-
-                    prev_close = ticker_data["Close"].iloc[0]
-                    current = ticker_data["Close"].iloc[-1]
-                    volume = ticker_data["Volume"].iloc[-1]
-
-                    if (
-                        pd.isna(prev_close)
-                        or pd.isna(current)
-                        or pd.isna(volume)
-                        or prev_close == 0
-                    ):
-                        continue
-
-                    change = current - prev_close
-                    change_percent = (change / prev_close) * 100
-
-                    if pd.notna(change_percent) and pd.notna(volume):
-                        results.append(
-                            {
-                                "symbol": symbol,
-                                "price": round(current, 2),
-                                "change": round(change, 2),
-                                "change_percent": round(change_percent, 2),
-                                "volume": int(volume),
-                            }
-                        )
-                except Exception as e:
-                    logger.debug(f"Error processing {symbol}: {str(e)}")
-                    continue
-
-            results.sort(key=lambda x: x["volume"], reverse=True)
-            return results[:limit]
-
+            return snapshot.movers(snapshot.active, "volume", True, limit)
         except Exception as e:
             logger.error(f"Error fetching most active stocks: {str(e)}")
             return []
@@ -532,26 +546,7 @@ class MarketDataProvider:
             Dictionary mapping sector names to performance percentages
         """
         try:
-            results = {}
-            for sector, etf in SECTOR_ETFS.items():
-                try:
-                    data = yf.Ticker(etf)
-                    hist = data.history(period="2d")
-
-                    if len(hist) < 2:
-                        continue
-
-                    prev_close = hist["Close"].iloc[0]
-                    current = hist["Close"].iloc[-1]
-                    change_percent = ((current - prev_close) / prev_close) * 100
-
-                    results[sector] = round(change_percent, 2)
-                except Exception as e:
-                    logger.debug(f"Error processing sector {sector}: {str(e)}")
-                    continue
-
-            return results
-
+            return dict(self.get_market_snapshot().sectors)
         except Exception as e:
             logger.error(f"Error fetching sector performance: {str(e)}")
             return {}
@@ -575,7 +570,7 @@ class MarketDataProvider:
                 check_stocks = symbols[:50]
             else:
                 # Get active stocks to check
-                check_stocks = _get_finviz_movers("active", limit=50)
+                check_stocks = self.get_market_snapshot().active[:50]
 
             results = []
             today = datetime.now(UTC).date()
@@ -662,24 +657,23 @@ class MarketDataProvider:
         """
         Get comprehensive market overview (async version).
 
-        Uses concurrent execution for better performance.
+        The snapshot is built in an executor; all sections are projections
+        over it. If the build fails, every section is empty and the error is
+        reported under ``error``.
         """
-        tasks = [
-            self.get_market_summary_async(),
-            self.get_top_gainers_async(5),
-            self.get_top_losers_async(5),
-            self.get_sector_performance_async(),
-        ]
-
-        summary, gainers, losers, sectors = await asyncio.gather(*tasks)
-
-        return {
-            "timestamp": datetime.now(UTC).isoformat(),
-            "market_summary": summary,
-            "top_gainers": gainers,
-            "top_losers": losers,
-            "sector_performance": sectors,
-        }
+        try:
+            await self._run_in_executor(self.get_market_snapshot)
+        except Exception as e:
+            logger.error(f"Error building market snapshot: {str(e)}")
+            return {
+                "timestamp": datetime.now(UTC).isoformat(),
+                "market_summary": {},
+                "top_gainers": [],
+                "top_losers": [],
+                "sector_performance": {},
+                "error": str(e),
+            }
+        return self.get_market_overview()
 
     def get_market_overview(self) -> dict[str, Any]:
         """
@@ -704,6 +698,9 @@ class MarketDataProvider:
 
 __all__ = [
     "MarketDataProvider",
+    "MarketSnapshot",
+    "clear_market_snapshot",
+    "get_market_snapshot",
     "MARKET_INDICES",
     "SECTOR_ETFS",
 ]
@@ -1 +1,14 @@
 """Pytest configuration for this package."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_fred_store(tmp_path, monkeypatch):
+    """Keep the default FRED series store out of the home directory."""
+    from maverick_data.providers import fred_store
+
+    path = str(tmp_path / "fred_series.db")
+    monkeypatch.setenv("FRED_STORE_PATH", path)
+    monkeypatch.setattr(fred_store, "FRED_STORE_PATH", path)
+    return path
@@ -0,0 +1,137 @@
+"""Tests for the local FRED series store and incremental macro updates."""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from maverick_data.providers.fred_store import FredSeriesStore
+from maverick_data.providers.macro_data import MacroDataProvider
+
+
+class FakeFred:
+    """FRED client over fixed daily series that records each request."""
+
+    def __init__(self, days: int = 3000):
+        end = pd.Timestamp(date.today())
+        index = pd.date_range(end=end - pd.Timedelta(days=1), periods=days, freq="D")
+        self.data = {
+            sid: pd.Series(np.linspace(100, 200, days), index=index)
+            for sid in ("SP500", "UNRATE", "VIXCLS")
+        }
+        self.calls = []
+
+    def get_series(self, series_id, observation_start=None, observation_end=None):
+        self.calls.append((series_id, observation_start, observation_end))
+        series = self.data.get(series_id, pd.Series(dtype=float))
+        if observation_start:
+            series = series[series.index >= observation_start]
+        if observation_end:
+            series = series[series.index <= observation_end]
+        return series
+
+    def publish(self, series_id, value):
+        """Append an observation dated today."""
+        self.data[series_id].loc[pd.Timestamp(date.today())] = value
+
+
+def make_provider(fred: FakeFred, **kwargs) -> MacroDataProvider:
+    provider = MacroDataProvider(store=FredSeriesStore(":memory:"), **kwargs)
+    provider._fred = fred
+    return provider
+
+
+def iso(days_ago: int) -> str:
+    return (date.today() - timedelta(days=days_ago)).isoformat()
+
+
+class TestFredSeriesStore:
+    """Test the SQLite observation store."""
+
+    def test_round_trip_and_status(self):
+        store = FredSeriesStore(":memory:")
+        series = pd.Series([1.0, np.nan, 3.0], index=pd.date_range("2024-01-01", periods=3))
+        store.write("UNRATE", series, history_start="2023-12-01")
+
+        stored = store.read("UNRATE", "2024-01-02", "2024-01-03")
+        assert list(stored.index.strftime("%Y-%m-%d")) == ["2024-01-02", "2024-01-03"]
+        assert np.isnan(stored.iloc[0]) and stored.iloc[1] == 3.0
+
+        history_start, last_date, refreshed_at = store.status("UNRATE")
+        assert (history_start, last_date) == ("2023-12-01", "2024-01-03")
+        assert refreshed_at > 0
+
+
+class TestIncrementalUpdates:
+    """Test the provider only fetches what the store is missing."""
+
+    def test_construction_does_not_fetch(self):
+        fred = FakeFred()
+        make_provider(fred)
+        assert fred.calls == []
+
+    def test_fetches_only_newer_observations(self):
+        fred = FakeFred()
+        provider = make_provider(fred, refresh_interval=0)
+
+        first = provider._get_fred_series("SP500", iso(30), iso(0))
+        assert len(fred.calls) == 1
+        assert len(first) == 30
+
+        fred.calls.clear()
+        fred.publish("SP500", 250.0)
+        latest = provider._get_fred_series("SP500", iso(30), iso(0))
+
+        # One request, starting the day after the last stored observation
+        assert fred.calls == [("SP500", iso(0), None)]
+        assert latest.iloc[-1] == 250.0
+
+    def test_reads_served_from_store_within_refresh_interval(self):
+        fred = FakeFred()
+        provider = make_provider(fred)
+
+        provider._get_fred_series("UNRATE", iso(90), iso(0))
+        provider._get_fred_series("UNRATE", iso(30), iso(0))
+        assert provider.get_unemployment_rate()["current"] is not None
+        assert len(fred.calls) == 1
+
+    def test_backfills_older_history_once(self):
+        fred = FakeFred()
+        provider = make_provider(fred)
+        provider._get_fred_series("UNRATE", iso(30), iso(0))
+
+        older = provider._get_fred_series("UNRATE", iso(2500), iso(0))
+        assert len(older) == 2500
+        assert len(fred.calls) == 2
+        _, start, end = fred.calls[-1]
+        assert start == iso(2500) and end < fred.calls[0][1]
+
+    def test_fetch_errors_fall_back_to_stored_data(self):
+        fred = FakeFred()
+        provider = make_provider(fred, refresh_interval=0)
+        provider._get_fred_series("VIXCLS", iso(7), iso(0))
+
+        fred.get_series = lambda *args, **kwargs: (_ for _ in ()).throw(OSError())
+        assert len(provider._get_fred_series("VIXCLS", iso(7), iso(0))) == 7
+
+
+class TestBatchRefresh:
+    """Test refreshing all series together."""
+
+    def test_refresh_all_series_updates_store_and_bounds(self):
+        fred = FakeFred()
+        provider = make_provider(fred)
+
+        counts = provider.refresh_all_series(("SP500", "UNRATE", "VIXCLS"))
+        assert all(n > 0 for n in counts.values())
+        assert provider.historical_data_bounds["vix"]["max"] <= 200.0
+
+        fred.calls.clear()
+        fred.publish("SP500", 250.0)
+        counts = provider.refresh_all_series(("SP500", "UNRATE"))
+        assert counts == {"SP500": 1, "UNRATE": 0}
+        assert {c[0] for c in fred.calls} >= {"SP500", "UNRATE"}
+
+
+def test_default_store_is_isolated(isolated_fred_store):
+    assert FredSeriesStore().path == isolated_fred_store
@@ -0,0 +1,129 @@
+"""Tests for the shared market snapshot behind MarketDataProvider."""
+
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from maverick_data.providers import market_data
+from maverick_data.providers.market_data import (
+    MARKET_INDICES,
+    SECTOR_ETFS,
+    MarketDataProvider,
+    clear_market_snapshot,
+)
+
+MOVERS = {
+    "gainers": ["UP1", "UP2"],
+    "losers": ["DN1", "DN2"],
+    "active": ["UP1", "DN1", "BIG"],
+}
+
+
+@pytest.fixture
+def downloads(monkeypatch):
+    """Patch finviz and yfinance; record each batch download."""
+    calls = []
+    closes = {"UP1": (10, 12), "UP2": (10, 11), "DN1": (10, 8), "DN2": (10, 9.5)}
+
+    def fake_download(tickers, **kwargs):
+        symbols = tickers.split()
+        calls.append(symbols)
+        time.sleep(0.05)
+        frames = {}
+        for i, symbol in enumerate(symbols):
+            prev, cur = closes.get(symbol, (100.0, 101.0))
+            frames[symbol] = pd.DataFrame(
+                {"Close": [prev, cur], "Volume": [1_000, 1_000 * (i + 1)]},
+                index=pd.date_range("2024-01-01", periods=2),
+            )
+        return pd.concat(frames, axis=1)
+
+    monkeypatch.setattr(market_data.yf, "download", fake_download)
+    monkeypatch.setattr(
+        market_data, "_get_finviz_movers", lambda kind, limit=50: MOVERS[kind]
+    )
+    clear_market_snapshot()
+    yield calls
+    clear_market_snapshot()
+
+
+class TestMarketSnapshot:
+    """Test the overview methods share one batched download."""
+
+    def test_overview_uses_one_download(self, downloads):
+        provider = MarketDataProvider()
+        overview = provider.get_market_overview()
+        provider.get_most_active(3)
+
+        assert len(downloads) == 1
+        assert set(downloads[0]) >= {*MARKET_INDICES, *SECTOR_ETFS.values(), "BIG"}
+        assert len(downloads[0]) == len(set(downloads[0]))
+
+        assert [g["symbol"] for g in overview["top_gainers"]] == ["UP1", "UP2"]
+        assert [g["symbol"] for g in overview["top_losers"]] == ["DN1", "DN2"]
+        assert overview["top_gainers"][0]["change_percent"] == 20.0
+        assert overview["market_summary"]["^GSPC"]["name"] == "S&P 500"
+        assert overview["sector_performance"]["Technology"] == 1.0
+
+    def test_most_active_sorted_by_volume(self, downloads):
+        active = MarketDataProvider().get_most_active(2)
+        volumes = [a["volume"] for a in active]
+        assert volumes == sorted(volumes, reverse=True)
+        assert "rows" not in active[0]
+
+    def test_concurrent_callers_build_once(self, downloads):
+        provider = MarketDataProvider()
+        threads = [
+            threading.Thread(target=provider.get_sector_performance) for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(downloads) == 1
+
+    def test_snapshot_rebuilt_after_ttl(self, downloads):
+        provider = MarketDataProvider(snapshot_ttl=60)
+        provider.get_market_summary()
+        provider.get_market_snapshot(force_refresh=True)
+        assert len(downloads) == 2
+
+        MarketDataProvider(snapshot_ttl=0).get_market_summary()
+        assert len(downloads) == 3
+
+    @pytest.mark.asyncio
+    async def test_async_overview(self, downloads):
+        overview = await MarketDataProvider().get_market_overview_async()
+        assert overview["top_gainers"] and len(downloads) == 1
+        assert not np.isnan(overview["top_losers"][0]["change_percent"])
+
+    def test_large_limit_widens_universe(self, downloads, monkeypatch):
+        requested = []
+        many = [f"S{i}" for i in range(120)]
+
+        def fake_movers(kind, limit=50):
+            requested.append(limit)
+            return many[:limit]
+
+        monkeypatch.setattr(market_data, "_get_finviz_movers", fake_movers)
+        provider = MarketDataProvider()
+        assert len(provider.get_top_gainers(10)) == 10
+        assert len(provider.get_most_active(60)) == 60
+        assert requested == [50] * 3 + [120] * 3
+
+        # The wider snapshot serves smaller limits without another download
+        provider.get_top_losers(5)
+        assert len(downloads) == 2
+
+    @pytest.mark.asyncio
+    async def test_async_overview_reports_errors(self, downloads, monkeypatch):
+        def failing_download(tickers, **kwargs):
+            raise RuntimeError("yfinance down")
+
+        monkeypatch.setattr(market_data.yf, "download", failing_download)
+        overview = await MarketDataProvider().get_market_overview_async()
+        assert overview["error"] == "yfinance down"
+        assert overview["top_gainers"] == [] and overview["market_summary"] == {}
@@ -11,6 +11,8 @@ Modules:
     - concall: Conference call analysis interfaces
 """
 
+import asyncio
+
 # Market Provider and Screening
 from maverick_india.market import (
     INDIAN_MARKET_CONFIG,
@@ -27,6 +29,7 @@ from maverick_india.market import (
     get_nifty_sectors,
     get_smallcap_breakouts_india,
     get_value_picks_india,
+    run_all_india_screens,
 )
 
 # Economic Indicators
@@ -98,31 +101,39 @@ class CurrencyConverter:
 
 
 class IndianMarketScreener:
-    """Screener for Indian market stocks."""
+    """Screener for Indian market stocks.
+
+    Screens are synchronous (they may download the shared price panel), so
+    they run in a worker thread to keep the event loop free.
+    """
 
     async def get_maverick_bullish(self, limit: int = 20) -> list:
         """Get bullish stocks from Indian market."""
-        return await get_maverick_bullish_india(limit=limit)
+        return await asyncio.to_thread(get_maverick_bullish_india, limit=limit)
 
     async def get_maverick_bearish(self, limit: int = 20) -> list:
         """Get bearish stocks from Indian market."""
-        return await get_maverick_bearish_india(limit=limit)
+        return await asyncio.to_thread(get_maverick_bearish_india, limit=limit)
 
     async def get_momentum(self, limit: int = 20) -> list:
         """Get momentum stocks from Nifty 50."""
-        return await get_nifty50_momentum(limit=limit)
+        return await asyncio.to_thread(get_nifty50_momentum, limit=limit)
 
     async def get_sector_rotation(self) -> dict:
         """Get sector rotation analysis."""
-        return await get_nifty_sector_rotation()
+        return await asyncio.to_thread(get_nifty_sector_rotation)
 
     async def get_value_picks(self, limit: int = 20) -> list:
         """Get value picks from Indian market."""
-        return await get_value_picks_india(limit=limit)
+        return await asyncio.to_thread(get_value_picks_india, limit=limit)
 
     async def get_smallcap_breakouts(self, limit: int = 20) -> list:
         """Get smallcap breakout stocks."""
-        return await get_smallcap_breakouts_india(limit=limit)
+        return await asyncio.to_thread(get_smallcap_breakouts_india, limit=limit)
+
+    async def get_all_screens(self, limit: int = 20) -> dict:
+        """Run every screen against one shared price panel."""
+        return await asyncio.to_thread(run_all_india_screens, limit=limit)
 
 __all__ = [
     # Market Provider
@@ -143,6 +154,7 @@ __all__ = [
     "get_nifty_sector_rotation",
     "get_value_picks_india",
     "get_smallcap_breakouts_india",
+    "run_all_india_screens",
     # Economic Indicators
     "RBIDataProvider",
     "EconomicIndicatorsProvider",  # Alias
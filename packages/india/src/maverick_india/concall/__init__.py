@@ -46,6 +46,7 @@ from maverick_india.concall.services import (
     SENTIMENT_ANALYSIS_PROMPT,
     SUMMARIZATION_PROMPT,
     ConcallSummarizer,
+    ProviderStats,
     SentimentAnalyzer,
     TranscriptFetcher,
 )
@@ -78,6 +79,7 @@ __all__ = [
     "ScreenerProvider",
     # Services
     "TranscriptFetcher",
+    "ProviderStats",
     "ConcallSummarizer",
     "SentimentAnalyzer",
     "SUMMARIZATION_PROMPT",
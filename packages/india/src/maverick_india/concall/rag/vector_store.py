@@ -3,17 +3,66 @@ Vector Store Manager for Conference Call RAG.
 
 Manages Chroma vector database for semantic search over transcripts.
 Handles embeddings, indexing, and retrieval operations.
+
+Chroma clients are opened once per persist directory and shared, collection
+handles are cached per manager, and blocking Chroma and embedding calls run
+on a dedicated thread pool. Embeddings are cached by content hash.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any, Protocol
+from typing import Any, Callable, Protocol, TypeVar
+
+from maverick_core.config.base import get_env_int
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+DEFAULT_CHUNK_SIZE = 1000
+DEFAULT_CHUNK_OVERLAP = 200
+
+VECTOR_STORE_WORKERS = get_env_int("VECTOR_STORE_WORKERS", 4)
+EMBEDDING_CACHE_MAX_ENTRIES = get_env_int("EMBEDDING_CACHE_MAX_ENTRIES", 50000)
+
+
+def make_text_splitter(
+    chunk_size: int = DEFAULT_CHUNK_SIZE, chunk_overlap: int = DEFAULT_CHUNK_OVERLAP
+):
+    """
+    Create the transcript text splitter.
+
+    Shared by indexing and summarization so both see the same chunk
+    boundaries.
+
+    Args:
+        chunk_size: Size of text chunks in characters
+        chunk_overlap: Overlap between consecutive chunks
+
+    Returns:
+        RecursiveCharacterTextSplitter instance
+    """
+    try:
+        from langchain_text_splitters import RecursiveCharacterTextSplitter
+    except ImportError:
+        from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+    return RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        length_function=len,
+        separators=["\n\n", "\n", ". ", " ", ""],
+    )
+
 
 class EmbeddingFunctionProtocol(Protocol):
     """Protocol for embedding functions."""
@@ -27,6 +76,141 @@ class EmbeddingFunctionProtocol(Protocol):
         ...
 
 
+class EmbeddingCache:
+    """Thread-safe LRU of embedding vectors keyed by model and content hash."""
+
+    def __init__(self, max_entries: int = EMBEDDING_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(model: str, text: str) -> str:
+        """Cache key for a text embedded by a model."""
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{model}:{digest}"
+
+    def get_many(self, keys: list[str]) -> list[list[float] | None]:
+        """Look up several keys, counting hits and misses."""
+        with self._lock:
+            found = []
+            for key in keys:
+                vector = self._entries.get(key)
+                if vector is not None:
+                    self._entries.move_to_end(key)
+                found.append(vector)
+            hit_count = sum(v is not None for v in found)
+            self.hits += hit_count
+            self.misses += len(keys) - hit_count
+            return found
+
+    def set_many(self, items: dict[str, list[float]]) -> None:
+        """Store several vectors, evicting least recently used entries."""
+        with self._lock:
+            for key, vector in items.items():
+                self._entries[key] = vector
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_embedding_cache = EmbeddingCache()
+
+
+class CachedEmbeddings:
+    """Embedding function wrapper that skips the model for cached content."""
+
+    def __init__(
+        self,
+        embeddings: EmbeddingFunctionProtocol,
+        model: str,
+        cache: EmbeddingCache | None = None,
+    ):
+        """
+        Wrap an embedding function.
+
+        Args:
+            embeddings: Underlying embedding function
+            model: Model identifier used in cache keys
+            cache: Embedding cache (default: the shared process-wide cache)
+        """
+        self.embeddings = embeddings
+        self.model = model
+        self.cache = cache if cache is not None else _embedding_cache
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed documents, calling the model only for uncached texts."""
+        keys = [self.cache.key(self.model, t) for t in texts]
+        vectors = self.cache.get_many(keys)
+
+        # Embed each distinct missing text once
+        missing: dict[str, str] = {}
+        for key, text, vector in zip(keys, texts, vectors, strict=True):
+            if vector is None:
+                missing.setdefault(key, text)
+        if missing:
+            computed = self.embeddings.embed_documents(list(missing.values()))
+            fresh = dict(zip(missing, computed, strict=True))
+            self.cache.set_many(fresh)
+            vectors = [v if v is not None else fresh[k] for k, v in zip(keys, vectors)]
+
+        return [list(v) for v in vectors]
+
+    def embed_query(self, text: str) -> list[float]:
+        """Embed a query, reusing the cached vector for repeated queries."""
+        key = self.cache.key(f"{self.model}:query", text)
+        vector = self.cache.get_many([key])[0]
+        if vector is None:
+            vector = self.embeddings.embed_query(text)
+            self.cache.set_many({key: vector})
+        return list(vector)
+
+
+_clients: dict[str, Any] = {}
+_clients_lock = threading.Lock()
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_chroma_client(persist_directory: str):
+    """
+    Get the shared Chroma client for a persist directory.
+
+    Args:
+        persist_directory: Chroma database path
+
+    Returns:
+        chromadb PersistentClient, opened once per directory
+    """
+    client = _clients.get(persist_directory)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(persist_directory)
+            if client is None:
+                from chromadb import PersistentClient
+
+                client = PersistentClient(path=persist_directory)
+                _clients[persist_directory] = client
+    return client
+
+
+def get_vector_store_executor() -> ThreadPoolExecutor:
+    """Get the thread pool that runs blocking Chroma and embedding calls."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=VECTOR_STORE_WORKERS, thread_name_prefix="vector-store"
+                )
+    return _executor
+
+
 class VectorStoreManager:
     """
     Manage vector store for conference call transcripts.
@@ -39,7 +223,7 @@ class VectorStoreManager:
 
     Design Philosophy:
         - Lightweight: Uses local Chroma database
-        - Efficient: Caches embeddings to avoid recomputation
+        - Efficient: Shared client, cached collection handles and embeddings
         - Organized: One collection per transcript (ticker_quarter_year)
         - Metadata-rich: Stores source info with each chunk
 
@@ -65,8 +249,8 @@ class VectorStoreManager:
         self,
         persist_directory: str | None = None,
         embedding_model: str = "openai",
-        chunk_size: int = 1000,
-        chunk_overlap: int = 200,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
     ):
         """
         Initialize vector store manager.
@@ -90,6 +274,8 @@ class VectorStoreManager:
         self._embedding_function: EmbeddingFunctionProtocol | None = None
         self._embedding_model = embedding_model
         self._text_splitter = None
+        self._vectorstores: dict[str, Any] = {}
+        self._lock = threading.Lock()
 
         logger.info(
             f"VectorStoreManager initialized: {self.persist_directory}, "
@@ -107,8 +293,11 @@ class VectorStoreManager:
                     raise ValueError(
                         "OPENAI_API_KEY environment variable required for OpenAI embeddings"
                     )
-                self._embedding_function = OpenAIEmbeddings(
-                    model="text-embedding-3-small"  # Cost-effective embedding model
+                self._embedding_function = CachedEmbeddings(
+                    OpenAIEmbeddings(
+                        model="text-embedding-3-small"  # Cost-effective embedding model
+                    ),
+                    model="openai:text-embedding-3-small",
                 )
             else:
                 # Future: Add sentence-transformers support
@@ -119,16 +308,37 @@ class VectorStoreManager:
     def _get_text_splitter(self):
         """Get or create text splitter (lazy initialization)."""
         if self._text_splitter is None:
-            from langchain.text_splitter import RecursiveCharacterTextSplitter
-
-            self._text_splitter = RecursiveCharacterTextSplitter(
-                chunk_size=self.chunk_size,
-                chunk_overlap=self.chunk_overlap,
-                length_function=len,
-                separators=["\n\n", "\n", ". ", " ", ""],
-            )
+            self._text_splitter = make_text_splitter(self.chunk_size, self.chunk_overlap)
         return self._text_splitter
 
+    def _get_client(self):
+        """Get the shared Chroma client for this persist directory."""
+        return get_chroma_client(self.persist_directory)
+
+    def _get_vectorstore(self, collection_name: str):
+        """Get the cached Chroma handle for a collection, creating it once."""
+        vectorstore = self._vectorstores.get(collection_name)
+        if vectorstore is None:
+            with self._lock:
+                vectorstore = self._vectorstores.get(collection_name)
+                if vectorstore is None:
+                    from langchain_chroma import Chroma
+
+                    vectorstore = Chroma(
+                        collection_name=collection_name,
+                        embedding_function=self._get_embedding_function(),
+                        client=self._get_client(),
+                    )
+                    self._vectorstores[collection_name] = vectorstore
+        return vectorstore
+
+    async def _run_blocking(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking Chroma or embedding call on the vector store executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            get_vector_store_executor(), partial(func, *args, **kwargs)
+        )
+
     def _get_collection_name(self, ticker: str, quarter: str, fiscal_year: int) -> str:
         """
         Get collection name for transcript.
@@ -172,8 +382,6 @@ class VectorStoreManager:
             ... )
             >>> print(f"Indexed {stats['chunk_count']} chunks")
         """
-        from langchain_chroma import Chroma
-
         collection_name = self._get_collection_name(ticker, quarter, fiscal_year)
 
         logger.info(
@@ -184,7 +392,7 @@ class VectorStoreManager:
         try:
             # Split text into chunks
             text_splitter = self._get_text_splitter()
-            chunks = text_splitter.split_text(transcript_text)
+            chunks = await self._run_blocking(text_splitter.split_text, transcript_text)
 
             # Prepare metadata for each chunk
             base_metadata = {
@@ -200,16 +408,12 @@ class VectorStoreManager:
                 {**base_metadata, "chunk_index": i} for i in range(len(chunks))
             ]
 
-            # Create/load vector store
-            vectorstore = Chroma(
-                collection_name=collection_name,
-                embedding_function=self._get_embedding_function(),
-                persist_directory=self.persist_directory,
+            # Add documents (embeddings of unchanged chunks come from the cache)
+            vectorstore = self._get_vectorstore(collection_name)
+            await self._run_blocking(
+                vectorstore.add_texts, texts=chunks, metadatas=metadatas
             )
 
-            # Add documents
-            vectorstore.add_texts(texts=chunks, metadatas=metadatas)
-
             logger.info(
                 f"Successfully indexed {len(chunks)} chunks for {ticker} {quarter} FY{fiscal_year}"
             )
@@ -257,8 +461,6 @@ class VectorStoreManager:
             ...     print(result["content"])
             ...     print(result["score"])
         """
-        from langchain_chroma import Chroma
-
         collection_name = self._get_collection_name(ticker, quarter, fiscal_year)
 
         logger.info(
@@ -266,16 +468,10 @@ class VectorStoreManager:
         )
 
         try:
-            # Load vector store
-            vectorstore = Chroma(
-                collection_name=collection_name,
-                embedding_function=self._get_embedding_function(),
-                persist_directory=self.persist_directory,
-            )
-
             # Similarity search with scores
-            results_with_scores = vectorstore.similarity_search_with_score(
-                query_text, k=top_k
+            vectorstore = self._get_vectorstore(collection_name)
+            results_with_scores = await self._run_blocking(
+                vectorstore.similarity_search_with_score, query_text, k=top_k
             )
 
             # Format results
@@ -308,18 +504,11 @@ class VectorStoreManager:
         Returns:
             bool: True if collection exists
         """
-        from langchain_chroma import Chroma
-
         collection_name = self._get_collection_name(ticker, quarter, fiscal_year)
 
         try:
-            vectorstore = Chroma(
-                collection_name=collection_name,
-                embedding_function=self._get_embedding_function(),
-                persist_directory=self.persist_directory,
-            )
-            # Try to get collection count
-            count = vectorstore._collection.count()
+            # Try to get collection count (no embedding function needed)
+            count = self._get_client().get_collection(collection_name).count()
             return count > 0
         except Exception:
             return False
@@ -335,19 +524,14 @@ class VectorStoreManager:
             quarter: Quarter
             fiscal_year: Year
         """
-        from langchain_chroma import Chroma
-
         collection_name = self._get_collection_name(ticker, quarter, fiscal_year)
 
         logger.info(f"Deleting collection {collection_name}")
 
         try:
-            vectorstore = Chroma(
-                collection_name=collection_name,
-                embedding_function=self._get_embedding_function(),
-                persist_directory=self.persist_directory,
-            )
-            vectorstore.delete_collection()
+            with self._lock:
+                self._vectorstores.pop(collection_name, None)
+            self._get_client().delete_collection(collection_name)
             logger.info(f"Successfully deleted collection {collection_name}")
         except Exception as e:
             logger.warning(f"Failed to delete collection {collection_name}: {e}")
@@ -361,10 +545,7 @@ class VectorStoreManager:
         """
         try:
             # Get all collections in persist directory
-            from chromadb import PersistentClient
-
-            client = PersistentClient(path=self.persist_directory)
-            collections = client.list_collections()
+            collections = self._get_client().list_collections()
 
             total_chunks = 0
             collection_stats = []
@@ -381,6 +562,11 @@ class VectorStoreManager:
                 "total_collections": len(collections),
                 "total_chunks": total_chunks,
                 "collections": collection_stats,
+                "embedding_cache": {
+                    "entries": len(_embedding_cache),
+                    "hits": _embedding_cache.hits,
+                    "misses": _embedding_cache.misses,
+                },
             }
 
         except Exception as e:
@@ -392,5 +578,11 @@ class VectorStoreManager:
             }
 
 
-__all__ = ["VectorStoreManager"]
+__all__ = [
+    "CachedEmbeddings",
+    "EmbeddingCache",
+    "VectorStoreManager",
+    "get_chroma_client",
+    "make_text_splitter",
+]
 
@@ -14,10 +14,20 @@ These are optional and will gracefully degrade if not available.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, Callable
 
+from maverick_core.caching import (
+    LLMResponseCache,
+    get_llm_cache,
+    get_llm_model_id,
+    make_llm_cache_key,
+)
+
 from maverick_india.concall.providers import (
     CompanyIRProvider,
     ConcallProvider,
@@ -28,8 +38,57 @@ from maverick_india.concall.providers import (
 if TYPE_CHECKING:
     from maverick_data.models import ConferenceCall
 
+from maverick_core.config.base import get_env_bool, get_env_float, get_env_int
+
 logger = logging.getLogger(__name__)
 
+HEDGED_FETCH_ENABLED = get_env_bool("CONCALL_HEDGED_FETCH", False)
+HEDGE_DELAY_SECONDS = get_env_float("CONCALL_HEDGE_DELAY_SECONDS", 2.0)
+
+# Map-reduce summarization
+SINGLE_PASS_MAX_CHARS = 20000
+SUMMARY_CHUNK_SIZE = 12000
+SUMMARY_CHUNK_OVERLAP = 500
+SUMMARY_MAX_CONCURRENCY = get_env_int("CONCALL_SUMMARY_CONCURRENCY", 4)
+SUMMARY_TOKEN_BUDGET = get_env_int("CONCALL_SUMMARY_TOKEN_BUDGET", 16000)
+CHARS_PER_TOKEN = 4
+
+# Weight of the latest attempt in a provider's moving-average latency
+LATENCY_EWMA_ALPHA = 0.3
+
+
+@dataclass
+class ProviderStats:
+    """Success rate and latency observed for one transcript provider."""
+
+    attempts: int = 0
+    successes: int = 0
+    avg_latency: float | None = None
+
+    def record(self, latency: float, success: bool) -> None:
+        """Record the outcome of one completed fetch attempt."""
+        self.attempts += 1
+        self.successes += int(success)
+        if self.avg_latency is None:
+            self.avg_latency = latency
+        else:
+            self.avg_latency += LATENCY_EWMA_ALPHA * (latency - self.avg_latency)
+
+    @property
+    def success_rate(self) -> float:
+        """Smoothed success rate (0.5 before any attempts)."""
+        return (self.successes + 1) / (self.attempts + 2)
+
+    def expected_cost(self, default_latency: float) -> float:
+        """Expected seconds spent per successful fetch, used for ordering."""
+        latency = self.avg_latency if self.avg_latency is not None else default_latency
+        return latency / self.success_rate
+
+
+# Provider stats shared by all fetchers in the process, keyed by provider
+# name; callers typically build a new TranscriptFetcher per request
+_PROVIDER_STATS: dict[str, ProviderStats] = {}
+
 
 class TranscriptFetcher:
     """
@@ -49,10 +108,20 @@ class TranscriptFetcher:
         2. NSEProvider (exchange filings)
         3. ScreenerProvider (consolidated source, fallback)
 
+    Hedged Mode:
+        Starts the best provider, then starts the next one after
+        ``hedge_delay`` seconds or as soon as a running provider fails. The
+        first valid transcript wins and the other attempts are cancelled.
+        Providers are ordered by observed success rate and latency, so a cold
+        fetch costs roughly the fastest provider's latency. The statistics
+        are shared process-wide across fetcher instances.
+
     Attributes:
         providers: List of data providers to try
         save_to_db: Whether to persist transcripts to database
         use_cache: Whether to check database before fetching
+        hedged: Whether to race providers instead of trying them in turn
+        hedge_delay: Seconds before starting the next provider in hedged mode
 
     Example:
         >>> fetcher = TranscriptFetcher()
@@ -67,6 +136,9 @@ class TranscriptFetcher:
         save_to_db: bool = True,
         use_cache: bool = True,
         session_factory: Callable[[], Any] | None = None,
+        hedged: bool = HEDGED_FETCH_ENABLED,
+        hedge_delay: float = HEDGE_DELAY_SECONDS,
+        provider_stats: dict[str, ProviderStats] | None = None,
     ):
         """
         Initialize transcript fetcher.
@@ -76,6 +148,10 @@ class TranscriptFetcher:
             save_to_db: Save fetched transcripts to database
             use_cache: Check database cache before fetching
             session_factory: Optional callable returning database session
+            hedged: Race providers with staggered starts (default: CONCALL_HEDGED_FETCH)
+            hedge_delay: Seconds to wait on a provider before starting the next
+            provider_stats: Provider statistics by name (default: shared
+                process-wide)
         """
         self.providers = providers or [
             CompanyIRProvider(session_factory=session_factory),
@@ -85,6 +161,9 @@ class TranscriptFetcher:
         self.save_to_db = save_to_db
         self.use_cache = use_cache
         self._session_factory = session_factory
+        self.hedged = hedged
+        self.hedge_delay = hedge_delay
+        self._stats = _PROVIDER_STATS if provider_stats is None else provider_stats
         logger.info(f"Initialized TranscriptFetcher with {len(self.providers)} providers")
 
     async def fetch_transcript(
@@ -130,7 +209,10 @@ class TranscriptFetcher:
                 )
                 return cached
 
-        # Step 2: Try each provider
+        # Step 2: Fetch from providers
+        if self.hedged:
+            return await self._fetch_hedged(ticker, quarter, fiscal_year)
+
         for provider in self.providers:
             try:
                 # Check if provider supports this ticker
@@ -145,20 +227,10 @@ class TranscriptFetcher:
                 )
 
                 # Fetch transcript
-                result = await provider.fetch_transcript(ticker, quarter, fiscal_year)
+                result = await self._attempt(provider, ticker, quarter, fiscal_year)
 
                 if result:
-                    # Add provider info
-                    result["source"] = provider.name
-
-                    # Step 3: Save to database
-                    if self.save_to_db and self._session_factory:
-                        self._save_to_db(ticker, quarter, fiscal_year, result)
-
-                    logger.info(
-                        f"[FETCH] Successfully fetched {ticker} {quarter} FY{fiscal_year} from {provider.name}"
-                    )
-                    return result
+                    return self._accept(provider, ticker, quarter, fiscal_year, result)
 
             except Exception as e:
                 logger.warning(
@@ -172,6 +244,153 @@ class TranscriptFetcher:
         )
         return None
 
+    async def _fetch_hedged(
+        self, ticker: str, quarter: str, fiscal_year: int
+    ) -> dict[str, Any] | None:
+        """
+        Race providers with staggered starts and keep the first valid result.
+
+        Args:
+            ticker: Normalized stock symbol
+            quarter: Normalized quarter
+            fiscal_year: Year
+
+        Returns:
+            dict with transcript data or None if every provider failed
+        """
+        candidates = [
+            p for p in self.ordered_providers() if self._is_available(p, ticker)
+        ]
+        running: dict[asyncio.Task, ConcallProvider] = {}
+        next_index = 0
+
+        def launch_next() -> None:
+            nonlocal next_index
+            provider = candidates[next_index]
+            next_index += 1
+            logger.info(
+                f"Attempting to fetch {ticker} {quarter} FY{fiscal_year} from {provider.name}"
+            )
+            task = asyncio.create_task(
+                self._attempt(provider, ticker, quarter, fiscal_year)
+            )
+            running[task] = provider
+
+        try:
+            while running or next_index < len(candidates):
+                if not running:
+                    launch_next()
+
+                more_to_start = next_index < len(candidates)
+                done, _ = await asyncio.wait(
+                    running,
+                    timeout=self.hedge_delay if more_to_start else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                if not done:
+                    # Slow provider: hedge with the next one
+                    launch_next()
+                    continue
+
+                for task in done:
+                    provider = running.pop(task)
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        logger.warning(f"Provider {provider.name} failed for {ticker}: {e}")
+                        result = None
+
+                    if result:
+                        return self._accept(provider, ticker, quarter, fiscal_year, result)
+
+                # Failure: start the next provider without waiting
+                if more_to_start:
+                    launch_next()
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        logger.warning(
+            f"All providers failed for {ticker} {quarter} FY{fiscal_year}"
+        )
+        return None
+
+    def _is_available(self, provider: ConcallProvider, ticker: str) -> bool:
+        """Check provider support for a ticker, treating errors as unsupported."""
+        try:
+            return provider.is_available(ticker)
+        except Exception as e:
+            logger.warning(f"Provider {provider.name} availability check failed: {e}")
+            return False
+
+    async def _attempt(
+        self,
+        provider: ConcallProvider,
+        ticker: str,
+        quarter: str,
+        fiscal_year: int,
+    ) -> dict[str, Any] | None:
+        """Fetch from one provider, recording its latency and outcome."""
+        stats = self._stats.setdefault(provider.name, ProviderStats())
+        started = time.monotonic()
+        try:
+            result = await provider.fetch_transcript(ticker, quarter, fiscal_year)
+        except asyncio.CancelledError:
+            # Lost the race; says nothing about the provider
+            raise
+        except Exception:
+            stats.record(time.monotonic() - started, False)
+            raise
+
+        success = bool(result and result.get("transcript_text"))
+        stats.record(time.monotonic() - started, success)
+        return result if success else None
+
+    def _accept(
+        self,
+        provider: ConcallProvider,
+        ticker: str,
+        quarter: str,
+        fiscal_year: int,
+        result: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Tag and persist a fetched transcript."""
+        # Add provider info
+        result["source"] = provider.name
+
+        # Step 3: Save to database
+        if self.save_to_db and self._session_factory:
+            self._save_to_db(ticker, quarter, fiscal_year, result)
+
+        logger.info(
+            f"[FETCH] Successfully fetched {ticker} {quarter} FY{fiscal_year} from {provider.name}"
+        )
+        return result
+
+    def ordered_providers(self) -> list[ConcallProvider]:
+        """
+        Get providers in hedged-mode order.
+
+        Providers are sorted by expected time per successful fetch (average
+        latency over smoothed success rate). Providers without history keep
+        their configured priority.
+
+        Returns:
+            Providers, most promising first
+        """
+        stats = self._stats
+        return sorted(
+            self.providers,
+            key=lambda p: (
+                stats[p.name].expected_cost(self.hedge_delay)
+                if p.name in stats
+                else ProviderStats().expected_cost(self.hedge_delay)
+            ),
+        )
+
     def _get_from_cache(
         self, ticker: str, quarter: str, fiscal_year: int
     ) -> dict[str, Any] | None:
@@ -392,17 +611,25 @@ class TranscriptFetcher:
         """
         status = []
         for i, provider in enumerate(self.providers):
+            stats = self._stats.get(provider.name, ProviderStats())
             status.append(
                 {
                     "priority": i,
                     "name": provider.name,
                     "type": type(provider).__name__,
+                    "attempts": stats.attempts,
+                    "success_rate": round(stats.success_rate, 3),
+                    "avg_latency": stats.avg_latency,
                 }
             )
         return status
 
 
-# Prompts for AI analysis
+# Prompts for AI analysis. Bump the matching *_PROMPT_VERSION when a prompt
+# changes so cached LLM responses are not reused.
+SUMMARIZATION_PROMPT_VERSION = "concall_summary:v1"
+SENTIMENT_ANALYSIS_PROMPT_VERSION = "concall_sentiment:v1"
+
 SUMMARIZATION_PROMPT = """You are a financial analyst expert. Summarize this earnings call transcript for {ticker} ({company_name}) {quarter} FY{fiscal_year}.
 
 **TRANSCRIPT:**
@@ -423,6 +650,49 @@ Provide a JSON response with:
 Return ONLY the JSON object, no additional text.
 """
 
+CHUNK_SUMMARY_PROMPT_VERSION = "concall_chunk_summary:v1"
+REDUCE_SUMMARY_PROMPT_VERSION = "concall_reduce_summary:v1"
+
+CHUNK_SUMMARY_PROMPT = """You are a financial analyst expert. Extract the key facts from this excerpt of an earnings call transcript.
+
+**EXCERPT:**
+{chunk_text}
+
+Provide a JSON response with:
+{{
+    "summary": "2-3 sentence summary of the excerpt",
+    "key_metrics": {{"metric": "value", ...}},
+    "business_highlights": ["highlight1", ...],
+    "management_guidance": ["guidance1", ...],
+    "key_risks": ["risk1", ...],
+    "opportunities": ["opportunity1", ...],
+    "qa_insights": ["insight1", ...]
+}}
+
+Use empty lists or objects for anything the excerpt does not cover.
+Return ONLY the JSON object, no additional text.
+"""
+
+REDUCE_SUMMARY_PROMPT = """You are a financial analyst expert. Combine these notes, taken from consecutive sections of the earnings call transcript for {ticker} ({company_name}) {quarter} FY{fiscal_year}, into one summary of the whole call.
+
+**SECTION NOTES:**
+{partial_summaries}
+
+Provide a JSON response with:
+{{
+    "executive_summary": "2-3 sentence high-level summary",
+    "key_metrics": {{"revenue": "...", "profit": "...", "growth": "..."}},
+    "business_highlights": ["highlight1", "highlight2", ...],
+    "management_guidance": {{"outlook": "...", "targets": [...]}},
+    "sentiment": "<very_positive|positive|neutral|cautious|negative>",
+    "key_risks": ["risk1", "risk2", ...],
+    "opportunities": ["opportunity1", "opportunity2", ...],
+    "qa_insights": ["insight1", "insight2", ...]
+}}
+
+Return ONLY the JSON object, no additional text.
+"""
+
 SENTIMENT_ANALYSIS_PROMPT = """Analyze the sentiment and management tone from this earnings call transcript.
 
 **TRANSCRIPT:**
@@ -445,6 +715,93 @@ Return ONLY the JSON object, no additional text.
 """
 
 
+def parse_llm_json(text: str) -> dict[str, Any] | None:
+    """Parse a JSON object from an LLM response, optionally in a markdown fence."""
+    import json
+    import re
+
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        json_match = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", text, re.DOTALL)
+        if json_match:
+            try:
+                return json.loads(json_match.group(1))
+            except json.JSONDecodeError:
+                return None
+        return None
+
+
+async def invoke_llm_cached(
+    llm_provider: Any,
+    response_cache: LLMResponseCache | None,
+    prompt: str,
+    prompt_version: str,
+    cache_content: str | None = None,
+    refresh: bool = False,
+) -> str | None:
+    """
+    Invoke the LLM, caching responses that parse as JSON.
+
+    Args:
+        llm_provider: LLM provider instance
+        response_cache: LLM response cache (None disables caching)
+        prompt: Rendered prompt
+        prompt_version: Prompt template version for the cache key
+        cache_content: Content to key the cache on (default: the prompt)
+        refresh: Skip the cached response and overwrite it with a new one
+
+    Returns:
+        Response text, or None if it did not parse as JSON
+    """
+
+    async def invoke_llm() -> str | None:
+        response = await llm_provider.ainvoke(prompt)
+        text = response.content if hasattr(response, "content") else str(response)
+        return text if parse_llm_json(text) else None
+
+    if response_cache is None:
+        return await invoke_llm()
+
+    cache_key = make_llm_cache_key(
+        model_id=get_llm_model_id(llm_provider),
+        prompt_version=prompt_version,
+        content=cache_content if cache_content is not None else prompt,
+    )
+    if refresh:
+        text = await invoke_llm()
+        if text is not None:
+            await response_cache.set(cache_key, text)
+        return text
+    return await response_cache.get_or_compute(cache_key, invoke_llm)
+
+
+class TokenBudget:
+    """Limit on estimated prompt tokens in flight across concurrent LLM calls."""
+
+    def __init__(self, max_tokens: int):
+        self.max_tokens = max_tokens
+        self.in_flight = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self, tokens: int) -> int:
+        """Wait until ``tokens`` fit in the budget; returns the amount reserved."""
+        # A single request larger than the budget runs alone
+        tokens = min(tokens, self.max_tokens)
+        async with self._condition:
+            await self._condition.wait_for(
+                lambda: self.in_flight + tokens <= self.max_tokens
+            )
+            self.in_flight += tokens
+        return tokens
+
+    async def release(self, tokens: int) -> None:
+        """Return reserved tokens to the budget."""
+        async with self._condition:
+            self.in_flight -= tokens
+            self._condition.notify_all()
+
+
 class ConcallSummarizer:
     """
     AI-powered summarization service for conference call transcripts.
@@ -452,6 +809,12 @@ class ConcallSummarizer:
     Requires maverick-agents package for LLM access.
     Falls back gracefully if LLM is not available.
 
+    Transcripts longer than SINGLE_PASS_MAX_CHARS are summarized map-reduce
+    style: the transcript is split with the RAG text splitter, chunks are
+    summarized concurrently (bounded by a semaphore and a token budget, and
+    cached by chunk content), and the partial summaries are reduced into the
+    structured summary.
+
     Example:
         >>> summarizer = ConcallSummarizer()
         >>> summary = await summarizer.summarize_transcript(
@@ -464,6 +827,10 @@ class ConcallSummarizer:
         llm_provider: Any | None = None,
         session_factory: Callable[[], Any] | None = None,
         save_to_db: bool = True,
+        response_cache: LLMResponseCache | None = None,
+        max_concurrency: int = SUMMARY_MAX_CONCURRENCY,
+        token_budget: int = SUMMARY_TOKEN_BUDGET,
+        chunk_size: int = SUMMARY_CHUNK_SIZE,
     ):
         """
         Initialize summarizer.
@@ -472,10 +839,18 @@ class ConcallSummarizer:
             llm_provider: LLM provider instance (from maverick-agents)
             session_factory: Optional callable returning database session
             save_to_db: Save summaries to database
+            response_cache: LLM response cache (defaults to the shared cache)
+            max_concurrency: Maximum concurrent chunk summaries
+            token_budget: Maximum estimated prompt tokens in flight
+            chunk_size: Map-reduce chunk size in characters
         """
         self._llm_provider = llm_provider
         self._session_factory = session_factory
         self.save_to_db = save_to_db
+        self._response_cache = response_cache or get_llm_cache()
+        self.max_concurrency = max_concurrency
+        self.token_budget = token_budget
+        self.chunk_size = chunk_size
         logger.info("Initialized ConcallSummarizer")
 
     async def summarize_transcript(
@@ -487,6 +862,7 @@ class ConcallSummarizer:
         company_name: str | None = None,
         mode: str = "standard",
         force_refresh: bool = False,
+        map_reduce: bool | None = None,
     ) -> dict[str, Any] | None:
         """
         Generate AI summary of conference call transcript.
@@ -499,6 +875,7 @@ class ConcallSummarizer:
             company_name: Company name (optional)
             mode: Summarization mode (concise, standard, detailed)
             force_refresh: Skip cache and regenerate
+            map_reduce: Summarize in chunks (default: only for long transcripts)
 
         Returns:
             dict: Structured summary or None if failed
@@ -518,24 +895,29 @@ class ConcallSummarizer:
             logger.warning("LLM provider not configured, cannot generate summary")
             return None
 
-        try:
-            # Build prompt
-            prompt = SUMMARIZATION_PROMPT.format(
-                transcript_text=transcript_text[:20000],  # Truncate for context window
-                ticker=ticker,
-                company_name=company_name or ticker,
-                quarter=quarter,
-                fiscal_year=fiscal_year,
-            )
-
-            # Generate summary
-            import json
-
-            response = await self._llm_provider.ainvoke(prompt)
-            summary_text = response.content if hasattr(response, "content") else str(response)
+        if map_reduce is None:
+            map_reduce = len(transcript_text) > SINGLE_PASS_MAX_CHARS
 
-            # Parse JSON
-            summary = self._parse_json_response(summary_text)
+        try:
+            if map_reduce:
+                summary, chunk_count = await self._summarize_map_reduce(
+                    ticker,
+                    quarter,
+                    fiscal_year,
+                    transcript_text,
+                    company_name,
+                    refresh=force_refresh,
+                )
+            else:
+                summary = await self._summarize_single_pass(
+                    ticker,
+                    quarter,
+                    fiscal_year,
+                    transcript_text,
+                    company_name,
+                    refresh=force_refresh,
+                )
+                chunk_count = 1
             if not summary:
                 return None
 
@@ -545,6 +927,8 @@ class ConcallSummarizer:
                 "quarter": quarter,
                 "fiscal_year": fiscal_year,
                 "mode": mode,
+                "strategy": "map_reduce" if map_reduce else "single_pass",
+                "chunk_count": chunk_count,
             }
 
             # Save to database
@@ -558,19 +942,127 @@ class ConcallSummarizer:
             logger.error(f"Failed to summarize {ticker} {quarter} FY{fiscal_year}: {e}")
             return None
 
-    def _parse_json_response(self, text: str) -> dict[str, Any] | None:
-        """Parse JSON from LLM response."""
-        import json
-        import re
+    async def _summarize_single_pass(
+        self,
+        ticker: str,
+        quarter: str,
+        fiscal_year: int,
+        transcript_text: str,
+        company_name: str | None,
+        refresh: bool = False,
+    ) -> dict[str, Any] | None:
+        """Summarize a transcript with one LLM call."""
+        prompt = SUMMARIZATION_PROMPT.format(
+            transcript_text=transcript_text[:SINGLE_PASS_MAX_CHARS],
+            ticker=ticker,
+            company_name=company_name or ticker,
+            quarter=quarter,
+            fiscal_year=fiscal_year,
+        )
 
-        try:
-            return json.loads(text)
-        except json.JSONDecodeError:
-            # Try to extract JSON from markdown
-            json_match = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", text, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group(1))
+        # Served from the LLM cache for repeat transcripts
+        summary_text = await self._invoke_llm_cached(
+            prompt, SUMMARIZATION_PROMPT_VERSION, refresh=refresh
+        )
+        if summary_text is None:
             return None
+        return self._parse_json_response(summary_text)
+
+    async def _summarize_map_reduce(
+        self,
+        ticker: str,
+        quarter: str,
+        fiscal_year: int,
+        transcript_text: str,
+        company_name: str | None,
+        refresh: bool = False,
+    ) -> tuple[dict[str, Any] | None, int]:
+        """
+        Summarize a transcript chunk by chunk, then reduce the partial summaries.
+
+        Args:
+            ticker: Stock symbol
+            quarter: Quarter
+            fiscal_year: Year
+            transcript_text: Full transcript content
+            company_name: Company name
+            refresh: Bypass and overwrite cached LLM responses
+
+        Returns:
+            Tuple of (structured summary or None, number of chunks)
+        """
+        import json
+
+        from maverick_india.concall.rag.vector_store import make_text_splitter
+
+        splitter = make_text_splitter(self.chunk_size, SUMMARY_CHUNK_OVERLAP)
+        chunks = splitter.split_text(transcript_text)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        budget = TokenBudget(self.token_budget)
+
+        async def summarize_chunk(chunk: str) -> dict[str, Any] | None:
+            prompt = CHUNK_SUMMARY_PROMPT.format(chunk_text=chunk)
+            async with semaphore:
+                reserved = await budget.acquire(len(prompt) // CHARS_PER_TOKEN)
+                try:
+                    # Keyed by chunk content, so shared passages are summarized once
+                    text = await self._invoke_llm_cached(
+                        prompt,
+                        CHUNK_SUMMARY_PROMPT_VERSION,
+                        cache_content=chunk,
+                        refresh=refresh,
+                    )
+                except Exception as e:
+                    logger.warning(f"Chunk summary failed for {ticker}: {e}")
+                    return None
+                finally:
+                    await budget.release(reserved)
+            return self._parse_json_response(text) if text else None
+
+        partials = await asyncio.gather(*(summarize_chunk(c) for c in chunks))
+        partials = [p for p in partials if p]
+        if not partials:
+            return None, len(chunks)
+
+        logger.info(
+            f"Reducing {len(partials)}/{len(chunks)} chunk summaries for "
+            f"{ticker} {quarter} FY{fiscal_year}"
+        )
+        prompt = REDUCE_SUMMARY_PROMPT.format(
+            partial_summaries=json.dumps(partials, ensure_ascii=False, indent=1),
+            ticker=ticker,
+            company_name=company_name or ticker,
+            quarter=quarter,
+            fiscal_year=fiscal_year,
+        )
+        summary_text = await self._invoke_llm_cached(
+            prompt, REDUCE_SUMMARY_PROMPT_VERSION, refresh=refresh
+        )
+        if summary_text is None:
+            return None, len(chunks)
+        return self._parse_json_response(summary_text), len(chunks)
+
+    async def _invoke_llm_cached(
+        self,
+        prompt: str,
+        prompt_version: str,
+        cache_content: str | None = None,
+        refresh: bool = False,
+    ) -> str | None:
+        """Invoke the LLM through the response cache (see invoke_llm_cached)."""
+        return await invoke_llm_cached(
+            self._llm_provider,
+            self._response_cache,
+            prompt,
+            prompt_version,
+            cache_content=cache_content,
+            refresh=refresh,
+        )
+
+    def _parse_json_response(self, text: str) -> dict[str, Any] | None:
+        """Parse JSON from LLM response."""
+        return parse_llm_json(text)
 
     def _get_from_cache(
         self, ticker: str, quarter: str, fiscal_year: int
@@ -668,6 +1160,7 @@ class SentimentAnalyzer:
         llm_provider: Any | None = None,
         session_factory: Callable[[], Any] | None = None,
         save_to_db: bool = True,
+        response_cache: LLMResponseCache | None = None,
     ):
         """
         Initialize sentiment analyzer.
@@ -676,10 +1169,12 @@ class SentimentAnalyzer:
             llm_provider: LLM provider instance
             session_factory: Optional callable returning database session
             save_to_db: Save results to database
+            response_cache: LLM response cache (defaults to the shared cache)
         """
         self._llm_provider = llm_provider
         self._session_factory = session_factory
         self.save_to_db = save_to_db
+        self._response_cache = response_cache or get_llm_cache()
         logger.info("Initialized SentimentAnalyzer")
 
     async def analyze_sentiment(
@@ -724,11 +1219,16 @@ class SentimentAnalyzer:
                 transcript_text=transcript_text[:15000]  # Truncate
             )
 
-            # Generate analysis
-            import json
-
-            response = await self._llm_provider.ainvoke(prompt)
-            sentiment_text = response.content if hasattr(response, "content") else str(response)
+            # Generate analysis (served from the LLM cache for repeat transcripts)
+            sentiment_text = await invoke_llm_cached(
+                self._llm_provider,
+                self._response_cache,
+                prompt,
+                SENTIMENT_ANALYSIS_PROMPT_VERSION,
+                refresh=not use_cache,
+            )
+            if sentiment_text is None:
+                return None
 
             # Parse JSON
             sentiment = self._parse_json_response(sentiment_text)
@@ -756,16 +1256,7 @@ class SentimentAnalyzer:
 
     def _parse_json_response(self, text: str) -> dict[str, Any] | None:
         """Parse JSON from LLM response."""
-        import json
-        import re
-
-        try:
-            return json.loads(text)
-        except json.JSONDecodeError:
-            json_match = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", text, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group(1))
-            return None
+        return parse_llm_json(text)
 
     def _get_from_cache(
         self, ticker: str, quarter: str, fiscal_year: int
@@ -14,13 +14,20 @@ from maverick_india.market.provider import (
     format_indian_currency,
     get_nifty_sectors,
 )
+from maverick_india.market.panel import (
+    PricePanel,
+    clear_price_panel_cache,
+    get_price_panel,
+)
 from maverick_india.market.screening import (
+    NIFTY50_SECTORS,
     get_maverick_bearish_india,
     get_maverick_bullish_india,
     get_nifty50_momentum,
     get_nifty_sector_rotation,
     get_smallcap_breakouts_india,
     get_value_picks_india,
+    run_all_india_screens,
 )
 
 __all__ = [
@@ -33,11 +40,17 @@ __all__ = [
     "get_nifty_sectors",
     "fetch_nse_data",
     "fetch_bse_data",
+    # Price panel
+    "PricePanel",
+    "get_price_panel",
+    "clear_price_panel_cache",
     # Screening
+    "NIFTY50_SECTORS",
     "get_maverick_bullish_india",
     "get_maverick_bearish_india",
     "get_nifty50_momentum",
     "get_nifty_sector_rotation",
     "get_value_picks_india",
     "get_smallcap_breakouts_india",
+    "run_all_india_screens",
 ]
@@ -0,0 +1,219 @@
+"""
+Shared OHLCV price panel for Indian market screening.
+
+Downloads the whole NSE universe in one batched ``yf.download`` call and keeps
+it as wide (date x symbol) frames, so every screen reads the same data and
+indicators are computed once, vectorized across symbols. Panels are cached
+per (universe, period) with a TTL; concurrent callers wait for the in-flight
+download instead of starting their own.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+from maverick_core.config.base import get_env_int
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PANEL_PERIOD = "1y"
+DEFAULT_PANEL_TTL_SECONDS = get_env_int("INDIA_PANEL_TTL_SECONDS", 900)
+
+_OHLCV_FIELDS = ("Open", "High", "Low", "Close", "Volume")
+
+
+@dataclass
+class PricePanel:
+    """Aligned OHLCV frames (index: dates, columns: symbols) for a universe."""
+
+    open: pd.DataFrame
+    high: pd.DataFrame
+    low: pd.DataFrame
+    close: pd.DataFrame
+    volume: pd.DataFrame
+    fetched_at: float = field(default_factory=time.time)
+
+    @property
+    def symbols(self) -> list[str]:
+        """Symbols with at least one close in the panel."""
+        return list(self.close.columns)
+
+    @property
+    def empty(self) -> bool:
+        return self.close.empty
+
+    def window(self, frame: pd.DataFrame, period: str) -> pd.DataFrame:
+        """Slice a panel frame to a trailing calendar period.
+
+        Args:
+            frame: One of the panel frames
+            period: yfinance-style period ("80d", "3mo", "1y")
+
+        Returns:
+            Rows within the period ending at the last panel date
+        """
+        if frame.empty:
+            return frame
+        start = frame.index[-1] - _period_offset(period)
+        return frame.loc[frame.index > start]
+
+    @cached_property
+    def rsi_14(self) -> pd.DataFrame:
+        """Wilder RSI(14) for every symbol (same method as core ``calculate_rsi``)."""
+        delta = self.close.diff()
+        gains = delta.where(delta > 0, 0.0)
+        losses = (-delta).where(delta < 0, 0.0)
+        avg_gain = gains.ewm(alpha=1 / 14, min_periods=14, adjust=False).mean()
+        avg_loss = losses.ewm(alpha=1 / 14, min_periods=14, adjust=False).mean()
+        rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+        return rsi.replace([np.inf, -np.inf], 100)
+
+    @cached_property
+    def sma_20(self) -> pd.DataFrame:
+        """20-day simple moving average of closes."""
+        return self.close.rolling(window=20).mean()
+
+    @cached_property
+    def sma_50(self) -> pd.DataFrame:
+        """50-day simple moving average of closes."""
+        return self.close.rolling(window=50).mean()
+
+    @cached_property
+    def week_change_pct(self) -> pd.Series:
+        """Percent change from the 5th-last close to the last close."""
+        if len(self.close) < 5:
+            return pd.Series(np.nan, index=self.close.columns)
+        return (self.close.iloc[-1] / self.close.iloc[-5] - 1) * 100
+
+
+def _period_offset(period: str) -> pd.DateOffset:
+    """Convert a yfinance period string into a calendar offset."""
+    period = period.strip().lower()
+    if period.endswith("mo"):
+        return pd.DateOffset(months=int(period[:-2]))
+    if period.endswith("y"):
+        return pd.DateOffset(years=int(period[:-1]))
+    if period.endswith("wk"):
+        return pd.DateOffset(weeks=int(period[:-2]))
+    if period.endswith("d"):
+        return pd.DateOffset(days=int(period[:-1]))
+    raise ValueError(f"Unsupported period: {period}")
+
+
+def fetch_price_panel(
+    symbols: list[str], period: str = DEFAULT_PANEL_PERIOD
+) -> PricePanel:
+    """
+    Batch-download OHLCV data for a universe into a price panel.
+
+    Args:
+        symbols: Ticker symbols (with exchange suffix)
+        period: yfinance period to download
+
+    Returns:
+        PricePanel with one column per symbol that returned data
+    """
+    data = yf.download(
+        tickers=symbols,
+        period=period,
+        group_by="column",
+        auto_adjust=True,
+        threads=True,
+        progress=False,
+    )
+
+    if data is None or data.empty:
+        empty = pd.DataFrame()
+        return PricePanel(empty, empty, empty, empty, empty)
+
+    if not isinstance(data.columns, pd.MultiIndex):
+        data.columns = pd.MultiIndex.from_product([data.columns, symbols[:1]])
+
+    data.index = pd.to_datetime(data.index).tz_localize(None)
+    frames = {name: data[name].astype(float) for name in _OHLCV_FIELDS}
+
+    # Drop symbols that returned no prices at all
+    valid = frames["Close"].columns[frames["Close"].notna().any()]
+    frames = {name: frame[valid] for name, frame in frames.items()}
+
+    logger.info(f"Fetched price panel for {len(valid)}/{len(symbols)} symbols")
+    return PricePanel(
+        open=frames["Open"],
+        high=frames["High"],
+        low=frames["Low"],
+        close=frames["Close"],
+        volume=frames["Volume"],
+    )
+
+
+@lru_cache(maxsize=1)
+def get_nse_universe() -> tuple[str, ...]:
+    """Get the NSE screening universe (Nifty 50 constituents)."""
+    from maverick_india.market.provider import IndianMarketDataProvider
+
+    return tuple(IndianMarketDataProvider().get_nifty50_constituents())
+
+
+_panel_cache: dict[tuple[tuple[str, ...], str], PricePanel] = {}
+_panel_locks: dict[tuple[tuple[str, ...], str], threading.Lock] = {}
+_panel_cache_lock = threading.Lock()
+
+
+def get_price_panel(
+    symbols: list[str] | None = None,
+    period: str = DEFAULT_PANEL_PERIOD,
+    ttl_seconds: int = DEFAULT_PANEL_TTL_SECONDS,
+) -> PricePanel:
+    """
+    Get a cached price panel, downloading it at most once per TTL.
+
+    Args:
+        symbols: Universe to load (defaults to the NSE screening universe)
+        period: yfinance period to download
+        ttl_seconds: Maximum panel age before it is refreshed
+
+    Returns:
+        Shared PricePanel instance
+    """
+    key = (tuple(symbols) if symbols else get_nse_universe(), period)
+
+    with _panel_cache_lock:
+        panel = _panel_cache.get(key)
+        if panel is not None and time.time() - panel.fetched_at < ttl_seconds:
+            return panel
+        key_lock = _panel_locks.setdefault(key, threading.Lock())
+
+    with key_lock:
+        # Another caller may have refreshed the panel while we waited
+        panel = _panel_cache.get(key)
+        if panel is not None and time.time() - panel.fetched_at < ttl_seconds:
+            return panel
+
+        panel = fetch_price_panel(list(key[0]), period)
+        if not panel.empty:
+            with _panel_cache_lock:
+                _panel_cache[key] = panel
+        return panel
+
+
+def clear_price_panel_cache() -> None:
+    """Drop all cached price panels."""
+    with _panel_cache_lock:
+        _panel_cache.clear()
+
+
+__all__ = [
+    "PricePanel",
+    "clear_price_panel_cache",
+    "fetch_price_panel",
+    "get_nse_universe",
+    "get_price_panel",
+]
@@ -0,0 +1,172 @@
+"""Tests for map-reduce transcript summarization."""
+
+import asyncio
+import json
+
+import pytest
+
+from maverick_core.caching import LLMResponseCache
+from maverick_india.concall.services import (
+    ConcallSummarizer,
+    SentimentAnalyzer,
+    TokenBudget,
+)
+
+
+class FakeLLM:
+    """LLM that answers chunk and reduce prompts and tracks concurrency."""
+
+    model_name = "fake-llm"
+
+    def __init__(self, delay: float = 0.02):
+        self.delay = delay
+        self.prompts: list[str] = []
+        self.active = 0
+        self.peak = 0
+
+    async def ainvoke(self, prompt: str):
+        self.prompts.append(prompt)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+
+        if "**SECTION NOTES:**" in prompt:
+            sections = prompt.split("**SECTION NOTES:**")[1].count('"section"')
+            return json.dumps({"executive_summary": f"{sections} sections"})
+        if "**EXCERPT:**" in prompt:
+            return json.dumps({"summary": "section", "qa_insights": []})
+        return json.dumps({"executive_summary": "single pass"})
+
+
+def transcript(paragraphs: int) -> str:
+    return "\n\n".join(
+        f"Paragraph {i}. " + "Revenue grew on strong demand. " * 30
+        for i in range(paragraphs)
+    )
+
+
+def make_summarizer(llm: FakeLLM, **kwargs) -> ConcallSummarizer:
+    return ConcallSummarizer(
+        llm_provider=llm,
+        save_to_db=False,
+        response_cache=LLMResponseCache(),
+        **kwargs,
+    )
+
+
+class TestMapReduceSummary:
+    """Test chunked concurrent summarization."""
+
+    @pytest.mark.asyncio
+    async def test_long_transcript_is_fully_covered(self):
+        llm = FakeLLM()
+        text = transcript(60)
+        summary = await make_summarizer(llm, chunk_size=4000).summarize_transcript(
+            "TCS.NS", "Q1", 2025, text
+        )
+
+        chunk_prompts = [p for p in llm.prompts if "**EXCERPT:**" in p]
+        assert summary["_metadata"]["strategy"] == "map_reduce"
+        assert summary["_metadata"]["chunk_count"] == len(chunk_prompts) > 1
+        assert "Paragraph 59." in "".join(chunk_prompts)
+        assert summary["executive_summary"] == f"{len(chunk_prompts)} sections"
+
+    @pytest.mark.asyncio
+    async def test_chunks_run_concurrently_under_semaphore(self):
+        llm = FakeLLM(delay=0.05)
+        summarizer = make_summarizer(llm, chunk_size=2000, max_concurrency=3)
+        await summarizer.summarize_transcript("TCS.NS", "Q1", 2025, transcript(40))
+        assert llm.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_token_budget_limits_in_flight_chunks(self):
+        llm = FakeLLM(delay=0.05)
+        # Each chunk prompt is ~600 tokens, so only two fit in the budget
+        summarizer = make_summarizer(
+            llm, chunk_size=2000, max_concurrency=10, token_budget=1300
+        )
+        await summarizer.summarize_transcript("TCS.NS", "Q1", 2025, transcript(40))
+        assert llm.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_chunk_summaries_cached_by_content(self):
+        llm = FakeLLM()
+        summarizer = make_summarizer(llm, chunk_size=4000)
+        text = transcript(30)
+        await summarizer.summarize_transcript("TCS.NS", "Q1", 2025, text)
+        first_calls = len(llm.prompts)
+
+        # Same content under another company: only the reduce step is new
+        await summarizer.summarize_transcript("INFY.NS", "Q1", 2025, text)
+        assert len(llm.prompts) == first_calls + 1
+
+    @pytest.mark.asyncio
+    async def test_short_transcript_uses_single_pass(self):
+        llm = FakeLLM()
+        summary = await make_summarizer(llm).summarize_transcript(
+            "TCS.NS", "Q1", 2025, transcript(2)
+        )
+        assert summary["executive_summary"] == "single pass"
+        assert summary["_metadata"]["strategy"] == "single_pass"
+        assert len(llm.prompts) == 1
+
+
+class CountingLLM:
+    """LLM whose JSON answer changes on every call."""
+
+    model_name = "counting-llm"
+
+    def __init__(self):
+        self.calls = 0
+
+    async def ainvoke(self, prompt: str):
+        self.calls += 1
+        return json.dumps(
+            {"executive_summary": f"v{self.calls}", "overall_sentiment": "positive"}
+        )
+
+
+class TestCacheBypass:
+    """Test explicit refreshes skip and overwrite cached LLM responses."""
+
+    @pytest.mark.asyncio
+    async def test_force_refresh_regenerates_summary(self):
+        llm = CountingLLM()
+        summarizer = make_summarizer(llm)
+        text = transcript(2)
+
+        first = await summarizer.summarize_transcript("TCS.NS", "Q1", 2025, text)
+        cached = await summarizer.summarize_transcript("TCS.NS", "Q1", 2025, text)
+        refreshed = await summarizer.summarize_transcript(
+            "TCS.NS", "Q1", 2025, text, force_refresh=True
+        )
+        after = await summarizer.summarize_transcript("TCS.NS", "Q1", 2025, text)
+
+        assert first["executive_summary"] == cached["executive_summary"] == "v1"
+        assert refreshed["executive_summary"] == after["executive_summary"] == "v2"
+        assert llm.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_sentiment_without_cache_calls_llm(self):
+        llm = CountingLLM()
+        analyzer = SentimentAnalyzer(
+            llm_provider=llm, save_to_db=False, response_cache=LLMResponseCache()
+        )
+        text = transcript(2)
+
+        await analyzer.analyze_sentiment("TCS.NS", "Q1", 2025, text)
+        await analyzer.analyze_sentiment("TCS.NS", "Q1", 2025, text)
+        await analyzer.analyze_sentiment("TCS.NS", "Q1", 2025, text, use_cache=False)
+        assert llm.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_token_budget_admits_oversized_request_alone():
+    budget = TokenBudget(100)
+    reserved = await budget.acquire(500)
+    assert reserved == 100 and budget.in_flight == 100
+    await budget.release(reserved)
+    assert budget.in_flight == 0
@@ -0,0 +1,106 @@
+"""Tests for the shared price panel and vectorized India screens."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from maverick_core.technical import calculate_rsi
+from maverick_india.market import panel as panel_module
+from maverick_india.market import (
+    clear_price_panel_cache,
+    get_maverick_bullish_india,
+    get_price_panel,
+    run_all_india_screens,
+)
+
+SYMBOLS = ["UP.NS", "DOWN.NS", "FLAT.NS"]
+
+
+def _fake_download(calls: list):
+    def download(tickers, period, **kwargs):
+        calls.append((tuple(tickers), period))
+        dates = pd.bdate_range(end="2024-06-28", periods=250)
+        rng = np.random.default_rng(0)
+        trends = {"UP.NS": 0.004, "DOWN.NS": -0.004, "FLAT.NS": 0.0}
+        frames = {}
+        for symbol in tickers:
+            noise = rng.normal(0, 0.01, len(dates))
+            close = 100 * np.exp(np.cumsum(trends[symbol] + noise))
+            frames[symbol] = pd.DataFrame(
+                {
+                    "Open": close,
+                    "High": close * 1.01,
+                    "Low": close * 0.99,
+                    "Close": close,
+                    "Volume": np.full(len(dates), 1_000_000.0),
+                },
+                index=dates,
+            )
+        return pd.concat(frames, axis=1).swaplevel(axis=1).sort_index(axis=1)
+
+    return download
+
+
+@pytest.fixture
+def download_calls(monkeypatch):
+    calls: list = []
+    monkeypatch.setattr(panel_module.yf, "download", _fake_download(calls))
+    clear_price_panel_cache()
+    yield calls
+    clear_price_panel_cache()
+
+
+class TestPricePanel:
+    """Test panel caching and indicator parity."""
+
+    def test_panel_downloaded_once_within_ttl(self, download_calls):
+        first = get_price_panel(SYMBOLS)
+        second = get_price_panel(SYMBOLS)
+
+        assert first is second
+        assert len(download_calls) == 1
+        assert first.symbols == sorted(SYMBOLS)
+
+    def test_expired_panel_is_refreshed(self, download_calls):
+        get_price_panel(SYMBOLS)
+        get_price_panel(SYMBOLS, ttl_seconds=0)
+        assert len(download_calls) == 2
+
+    def test_rsi_matches_core_indicator(self, download_calls):
+        panel = get_price_panel(SYMBOLS)
+        expected = calculate_rsi(pd.DataFrame({"Close": panel.close["UP.NS"]}))
+        pd.testing.assert_series_equal(
+            panel.rsi_14["UP.NS"], expected, check_names=False
+        )
+
+    def test_window_uses_calendar_period(self, download_calls):
+        panel = get_price_panel(SYMBOLS)
+        window = panel.window(panel.close, "3mo")
+        assert window.index[0] > panel.close.index[-1] - pd.DateOffset(months=3)
+
+
+class TestScreens:
+    """Test screens run off one shared panel."""
+
+    def test_run_all_screens_single_download(self, download_calls):
+        results = run_all_india_screens(symbols=SYMBOLS)
+
+        assert len(download_calls) == 1
+        assert set(results) >= {
+            "maverick_bullish",
+            "maverick_bearish",
+            "nifty50_momentum",
+            "value_picks",
+            "smallcap_breakouts",
+            "sector_rotation",
+        }
+        assert results["universe_size"] == 3
+
+    def test_bullish_excludes_downtrend(self, download_calls):
+        panel = get_price_panel(SYMBOLS)
+        results = get_maverick_bullish_india(rsi_high=100, panel=panel)
+
+        symbols = {r["symbol"] for r in results}
+        assert "DOWN.NS" not in symbols
+        scores = [r["score"] for r in results]
+        assert scores == sorted(scores, reverse=True)
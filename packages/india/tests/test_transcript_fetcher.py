@@ -0,0 +1,159 @@
+"""Tests for sequential and hedged transcript fetching."""
+
+import asyncio
+import time
+
+import pytest
+
+from maverick_india.concall.providers import ConcallProvider
+from maverick_india.concall.services import ProviderStats, TranscriptFetcher
+
+
+class FakeProvider(ConcallProvider):
+    """Provider that answers after a fixed delay."""
+
+    def __init__(self, name: str, delay: float, text: str | None = "transcript", error=None):
+        self._name = name
+        self.delay = delay
+        self.text = text
+        self.error = error
+        self.started = 0
+        self.cancelled = False
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def is_available(self, ticker: str) -> bool:
+        return True
+
+    async def fetch_transcript(self, ticker, quarter, fiscal_year):
+        self.started += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error:
+            raise self.error
+        if self.text is None:
+            return None
+        return {"transcript_text": f"{self.text} from {self._name}"}
+
+
+def make_fetcher(providers, **kwargs) -> TranscriptFetcher:
+    kwargs.setdefault("provider_stats", {})
+    return TranscriptFetcher(providers=providers, save_to_db=False, use_cache=False, **kwargs)
+
+
+class TestHedgedFetch:
+    """Test racing providers with staggered starts."""
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged(self):
+        slow = FakeProvider("ir", delay=1.0)
+        fast = FakeProvider("nse", delay=0.05)
+        fetcher = make_fetcher([slow, fast], hedged=True, hedge_delay=0.05)
+
+        started = time.monotonic()
+        result = await fetcher.fetch_transcript("TCS.NS", "q1", 2025)
+
+        assert result["source"] == "nse"
+        assert time.monotonic() - started < 0.5
+        assert slow.cancelled
+
+    @pytest.mark.asyncio
+    async def test_failure_starts_next_provider_immediately(self):
+        broken = FakeProvider("ir", delay=0.01, error=RuntimeError("boom"))
+        empty = FakeProvider("nse", delay=0.01, text=None)
+        good = FakeProvider("screener", delay=0.01)
+        fetcher = make_fetcher([broken, empty, good], hedged=True, hedge_delay=10)
+
+        started = time.monotonic()
+        result = await fetcher.fetch_transcript("TCS.NS", "Q1", 2025)
+
+        assert result["source"] == "screener"
+        assert time.monotonic() - started < 1.0
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_does_not_start_others(self):
+        primary = FakeProvider("ir", delay=0.01)
+        backup = FakeProvider("nse", delay=0.01)
+        fetcher = make_fetcher([primary, backup], hedged=True, hedge_delay=1.0)
+
+        assert (await fetcher.fetch_transcript("TCS.NS", "Q1", 2025))["source"] == "ir"
+        assert backup.started == 0
+
+    @pytest.mark.asyncio
+    async def test_all_fail_returns_none(self):
+        providers = [FakeProvider(n, delay=0.01, text=None) for n in ("a", "b", "c")]
+        fetcher = make_fetcher(providers, hedged=True, hedge_delay=0.01)
+
+        assert await fetcher.fetch_transcript("TCS.NS", "Q1", 2025) is None
+        assert all(p.started == 1 for p in providers)
+
+    @pytest.mark.asyncio
+    async def test_providers_reordered_by_stats(self):
+        flaky = FakeProvider("ir", delay=0.02, text=None)
+        reliable = FakeProvider("nse", delay=0.02)
+        fetcher = make_fetcher([flaky, reliable], hedged=True, hedge_delay=1.0)
+
+        for _ in range(3):
+            await fetcher.fetch_transcript("TCS.NS", "Q1", 2025)
+
+        assert [p.name for p in fetcher.ordered_providers()] == ["nse", "ir"]
+        status = {s["name"]: s for s in fetcher.get_provider_status()}
+        assert status["nse"]["attempts"] == 3
+        assert status["ir"]["success_rate"] < status["nse"]["success_rate"]
+
+
+    @pytest.mark.asyncio
+    async def test_availability_error_skips_provider(self):
+        broken = FakeProvider("ir", delay=0.01)
+        broken.is_available = lambda ticker: 1 / 0
+        good = FakeProvider("nse", delay=0.01)
+        fetcher = make_fetcher([broken, good], hedged=True, hedge_delay=1.0)
+
+        assert (await fetcher.fetch_transcript("TCS.NS", "Q1", 2025))["source"] == "nse"
+        assert broken.started == 0
+
+    @pytest.mark.asyncio
+    async def test_stats_shared_across_fetchers(self, monkeypatch):
+        from maverick_india.concall import services
+
+        monkeypatch.setattr(services, "_PROVIDER_STATS", {})
+        flaky = FakeProvider("ir", delay=0.02, text=None)
+        reliable = FakeProvider("nse", delay=0.02)
+
+        # A new fetcher per request, as the API routers do
+        for _ in range(3):
+            fetcher = TranscriptFetcher(
+                providers=[flaky, reliable], save_to_db=False, use_cache=False,
+                hedged=True, hedge_delay=1.0,
+            )
+            await fetcher.fetch_transcript("TCS.NS", "Q1", 2025)
+
+        assert [p.name for p in fetcher.ordered_providers()] == ["nse", "ir"]
+        assert services._PROVIDER_STATS["nse"].attempts == 3
+
+
+class TestSequentialFetch:
+    """Test the default cascading mode."""
+
+    @pytest.mark.asyncio
+    async def test_falls_through_in_order(self):
+        broken = FakeProvider("ir", delay=0, error=RuntimeError("boom"))
+        good = FakeProvider("nse", delay=0)
+        fetcher = make_fetcher([broken, good])
+
+        assert (await fetcher.fetch_transcript("TCS.NS", "Q1", 2025))["source"] == "nse"
+        assert fetcher._stats["ir"].attempts == 1
+
+
+def test_provider_stats_expected_cost():
+    stats = ProviderStats()
+    assert stats.expected_cost(2.0) == 4.0
+    stats.record(1.0, True)
+    stats.record(2.0, True)
+    assert stats.success_rate == 0.75
+    assert stats.avg_latency == pytest.approx(1.3)
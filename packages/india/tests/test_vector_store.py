@@ -0,0 +1,107 @@
+"""Tests for the shared Chroma client, handle cache and embedding cache."""
+
+import threading
+
+import pytest
+
+pytest.importorskip("chromadb")
+pytest.importorskip("langchain_chroma")
+
+from maverick_india.concall.rag.vector_store import (  # noqa: E402
+    CachedEmbeddings,
+    EmbeddingCache,
+    VectorStoreManager,
+    get_chroma_client,
+)
+
+
+class FakeEmbeddings:
+    """Deterministic embeddings that record calls and calling threads."""
+
+    def __init__(self):
+        self.documents: list[str] = []
+        self.queries: list[str] = []
+        self.threads: set[str] = set()
+
+    def _vector(self, text: str) -> list[float]:
+        return [float(len(text)), float(sum(map(ord, text)) % 97), 1.0]
+
+    def embed_documents(self, texts):
+        self.threads.add(threading.current_thread().name)
+        self.documents.extend(texts)
+        return [self._vector(t) for t in texts]
+
+    def embed_query(self, text):
+        self.threads.add(threading.current_thread().name)
+        self.queries.append(text)
+        return self._vector(text)
+
+
+@pytest.fixture
+def manager(tmp_path):
+    fake = FakeEmbeddings()
+    manager = VectorStoreManager(persist_directory=str(tmp_path), chunk_size=200, chunk_overlap=0)
+    manager._embedding_function = CachedEmbeddings(fake, model="fake", cache=EmbeddingCache())
+    return manager, fake
+
+
+TRANSCRIPT = "\n\n".join(f"Section {i}: revenue grew {i}% on demand." * 3 for i in range(10))
+
+
+class TestVectorStoreManager:
+    """Test indexing and querying reuse clients, handles and embeddings."""
+
+    @pytest.mark.asyncio
+    async def test_reindex_and_repeat_query_skip_embedding_model(self, manager):
+        manager, fake = manager
+
+        stats = await manager.index_transcript("TCS.NS", "Q1", 2025, TRANSCRIPT)
+        embedded = len(fake.documents)
+        assert embedded == stats["chunk_count"] > 1
+
+        await manager.index_transcript("TCS.NS", "Q1", 2025, TRANSCRIPT)
+        assert len(fake.documents) == embedded
+
+        first = await manager.query("TCS.NS", "Q1", 2025, "revenue growth", top_k=2)
+        second = await manager.query("TCS.NS", "Q1", 2025, "revenue growth", top_k=2)
+        assert len(first) == 2 and first == second
+        assert fake.queries == ["revenue growth"]
+
+        # Blocking work ran off the event loop thread
+        assert fake.threads and all(t.startswith("vector-store") for t in fake.threads)
+
+    @pytest.mark.asyncio
+    async def test_client_and_handles_are_reused(self, manager, tmp_path):
+        manager, _ = manager
+        await manager.index_transcript("TCS.NS", "Q1", 2025, TRANSCRIPT)
+
+        handle = manager._get_vectorstore("TCS_NS_Q1_2025")
+        await manager.query("TCS.NS", "Q1", 2025, "demand")
+        assert manager._get_vectorstore("TCS_NS_Q1_2025") is handle
+        assert manager._get_client() is get_chroma_client(str(tmp_path))
+
+    @pytest.mark.asyncio
+    async def test_exists_statistics_and_delete(self, manager):
+        manager, _ = manager
+        assert not manager.collection_exists("TCS.NS", "Q1", 2025)
+
+        stats = await manager.index_transcript("TCS.NS", "Q1", 2025, TRANSCRIPT)
+        assert manager.collection_exists("TCS.NS", "Q1", 2025)
+        assert manager.get_statistics()["total_chunks"] == stats["chunk_count"]
+
+        manager.delete_collection("TCS.NS", "Q1", 2025)
+        assert not manager.collection_exists("TCS.NS", "Q1", 2025)
+        assert "TCS_NS_Q1_2025" not in manager._vectorstores
+
+
+def test_cached_embeddings_embed_duplicates_once():
+    fake = FakeEmbeddings()
+    embeddings = CachedEmbeddings(fake, model="fake", cache=EmbeddingCache(max_entries=2))
+
+    vectors = embeddings.embed_documents(["a", "bb", "a"])
+    assert vectors[0] == vectors[2]
+    assert fake.documents == ["a", "bb"]
+
+    embeddings.embed_documents(["ccc"])  # evicts "a"
+    embeddings.embed_documents(["a"])
+    assert fake.documents == ["a", "bb", "ccc", "a"]
@@ -8,7 +8,8 @@ Provides a clean interface for creating and configuring the MCP server.
 import logging
 import sys
 import warnings
-from typing import Any, Callable, Protocol
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Protocol
 
 from fastmcp import FastMCP
 
@@ -64,6 +65,28 @@ def configure_warnings() -> None:
     )
 
 
+@asynccontextmanager
+async def server_lifespan(server: Any) -> AsyncIterator[dict[str, Any]]:
+    """
+    Server lifespan: release process-wide clients on shutdown.
+
+    Closes the shared crypto provider registry (HTTP connection pool and
+    thread pool) when the crypto package is installed.
+    """
+    try:
+        yield {}
+    finally:
+        try:
+            from maverick_crypto.providers import close_provider_registry
+        except ImportError:
+            pass
+        else:
+            try:
+                await close_provider_registry()
+            except Exception as e:
+                logger.warning(f"Error closing crypto provider registry: {e}")
+
+
 class FastMCPProtocol(Protocol):
     """Protocol describing the FastMCP interface."""
 
@@ -112,7 +135,7 @@ class MaverickServer:
         if configure_warnings_filter:
             configure_warnings()
 
-        self._fastmcp = FastMCP(name=name)
+        self._fastmcp = FastMCP(name=name, lifespan=server_lifespan)
         self._fastmcp.dependencies = []
         self._name = name
         self._tools_registered = False
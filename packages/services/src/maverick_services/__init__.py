@@ -50,6 +50,7 @@ from maverick_services.alert_service import (
     AlertType,
     AlertPriority,
     AlertStatus,
+    AlertRuleIndex,
     get_alert_service,
     PRESET_RULES,
 )
@@ -70,12 +71,21 @@ from maverick_services.custom_screener_service import (
     PRESET_SCREENERS,
     FILTER_FIELD_METADATA,
 )
+from maverick_services.screener_engine import (
+    CompiledFilter,
+    UniverseSnapshot,
+    compile_conditions,
+    get_universe_snapshot,
+    clear_universe_snapshots,
+)
 from maverick_services.export_service import (
+    HAS_PYARROW,
     ExportService,
     ExportFormat,
     ExportType,
     ExportConfig,
     ExportResult,
+    ExportStream,
     get_export_service,
 )
 from maverick_services.thesis_tracking_service import (
@@ -119,6 +129,11 @@ from maverick_services.risk_metrics_service import (
     STRESS_SCENARIOS,
     get_risk_metrics_service,
 )
+from maverick_services.document_repository import (
+    RedisDocumentRepository,
+    decode_document,
+    encode_document,
+)
 from maverick_services.exceptions import (
     ServiceError,
     ServiceException,
@@ -169,6 +184,7 @@ __all__ = [
     "AlertType",
     "AlertPriority",
     "AlertStatus",
+    "AlertRuleIndex",
     "get_alert_service",
     "PRESET_RULES",
     # Watchlist Services
@@ -176,6 +192,10 @@ __all__ = [
     "Watchlist",
     "WatchlistItem",
     "get_watchlist_service",
+    # Redis document persistence
+    "RedisDocumentRepository",
+    "encode_document",
+    "decode_document",
     # Custom Screener Services
     "CustomScreenerService",
     "CustomScreener",
@@ -186,13 +206,20 @@ __all__ = [
     "get_custom_screener_service",
     "PRESET_SCREENERS",
     "FILTER_FIELD_METADATA",
+    "CompiledFilter",
+    "UniverseSnapshot",
+    "compile_conditions",
+    "get_universe_snapshot",
+    "clear_universe_snapshots",
     # Export Services
     "ExportService",
     "ExportFormat",
     "ExportType",
     "ExportConfig",
     "ExportResult",
+    "ExportStream",
     "get_export_service",
+    "HAS_PYARROW",
     # Thesis Tracking Services
     "ThesisTrackingService",
     "InvestmentThesisEntry",
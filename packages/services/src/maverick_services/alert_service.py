@@ -8,6 +8,9 @@ Supports configurable alert rules with real-time notifications via SSE.
 import asyncio
 import json
 import logging
+import time
+import weakref
+from bisect import bisect_left, bisect_right, insort
 from dataclasses import dataclass, field
 from datetime import datetime, UTC, timedelta
 from decimal import Decimal
@@ -17,6 +20,9 @@ from uuid import uuid4
 
 from redis.asyncio import Redis
 
+from maverick_core.config.base import get_env_int
+from maverick_services.document_repository import RedisDocumentRepository
+
 logger = logging.getLogger(__name__)
 
 
@@ -168,6 +174,182 @@ class Alert:
         )
 
 
+# ============================================
+# Rule Index
+# ============================================
+
+
+# Alert types whose rules fire on new entries in a screening run
+SCREENING_ALERT_TYPES = {
+    AlertType.NEW_MAVERICK_STOCK: "Maverick",
+    AlertType.NEW_BEAR_STOCK: "Bear",
+    AlertType.NEW_BREAKOUT: "Breakout",
+}
+
+# Maximum age of the shared rule index before it is rebuilt from Redis
+RULE_INDEX_TTL_SECONDS = get_env_int("ALERT_RULE_INDEX_TTL_SECONDS", 300)
+
+# Maximum alerts delivered concurrently by one batch (each may call the LLM)
+ALERT_DELIVERY_CONCURRENCY = get_env_int("ALERT_DELIVERY_CONCURRENCY", 8)
+
+# Delay before resubscribing to rule changes, doubled per consecutive drop
+RULE_LISTENER_MIN_BACKOFF_SECONDS = 1.0
+RULE_LISTENER_MAX_BACKOFF_SECONDS = 30.0
+
+
+def _threshold_key(entry: tuple[float, str]) -> float:
+    return entry[0]
+
+
+class AlertRuleIndex:
+    """
+    In-memory index of enabled alert rules across all users.
+    
+    Threshold rules are grouped by (alert type, ticker, direction), with "*"
+    as the ticker for rules that apply to any ticker. Each group is a list of
+    (threshold, rule_id) sorted by threshold, so a tick finds every triggered
+    rule with one binary search:
+    
+    - "above" rules fire when value >= threshold (a prefix of the list)
+    - "below" rules fire when value <= threshold (a suffix of the list)
+    """
+    
+    ANY_TICKER = "*"
+    
+    def __init__(self):
+        self.rules: dict[str, AlertRule] = {}
+        self.built_at = time.monotonic()
+        self._thresholds: dict[tuple[AlertType, str, str], list[tuple[float, str]]] = {}
+        self._rule_groups: dict[str, tuple[tuple[AlertType, str, str], tuple[float, str]]] = {}
+        self._user_rules: dict[str, set[str]] = {}
+    
+    def __len__(self) -> int:
+        return len(self.rules)
+    
+    def is_stale(self, ttl_seconds: float = RULE_INDEX_TTL_SECONDS) -> bool:
+        """Whether the index is older than the refresh interval."""
+        return time.monotonic() - self.built_at >= ttl_seconds
+    
+    @staticmethod
+    def _threshold_entry(rule: AlertRule) -> tuple[str, str, float] | None:
+        """Get (ticker, direction, threshold) for an indexable rule."""
+        conditions = rule.conditions
+        ticker = str(conditions.get("ticker") or AlertRuleIndex.ANY_TICKER).upper()
+        
+        if rule.alert_type == AlertType.PRICE_TARGET_HIT:
+            target = conditions.get("target_price")
+            direction = conditions.get("direction", "above")
+            if not target or ticker == AlertRuleIndex.ANY_TICKER:
+                return None
+            if direction not in ("above", "below"):
+                return None
+            return ticker, direction, float(target)
+        
+        if rule.alert_type == AlertType.RSI_OVERSOLD:
+            return ticker, "below", float(conditions.get("threshold", 30))
+        
+        if rule.alert_type == AlertType.RSI_OVERBOUGHT:
+            return ticker, "above", float(conditions.get("threshold", 70))
+        
+        if rule.alert_type in SCREENING_ALERT_TYPES:
+            return AlertRuleIndex.ANY_TICKER, "above", float(conditions.get("min_score", 0))
+        
+        return None
+    
+    def add(self, rule: AlertRule) -> None:
+        """Add or replace a rule."""
+        self.remove(rule.rule_id)
+        self.rules[rule.rule_id] = rule
+        self._user_rules.setdefault(rule.user_id, set()).add(rule.rule_id)
+        
+        if not rule.enabled:
+            return
+        
+        try:
+            entry = self._threshold_entry(rule)
+        except (TypeError, ValueError):
+            logger.warning(f"Alert rule {rule.rule_id} has invalid conditions")
+            return
+        
+        if entry is not None:
+            ticker, direction, threshold = entry
+            group = (rule.alert_type, ticker, direction)
+            item = (threshold, rule.rule_id)
+            insort(self._thresholds.setdefault(group, []), item)
+            self._rule_groups[rule.rule_id] = (group, item)
+    
+    def remove(self, rule_id: str) -> None:
+        """Remove a rule if present."""
+        rule = self.rules.pop(rule_id, None)
+        if rule is None:
+            return
+        
+        self._user_rules.get(rule.user_id, set()).discard(rule_id)
+        indexed = self._rule_groups.pop(rule_id, None)
+        if indexed is not None:
+            group, item = indexed
+            entries = self._thresholds[group]
+            entries.pop(bisect_left(entries, item))
+            if not entries:
+                del self._thresholds[group]
+    
+    def replace_user_rules(self, user_id: str, rules: list[AlertRule]) -> None:
+        """Replace every rule owned by a user."""
+        for rule_id in list(self._user_rules.get(user_id, ())):
+            self.remove(rule_id)
+        for rule in rules:
+            self.add(rule)
+    
+    def match(
+        self,
+        alert_type: AlertType,
+        value: float,
+        ticker: str | None = None,
+    ) -> list[AlertRule]:
+        """
+        Find enabled rules of a type triggered by a value.
+        
+        Args:
+            alert_type: Alert type to match
+            value: Observed price, RSI or score
+            ticker: Ticker the value belongs to (None matches only
+                rules that apply to any ticker)
+        
+        Returns:
+            Triggered rules
+        """
+        tickers = [self.ANY_TICKER]
+        if ticker:
+            tickers.append(ticker.upper())
+        
+        matched = []
+        for key in tickers:
+            above = self._thresholds.get((alert_type, key, "above"))
+            if above:
+                matched.extend(above[: bisect_right(above, value, key=_threshold_key)])
+            below = self._thresholds.get((alert_type, key, "below"))
+            if below:
+                matched.extend(below[bisect_left(below, value, key=_threshold_key):])
+        
+        return [self.rules[rule_id] for _, rule_id in matched]
+
+
+# Rule indexes shared by every AlertService on the same Redis client
+_shared_rule_indexes: "weakref.WeakKeyDictionary[Redis, AlertRuleIndex]" = (
+    weakref.WeakKeyDictionary()
+)
+_rule_index_locks: "weakref.WeakKeyDictionary[Redis, asyncio.Lock]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _rule_index_build_lock(redis_client: Redis) -> asyncio.Lock:
+    lock = _rule_index_locks.get(redis_client)
+    if lock is None:
+        lock = _rule_index_locks[redis_client] = asyncio.Lock()
+    return lock
+
+
 # ============================================
 # Alert Service
 # ============================================
@@ -191,6 +373,7 @@ class AlertService:
     STREAM_KEY = "alerts:stream:{user_id}"
     COOLDOWN_KEY = "alerts:cooldown:{rule_id}"
     UNREAD_COUNT_KEY = "alerts:unread:{user_id}"
+    RULE_CHANGES_CHANNEL = "alerts:rules:changes"
     
     # Limits
     MAX_RULES_PER_USER = 20
@@ -203,6 +386,9 @@ class AlertService:
         llm_api_key: str | None = None,
     ):
         self.redis = redis_client
+        self.repository = (
+            RedisDocumentRepository(redis_client) if redis_client else None
+        )
         self.llm_api_key = llm_api_key
         self._monitoring_tasks: dict[str, asyncio.Task] = {}
     
@@ -239,12 +425,12 @@ class AlertService:
         )
         
         # Store rule
-        rules_key = self.RULES_KEY.format(user_id=user_id)
-        await self.redis.hset(
-            rules_key,
+        await self.repository.hash_put(
+            self.RULES_KEY.format(user_id=user_id),
             rule.rule_id,
-            json.dumps(self._rule_to_dict(rule)),
+            self._rule_to_dict(rule),
         )
+        await self._rule_changed(user_id, rule)
         
         logger.info(f"Created alert rule {rule.rule_id} for user {user_id}")
         return rule
@@ -254,31 +440,24 @@ class AlertService:
         if not self.redis:
             return []
         
-        rules_key = self.RULES_KEY.format(user_id=user_id)
-        rules_data = await self.redis.hgetall(rules_key)
-        
-        rules = []
-        for rule_json in rules_data.values():
-            try:
-                rule_dict = json.loads(rule_json)
-                rules.append(self._rule_from_dict(rule_dict))
-            except Exception as e:
-                logger.warning(f"Failed to parse rule: {e}")
-        
-        return rules
+        rules_data = await self.repository.hash_get_all(
+            self.RULES_KEY.format(user_id=user_id)
+        )
+        return self._parse_rules(rules_data.values())
     
     async def get_rule(self, user_id: str, rule_id: str) -> AlertRule | None:
         """Get a specific rule."""
         if not self.redis:
             return None
         
-        rules_key = self.RULES_KEY.format(user_id=user_id)
-        rule_json = await self.redis.hget(rules_key, rule_id)
+        rule_dict = await self.repository.hash_get(
+            self.RULES_KEY.format(user_id=user_id), rule_id
+        )
         
-        if not rule_json:
+        if not rule_dict:
             return None
         
-        return self._rule_from_dict(json.loads(rule_json))
+        return self._rule_from_dict(rule_dict)
     
     async def update_rule(
         self,
@@ -302,12 +481,12 @@ class AlertService:
         rule.updated_at = datetime.now(UTC)
         
         # Save
-        rules_key = self.RULES_KEY.format(user_id=user_id)
-        await self.redis.hset(
-            rules_key,
+        await self.repository.hash_put(
+            self.RULES_KEY.format(user_id=user_id),
             rule_id,
-            json.dumps(self._rule_to_dict(rule)),
+            self._rule_to_dict(rule),
         )
+        await self._rule_changed(user_id, rule)
         
         return rule
     
@@ -316,15 +495,127 @@ class AlertService:
         if not self.redis:
             return False
         
-        rules_key = self.RULES_KEY.format(user_id=user_id)
-        deleted = await self.redis.hdel(rules_key, rule_id)
-        return deleted > 0
+        deleted = await self.repository.hash_delete(
+            self.RULES_KEY.format(user_id=user_id), rule_id
+        )
+        if deleted:
+            await self._rule_changed(user_id, rule_id=rule_id)
+        return deleted
     
     async def toggle_rule(self, user_id: str, rule_id: str, enabled: bool) -> bool:
         """Enable or disable a rule."""
         rule = await self.update_rule(user_id, rule_id, {"enabled": enabled})
         return rule is not None
     
+    # ================================
+    # Rule Index
+    # ================================
+    
+    async def get_rule_index(self, refresh: bool = False) -> AlertRuleIndex:
+        """
+        Get the rule index shared by services on this Redis client.
+        
+        The index is built from every user's rules (one SCAN plus one
+        pipelined HGETALL round trip), kept current by this process's rule
+        updates and rebuilt once it is older than RULE_INDEX_TTL_SECONDS.
+        Run listen_for_rule_changes() to apply other replicas' updates
+        immediately.
+        """
+        index = _shared_rule_indexes.get(self.redis) if self.redis else None
+        if index is not None and not refresh and not index.is_stale():
+            return index
+        
+        if not self.redis:
+            return AlertRuleIndex()
+        
+        async with _rule_index_build_lock(self.redis):
+            index = _shared_rule_indexes.get(self.redis)
+            if index is not None and not refresh and not index.is_stale():
+                return index
+            
+            rebuilt = AlertRuleIndex()
+            rule_keys = await self.repository.scan_keys(
+                self.RULES_KEY.format(user_id="*")
+            )
+            for rules_data in await self.repository.hash_get_all_many(rule_keys):
+                for rule in self._parse_rules(rules_data.values()):
+                    rebuilt.add(rule)
+            
+            _shared_rule_indexes[self.redis] = rebuilt
+            logger.info(f"Built alert rule index with {len(rebuilt)} rules")
+            return rebuilt
+    
+    async def listen_for_rule_changes(self) -> None:
+        """
+        Keep the shared rule index in sync with rule changes made elsewhere.
+        
+        Long-running; start it as a background task. Each change message
+        carries a user id whose rules are reloaded from Redis. Whenever the
+        subscription ends, it is re-established after a backoff delay.
+        """
+        if not self.redis:
+            return
+        
+        delay = RULE_LISTENER_MIN_BACKOFF_SECONDS
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                await pubsub.subscribe(self.RULE_CHANGES_CHANNEL)
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    delay = RULE_LISTENER_MIN_BACKOFF_SECONDS
+                    user_id = message["data"]
+                    if isinstance(user_id, bytes):
+                        user_id = user_id.decode()
+                    await self._reload_user_rules(user_id)
+                logger.warning("Alert rule change subscription ended")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Alert rule change subscription lost: {e}")
+            finally:
+                # Changes may have been missed; rebuild the index on next use
+                _shared_rule_indexes.pop(self.redis, None)
+                try:
+                    await pubsub.unsubscribe(self.RULE_CHANGES_CHANNEL)
+                    await pubsub.close()
+                except Exception:
+                    pass
+            
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RULE_LISTENER_MAX_BACKOFF_SECONDS)
+    
+    async def _reload_user_rules(self, user_id: str) -> None:
+        """Reload one user's rules into the shared index."""
+        index = _shared_rule_indexes.get(self.redis)
+        if index is None:
+            return
+        
+        rules_data = await self.repository.hash_get_all(
+            self.RULES_KEY.format(user_id=user_id)
+        )
+        index.replace_user_rules(user_id, self._parse_rules(rules_data.values()))
+    
+    async def _rule_changed(
+        self,
+        user_id: str,
+        rule: AlertRule | None = None,
+        rule_id: str | None = None,
+    ) -> None:
+        """Apply a rule change to the local index and notify other replicas."""
+        index = _shared_rule_indexes.get(self.redis)
+        if index is not None:
+            if rule is not None:
+                index.add(rule)
+            elif rule_id is not None:
+                index.remove(rule_id)
+        
+        try:
+            await self.redis.publish(self.RULE_CHANGES_CHANNEL, user_id)
+        except Exception as e:
+            logger.warning(f"Failed to publish alert rule change: {e}")
+    
     # ================================
     # Alert Triggering
     # ================================
@@ -357,16 +648,8 @@ class AlertService:
                 logger.debug(f"Rule {rule_id} in cooldown, skipping alert")
                 raise ValueError("Alert in cooldown period")
         
-        # Generate AI insight if enabled
-        ai_insight = None
-        if generate_insight and ticker:
-            ai_insight = await self._generate_alert_insight(
-                alert_type=alert_type,
-                ticker=ticker,
-                data=data or {},
-            )
+        rule = await self.get_rule(user_id, rule_id) if rule_id else None
         
-        # Create alert
         alert = Alert(
             alert_id=str(uuid4()),
             user_id=user_id,
@@ -377,37 +660,120 @@ class AlertService:
             message=message,
             ticker=ticker,
             data=data or {},
-            ai_insight=ai_insight,
         )
+        return await self._deliver_alert(
+            alert,
+            cooldown_minutes=rule.cooldown_minutes if rule else None,
+            generate_insight=generate_insight,
+        )
+    
+    async def _deliver_alert(
+        self,
+        alert: Alert,
+        cooldown_minutes: int | None = None,
+        generate_insight: bool = True,
+    ) -> Alert:
+        """Store, count and publish an alert, starting the rule cooldown."""
+        # Generate AI insight if enabled
+        if generate_insight and alert.ticker:
+            alert.ai_insight = await self._generate_alert_insight(
+                alert_type=alert.alert_type,
+                ticker=alert.ticker,
+                data=alert.data,
+            )
+        
+        user_id = alert.user_id
+        alert_json = json.dumps(alert.to_dict())
+        
+        # Write history, unread count, stream and cooldown in one round trip
+        pipe = self.redis.pipeline(transaction=False)
         
         # Store in history
         alerts_key = self.ALERTS_KEY.format(user_id=user_id)
-        await self.redis.lpush(alerts_key, json.dumps(alert.to_dict()))
-        await self.redis.ltrim(alerts_key, 0, self.MAX_ALERTS_HISTORY - 1)
-        await self.redis.expire(alerts_key, self.ALERT_TTL_DAYS * 86400)
+        pipe.lpush(alerts_key, alert_json)
+        pipe.ltrim(alerts_key, 0, self.MAX_ALERTS_HISTORY - 1)
+        pipe.expire(alerts_key, self.ALERT_TTL_DAYS * 86400)
         
         # Increment unread count
-        unread_key = self.UNREAD_COUNT_KEY.format(user_id=user_id)
-        await self.redis.incr(unread_key)
+        pipe.incr(self.UNREAD_COUNT_KEY.format(user_id=user_id))
         
         # Publish to SSE stream
-        stream_key = self.STREAM_KEY.format(user_id=user_id)
-        await self.redis.publish(stream_key, json.dumps(alert.to_dict()))
+        pipe.publish(self.STREAM_KEY.format(user_id=user_id), alert_json)
         
         # Set cooldown if rule-based
-        if rule_id:
-            rule = await self.get_rule(user_id, rule_id)
-            if rule:
-                cooldown_key = self.COOLDOWN_KEY.format(rule_id=rule_id)
-                await self.redis.setex(
-                    cooldown_key,
-                    rule.cooldown_minutes * 60,
-                    "1",
-                )
+        if alert.rule_id and cooldown_minutes is not None:
+            pipe.setex(
+                self.COOLDOWN_KEY.format(rule_id=alert.rule_id),
+                cooldown_minutes * 60,
+                "1",
+            )
+        
+        await pipe.execute()
         
-        logger.info(f"Triggered alert {alert.alert_id} for user {user_id}: {title}")
+        logger.info(f"Triggered alert {alert.alert_id} for user {user_id}: {alert.title}")
         return alert
     
+    async def _trigger_matches(
+        self,
+        matches: list[tuple[AlertRule, dict]],
+    ) -> list[Alert]:
+        """
+        Trigger alerts for matched rules in bulk.
+        
+        Cooldowns for all matched rules are checked in one pipelined round
+        trip; each rule fires at most once per batch. At most
+        ALERT_DELIVERY_CONCURRENCY alerts are delivered at a time, and a
+        failed delivery is logged and left out of the result.
+        
+        Args:
+            matches: (rule, alert fields) pairs
+        
+        Returns:
+            Triggered alerts
+        """
+        if not matches or not self.redis:
+            return []
+        
+        rule_ids = list(dict.fromkeys(rule.rule_id for rule, _ in matches))
+        pipe = self.redis.pipeline(transaction=False)
+        for rule_id in rule_ids:
+            pipe.exists(self.COOLDOWN_KEY.format(rule_id=rule_id))
+        cooling = {
+            rule_id
+            for rule_id, in_cooldown in zip(rule_ids, await pipe.execute())
+            if in_cooldown
+        }
+        
+        semaphore = asyncio.Semaphore(ALERT_DELIVERY_CONCURRENCY)
+        
+        async def deliver(alert: Alert, cooldown_minutes: int) -> Alert:
+            async with semaphore:
+                return await self._deliver_alert(
+                    alert, cooldown_minutes=cooldown_minutes
+                )
+        
+        pending = []
+        fired = set(cooling)
+        for rule, fields in matches:
+            if rule.rule_id in fired:
+                continue
+            fired.add(rule.rule_id)
+            alert = Alert(
+                alert_id=str(uuid4()),
+                user_id=rule.user_id,
+                rule_id=rule.rule_id,
+                **fields,
+            )
+            pending.append(deliver(alert, rule.cooldown_minutes))
+        
+        alerts = []
+        for result in await asyncio.gather(*pending, return_exceptions=True):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to deliver alert: {result}")
+            else:
+                alerts.append(result)
+        return alerts
+    
     # ================================
     # Alert History
     # ================================
@@ -549,66 +915,160 @@ class AlertService:
     # Screening Monitors
     # ================================
     
-    async def check_maverick_alerts(
+    async def evaluate_screening_diff(
         self,
-        user_id: str,
         current_results: list[dict],
-        previous_results: list[dict] | None = None,
+        previous_results: list[dict] | None,
+        alert_type: AlertType = AlertType.NEW_MAVERICK_STOCK,
+        user_id: str | None = None,
     ) -> list[Alert]:
         """
-        Check for new Maverick stocks and trigger alerts.
+        Trigger screening alerts for stocks new to a screen, for all users.
         
-        Compares current screening results with previous to find new entries.
+        Args:
+            current_results: Latest screening results
+            previous_results: Results from the previous run
+            alert_type: Screening alert type (maverick, bear or breakout)
+            user_id: Only evaluate this user's rules
+        
+        Returns:
+            Triggered alerts
         """
         if not previous_results:
             return []
         
-        # Get user's rules for maverick alerts
-        rules = await self.get_rules(user_id)
-        maverick_rules = [
-            r for r in rules
-            if r.alert_type == AlertType.NEW_MAVERICK_STOCK and r.enabled
-        ]
-        
-        if not maverick_rules:
+        previous_tickers = {r["ticker"] for r in previous_results}
+        new_stocks = [s for s in current_results if s["ticker"] not in previous_tickers]
+        if not new_stocks:
             return []
         
-        # Find new stocks
-        previous_tickers = {r["ticker"] for r in previous_results}
-        new_stocks = [
-            s for s in current_results
-            if s["ticker"] not in previous_tickers
-        ]
+        index = await self.get_rule_index()
+        screen = SCREENING_ALERT_TYPES.get(alert_type, alert_type.value)
+        title_prefix = {
+            AlertType.NEW_MAVERICK_STOCK: "New Maverick Stock",
+            AlertType.NEW_BEAR_STOCK: "New Bear Stock",
+            AlertType.NEW_BREAKOUT: "New Breakout",
+        }.get(alert_type, "New Screening Result")
         
-        alerts = []
+        matches = []
         for stock in new_stocks:
-            for rule in maverick_rules:
-                # Check conditions
-                min_score = rule.conditions.get("min_score", 0)
-                if stock.get("score", 0) < min_score:
+            for rule in index.match(alert_type, stock.get("score") or 0):
+                if user_id is not None and rule.user_id != user_id:
                     continue
                 
                 sectors = rule.conditions.get("sectors", [])
                 if sectors and stock.get("sector") not in sectors:
                     continue
                 
-                try:
-                    alert = await self.trigger_alert(
-                        user_id=user_id,
-                        alert_type=AlertType.NEW_MAVERICK_STOCK,
-                        title=f"New Maverick Stock: {stock['ticker']}",
-                        message=f"{stock.get('name', stock['ticker'])} added to Maverick screen with score {stock.get('score', 'N/A')}",
-                        ticker=stock["ticker"],
-                        data=stock,
-                        rule_id=rule.rule_id,
-                        priority=rule.priority,
+                matches.append((rule, {
+                    "alert_type": alert_type,
+                    "priority": rule.priority,
+                    "title": f"{title_prefix}: {stock['ticker']}",
+                    "message": f"{stock.get('name', stock['ticker'])} added to {screen} screen with score {stock.get('score', 'N/A')}",
+                    "ticker": stock["ticker"],
+                    "data": stock,
+                }))
+        
+        return await self._trigger_matches(matches)
+    
+    async def evaluate_rsi_tick(
+        self,
+        rsi_values: dict[str, float],
+        user_id: str | None = None,
+    ) -> list[Alert]:
+        """
+        Trigger RSI oversold/overbought alerts for a batch of readings.
+        
+        Args:
+            rsi_values: Ticker -> latest RSI
+            user_id: Only evaluate this user's rules
+        
+        Returns:
+            Triggered alerts
+        """
+        index = await self.get_rule_index()
+        
+        matches = []
+        for ticker, rsi_value in rsi_values.items():
+            for alert_type, label, verb, side in (
+                (AlertType.RSI_OVERSOLD, "Oversold", "dropped to", "below"),
+                (AlertType.RSI_OVERBOUGHT, "Overbought", "rose to", "above"),
+            ):
+                for rule in index.match(alert_type, rsi_value, ticker):
+                    if user_id is not None and rule.user_id != user_id:
+                        continue
+                    
+                    threshold = rule.conditions.get(
+                        "threshold", 30 if alert_type == AlertType.RSI_OVERSOLD else 70
                     )
-                    alerts.append(alert)
-                except ValueError:
-                    # Cooldown
-                    pass
+                    matches.append((rule, {
+                        "alert_type": alert_type,
+                        "priority": rule.priority,
+                        "title": f"RSI {label}: {ticker}",
+                        "message": f"{ticker} RSI {verb} {rsi_value:.1f} ({side} {threshold})",
+                        "ticker": ticker,
+                        "data": {"rsi": rsi_value, "threshold": threshold},
+                    }))
         
-        return alerts
+        return await self._trigger_matches(matches)
+    
+    async def evaluate_price_tick(
+        self,
+        prices: dict[str, float],
+        user_id: str | None = None,
+    ) -> list[Alert]:
+        """
+        Trigger price target alerts for a batch of prices.
+        
+        Args:
+            prices: Ticker -> latest price
+            user_id: Only evaluate this user's rules
+        
+        Returns:
+            Triggered alerts
+        """
+        index = await self.get_rule_index()
+        
+        matches = []
+        for ticker, current_price in prices.items():
+            for rule in index.match(AlertType.PRICE_TARGET_HIT, current_price, ticker):
+                if user_id is not None and rule.user_id != user_id:
+                    continue
+                
+                target_price = rule.conditions.get("target_price")
+                direction = rule.conditions.get("direction", "above")
+                matches.append((rule, {
+                    "alert_type": AlertType.PRICE_TARGET_HIT,
+                    "priority": AlertPriority.HIGH,
+                    "title": f"Price Target Hit: {ticker}",
+                    "message": f"{ticker} reached ${current_price:.2f} ({direction} ${target_price:.2f})",
+                    "ticker": ticker,
+                    "data": {
+                        "current_price": current_price,
+                        "target_price": target_price,
+                        "direction": direction,
+                    },
+                }))
+        
+        return await self._trigger_matches(matches)
+    
+    async def check_maverick_alerts(
+        self,
+        user_id: str,
+        current_results: list[dict],
+        previous_results: list[dict] | None = None,
+    ) -> list[Alert]:
+        """
+        Check for new Maverick stocks and trigger alerts.
+        
+        Compares current screening results with previous to find new entries.
+        """
+        return await self.evaluate_screening_diff(
+            current_results,
+            previous_results,
+            AlertType.NEW_MAVERICK_STOCK,
+            user_id=user_id,
+        )
     
     async def check_rsi_alerts(
         self,
@@ -617,49 +1077,8 @@ class AlertService:
         rsi_value: float,
     ) -> Alert | None:
         """Check RSI thresholds and trigger alert if needed."""
-        rules = await self.get_rules(user_id)
-        
-        for rule in rules:
-            if not rule.enabled:
-                continue
-            
-            # Check RSI oversold
-            if rule.alert_type == AlertType.RSI_OVERSOLD:
-                threshold = rule.conditions.get("threshold", 30)
-                if rsi_value <= threshold:
-                    try:
-                        return await self.trigger_alert(
-                            user_id=user_id,
-                            alert_type=AlertType.RSI_OVERSOLD,
-                            title=f"RSI Oversold: {ticker}",
-                            message=f"{ticker} RSI dropped to {rsi_value:.1f} (below {threshold})",
-                            ticker=ticker,
-                            data={"rsi": rsi_value, "threshold": threshold},
-                            rule_id=rule.rule_id,
-                            priority=rule.priority,
-                        )
-                    except ValueError:
-                        pass
-            
-            # Check RSI overbought
-            elif rule.alert_type == AlertType.RSI_OVERBOUGHT:
-                threshold = rule.conditions.get("threshold", 70)
-                if rsi_value >= threshold:
-                    try:
-                        return await self.trigger_alert(
-                            user_id=user_id,
-                            alert_type=AlertType.RSI_OVERBOUGHT,
-                            title=f"RSI Overbought: {ticker}",
-                            message=f"{ticker} RSI rose to {rsi_value:.1f} (above {threshold})",
-                            ticker=ticker,
-                            data={"rsi": rsi_value, "threshold": threshold},
-                            rule_id=rule.rule_id,
-                            priority=rule.priority,
-                        )
-                    except ValueError:
-                        pass
-        
-        return None
+        alerts = await self.evaluate_rsi_tick({ticker: rsi_value}, user_id=user_id)
+        return alerts[0] if alerts else None
     
     async def check_price_target_alert(
         self,
@@ -668,46 +1087,8 @@ class AlertService:
         current_price: float,
     ) -> Alert | None:
         """Check if price target has been hit."""
-        rules = await self.get_rules(user_id)
-        
-        for rule in rules:
-            if rule.alert_type != AlertType.PRICE_TARGET_HIT or not rule.enabled:
-                continue
-            
-            if rule.conditions.get("ticker", "").upper() != ticker.upper():
-                continue
-            
-            target_price = rule.conditions.get("target_price")
-            direction = rule.conditions.get("direction", "above")
-            
-            if not target_price:
-                continue
-            
-            hit = (
-                (direction == "above" and current_price >= target_price) or
-                (direction == "below" and current_price <= target_price)
-            )
-            
-            if hit:
-                try:
-                    return await self.trigger_alert(
-                        user_id=user_id,
-                        alert_type=AlertType.PRICE_TARGET_HIT,
-                        title=f"Price Target Hit: {ticker}",
-                        message=f"{ticker} reached ${current_price:.2f} ({direction} ${target_price:.2f})",
-                        ticker=ticker,
-                        data={
-                            "current_price": current_price,
-                            "target_price": target_price,
-                            "direction": direction,
-                        },
-                        rule_id=rule.rule_id,
-                        priority=AlertPriority.HIGH,
-                    )
-                except ValueError:
-                    pass
-        
-        return None
+        alerts = await self.evaluate_price_tick({ticker: current_price}, user_id=user_id)
+        return alerts[0] if alerts else None
     
     # ================================
     # AI Insight Generation
@@ -789,6 +1170,16 @@ class AlertService:
     # Helpers
     # ================================
     
+    def _parse_rules(self, rule_dicts) -> list[AlertRule]:
+        """Parse stored rules, skipping invalid ones."""
+        rules = []
+        for rule_dict in rule_dicts:
+            try:
+                rules.append(self._rule_from_dict(rule_dict))
+            except Exception as e:
+                logger.warning(f"Failed to parse rule: {e}")
+        return rules
+    
     def _rule_to_dict(self, rule: AlertRule) -> dict:
         """Convert rule to dictionary."""
         return {
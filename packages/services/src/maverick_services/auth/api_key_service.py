@@ -4,6 +4,7 @@ API Key service for managing programmatic access.
 Handles API key creation, validation, and revocation.
 """
 
+import asyncio
 from datetime import datetime, timedelta, UTC
 from uuid import UUID
 import secrets
@@ -96,7 +97,7 @@ class APIKeyService:
         full_key, key_prefix = self._generate_key()
         
         # Hash the key for storage
-        key_hash = self._hasher.hash(full_key)
+        key_hash = await asyncio.to_thread(self._hasher.hash, full_key)
         
         # Calculate expiration
         expires_at = None
@@ -253,7 +254,7 @@ class APIKeyService:
             return None
         
         # Verify hash
-        if not self._hasher.verify(full_key, api_key.key_hash):
+        if not await asyncio.to_thread(self._hasher.verify, full_key, api_key.key_hash):
             return None
         
         # Update last used
@@ -4,6 +4,7 @@ Password reset service.
 Handles password reset token generation, validation, and password updates.
 """
 
+import asyncio
 import secrets
 import hashlib
 import logging
@@ -209,7 +210,7 @@ class PasswordResetService:
             raise NotFoundError("User not found")
         
         # Update password
-        user.password_hash = password_hasher.hash(new_password)
+        user.password_hash = await asyncio.to_thread(password_hasher.hash, new_password)
         user.updated_at = datetime.now(UTC)
         
         # Mark token as used
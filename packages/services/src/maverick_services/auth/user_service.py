@@ -4,6 +4,7 @@ User service for authentication operations.
 Handles user registration, authentication, and profile management.
 """
 
+import asyncio
 from datetime import datetime, UTC
 from uuid import UUID
 import logging
@@ -85,7 +86,7 @@ class UserService:
             raise ConflictError(f"Email {email} is already registered")
         
         # Hash password
-        password_hash = self._hasher.hash(password)
+        password_hash = await asyncio.to_thread(self._hasher.hash, password)
         
         # Create user
         user = User(
@@ -151,12 +152,12 @@ class UserService:
             raise AuthenticationError("Account is deactivated")
         
         # Verify password
-        if not self._hasher.verify(password, user.password_hash):
+        if not await asyncio.to_thread(self._hasher.verify, password, user.password_hash):
             raise AuthenticationError("Invalid email or password")
         
         # Check if password needs rehash (security upgrade)
         if self._hasher.needs_rehash(user.password_hash):
-            user.password_hash = self._hasher.hash(password)
+            user.password_hash = await asyncio.to_thread(self._hasher.hash, password)
             await self._db.commit()
             logger.info(f"Rehashed password for user {email}")
         
@@ -276,11 +277,11 @@ class UserService:
             raise NotFoundError(f"User {user_id} not found")
         
         # Verify current password
-        if not self._hasher.verify(current_password, user.password_hash):
+        if not await asyncio.to_thread(self._hasher.verify, current_password, user.password_hash):
             raise AuthenticationError("Current password is incorrect")
         
         # Hash and set new password
-        user.password_hash = self._hasher.hash(new_password)
+        user.password_hash = await asyncio.to_thread(self._hasher.hash, new_password)
         user.updated_at = datetime.now(UTC)
         
         await self._db.commit()
@@ -4,7 +4,6 @@ Custom Screener Service.
 Allows users to define, save, and run custom stock screening criteria.
 """
 
-import json
 import logging
 from collections.abc import Callable
 from dataclasses import dataclass, field
@@ -14,6 +13,15 @@ from uuid import uuid4
 
 from redis.asyncio import Redis
 
+from maverick_services.document_repository import RedisDocumentRepository
+from maverick_services.screener_engine import (
+    DEFAULT_UNIVERSE_KEY,
+    UniverseSnapshot,
+    compile_conditions,
+    get_universe_snapshot,
+    select_top,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -324,6 +332,9 @@ class CustomScreenerService:
         redis_client: Redis | None = None,
     ):
         self.redis = redis_client
+        self.repository = (
+            RedisDocumentRepository(redis_client) if redis_client else None
+        )
     
     # ================================
     # Screener CRUD
@@ -367,11 +378,13 @@ class CustomScreenerService:
             max_results=min(max_results, 100),
         )
         
-        await self._save_screener(screener)
-        
-        # Add to user's screener index
-        screeners_key = self.SCREENERS_KEY.format(user_id=user_id)
-        await self.redis.sadd(screeners_key, screener.screener_id)
+        # Save and add to user's screener index in one round trip
+        await self.repository.put(
+            self._screener_key(screener.screener_id),
+            screener.to_dict(),
+            index_keys=[self.SCREENERS_KEY.format(user_id=user_id)],
+            member=screener.screener_id,
+        )
         
         logger.info(f"Created screener {screener.screener_id} for user {user_id}")
         return screener
@@ -381,14 +394,14 @@ class CustomScreenerService:
         if not self.redis:
             return []
         
-        screeners_key = self.SCREENERS_KEY.format(user_id=user_id)
-        screener_ids = await self.redis.smembers(screeners_key)
-        
-        screeners = []
-        for scr_id in screener_ids:
-            screener = await self.get_screener(user_id, scr_id)
-            if screener:
-                screeners.append(screener)
+        documents = await self.repository.load_index(
+            self.SCREENERS_KEY.format(user_id=user_id), self._screener_key
+        )
+        screeners = [
+            screener
+            for screener in map(CustomScreener.from_dict, documents)
+            if screener.user_id == user_id or screener.is_public
+        ]
         
         # Sort by name
         screeners.sort(key=lambda s: s.name.lower())
@@ -399,13 +412,12 @@ class CustomScreenerService:
         if not self.redis:
             return None
         
-        screener_key = self.SCREENER_KEY.format(screener_id=screener_id)
-        data = await self.redis.get(screener_key)
+        data = await self.repository.get(self._screener_key(screener_id))
         
         if not data:
             return None
         
-        screener = CustomScreener.from_dict(json.loads(data))
+        screener = CustomScreener.from_dict(data)
         
         # Verify ownership (unless public)
         if screener.user_id != user_id and not screener.is_public:
@@ -461,17 +473,15 @@ class CustomScreenerService:
         if not screener or screener.user_id != user_id:
             return False
         
-        # Delete from Redis
-        screener_key = self.SCREENER_KEY.format(screener_id=screener_id)
-        await self.redis.delete(screener_key)
-        
-        # Remove from user's index
-        screeners_key = self.SCREENERS_KEY.format(user_id=user_id)
-        await self.redis.srem(screeners_key, screener_id)
-        
-        # Delete cached results
-        results_key = self.RESULTS_KEY.format(screener_id=screener_id)
-        await self.redis.delete(results_key)
+        # Delete screener and cached results, and remove from user's index
+        await self.repository.delete(
+            [
+                self._screener_key(screener_id),
+                self.RESULTS_KEY.format(screener_id=screener_id),
+            ],
+            index_keys=[self.SCREENERS_KEY.format(user_id=user_id)],
+            member=screener_id,
+        )
         
         logger.info(f"Deleted screener {screener_id}")
         return True
@@ -506,12 +516,17 @@ class CustomScreenerService:
         user_id: str,
         screener_id: str,
         stock_data_fetcher: Callable | None = None,
+        snapshot: UniverseSnapshot | None = None,
+        universe_key: str = DEFAULT_UNIVERSE_KEY,
     ) -> ScreenerResult:
         """
         Run a screener against the stock universe.
         
         stock_data_fetcher should be an async function that returns
-        a list of stock data dicts with all filterable fields.
+        a list of stock data dicts with all filterable fields. Its result is
+        cached as a shared columnar snapshot under universe_key, so
+        consecutive runs (across users and screeners) reuse one fetch. A
+        prebuilt snapshot can be passed instead.
         """
         import time
         start_time = time.time()
@@ -520,26 +535,24 @@ class CustomScreenerService:
         if not screener:
             raise ValueError("Screener not found")
         
-        # Fetch stock data
-        if stock_data_fetcher:
-            stocks = await stock_data_fetcher()
-        else:
-            # Placeholder - would integrate with actual data service
-            stocks = []
-        
-        # Apply filters
-        filtered = self._apply_filters(stocks, screener.conditions)
-        
-        # Sort results
-        if screener.sort_by:
-            sort_field = screener.sort_by.value
-            filtered.sort(
-                key=lambda s: s.get(sort_field, 0) or 0,
-                reverse=screener.sort_descending,
-            )
-        
-        # Limit results
-        filtered = filtered[:screener.max_results]
+        # Columnar stock universe
+        if snapshot is None:
+            if stock_data_fetcher:
+                snapshot = await get_universe_snapshot(stock_data_fetcher, universe_key)
+            else:
+                # Placeholder - would integrate with actual data service
+                snapshot = UniverseSnapshot.from_records([])
+        
+        # Apply filters as vectorized masks, then select the top matches
+        mask = compile_conditions(screener.conditions).evaluate(snapshot)
+        top = select_top(
+            snapshot,
+            mask,
+            limit=screener.max_results,
+            sort_by=screener.sort_by.value if screener.sort_by else None,
+            descending=screener.sort_descending,
+        )
+        filtered = snapshot.rows(top)
         
         execution_time = int((time.time() - start_time) * 1000)
         
@@ -552,21 +565,20 @@ class CustomScreenerService:
             screener_id=screener_id,
             run_at=datetime.now(UTC),
             stocks=filtered,
-            total_matches=len(filtered),
+            total_matches=int(mask.sum()),
             execution_time_ms=execution_time,
         )
         
         # Cache results
-        if self.redis:
-            results_key = self.RESULTS_KEY.format(screener_id=screener_id)
-            await self.redis.setex(
-                results_key,
-                3600,  # 1 hour TTL
-                json.dumps({
+        if self.repository:
+            await self.repository.put(
+                self.RESULTS_KEY.format(screener_id=screener_id),
+                {
                     "run_at": result.run_at.isoformat(),
                     "stocks": result.stocks,
                     "total_matches": result.total_matches,
-                }),
+                },
+                ttl=3600,  # 1 hour TTL
             )
         
         return result
@@ -585,13 +597,13 @@ class CustomScreenerService:
         if not screener:
             return None
         
-        results_key = self.RESULTS_KEY.format(screener_id=screener_id)
-        data = await self.redis.get(results_key)
+        cached = await self.repository.get(
+            self.RESULTS_KEY.format(screener_id=screener_id)
+        )
         
-        if not data:
+        if not cached:
             return None
         
-        cached = json.loads(data)
         return ScreenerResult(
             screener_id=screener_id,
             run_at=datetime.fromisoformat(cached["run_at"]),
@@ -640,75 +652,25 @@ class CustomScreenerService:
         if not conditions:
             return stocks
         
-        filtered = []
-        for stock in stocks:
-            if self._matches_conditions(stock, conditions):
-                filtered.append(stock)
-        
-        return filtered
-    
-    def _matches_conditions(
-        self,
-        stock: dict,
-        conditions: list[FilterCondition],
-    ) -> bool:
-        """Check if stock matches all conditions (AND logic)."""
-        for condition in conditions:
-            value = stock.get(condition.field.value)
-            if value is None:
-                return False
-            
-            if not self._evaluate_condition(value, condition):
-                return False
-        
-        return True
-    
-    def _evaluate_condition(
-        self,
-        value: float | str,
-        condition: FilterCondition,
-    ) -> bool:
-        """Evaluate a single condition."""
-        op = condition.operator
-        cond_value = condition.value
-        
-        try:
-            if op == FilterOperator.EQUALS:
-                return value == cond_value
-            elif op == FilterOperator.NOT_EQUALS:
-                return value != cond_value
-            elif op == FilterOperator.GREATER_THAN:
-                return float(value) > float(cond_value)
-            elif op == FilterOperator.GREATER_OR_EQUAL:
-                return float(value) >= float(cond_value)
-            elif op == FilterOperator.LESS_THAN:
-                return float(value) < float(cond_value)
-            elif op == FilterOperator.LESS_OR_EQUAL:
-                return float(value) <= float(cond_value)
-            elif op == FilterOperator.BETWEEN:
-                return float(condition.value) <= float(value) <= float(condition.value2)
-            elif op == FilterOperator.IN:
-                return value in cond_value
-            elif op == FilterOperator.NOT_IN:
-                return value not in cond_value
-            elif op == FilterOperator.CONTAINS:
-                return str(cond_value).lower() in str(value).lower()
-        except (TypeError, ValueError):
-            return False
-        
-        return False
+        snapshot = UniverseSnapshot.from_records(stocks)
+        mask = compile_conditions(conditions).evaluate(snapshot)
+        return snapshot.rows(mask.nonzero()[0])
     
     # ================================
     # Helpers
     # ================================
     
+    def _screener_key(self, screener_id: str) -> str:
+        return self.SCREENER_KEY.format(screener_id=screener_id)
+    
     async def _save_screener(self, screener: CustomScreener) -> None:
         """Save screener to Redis."""
-        if not self.redis:
+        if not self.repository:
             raise RuntimeError("Redis not available")
         
-        screener_key = self.SCREENER_KEY.format(screener_id=screener.screener_id)
-        await self.redis.set(screener_key, json.dumps(screener.to_dict()))
+        await self.repository.put(
+            self._screener_key(screener.screener_id), screener.to_dict()
+        )
 
 
 # ============================================
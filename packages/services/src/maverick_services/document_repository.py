@@ -0,0 +1,278 @@
+"""
+Redis Document Repository.
+
+Shared persistence layer for the Redis-backed user services (watchlists,
+theses, alert rules, custom screeners). Documents are plain dicts stored as
+msgpack, loaded in bulk with pipelined ``MGET``/``HGETALL`` and written in
+batched pipelines, so listing a user's documents costs one or two round trips
+instead of one per document.
+
+Documents written as JSON by earlier versions are still readable; they are
+rewritten as msgpack the next time they are saved.
+"""
+
+import json
+import logging
+from collections.abc import Callable, Iterable, Sequence
+
+from redis.asyncio import Redis
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - msgpack is a declared dependency
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+# MGET chunk size to keep individual commands bounded
+MGET_CHUNK_SIZE = 500
+
+
+def encode_document(document: dict) -> bytes:
+    """
+    Encode a document for storage.
+
+    Args:
+        document: JSON-compatible dictionary
+
+    Returns:
+        msgpack bytes (UTF-8 JSON if msgpack is unavailable)
+    """
+    if msgpack is not None:
+        return msgpack.packb(document, use_bin_type=True)
+    return json.dumps(document).encode()
+
+
+def decode_document(raw: bytes | str | None) -> dict | None:
+    """
+    Decode a stored document written as msgpack or legacy JSON.
+
+    Args:
+        raw: Value returned by Redis
+
+    Returns:
+        Decoded document, or None if missing or undecodable
+    """
+    if raw is None:
+        return None
+
+    try:
+        if isinstance(raw, str):
+            return json.loads(raw)
+        # JSON documents start with "{"; msgpack maps never do
+        if raw[:1] == b"{" or msgpack is None:
+            return json.loads(raw)
+        return msgpack.unpackb(raw, raw=False)
+    except Exception as e:
+        logger.warning(f"Failed to decode stored document: {e}")
+        return None
+
+
+def _member_to_str(member: bytes | str) -> str:
+    return member.decode() if isinstance(member, bytes) else member
+
+
+def _decode_hash(raw: dict | None) -> dict[str, dict]:
+    documents = {}
+    for field, value in (raw or {}).items():
+        doc = decode_document(value)
+        if doc is not None:
+            documents[_member_to_str(field)] = doc
+    return documents
+
+
+class RedisDocumentRepository:
+    """
+    Bulk document access over a Redis client.
+
+    Works with clients created with ``decode_responses=False`` (binary
+    values); index members are always returned as ``str``.
+    """
+
+    def __init__(self, redis_client: Redis):
+        self.redis = redis_client
+
+    # ================================
+    # Reads
+    # ================================
+
+    async def get(self, key: str) -> dict | None:
+        """Load a single document."""
+        return decode_document(await self.redis.get(key))
+
+    async def get_many(self, keys: Sequence[str]) -> list[dict | None]:
+        """
+        Load documents with pipelined ``MGET``.
+
+        Args:
+            keys: Document keys
+
+        Returns:
+            Documents in key order (None for missing keys)
+        """
+        if not keys:
+            return []
+
+        pipe = self.redis.pipeline(transaction=False)
+        for i in range(0, len(keys), MGET_CHUNK_SIZE):
+            pipe.mget(keys[i : i + MGET_CHUNK_SIZE])
+        chunks = await pipe.execute()
+
+        return [decode_document(raw) for chunk in chunks for raw in chunk]
+
+    async def members(self, index_key: str) -> list[str]:
+        """Get the ids stored in a set index."""
+        return [_member_to_str(m) for m in await self.redis.smembers(index_key)]
+
+    async def load_index(
+        self,
+        index_key: str,
+        key_for_id: Callable[[str], str],
+    ) -> list[dict]:
+        """
+        Load every document referenced by a set index (two round trips).
+
+        Args:
+            index_key: Set holding document ids
+            key_for_id: Maps a document id to its key
+
+        Returns:
+            Documents that still exist
+        """
+        ids = await self.members(index_key)
+        documents = await self.get_many([key_for_id(doc_id) for doc_id in ids])
+        return [doc for doc in documents if doc is not None]
+
+    async def hash_get(self, hash_key: str, field: str) -> dict | None:
+        """Load a single document stored in a hash field."""
+        return decode_document(await self.redis.hget(hash_key, field))
+
+    async def hash_get_all(self, hash_key: str) -> dict[str, dict]:
+        """Load every document stored in a hash."""
+        return _decode_hash(await self.redis.hgetall(hash_key))
+
+    async def hash_get_all_many(
+        self, hash_keys: Sequence[str]
+    ) -> list[dict[str, dict]]:
+        """
+        Load several hashes of documents with one pipelined round trip.
+
+        Args:
+            hash_keys: Hash keys
+
+        Returns:
+            Field -> document mappings in key order
+        """
+        if not hash_keys:
+            return []
+
+        pipe = self.redis.pipeline(transaction=False)
+        for hash_key in hash_keys:
+            pipe.hgetall(hash_key)
+        return [_decode_hash(raw) for raw in await pipe.execute()]
+
+    async def scan_keys(self, pattern: str, count: int = 500) -> list[str]:
+        """Find keys matching a pattern with incremental ``SCAN``."""
+        return [
+            _member_to_str(key)
+            async for key in self.redis.scan_iter(match=pattern, count=count)
+        ]
+
+    # ================================
+    # Writes
+    # ================================
+
+    async def put(
+        self,
+        key: str,
+        document: dict,
+        index_keys: Iterable[str] = (),
+        member: str | None = None,
+        ttl: int | None = None,
+    ) -> None:
+        """
+        Save a document and add it to set indexes in one round trip.
+
+        Args:
+            key: Document key
+            document: Document to store
+            index_keys: Set indexes to add ``member`` to
+            member: Document id for the indexes
+            ttl: Optional expiry in seconds
+        """
+        await self.put_many(
+            [(key, document)], ttl=ttl, index_keys=index_keys, member=member
+        )
+
+    async def put_many(
+        self,
+        items: Sequence[tuple[str, dict]],
+        ttl: int | None = None,
+        index_keys: Iterable[str] = (),
+        member: str | None = None,
+    ) -> None:
+        """
+        Save several documents in one pipelined round trip.
+
+        Args:
+            items: (key, document) pairs
+            ttl: Optional expiry in seconds applied to every document
+            index_keys: Set indexes to add ``member`` to
+            member: Document id for the indexes
+        """
+        if not items:
+            return
+
+        pipe = self.redis.pipeline(transaction=False)
+        for key, document in items:
+            pipe.set(key, encode_document(document), ex=ttl)
+        if member is not None:
+            for index_key in index_keys:
+                pipe.sadd(index_key, member)
+        await pipe.execute()
+
+    async def delete(
+        self,
+        keys: Iterable[str],
+        index_keys: Iterable[str] = (),
+        member: str | None = None,
+    ) -> None:
+        """
+        Delete documents and remove a member from set indexes in one round trip.
+
+        Args:
+            keys: Keys to delete
+            index_keys: Set indexes to remove ``member`` from
+            member: Document id for the indexes
+        """
+        pipe = self.redis.pipeline(transaction=False)
+        keys = list(keys)
+        if keys:
+            pipe.delete(*keys)
+        if member is not None:
+            for index_key in index_keys:
+                pipe.srem(index_key, member)
+        await pipe.execute()
+
+    async def hash_put_many(self, hash_key: str, documents: dict[str, dict]) -> None:
+        """Save several documents into hash fields with one ``HSET``."""
+        if documents:
+            await self.redis.hset(
+                hash_key,
+                mapping={f: encode_document(d) for f, d in documents.items()},
+            )
+
+    async def hash_put(self, hash_key: str, field: str, document: dict) -> None:
+        """Save a document into a hash field."""
+        await self.hash_put_many(hash_key, {field: document})
+
+    async def hash_delete(self, hash_key: str, field: str) -> bool:
+        """Delete a hash field, returning whether it existed."""
+        return bool(await self.redis.hdel(hash_key, field))
+
+
+__all__ = [
+    "RedisDocumentRepository",
+    "decode_document",
+    "encode_document",
+]
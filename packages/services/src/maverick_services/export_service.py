@@ -1,14 +1,22 @@
 """
 Export Service.
 
-Handles data export in multiple formats (CSV, PDF, Excel).
+Handles data export in multiple formats (CSV, JSON, Parquet).
+
+Exports are produced as a stream of encoded chunks built from lazily
+generated rows, so large exports can be sent with a streaming response
+(optionally gzip-compressed) while only one chunk of rows is held in memory.
 """
 
 import csv
+import importlib.util
 import io
 import json
 import logging
-from dataclasses import dataclass
+import textwrap
+import zlib
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from dataclasses import dataclass, field
 from datetime import datetime, UTC
 from decimal import Decimal
 from enum import Enum
@@ -16,6 +24,12 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Rows encoded per streamed chunk (and per Parquet row group)
+EXPORT_CHUNK_ROWS = 500
+
+# Parquet exports need the optional pyarrow dependency (the "parquet" extra)
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
 
 # ============================================
 # Enums and Types
@@ -27,6 +41,7 @@ class ExportFormat(Enum):
     
     CSV = "csv"
     JSON = "json"
+    PARQUET = "parquet"  # Requires pyarrow
     # PDF and Excel require additional libraries
     # PDF = "pdf"
     # EXCEL = "xlsx"
@@ -69,6 +84,17 @@ class ExportResult:
     generated_at: datetime
 
 
+@dataclass
+class ExportStream:
+    """A streamed export; iterate ``chunks`` to produce the file."""
+    
+    chunks: AsyncIterator[bytes]
+    filename: str
+    content_type: str
+    compressed: bool = False
+    generated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+
 # ============================================
 # Export Service
 # ============================================
@@ -91,7 +117,9 @@ class ExportService:
     CONTENT_TYPES = {
         ExportFormat.CSV: "text/csv",
         ExportFormat.JSON: "application/json",
+        ExportFormat.PARQUET: "application/vnd.apache.parquet",
     }
+    GZIP_CONTENT_TYPE = "application/gzip"
     
     def __init__(self):
         pass
@@ -126,27 +154,76 @@ class ExportService:
         if isinstance(data, dict):
             data = [data]
         
-        # Generate export based on format
-        if format == ExportFormat.CSV:
-            content = self._export_csv(data, config)
-        elif format == ExportFormat.JSON:
-            content = self._export_json(data, config)
-        else:
-            raise ValueError(f"Unsupported format: {format}")
-        
-        # Generate filename
-        timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
-        extension = format.value
-        filename = f"{export_type.value}_{timestamp}.{extension}"
+        content = b"".join([
+            chunk async for chunk in self._encode(data, format, config)
+        ])
         
         return ExportResult(
             content=content,
-            filename=filename,
+            filename=self._default_filename(export_type, format),
             content_type=self.CONTENT_TYPES[format],
             row_count=len(data),
             generated_at=datetime.now(UTC),
         )
     
+    def stream(
+        self,
+        export_type: ExportType,
+        rows: Iterable[dict] | AsyncIterable[dict],
+        format: ExportFormat = ExportFormat.CSV,
+        filename: str | None = None,
+        compress: bool = False,
+        config: ExportConfig | None = None,
+    ) -> ExportStream:
+        """
+        Stream an export chunk by chunk.
+        
+        Rows are consumed lazily (sync or async iterables), encoded
+        EXPORT_CHUNK_ROWS at a time and optionally gzip-compressed, so
+        memory use does not grow with the export size.
+        
+        Args:
+            export_type: Type of data being exported
+            rows: Rows to export, e.g. from one of the ``*_rows`` builders
+            format: Output format
+            filename: Download filename (defaults to type and timestamp)
+            compress: Gzip the stream (ignored for Parquet, which is
+                already compressed)
+            config: Export configuration options
+        
+        Returns:
+            ExportStream whose chunks can be sent with a StreamingResponse
+        """
+        if config is None:
+            config = ExportConfig(export_type=export_type, format=format)
+        if format not in self.CONTENT_TYPES:
+            raise ValueError(f"Unsupported format: {format}")
+        
+        if format == ExportFormat.PARQUET:
+            _require_pyarrow()
+        
+        filename = filename or self._default_filename(export_type, format)
+        chunks = self._encode(rows, format, config)
+        compress = compress and format != ExportFormat.PARQUET
+        
+        if compress:
+            return ExportStream(
+                chunks=self._gzip(chunks),
+                filename=f"{filename}.gz",
+                content_type=self.GZIP_CONTENT_TYPE,
+                compressed=True,
+            )
+        
+        return ExportStream(
+            chunks=chunks,
+            filename=filename,
+            content_type=self.CONTENT_TYPES[format],
+        )
+    
+    def _default_filename(self, export_type: ExportType, format: ExportFormat) -> str:
+        timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
+        return f"{export_type.value}_{timestamp}.{format.value}"
+    
     # ================================
     # Portfolio Export
     # ================================
@@ -163,11 +240,31 @@ class ExportService:
         Columns: Ticker, Shares, Cost Basis, Current Price, Market Value,
                  Unrealized P&L, P&L %, Sector
         """
-        # Transform positions to export format
-        export_data = []
+        export_data = list(self.portfolio_rows(positions, include_summary))
+        
+        config = ExportConfig(
+            export_type=ExportType.PORTFOLIO,
+            format=format,
+        )
+        
+        return await self.export(ExportType.PORTFOLIO, export_data, format, config)
+    
+    def portfolio_rows(
+        self,
+        positions: Iterable[dict],
+        include_summary: bool = True,
+    ) -> Iterator[dict]:
+        """Yield portfolio export rows, followed by an optional total row."""
+        total_cost = 0
+        total_value = 0
+        has_rows = False
         
         for pos in positions:
-            export_data.append({
+            has_rows = True
+            total_cost += pos.get("cost_basis", 0) or 0
+            total_value += pos.get("market_value", 0) or 0
+            
+            yield {
                 "Ticker": pos.get("ticker", ""),
                 "Shares": self._format_number(pos.get("shares", 0), 4),
                 "Cost Basis": self._format_currency(pos.get("cost_basis", 0)),
@@ -177,16 +274,14 @@ class ExportService:
                 "Unrealized P&L": self._format_currency(pos.get("unrealized_pl", 0)),
                 "P&L %": self._format_percent(pos.get("unrealized_pl_pct", 0)),
                 "Sector": pos.get("sector", ""),
-            })
+            }
         
         # Add summary row if requested
-        if include_summary and export_data:
-            total_cost = sum(p.get("cost_basis", 0) or 0 for p in positions)
-            total_value = sum(p.get("market_value", 0) or 0 for p in positions)
+        if include_summary and has_rows:
             total_pl = total_value - total_cost
             total_pl_pct = (total_pl / total_cost * 100) if total_cost else 0
             
-            export_data.append({
+            yield {
                 "Ticker": "TOTAL",
                 "Shares": "",
                 "Cost Basis": self._format_currency(total_cost),
@@ -196,14 +291,7 @@ class ExportService:
                 "Unrealized P&L": self._format_currency(total_pl),
                 "P&L %": self._format_percent(total_pl_pct),
                 "Sector": "",
-            })
-        
-        config = ExportConfig(
-            export_type=ExportType.PORTFOLIO,
-            format=format,
-        )
-        
-        return await self.export(ExportType.PORTFOLIO, export_data, format, config)
+            }
     
     # ================================
     # Watchlist Export
@@ -221,18 +309,7 @@ class ExportService:
         Columns: Ticker, Added Date, Notes, Target Price, Stop Price,
                  Current Price, Price Change %
         """
-        export_data = []
-        
-        for item in items:
-            export_data.append({
-                "Ticker": item.get("ticker", ""),
-                "Added Date": self._format_date(item.get("added_at")),
-                "Notes": item.get("notes", ""),
-                "Target Price": self._format_currency(item.get("target_price")),
-                "Stop Price": self._format_currency(item.get("stop_price")),
-                "Current Price": self._format_currency(item.get("current_price")),
-                "Price Change %": self._format_percent(item.get("price_change_pct")),
-            })
+        export_data = list(self.watchlist_rows(items))
         
         config = ExportConfig(
             export_type=ExportType.WATCHLIST,
@@ -241,10 +318,27 @@ class ExportService:
         )
         
         result = await self.export(ExportType.WATCHLIST, export_data, format, config)
-        result.filename = f"watchlist_{watchlist_name.lower().replace(' ', '_')}_{datetime.now(UTC).strftime('%Y%m%d')}.{format.value}"
+        result.filename = self.watchlist_filename(watchlist_name, format)
         
         return result
     
+    def watchlist_rows(self, items: Iterable[dict]) -> Iterator[dict]:
+        """Yield watchlist export rows."""
+        for item in items:
+            yield {
+                "Ticker": item.get("ticker", ""),
+                "Added Date": self._format_date(item.get("added_at")),
+                "Notes": item.get("notes", ""),
+                "Target Price": self._format_currency(item.get("target_price")),
+                "Stop Price": self._format_currency(item.get("stop_price")),
+                "Current Price": self._format_currency(item.get("current_price")),
+                "Price Change %": self._format_percent(item.get("price_change_pct")),
+            }
+    
+    def watchlist_filename(self, watchlist_name: str, format: ExportFormat) -> str:
+        """Download filename for a watchlist export."""
+        return f"watchlist_{watchlist_name.lower().replace(' ', '_')}_{datetime.now(UTC).strftime('%Y%m%d')}.{format.value}"
+    
     # ================================
     # Screening Results Export
     # ================================
@@ -260,29 +354,7 @@ class ExportService:
         
         Dynamic columns based on available data.
         """
-        if not results:
-            export_data = [{"Message": "No results"}]
-        else:
-            # Get all unique keys from results
-            all_keys = set()
-            for result in results:
-                all_keys.update(result.keys())
-            
-            # Order keys: ticker first, then alphabetical
-            ordered_keys = ["ticker"] if "ticker" in all_keys else []
-            ordered_keys.extend(sorted(k for k in all_keys if k != "ticker"))
-            
-            export_data = []
-            for result in results:
-                row = {}
-                for key in ordered_keys:
-                    value = result.get(key)
-                    # Format based on type
-                    if isinstance(value, float):
-                        row[key] = self._format_number(value, 2)
-                    else:
-                        row[key] = value if value is not None else ""
-                export_data.append(row)
+        export_data = list(self.screening_rows(results))
         
         config = ExportConfig(
             export_type=ExportType.SCREENING_RESULTS,
@@ -291,11 +363,41 @@ class ExportService:
         )
         
         result = await self.export(ExportType.SCREENING_RESULTS, export_data, format, config)
-        safe_name = screener_name.lower().replace(" ", "_")[:30]
-        result.filename = f"screen_{safe_name}_{datetime.now(UTC).strftime('%Y%m%d')}.{format.value}"
+        result.filename = self.screening_filename(screener_name, format)
         
         return result
     
+    def screening_rows(self, results: list[dict]) -> Iterator[dict]:
+        """Yield screening export rows with a column for every result key."""
+        if not results:
+            yield {"Message": "No results"}
+            return
+        
+        # Get all unique keys from results
+        all_keys = set()
+        for result in results:
+            all_keys.update(result.keys())
+        
+        # Order keys: ticker first, then alphabetical
+        ordered_keys = ["ticker"] if "ticker" in all_keys else []
+        ordered_keys.extend(sorted(k for k in all_keys if k != "ticker"))
+        
+        for result in results:
+            row = {}
+            for key in ordered_keys:
+                value = result.get(key)
+                # Format based on type
+                if isinstance(value, float):
+                    row[key] = self._format_number(value, 2)
+                else:
+                    row[key] = value if value is not None else ""
+            yield row
+    
+    def screening_filename(self, screener_name: str, format: ExportFormat) -> str:
+        """Download filename for a screening results export."""
+        safe_name = screener_name.lower().replace(" ", "_")[:30]
+        return f"screen_{safe_name}_{datetime.now(UTC).strftime('%Y%m%d')}.{format.value}"
+    
     # ================================
     # Tax Report Export
     # ================================
@@ -312,8 +414,21 @@ class ExportService:
         Columns: Date Acquired, Date Sold, Ticker, Shares, Cost Basis,
                  Proceeds, Gain/Loss, Term (Short/Long)
         """
-        export_data = []
+        export_data = list(self.tax_report_rows(transactions))
+        
+        config = ExportConfig(
+            export_type=ExportType.TAX_REPORT,
+            format=format,
+            options={"year": year},
+        )
+        
+        result = await self.export(ExportType.TAX_REPORT, export_data, format, config)
+        result.filename = f"tax_report_{year}.{format.value}"
         
+        return result
+    
+    def tax_report_rows(self, transactions: Iterable[dict]) -> Iterator[dict]:
+        """Yield tax report rows followed by the gains/losses summary."""
         total_short_term = 0
         total_long_term = 0
         
@@ -326,7 +441,7 @@ class ExportService:
             else:
                 total_short_term += gain_loss
             
-            export_data.append({
+            yield {
                 "Date Acquired": self._format_date(tx.get("acquired_date")),
                 "Date Sold": self._format_date(tx.get("sold_date")),
                 "Ticker": tx.get("ticker", ""),
@@ -335,61 +450,26 @@ class ExportService:
                 "Proceeds": self._format_currency(tx.get("proceeds", 0)),
                 "Gain/Loss": self._format_currency(gain_loss),
                 "Term": "Long-term" if is_long_term else "Short-term",
-            })
+            }
         
         # Add summary
-        export_data.append({})  # Empty row
-        export_data.append({
-            "Date Acquired": "SUMMARY",
-            "Date Sold": "",
-            "Ticker": "",
-            "Shares": "",
-            "Cost Basis": "",
-            "Proceeds": "",
-            "Gain/Loss": "",
-            "Term": "",
-        })
-        export_data.append({
-            "Date Acquired": "Short-term Gains/Losses:",
-            "Date Sold": "",
-            "Ticker": "",
-            "Shares": "",
-            "Cost Basis": "",
-            "Proceeds": "",
-            "Gain/Loss": self._format_currency(total_short_term),
-            "Term": "",
-        })
-        export_data.append({
-            "Date Acquired": "Long-term Gains/Losses:",
-            "Date Sold": "",
-            "Ticker": "",
-            "Shares": "",
-            "Cost Basis": "",
-            "Proceeds": "",
-            "Gain/Loss": self._format_currency(total_long_term),
-            "Term": "",
-        })
-        export_data.append({
-            "Date Acquired": "Total Gains/Losses:",
-            "Date Sold": "",
-            "Ticker": "",
-            "Shares": "",
-            "Cost Basis": "",
-            "Proceeds": "",
-            "Gain/Loss": self._format_currency(total_short_term + total_long_term),
-            "Term": "",
-        })
-        
-        config = ExportConfig(
-            export_type=ExportType.TAX_REPORT,
-            format=format,
-            options={"year": year},
-        )
-        
-        result = await self.export(ExportType.TAX_REPORT, export_data, format, config)
-        result.filename = f"tax_report_{year}.{format.value}"
-        
-        return result
+        yield {}  # Empty row
+        for label, gain_loss in (
+            ("SUMMARY", None),
+            ("Short-term Gains/Losses:", total_short_term),
+            ("Long-term Gains/Losses:", total_long_term),
+            ("Total Gains/Losses:", total_short_term + total_long_term),
+        ):
+            yield {
+                "Date Acquired": label,
+                "Date Sold": "",
+                "Ticker": "",
+                "Shares": "",
+                "Cost Basis": "",
+                "Proceeds": "",
+                "Gain/Loss": "" if gain_loss is None else self._format_currency(gain_loss),
+                "Term": "",
+            }
     
     # ================================
     # Trade Journal Export
@@ -405,10 +485,19 @@ class ExportService:
         
         Columns: Date, Ticker, Action, Shares, Price, Thesis, Outcome, Notes
         """
-        export_data = []
+        export_data = list(self.trade_journal_rows(trades))
         
+        config = ExportConfig(
+            export_type=ExportType.TRADE_JOURNAL,
+            format=format,
+        )
+        
+        return await self.export(ExportType.TRADE_JOURNAL, export_data, format, config)
+    
+    def trade_journal_rows(self, trades: Iterable[dict]) -> Iterator[dict]:
+        """Yield trade journal export rows."""
         for trade in trades:
-            export_data.append({
+            yield {
                 "Date": self._format_date(trade.get("date")),
                 "Ticker": trade.get("ticker", ""),
                 "Action": trade.get("action", ""),  # BUY/SELL
@@ -418,14 +507,7 @@ class ExportService:
                 "Thesis": trade.get("thesis", ""),
                 "Outcome": trade.get("outcome", ""),
                 "Notes": trade.get("notes", ""),
-            })
-        
-        config = ExportConfig(
-            export_type=ExportType.TRADE_JOURNAL,
-            format=format,
-        )
-        
-        return await self.export(ExportType.TRADE_JOURNAL, export_data, format, config)
+            }
     
     # ================================
     # Stock Analysis Export
@@ -462,28 +544,105 @@ class ExportService:
     # Format Exporters
     # ================================
     
-    def _export_csv(self, data: list[dict], config: ExportConfig) -> bytes:
-        """Export data as CSV."""
-        if not data:
-            return b""
-        
-        output = io.StringIO()
-        
-        # Get headers from first row
-        headers = list(data[0].keys())
-        
-        writer = csv.DictWriter(output, fieldnames=headers)
-        
-        if config.include_headers:
-            writer.writeheader()
+    async def _encode(
+        self,
+        rows: Iterable[dict] | AsyncIterable[dict],
+        format: ExportFormat,
+        config: ExportConfig,
+    ) -> AsyncIterator[bytes]:
+        """Encode rows into chunks of the requested format."""
+        batches = _batched(rows, EXPORT_CHUNK_ROWS)
         
-        writer.writerows(data)
+        if format == ExportFormat.CSV:
+            encoder = self._export_csv
+        elif format == ExportFormat.JSON:
+            encoder = self._export_json
+        elif format == ExportFormat.PARQUET:
+            encoder = self._export_parquet
+        else:
+            raise ValueError(f"Unsupported format: {format}")
         
-        return output.getvalue().encode("utf-8")
+        async for chunk in encoder(batches, config):
+            if chunk:
+                yield chunk
+    
+    async def _export_csv(
+        self,
+        batches: AsyncIterator[list[dict]],
+        config: ExportConfig,
+    ) -> AsyncIterator[bytes]:
+        """Export data as CSV."""
+        output = io.StringIO()
+        writer = None
+        
+        async for batch in batches:
+            if writer is None:
+                # Get headers from first (non-empty) row
+                first = next((row for row in batch if row), batch[0])
+                writer = csv.DictWriter(output, fieldnames=list(first.keys()))
+                if config.include_headers:
+                    writer.writeheader()
+            
+            writer.writerows(batch)
+            yield output.getvalue().encode("utf-8")
+            output.seek(0)
+            output.truncate()
+    
+    async def _export_json(
+        self,
+        batches: AsyncIterator[list[dict]],
+        config: ExportConfig,
+    ) -> AsyncIterator[bytes]:
+        """Export data as a JSON array (same layout as ``indent=2``)."""
+        separator = "[\n"
+        async for batch in batches:
+            items = ",\n".join(
+                textwrap.indent(json.dumps(row, indent=2, default=str), "  ")
+                for row in batch
+            )
+            yield f"{separator}{items}".encode("utf-8")
+            separator = ",\n"
+        
+        yield b"[]" if separator == "[\n" else b"\n]"
     
-    def _export_json(self, data: list[dict], config: ExportConfig) -> bytes:
-        """Export data as JSON."""
-        return json.dumps(data, indent=2, default=str).encode("utf-8")
+    async def _export_parquet(
+        self,
+        batches: AsyncIterator[list[dict]],
+        config: ExportConfig,
+    ) -> AsyncIterator[bytes]:
+        """Export data as Parquet, one row group per batch."""
+        pa, pq = _require_pyarrow()
+        
+        sink = _ChunkSink()
+        writer = None
+        schema = None
+        
+        try:
+            async for batch in batches:
+                table = _arrow_table(pa, batch, schema)
+                if writer is None:
+                    schema = table.schema
+                    writer = pq.ParquetWriter(pa.PythonFile(sink, mode="w"), schema)
+                writer.write_table(table)
+                yield sink.drain()
+        finally:
+            if writer is not None:
+                writer.close()
+        
+        if writer is None:
+            # Parquet needs a schema; an empty export has no columns
+            empty = pa.table({})
+            pq.write_table(empty, pa.PythonFile(sink, mode="w"))
+        yield sink.drain()
+    
+    async def _gzip(self, chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        """Gzip-compress a chunk stream."""
+        compressor = zlib.compressobj(wbits=31)  # gzip container
+        async for chunk in chunks:
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
     
     # ================================
     # Formatters
@@ -519,6 +678,114 @@ class ExportService:
         return value.strftime("%Y-%m-%d")
 
 
+# ============================================
+# Streaming Helpers
+# ============================================
+
+
+def _require_pyarrow() -> tuple[Any, Any]:
+    """Import pyarrow, which Parquet exports need."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ValueError(
+            "Parquet export requires pyarrow (pip install maverick-services[parquet])"
+        ) from e
+    return pa, pq
+
+
+async def _batched(
+    rows: Iterable[dict] | AsyncIterable[dict],
+    size: int,
+) -> AsyncIterator[list[dict]]:
+    """Group sync or async rows into lists of ``size``."""
+    batch = []
+    if isinstance(rows, AsyncIterable):
+        async for row in rows:
+            batch.append(row)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+    else:
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+def _arrow_table(pa: Any, batch: list[dict], schema: Any | None) -> Any:
+    """
+    Build an Arrow table for one batch.
+    
+    Missing values (None or the "" the row builders emit) become nulls in
+    every batch, so a column typed by the first batch stays valid for the
+    rest. Columns with no values in the first batch, or with mixed types,
+    are stored as text.
+    """
+    rows = [
+        {k: None if isinstance(v, str) and not v else v for k, v in row.items()}
+        for row in batch
+    ]
+    try:
+        table = pa.Table.from_pylist(rows, schema=schema)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        if schema is None:
+            columns = list(dict.fromkeys(key for row in rows for key in row))
+            schema = pa.schema([(name, pa.string()) for name in columns])
+        text_fields = {f.name for f in schema if pa.types.is_string(f.type)}
+        normalized = [
+            {
+                k: str(v) if k in text_fields and v is not None else v
+                for k, v in row.items()
+            }
+            for row in rows
+        ]
+        return pa.Table.from_pylist(normalized, schema=schema)
+    
+    if schema is None and any(pa.types.is_null(f.type) for f in table.schema):
+        table = table.cast(pa.schema([
+            f.with_type(pa.string()) if pa.types.is_null(f.type) else f
+            for f in table.schema
+        ]))
+    return table
+
+
+class _ChunkSink:
+    """Write-only file that hands written bytes back in chunks."""
+    
+    closed = False
+    
+    def __init__(self):
+        self._buffer = bytearray()
+        self._position = 0
+    
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        self._position += len(data)
+        return len(data)
+    
+    def tell(self) -> int:
+        return self._position
+    
+    def writable(self) -> bool:
+        return True
+    
+    def flush(self) -> None:
+        pass
+    
+    def close(self) -> None:
+        pass
+    
+    def drain(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
 # ============================================
 # Factory Function
 # ============================================
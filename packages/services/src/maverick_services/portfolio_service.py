@@ -4,11 +4,16 @@ Portfolio management service.
 Provides portfolio operations: add/remove positions, calculate P&L, performance metrics.
 """
 
+import asyncio
 from datetime import date, datetime, timedelta, UTC
 from decimal import Decimal
+import logging
 import math
 from typing import Protocol
 
+import numpy as np
+import pandas as pd
+
 from maverick_schemas.portfolio import (
     Position,
     PositionCreate,
@@ -24,6 +29,11 @@ from maverick_services.exceptions import (
     StockNotFoundError,
 )
 
+logger = logging.getLogger(__name__)
+
+# Concurrent historical fetches per performance request
+HISTORICAL_FETCH_CONCURRENCY = 8
+
 
 class PortfolioRepository(Protocol):
     """Protocol for portfolio data access."""
@@ -78,6 +88,74 @@ def _to_decimal(value: float | int | str | None) -> Decimal | None:
     return Decimal(str(value))
 
 
+def _float_to_decimal(value: float, places: int = 6) -> Decimal | None:
+    """Convert a computed float to Decimal (None for NaN)."""
+    if value is None or not math.isfinite(value):
+        return None
+    return Decimal(str(round(float(value), places)))
+
+
+def _performance_series(
+    prices: np.ndarray,
+    shares: np.ndarray,
+    fallback_prices: np.ndarray,
+    benchmark: np.ndarray,
+) -> dict[str, np.ndarray]:
+    """
+    Compute daily portfolio series from an aligned price matrix.
+
+    Missing (NaN) or zero prices are valued at the position's fallback price
+    (average cost). Returns are percentages; entries before the first
+    positive portfolio value / benchmark close are NaN.
+
+    Args:
+        prices: Closes, shape (days, positions)
+        shares: Shares held per position
+        fallback_prices: Price used when a close is missing
+        benchmark: Benchmark closes per day (NaN when missing)
+
+    Returns:
+        Dict of per-day arrays: value, daily_return, cumulative_return,
+        benchmark_return, drawdown
+    """
+    priced = np.where(np.isnan(prices) | (prices == 0), fallback_prices, prices)
+    value = priced @ shares
+
+    days = len(value)
+    cumulative = np.full(days, np.nan)
+    positive = np.flatnonzero(value > 0)
+    if positive.size:
+        first = positive[0]
+        initial = value[first]
+        cumulative[first:] = (value[first:] - initial) / initial * 100
+
+    daily = np.full(days, np.nan)
+    if days > 1:
+        prev = value[:-1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            daily[1:] = np.where(prev > 0, (value[1:] - prev) / prev * 100, np.nan)
+
+    benchmark_return = np.full(days, np.nan)
+    valid = np.flatnonzero(~np.isnan(benchmark) & (benchmark != 0))
+    if valid.size and benchmark[valid[0]] > 0:
+        initial_benchmark = benchmark[valid[0]]
+        benchmark_return = (benchmark - initial_benchmark) / initial_benchmark * 100
+        benchmark_return[: valid[0]] = np.nan
+        benchmark_return[benchmark == 0] = np.nan
+
+    running_max = np.maximum.accumulate(np.maximum(value, 0))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        drawdown = np.where(running_max > 0, (running_max - value) / running_max * 100, 0.0)
+
+    return {
+        "value": value,
+        "daily_return": daily,
+        "cumulative_return": cumulative,
+        "benchmark_return": benchmark_return,
+        "drawdown": drawdown,
+    }
+
+
 def _detect_market(ticker: str) -> Market:
     """Detect market from ticker."""
     ticker_upper = ticker.upper()
@@ -391,121 +469,69 @@ class PortfolioService:
                 period, start_date, end_date, benchmark
             )
 
-        # Get historical data for all positions and benchmark
+        # Fetch historical closes for all positions and the benchmark concurrently
         tickers = [p["ticker"] for p in positions_data]
-        all_tickers = tickers + [benchmark]
-
-        # Fetch historical data
-        historical_data = {}
-        for ticker in all_tickers:
-            try:
-                data = await self._historical_provider.get_historical(
-                    ticker, start_date, end_date
-                )
-                if data:
-                    historical_data[ticker] = {
-                        d["date"]: _to_decimal(d["close"]) for d in data
-                    }
-            except Exception:
-                continue
+        historical_data = await self._fetch_closes(
+            list(dict.fromkeys(tickers + [benchmark])), start_date, end_date
+        )
 
         if not historical_data:
             return self._generate_simulated_performance(
                 period, start_date, end_date, benchmark
             )
 
-        # Calculate daily portfolio values
-        data_points = []
-        dates_in_range = []
-        
         # Get all unique dates from benchmark (most liquid)
-        benchmark_data = historical_data.get(benchmark, {})
-        if benchmark_data:
-            dates_in_range = sorted(benchmark_data.keys())
+        benchmark_data = historical_data.get(benchmark)
+        if benchmark_data is not None:
+            dates_in_range = sorted(benchmark_data.index)
         else:
             # Generate date range
+            dates_in_range = []
             current = start_date
             while current <= end_date:
                 if current.weekday() < 5:  # Skip weekends
                     dates_in_range.append(current)
                 current += timedelta(days=1)
 
-        # Calculate positions at each date
-        initial_value = None
-        initial_benchmark = None
-        max_drawdown = Decimal("0")
-        max_value = Decimal("0")
-        max_drawdown_date = start_date
-
-        for i, d in enumerate(dates_in_range):
-            portfolio_value = Decimal("0")
-
-            # Calculate portfolio value at this date
-            for pos in positions_data:
-                ticker = pos["ticker"]
-                shares = Decimal(str(pos["shares"]))
-                
-                if ticker in historical_data:
-                    price = historical_data[ticker].get(d)
-                    if price:
-                        portfolio_value += shares * price
-                    else:
-                        # Use last known price or avg_cost
-                        avg_cost = Decimal(str(pos.get("avg_cost", 0)))
-                        portfolio_value += shares * avg_cost
-                else:
-                    # Fallback to cost basis
-                    avg_cost = Decimal(str(pos.get("avg_cost", 0)))
-                    portfolio_value += shares * avg_cost
-
-            # Get benchmark value
-            benchmark_value = benchmark_data.get(d)
-
-            # Set initial values
-            if initial_value is None and portfolio_value > 0:
-                initial_value = portfolio_value
-            if initial_benchmark is None and benchmark_value:
-                initial_benchmark = benchmark_value
-
-            # Calculate returns
-            daily_return = None
-            cumulative_return = None
-            benchmark_return = None
-
-            if initial_value and initial_value > 0:
-                cumulative_return = (
-                    (portfolio_value - initial_value) / initial_value * 100
-                )
-
-            if i > 0 and len(data_points) > 0:
-                prev_value = data_points[-1].portfolio_value
-                if prev_value and prev_value > 0:
-                    daily_return = (portfolio_value - prev_value) / prev_value * 100
-
-            if initial_benchmark and initial_benchmark > 0 and benchmark_value:
-                benchmark_return = (
-                    (benchmark_value - initial_benchmark) / initial_benchmark * 100
-                )
+        # Align closes into one (dates x positions) matrix
+        missing = np.full(len(dates_in_range), np.nan)
+        price_matrix = np.column_stack(
+            [
+                historical_data[ticker].reindex(dates_in_range).to_numpy(dtype=float)
+                if ticker in historical_data
+                else missing
+                for ticker in tickers
+            ]
+        ).reshape(len(dates_in_range), len(tickers))
+        shares = np.array([float(p["shares"]) for p in positions_data])
+        avg_costs = np.array([float(p.get("avg_cost", 0) or 0) for p in positions_data])
+        benchmark_closes = (
+            benchmark_data.reindex(dates_in_range).to_numpy(dtype=float)
+            if benchmark_data is not None
+            else np.full(len(dates_in_range), np.nan)
+        )
 
-            # Track max drawdown
-            if portfolio_value > max_value:
-                max_value = portfolio_value
-            if max_value > 0:
-                drawdown = (max_value - portfolio_value) / max_value * 100
-                if drawdown > max_drawdown:
-                    max_drawdown = drawdown
-                    max_drawdown_date = d
-
-            data_points.append(
-                PerformanceDataPoint(
-                    date=d,
-                    portfolio_value=portfolio_value,
-                    daily_return=daily_return,
-                    cumulative_return=cumulative_return,
-                    benchmark_value=benchmark_value,
-                    benchmark_return=benchmark_return,
-                )
+        series = _performance_series(price_matrix, shares, avg_costs, benchmark_closes)
+
+        # Convert to Decimal only at the output boundary
+        data_points = [
+            PerformanceDataPoint(
+                date=d,
+                portfolio_value=_float_to_decimal(value),
+                daily_return=_float_to_decimal(daily),
+                cumulative_return=_float_to_decimal(cumulative),
+                benchmark_value=_float_to_decimal(bench) if bench else None,
+                benchmark_return=_float_to_decimal(bench_return),
             )
+            for d, value, daily, cumulative, bench, bench_return in zip(
+                dates_in_range,
+                series["value"].tolist(),
+                series["daily_return"].tolist(),
+                series["cumulative_return"].tolist(),
+                benchmark_closes.tolist(),
+                series["benchmark_return"].tolist(),
+            )
+        ]
 
         # Calculate summary metrics
         total_return = Decimal("0")
@@ -514,32 +540,43 @@ class PortfolioService:
         alpha = None
         volatility = None
         sharpe_ratio = None
+        max_drawdown = Decimal("0")
+        max_drawdown_date = start_date
 
         if data_points:
+            values = series["value"]
+            positive = np.flatnonzero(values > 0)
+            if positive.size:
+                initial_value = values[positive[0]]
+                total_return_value = _float_to_decimal(values[-1] - initial_value)
+                total_return = _float_to_decimal(
+                    (values[-1] - initial_value) / initial_value * 100
+                )
+
             final_point = data_points[-1]
-            if initial_value and initial_value > 0:
-                total_return_value = final_point.portfolio_value - initial_value
-                total_return = total_return_value / initial_value * 100
-            
             if final_point.benchmark_return is not None:
                 final_benchmark_return = final_point.benchmark_return
                 alpha = total_return - final_benchmark_return
 
             # Calculate volatility (std dev of daily returns)
-            daily_returns = [
-                dp.daily_return for dp in data_points if dp.daily_return is not None
-            ]
+            daily_returns = series["daily_return"][~np.isnan(series["daily_return"])]
             if len(daily_returns) > 1:
-                mean_return = sum(daily_returns) / len(daily_returns)
-                variance = sum((r - mean_return) ** 2 for r in daily_returns) / len(daily_returns)
-                daily_vol = Decimal(str(math.sqrt(float(variance))))
-                volatility = daily_vol * Decimal(str(math.sqrt(252)))  # Annualized
+                mean_return = daily_returns.mean()
+                daily_vol = daily_returns.std()
+                annual_vol = daily_vol * math.sqrt(252)  # Annualized
+                volatility = _float_to_decimal(annual_vol)
 
                 # Sharpe ratio (assuming 0% risk-free rate)
-                if volatility > 0:
+                if annual_vol > 0:
                     # Annualize mean return
-                    annualized_return = mean_return * Decimal("252")
-                    sharpe_ratio = annualized_return / volatility
+                    sharpe_ratio = _float_to_decimal(mean_return * 252 / annual_vol)
+
+            # Track max drawdown
+            drawdown = series["drawdown"]
+            worst = int(np.argmax(drawdown))
+            if drawdown[worst] > 0:
+                max_drawdown = _float_to_decimal(drawdown[worst])
+                max_drawdown_date = dates_in_range[worst]
 
         return PortfolioPerformanceChart(
             period=period,
@@ -556,6 +593,51 @@ class PortfolioService:
             data=data_points,
         )
 
+    async def _fetch_closes(
+        self,
+        tickers: list[str],
+        start_date: date,
+        end_date: date,
+    ) -> dict[str, pd.Series]:
+        """
+        Fetch closing prices for several tickers concurrently.
+
+        Args:
+            tickers: Tickers to fetch
+            start_date: First date
+            end_date: Last date
+
+        Returns:
+            Ticker -> close series indexed by the provider's dates; tickers
+            that fail or return no data are omitted
+        """
+        semaphore = asyncio.Semaphore(HISTORICAL_FETCH_CONCURRENCY)
+
+        async def fetch(ticker: str) -> pd.Series | None:
+            async with semaphore:
+                try:
+                    data = await self._historical_provider.get_historical(
+                        ticker, start_date, end_date
+                    )
+                except Exception as e:
+                    logger.warning(f"Historical fetch failed for {ticker}: {e}")
+                    return None
+            if not data:
+                return None
+            closes = pd.Series(
+                [float(d["close"]) if d["close"] is not None else np.nan for d in data],
+                index=[d["date"] for d in data],
+            )
+            # Keep the last close per date, as a dict would
+            return closes[~closes.index.duplicated(keep="last")]
+
+        results = await asyncio.gather(*(fetch(ticker) for ticker in tickers))
+        return {
+            ticker: closes
+            for ticker, closes in zip(tickers, results)
+            if closes is not None
+        }
+
     def _generate_simulated_performance(
         self,
         period: str,
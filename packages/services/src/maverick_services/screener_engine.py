@@ -0,0 +1,351 @@
+"""
+Vectorized Screener Engine.
+
+Evaluates custom screener filter conditions against a columnar snapshot of
+the stock universe. A snapshot holds every ``FilterField`` value as a column;
+a screener's conditions are compiled once into a predicate that combines
+boolean masks over those columns, and top-N results are selected with
+``argpartition`` instead of sorting the whole universe.
+
+Snapshots are cached per named universe with a TTL and shared by every
+screener run (across users), so running many saved screeners costs one
+universe fetch.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from maverick_core.config.base import get_env_int
+
+if TYPE_CHECKING:
+    from maverick_services.custom_screener_service import FilterCondition
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SNAPSHOT_TTL_SECONDS = get_env_int("SCREENER_SNAPSHOT_TTL_SECONDS", 300)
+
+# Universe shared by screener runs that do not name one
+DEFAULT_UNIVERSE_KEY = "default"
+
+# Distinct universes whose snapshots are kept
+MAX_CACHED_SNAPSHOTS = 16
+
+Mask = Callable[["UniverseSnapshot"], np.ndarray]
+
+
+# ============================================
+# Universe Snapshot
+# ============================================
+
+
+@dataclass
+class UniverseSnapshot:
+    """Columnar view of the stock universe used by every screener run."""
+
+    records: list[dict]
+    frame: pd.DataFrame
+    built_at: float = field(default_factory=time.time)
+    _numeric: dict[str, np.ndarray] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_records(cls, stocks: Sequence[dict]) -> UniverseSnapshot:
+        """
+        Build a snapshot from stock data dicts.
+
+        Args:
+            stocks: Stock dicts keyed by ``FilterField`` values
+
+        Returns:
+            UniverseSnapshot over the given stocks
+        """
+        records = list(stocks)
+        frame = pd.DataFrame.from_records(records) if records else pd.DataFrame()
+        return cls(records=records, frame=frame)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def values(self, column: str) -> pd.Series:
+        """Raw column values (all-missing if the field is absent)."""
+        if column in self.frame.columns:
+            return self.frame[column]
+        return pd.Series([None] * len(self), dtype=object)
+
+    def numeric(self, column: str) -> np.ndarray:
+        """Column as float64, with missing or non-numeric cells as NaN."""
+        array = self._numeric.get(column)
+        if array is None:
+            series = self.values(column)
+            if series.dtype == object:
+                series = pd.to_numeric(series, errors="coerce")
+            array = series.to_numpy(dtype=float, na_value=np.nan)
+            self._numeric[column] = array
+        return array
+
+    def present(self, column: str) -> np.ndarray:
+        """Mask of rows where the column has a value."""
+        return self.values(column).notna().to_numpy()
+
+    def rows(self, indices: np.ndarray) -> list[dict]:
+        """Original stock dicts for the given row indices."""
+        return [self.records[i] for i in indices]
+
+
+_snapshot_cache: dict[str, UniverseSnapshot] = {}
+_snapshot_locks: dict[str, asyncio.Lock] = {}
+
+
+async def get_universe_snapshot(
+    fetcher: Callable[[], Awaitable[list[dict]]],
+    universe_key: str = DEFAULT_UNIVERSE_KEY,
+    ttl_seconds: int = DEFAULT_SNAPSHOT_TTL_SECONDS,
+) -> UniverseSnapshot:
+    """
+    Get the cached snapshot of a universe, fetching at most once per TTL.
+
+    The cache is keyed on ``universe_key``, not the fetcher, so per-request
+    fetchers for the same universe share one snapshot. Concurrent callers
+    wait for the in-flight fetch instead of starting their own.
+
+    Args:
+        fetcher: Async function returning stock data dicts
+        universe_key: Name of the universe the fetcher returns
+        ttl_seconds: Maximum snapshot age before it is rebuilt
+
+    Returns:
+        Shared UniverseSnapshot
+    """
+    snapshot = _snapshot_cache.get(universe_key)
+    if snapshot is not None and time.time() - snapshot.built_at < ttl_seconds:
+        return snapshot
+
+    lock = _snapshot_locks.setdefault(universe_key, asyncio.Lock())
+    async with lock:
+        snapshot = _snapshot_cache.get(universe_key)
+        if snapshot is not None and time.time() - snapshot.built_at < ttl_seconds:
+            return snapshot
+
+        snapshot = UniverseSnapshot.from_records(await fetcher())
+        _snapshot_cache.pop(universe_key, None)
+        while len(_snapshot_cache) >= MAX_CACHED_SNAPSHOTS:
+            oldest = next(iter(_snapshot_cache))
+            _snapshot_cache.pop(oldest)
+            _snapshot_locks.pop(oldest, None)
+        _snapshot_cache[universe_key] = snapshot
+        logger.info(
+            f"Built screener universe snapshot {universe_key!r} with {len(snapshot)} stocks"
+        )
+        return snapshot
+
+
+def clear_universe_snapshots() -> None:
+    """Drop all cached universe snapshots and their fetch locks."""
+    _snapshot_cache.clear()
+    _snapshot_locks.clear()
+
+
+# ============================================
+# Condition Compilation
+# ============================================
+
+
+def _as_float(value) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _never(snapshot: UniverseSnapshot) -> np.ndarray:
+    return np.zeros(len(snapshot), dtype=bool)
+
+
+def _compile_condition(field_name: str, operator: str, value, value2) -> Mask:
+    """Compile one condition into a mask function over a snapshot."""
+    if operator in ("greater_than", "greater_or_equal", "less_than", "less_or_equal"):
+        threshold = _as_float(value)
+        if threshold is None:
+            return _never
+        compare = {
+            "greater_than": np.greater,
+            "greater_or_equal": np.greater_equal,
+            "less_than": np.less,
+            "less_or_equal": np.less_equal,
+        }[operator]
+        # NaN compares False, so missing and non-numeric cells never match
+        return lambda s: compare(s.numeric(field_name), threshold)
+
+    if operator == "between":
+        low, high = _as_float(value), _as_float(value2)
+        if low is None or high is None:
+            return _never
+
+        def between(s: UniverseSnapshot) -> np.ndarray:
+            column = s.numeric(field_name)
+            return (column >= low) & (column <= high)
+
+        return between
+
+    if operator == "equals":
+        return lambda s: (s.values(field_name) == value).to_numpy()
+
+    if operator == "not_equals":
+        return lambda s: s.present(field_name) & (s.values(field_name) != value).to_numpy()
+
+    if operator in ("in", "not_in"):
+        if isinstance(value, (list, tuple, set)):
+            members = list(value)
+            matches = lambda s: s.values(field_name).isin(members).to_numpy()  # noqa: E731
+        elif isinstance(value, str):
+            # Substring membership, as with ``value in "..."``
+            matches = lambda s: s.values(field_name).map(  # noqa: E731
+                lambda v: isinstance(v, str) and v in value
+            ).to_numpy(dtype=bool)
+        else:
+            return _never
+
+        if operator == "in":
+            return matches
+        return lambda s: s.present(field_name) & ~matches(s)
+
+    if operator == "contains":
+        needle = str(value).lower()
+
+        def contains(s: UniverseSnapshot) -> np.ndarray:
+            column = s.values(field_name)
+            found = column.astype(str).str.lower().str.contains(needle, regex=False)
+            return s.present(field_name) & found.to_numpy(dtype=bool)
+
+        return contains
+
+    return _never
+
+
+@dataclass(frozen=True)
+class CompiledFilter:
+    """Vectorized predicate for a list of filter conditions (AND logic)."""
+
+    masks: tuple[Mask, ...]
+
+    def evaluate(self, snapshot: UniverseSnapshot) -> np.ndarray:
+        """
+        Evaluate the filter over a snapshot.
+
+        Args:
+            snapshot: Universe snapshot
+
+        Returns:
+            Boolean mask of matching rows
+        """
+        result = np.ones(len(snapshot), dtype=bool)
+        for mask in self.masks:
+            result &= mask(snapshot)
+            if not result.any():
+                break
+        return result
+
+
+@lru_cache(maxsize=1024)
+def _compile_cached(key: str) -> CompiledFilter:
+    conditions = json.loads(key)
+    return CompiledFilter(
+        tuple(
+            _compile_condition(c["field"], c["operator"], c["value"], c["value2"])
+            for c in conditions
+        )
+    )
+
+
+def compile_conditions(conditions: Sequence[FilterCondition]) -> CompiledFilter:
+    """
+    Compile filter conditions into a vectorized predicate.
+
+    Compiled filters are cached by condition content, so saved screeners are
+    compiled once and reused across runs.
+
+    Args:
+        conditions: Screener conditions
+
+    Returns:
+        CompiledFilter for the conditions
+    """
+    key = json.dumps([c.to_dict() for c in conditions], sort_keys=True, default=str)
+    return _compile_cached(key)
+
+
+# ============================================
+# Ranking
+# ============================================
+
+
+def select_top(
+    snapshot: UniverseSnapshot,
+    mask: np.ndarray,
+    limit: int,
+    sort_by: str | None = None,
+    descending: bool = True,
+) -> np.ndarray:
+    """
+    Select the row indices of the top matches.
+
+    Numeric sort fields use ``argpartition`` so only the selected rows are
+    fully sorted; missing values rank as 0. Non-numeric sort fields fall back
+    to a stable sort of the matches.
+
+    Args:
+        snapshot: Universe snapshot
+        mask: Boolean mask of matching rows
+        limit: Maximum rows to return
+        sort_by: Field to sort by (None keeps universe order)
+        descending: Sort direction
+
+    Returns:
+        Row indices in result order
+    """
+    matches = np.flatnonzero(mask)
+    if sort_by is None or len(matches) == 0:
+        return matches[:limit]
+
+    present = snapshot.present(sort_by)[matches]
+    numeric = snapshot.numeric(sort_by)[matches]
+
+    if np.isnan(numeric[present]).any():
+        # Text field: stable sort, missing values last
+        column = snapshot.values(sort_by).iloc[matches]
+        ordered = column.sort_values(
+            ascending=not descending, kind="stable", na_position="last"
+        )
+        return ordered.index.to_numpy()[:limit]
+
+    keys = np.nan_to_num(numeric, nan=0.0)
+    if descending:
+        keys = -keys
+
+    if limit < len(matches):
+        top = np.argpartition(keys, limit - 1)[:limit]
+        # Stable order within the selection, ties broken by universe order
+        top = top[np.lexsort((top, keys[top]))]
+    else:
+        top = np.argsort(keys, kind="stable")
+    return matches[top]
+
+
+__all__ = [
+    "CompiledFilter",
+    "UniverseSnapshot",
+    "clear_universe_snapshots",
+    "compile_conditions",
+    "get_universe_snapshot",
+    "select_top",
+]
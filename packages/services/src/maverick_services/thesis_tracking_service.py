@@ -4,7 +4,6 @@ Investment Thesis Tracking Service.
 Track investment theses, milestones, and validate decisions over time.
 """
 
-import json
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, UTC
@@ -13,6 +12,8 @@ from uuid import uuid4
 
 from redis.asyncio import Redis
 
+from maverick_services.document_repository import RedisDocumentRepository
+
 logger = logging.getLogger(__name__)
 
 
@@ -268,6 +269,9 @@ class ThesisTrackingService:
     
     def __init__(self, redis_client: Redis | None = None):
         self.redis = redis_client
+        self.repository = (
+            RedisDocumentRepository(redis_client) if redis_client else None
+        )
     
     # ================================
     # Thesis CRUD
@@ -311,14 +315,13 @@ class ThesisTrackingService:
             key_metrics=key_metrics or {},
         )
         
-        await self._save_thesis(thesis)
-        
-        # Add to indices
-        theses_key = self.THESES_KEY.format(user_id=user_id)
-        await self.redis.sadd(theses_key, thesis.thesis_id)
-        
-        ticker_key = self.TICKER_THESES_KEY.format(user_id=user_id, ticker=thesis.ticker)
-        await self.redis.sadd(ticker_key, thesis.thesis_id)
+        # Save and add to indices in one round trip
+        await self.repository.put(
+            self._thesis_key(thesis.thesis_id),
+            thesis.to_dict(),
+            index_keys=self._index_keys(user_id, thesis.ticker),
+            member=thesis.thesis_id,
+        )
         
         logger.info(f"Created thesis {thesis.thesis_id} for {ticker}")
         return thesis
@@ -332,15 +335,11 @@ class ThesisTrackingService:
         if not self.redis:
             return []
         
-        theses_key = self.THESES_KEY.format(user_id=user_id)
-        thesis_ids = await self.redis.smembers(theses_key)
-        
-        theses = []
-        for tid in thesis_ids:
-            thesis = await self.get_thesis(user_id, tid)
-            if thesis:
-                if status is None or thesis.status == status:
-                    theses.append(thesis)
+        theses = await self._load_theses(
+            user_id, self.THESES_KEY.format(user_id=user_id)
+        )
+        if status is not None:
+            theses = [thesis for thesis in theses if thesis.status == status]
         
         # Sort by created date, newest first
         theses.sort(key=lambda t: t.created_at, reverse=True)
@@ -351,13 +350,12 @@ class ThesisTrackingService:
         if not self.redis:
             return None
         
-        thesis_key = self.THESIS_KEY.format(thesis_id=thesis_id)
-        data = await self.redis.get(thesis_key)
+        data = await self.repository.get(self._thesis_key(thesis_id))
         
         if not data:
             return None
         
-        thesis = InvestmentThesisEntry.from_dict(json.loads(data))
+        thesis = InvestmentThesisEntry.from_dict(data)
         
         if thesis.user_id != user_id:
             return None
@@ -374,11 +372,8 @@ class ThesisTrackingService:
             return None
         
         ticker_key = self.TICKER_THESES_KEY.format(user_id=user_id, ticker=ticker.upper())
-        thesis_ids = await self.redis.smembers(ticker_key)
-        
-        for tid in thesis_ids:
-            thesis = await self.get_thesis(user_id, tid)
-            if thesis and thesis.status == ThesisStatus.ACTIVE:
+        for thesis in await self._load_theses(user_id, ticker_key):
+            if thesis.status == ThesisStatus.ACTIVE:
                 return thesis
         
         return None
@@ -433,16 +428,12 @@ class ThesisTrackingService:
         if not thesis:
             return False
         
-        # Remove from Redis
-        thesis_key = self.THESIS_KEY.format(thesis_id=thesis_id)
-        await self.redis.delete(thesis_key)
-        
-        # Remove from indices
-        theses_key = self.THESES_KEY.format(user_id=user_id)
-        await self.redis.srem(theses_key, thesis_id)
-        
-        ticker_key = self.TICKER_THESES_KEY.format(user_id=user_id, ticker=thesis.ticker)
-        await self.redis.srem(ticker_key, thesis_id)
+        # Remove document and index entries in one round trip
+        await self.repository.delete(
+            [self._thesis_key(thesis_id)],
+            index_keys=self._index_keys(user_id, thesis.ticker),
+            member=thesis_id,
+        )
         
         return True
     
@@ -641,13 +632,32 @@ class ThesisTrackingService:
     # Helpers
     # ================================
     
+    def _thesis_key(self, thesis_id: str) -> str:
+        return self.THESIS_KEY.format(thesis_id=thesis_id)
+    
+    def _index_keys(self, user_id: str, ticker: str) -> list[str]:
+        return [
+            self.THESES_KEY.format(user_id=user_id),
+            self.TICKER_THESES_KEY.format(user_id=user_id, ticker=ticker),
+        ]
+    
+    async def _load_theses(
+        self, user_id: str, index_key: str
+    ) -> list[InvestmentThesisEntry]:
+        """Bulk-load the user's theses referenced by an index."""
+        documents = await self.repository.load_index(index_key, self._thesis_key)
+        return [
+            thesis
+            for thesis in map(InvestmentThesisEntry.from_dict, documents)
+            if thesis.user_id == user_id
+        ]
+    
     async def _save_thesis(self, thesis: InvestmentThesisEntry) -> None:
         """Save thesis to Redis."""
-        if not self.redis:
+        if not self.repository:
             raise RuntimeError("Redis not available")
         
-        thesis_key = self.THESIS_KEY.format(thesis_id=thesis.thesis_id)
-        await self.redis.set(thesis_key, json.dumps(thesis.to_dict()))
+        await self.repository.put(self._thesis_key(thesis.thesis_id), thesis.to_dict())
 
 
 # ============================================
@@ -4,7 +4,6 @@ Watchlist Service.
 Manages user watchlists with real-time price tracking and alert integration.
 """
 
-import json
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, UTC
@@ -14,6 +13,8 @@ from uuid import uuid4
 
 from redis.asyncio import Redis
 
+from maverick_services.document_repository import RedisDocumentRepository
+
 logger = logging.getLogger(__name__)
 
 
@@ -137,6 +138,9 @@ class WatchlistService:
         redis_client: Redis | None = None,
     ):
         self.redis = redis_client
+        self.repository = (
+            RedisDocumentRepository(redis_client) if redis_client else None
+        )
     
     # ================================
     # Watchlist CRUD
@@ -160,10 +164,7 @@ class WatchlistService:
         
         # If setting as default, unset others
         if is_default:
-            for wl in existing:
-                if wl.is_default:
-                    wl.is_default = False
-                    await self._save_watchlist(wl)
+            await self._save_watchlists(self._unset_defaults(existing))
         
         # Create if this is the first, make it default
         if len(existing) == 0:
@@ -177,12 +178,13 @@ class WatchlistService:
             is_default=is_default,
         )
         
-        # Save to Redis
-        await self._save_watchlist(watchlist)
-        
-        # Add to user's watchlist index
-        watchlists_key = self.WATCHLISTS_KEY.format(user_id=user_id)
-        await self.redis.sadd(watchlists_key, watchlist.watchlist_id)
+        # Save and add to user's watchlist index in one round trip
+        await self.repository.put(
+            self._watchlist_key(watchlist.watchlist_id),
+            watchlist.to_dict(),
+            index_keys=[self.WATCHLISTS_KEY.format(user_id=user_id)],
+            member=watchlist.watchlist_id,
+        )
         
         logger.info(f"Created watchlist {watchlist.watchlist_id} for user {user_id}")
         return watchlist
@@ -192,14 +194,14 @@ class WatchlistService:
         if not self.redis:
             return []
         
-        watchlists_key = self.WATCHLISTS_KEY.format(user_id=user_id)
-        watchlist_ids = await self.redis.smembers(watchlists_key)
-        
-        watchlists = []
-        for wl_id in watchlist_ids:
-            watchlist = await self.get_watchlist(user_id, wl_id)
-            if watchlist:
-                watchlists.append(watchlist)
+        documents = await self.repository.load_index(
+            self.WATCHLISTS_KEY.format(user_id=user_id), self._watchlist_key
+        )
+        watchlists = [
+            watchlist
+            for watchlist in map(Watchlist.from_dict, documents)
+            if watchlist.user_id == user_id
+        ]
         
         # Sort by name, default first
         watchlists.sort(key=lambda w: (not w.is_default, w.name.lower()))
@@ -210,13 +212,12 @@ class WatchlistService:
         if not self.redis:
             return None
         
-        watchlist_key = self.WATCHLIST_KEY.format(watchlist_id=watchlist_id)
-        data = await self.redis.get(watchlist_key)
+        data = await self.repository.get(self._watchlist_key(watchlist_id))
         
         if not data:
             return None
         
-        watchlist = Watchlist.from_dict(json.loads(data))
+        watchlist = Watchlist.from_dict(data)
         
         # Verify ownership
         if watchlist.user_id != user_id:
@@ -255,10 +256,9 @@ class WatchlistService:
             if is_default:
                 # Unset other defaults
                 all_watchlists = await self.get_watchlists(user_id)
-                for wl in all_watchlists:
-                    if wl.is_default and wl.watchlist_id != watchlist_id:
-                        wl.is_default = False
-                        await self._save_watchlist(wl)
+                await self._save_watchlists(
+                    self._unset_defaults(all_watchlists, keep=watchlist_id)
+                )
             watchlist.is_default = is_default
         
         watchlist.updated_at = datetime.now(UTC)
@@ -279,17 +279,18 @@ class WatchlistService:
         if len(all_watchlists) == 1:
             raise ValueError("Cannot delete the only watchlist")
         
-        # Delete from Redis
-        watchlist_key = self.WATCHLIST_KEY.format(watchlist_id=watchlist_id)
-        await self.redis.delete(watchlist_key)
-        
-        # Remove from user's index
-        watchlists_key = self.WATCHLISTS_KEY.format(user_id=user_id)
-        await self.redis.srem(watchlists_key, watchlist_id)
+        # Delete and remove from user's index
+        await self.repository.delete(
+            [self._watchlist_key(watchlist_id)],
+            index_keys=[self.WATCHLISTS_KEY.format(user_id=user_id)],
+            member=watchlist_id,
+        )
         
         # If was default, set another as default
         if watchlist.is_default:
-            remaining = await self.get_watchlists(user_id)
+            remaining = [
+                wl for wl in all_watchlists if wl.watchlist_id != watchlist_id
+            ]
             if remaining:
                 remaining[0].is_default = True
                 await self._save_watchlist(remaining[0])
@@ -569,13 +570,33 @@ class WatchlistService:
     # Helpers
     # ================================
     
+    def _watchlist_key(self, watchlist_id: str) -> str:
+        return self.WATCHLIST_KEY.format(watchlist_id=watchlist_id)
+    
+    @staticmethod
+    def _unset_defaults(
+        watchlists: list[Watchlist], keep: str | None = None
+    ) -> list[Watchlist]:
+        """Clear default flags (except on ``keep``) and return the changed watchlists."""
+        changed = []
+        for wl in watchlists:
+            if wl.is_default and wl.watchlist_id != keep:
+                wl.is_default = False
+                changed.append(wl)
+        return changed
+    
     async def _save_watchlist(self, watchlist: Watchlist) -> None:
         """Save watchlist to Redis."""
-        if not self.redis:
+        await self._save_watchlists([watchlist])
+    
+    async def _save_watchlists(self, watchlists: list[Watchlist]) -> None:
+        """Save watchlists to Redis in one pipelined round trip."""
+        if not self.repository:
             raise RuntimeError("Redis not available")
         
-        watchlist_key = self.WATCHLIST_KEY.format(watchlist_id=watchlist.watchlist_id)
-        await self.redis.set(watchlist_key, json.dumps(watchlist.to_dict()))
+        await self.repository.put_many(
+            [(self._watchlist_key(wl.watchlist_id), wl.to_dict()) for wl in watchlists]
+        )
 
 
 # ============================================
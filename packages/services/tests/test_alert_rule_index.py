@@ -0,0 +1,256 @@
+"""Tests for the shared alert rule index."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from maverick_services.alert_service import (
+    AlertRule,
+    AlertRuleIndex,
+    AlertService,
+    AlertType,
+)
+from tests.test_document_repository import FakeRedis
+
+
+def _rule(rule_id, alert_type, conditions, user_id="u1", enabled=True):
+    return AlertRule(
+        rule_id=rule_id,
+        user_id=user_id,
+        name=rule_id,
+        alert_type=alert_type,
+        conditions=conditions,
+        enabled=enabled,
+    )
+
+
+class TestAlertRuleIndex:
+    """Test threshold lookups against the sorted rule groups."""
+
+    def test_price_targets_by_direction(self):
+        index = AlertRuleIndex()
+        index.add(_rule("a150", AlertType.PRICE_TARGET_HIT, {"ticker": "aapl", "target_price": 150}))
+        index.add(_rule("a200", AlertType.PRICE_TARGET_HIT, {"ticker": "AAPL", "target_price": 200}))
+        index.add(_rule("b120", AlertType.PRICE_TARGET_HIT, {"ticker": "AAPL", "target_price": 120, "direction": "below"}))
+        index.add(_rule("m150", AlertType.PRICE_TARGET_HIT, {"ticker": "MSFT", "target_price": 150}))
+
+        def ids(price):
+            return {r.rule_id for r in index.match(AlertType.PRICE_TARGET_HIT, price, "AAPL")}
+
+        assert ids(175) == {"a150"}
+        assert ids(200) == {"a150", "a200"}
+        assert ids(120) == {"b120"}
+        assert ids(130) == set()
+
+    def test_rsi_rules_any_ticker_and_scoped(self):
+        index = AlertRuleIndex()
+        index.add(_rule("any", AlertType.RSI_OVERSOLD, {"threshold": 30}))
+        index.add(_rule("nvda", AlertType.RSI_OVERSOLD, {"threshold": 25, "ticker": "NVDA"}))
+
+        assert {r.rule_id for r in index.match(AlertType.RSI_OVERSOLD, 20, "NVDA")} == {"any", "nvda"}
+        assert {r.rule_id for r in index.match(AlertType.RSI_OVERSOLD, 20, "AAPL")} == {"any"}
+        assert index.match(AlertType.RSI_OVERSOLD, 31, "NVDA") == []
+
+    def test_disabled_and_removed_rules_never_match(self):
+        index = AlertRuleIndex()
+        index.add(_rule("r1", AlertType.RSI_OVERBOUGHT, {"threshold": 70}))
+        index.add(_rule("r2", AlertType.RSI_OVERBOUGHT, {"threshold": 70}, enabled=False))
+        assert [r.rule_id for r in index.match(AlertType.RSI_OVERBOUGHT, 80)] == ["r1"]
+
+        index.remove("r1")
+        assert index.match(AlertType.RSI_OVERBOUGHT, 80) == []
+
+        index.replace_user_rules("u1", [_rule("r3", AlertType.RSI_OVERBOUGHT, {"threshold": 60})])
+        assert list(index.rules) == ["r3"]
+
+
+class TestAlertServiceEvaluation:
+    """Test one tick triggers the matching rules of every user."""
+
+    @pytest.mark.asyncio
+    async def test_price_tick_across_users(self):
+        redis = FakeRedis()
+        service = AlertService(redis_client=redis)
+        for user_id, target in (("u1", 150), ("u2", 180), ("u3", 250)):
+            await service.create_rule(
+                user_id, "Target", AlertType.PRICE_TARGET_HIT,
+                {"ticker": "AAPL", "target_price": target},
+            )
+
+        # A fresh service (e.g. another request) shares the index
+        other = AlertService(redis_client=redis)
+        alerts = await other.evaluate_price_tick({"AAPL": 200.0, "MSFT": 400.0})
+
+        assert sorted(a.user_id for a in alerts) == ["u1", "u2"]
+        assert all(a.priority.value == "high" for a in alerts)
+
+    @pytest.mark.asyncio
+    async def test_index_rebuilt_from_redis(self):
+        redis = FakeRedis()
+        await AlertService(redis_client=redis).create_rule(
+            "u1", "Oversold", AlertType.RSI_OVERSOLD, {"threshold": 30}
+        )
+
+        index = await AlertService(redis_client=redis).get_rule_index(refresh=True)
+        assert len(index) == 1
+        assert index.match(AlertType.RSI_OVERSOLD, 25, "AAPL")[0].user_id == "u1"
+
+    @pytest.mark.asyncio
+    async def test_screening_diff_and_per_user_projection(self):
+        service = AlertService(redis_client=FakeRedis())
+        await service.create_rule("u1", "High", AlertType.NEW_MAVERICK_STOCK, {"min_score": 80})
+        await service.create_rule(
+            "u2", "Tech", AlertType.NEW_MAVERICK_STOCK, {"min_score": 50, "sectors": ["Technology"]}
+        )
+
+        previous = [{"ticker": "OLD", "score": 99}]
+        current = previous + [
+            {"ticker": "NEW", "score": 85, "sector": "Energy"},
+            {"ticker": "TEC", "score": 60, "sector": "Technology"},
+        ]
+
+        alerts = await service.evaluate_screening_diff(current, previous)
+        assert sorted((a.user_id, a.ticker) for a in alerts) == [("u1", "NEW"), ("u2", "TEC")]
+
+    @pytest.mark.asyncio
+    async def test_cooldown_and_deleted_rules(self):
+        service = AlertService(redis_client=FakeRedis())
+        rule = await service.create_rule("u1", "Oversold", AlertType.RSI_OVERSOLD, {"threshold": 30})
+
+        alert = await service.check_rsi_alerts("u1", "AAPL", 25.0)
+        assert alert.rule_id == rule.rule_id
+        assert await service.check_rsi_alerts("u2", "AAPL", 25.0) is None
+
+        await service.delete_rule("u1", rule.rule_id)
+        assert await service.check_rsi_alerts("u1", "AAPL", 20.0) is None
+
+    @pytest.mark.asyncio
+    async def test_batch_delivery_bounded_and_failures_isolated(self, monkeypatch):
+        from maverick_services import alert_service
+
+        monkeypatch.setattr(alert_service, "ALERT_DELIVERY_CONCURRENCY", 2)
+        service = AlertService(redis_client=FakeRedis())
+        for user_id in ("u1", "u2", "u3", "u4", "u5"):
+            await service.create_rule(user_id, "Oversold", AlertType.RSI_OVERSOLD, {"threshold": 30})
+
+        active = peak = 0
+
+        async def deliver(alert, cooldown_minutes=None, generate_insight=True):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            if alert.user_id == "u3":
+                raise RuntimeError("LLM unavailable")
+            return alert
+
+        service._deliver_alert = deliver
+        alerts = await service.evaluate_rsi_tick({"AAPL": 20.0})
+
+        assert peak == 2
+        assert sorted(a.user_id for a in alerts) == ["u1", "u2", "u4", "u5"]
+
+
+class FakePubSub:
+    """Pub/sub that delivers queued messages, then fails, ends or waits forever."""
+
+    def __init__(self, messages, fail, wait=True):
+        self.messages = messages
+        self.fail = fail
+        self.wait = wait
+
+    async def subscribe(self, channel):
+        pass
+
+    async def unsubscribe(self, channel):
+        pass
+
+    async def close(self):
+        pass
+
+    async def listen(self):
+        for data in self.messages:
+            yield {"type": "message", "data": data}
+        if self.fail:
+            raise ConnectionError("connection reset")
+        if self.wait:
+            await asyncio.Event().wait()
+
+
+class TestRuleChangeListener:
+    """Test the listener keeps the shared index in sync."""
+
+    @pytest.mark.asyncio
+    async def test_reloads_changed_users_and_resubscribes(self, monkeypatch):
+        monkeypatch.setattr(asyncio, "sleep", _no_sleep)
+        redis = FakeRedis()
+        writer = AlertService(redis_client=redis)
+        await writer.create_rule("u1", "Oversold", AlertType.RSI_OVERSOLD, {"threshold": 30})
+        service = AlertService(redis_client=redis)
+        await service.get_rule_index()
+
+        # A rule written without updating the index (e.g. by another worker)
+        writer._rule_changed = AsyncMock()
+        await writer.create_rule("u2", "Oversold", AlertType.RSI_OVERSOLD, {"threshold": 40})
+        subscriptions = [FakePubSub([b"u2"], fail=True), FakePubSub([], fail=False)]
+        redis.pubsub = lambda: subscriptions.pop(0)
+
+        listener = asyncio.create_task(service.listen_for_rule_changes())
+        while subscriptions:
+            await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        # The lost subscription dropped the index, which is rebuilt complete
+        assert alert_service_indexes().get(redis) is None
+        index = await service.get_rule_index()
+        assert {r.user_id for r in index.match(AlertType.RSI_OVERSOLD, 25)} == {"u1", "u2"}
+
+        listener.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await listener
+
+    @pytest.mark.asyncio
+    async def test_backs_off_when_subscription_ends(self, monkeypatch):
+        delays = []
+
+        async def record_sleep(delay, result=None):
+            delays.append(delay)
+            await _real_sleep(0)
+            return result
+
+        redis = FakeRedis()
+        service = AlertService(redis_client=redis)
+        subscriptions = [
+            FakePubSub([], fail=False, wait=False),
+            FakePubSub([], fail=True),
+            FakePubSub([b"u1"], fail=False, wait=False),
+            FakePubSub([], fail=False),
+        ]
+        redis.pubsub = lambda: subscriptions.pop(0)
+        monkeypatch.setattr(asyncio, "sleep", record_sleep)
+
+        listener = asyncio.create_task(service.listen_for_rule_changes())
+        while subscriptions:
+            await _real_sleep(0)
+        listener.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await listener
+
+        # Clean ends back off like errors; a delivered message resets the delay
+        assert delays == [1.0, 2.0, 1.0]
+
+
+_real_sleep = asyncio.sleep
+
+
+async def _no_sleep(delay, result=None):
+    await _real_sleep(0)
+    return result
+
+
+def alert_service_indexes():
+    from maverick_services import alert_service
+
+    return alert_service._shared_rule_indexes
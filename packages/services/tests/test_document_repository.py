@@ -0,0 +1,222 @@
+"""Tests for the Redis document repository and the services built on it."""
+
+import fnmatch
+import json
+
+import pytest
+
+from maverick_services.alert_service import AlertService, AlertType
+from maverick_services.custom_screener_service import CustomScreenerService
+from maverick_services.document_repository import (
+    RedisDocumentRepository,
+    decode_document,
+    encode_document,
+)
+from maverick_services.thesis_tracking_service import ThesisTrackingService
+from maverick_services.watchlist_service import WatchlistService
+
+
+class FakeRedis:
+    """In-memory async Redis (binary responses) that counts round trips."""
+
+    def __init__(self):
+        self.values: dict[str, bytes] = {}
+        self.sets: dict[str, set[bytes]] = {}
+        self.hashes: dict[str, dict[bytes, bytes]] = {}
+        self.round_trips = 0
+
+    @staticmethod
+    def _b(value) -> bytes:
+        return value if isinstance(value, bytes) else str(value).encode()
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def _call(self, name, *args, **kwargs):
+        self.round_trips += 1
+        return getattr(self, f"_{name}")(*args, **kwargs)
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return lambda *args, **kwargs: self._call(name, *args, **kwargs)
+
+    async def scan_iter(self, match="*", count=None):
+        self.round_trips += 1
+        for key in [*self.values, *self.sets, *self.hashes]:
+            if fnmatch.fnmatchcase(key, match):
+                yield key
+
+    def _get(self, key):
+        return self.values.get(key)
+
+    def _mget(self, keys):
+        return [self.values.get(k) for k in keys]
+
+    def _set(self, key, value, ex=None):
+        self.values[key] = self._b(value)
+        return True
+
+    def _setex(self, key, ttl, value):
+        return self._set(key, value)
+
+    def _delete(self, *keys):
+        return sum(self.values.pop(k, None) is not None for k in keys)
+
+    def _sadd(self, key, *members):
+        self.sets.setdefault(key, set()).update(self._b(m) for m in members)
+
+    def _srem(self, key, *members):
+        self.sets.get(key, set()).difference_update(self._b(m) for m in members)
+
+    def _smembers(self, key):
+        return set(self.sets.get(key, set()))
+
+    def _hset(self, key, field=None, value=None, mapping=None):
+        mapping = mapping or {field: value}
+        self.hashes.setdefault(key, {}).update(
+            {self._b(f): self._b(v) for f, v in mapping.items()}
+        )
+
+    def _hget(self, key, field):
+        return self.hashes.get(key, {}).get(self._b(field))
+
+    def _hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def _hdel(self, key, field):
+        return int(self.hashes.get(key, {}).pop(self._b(field), None) is not None)
+
+    def _exists(self, key):
+        return int(key in self.values)
+
+    def _noop(self, *args, **kwargs):
+        return 1
+
+    _lpush = _ltrim = _expire = _incr = _publish = _noop
+
+
+class FakePipeline:
+    def __init__(self, redis: FakeRedis):
+        self.redis = redis
+        self.calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self):
+        self.redis.round_trips += 1
+        return [getattr(self.redis, f"_{n}")(*a, **kw) for n, a, kw in self.calls]
+
+
+class TestDocumentCodec:
+    """Test msgpack encoding with legacy JSON fallback."""
+
+    def test_round_trip(self):
+        doc = {"name": "Tech", "items": [{"ticker": "AAPL", "price": 1.5}]}
+        encoded = encode_document(doc)
+        assert decode_document(encoded) == doc
+        assert len(encoded) < len(json.dumps(doc))
+
+    def test_reads_legacy_json(self):
+        doc = {"name": "Tech"}
+        assert decode_document(json.dumps(doc).encode()) == doc
+        assert decode_document(json.dumps(doc)) == doc
+        assert decode_document(None) is None
+
+
+class TestRedisDocumentRepository:
+    """Test bulk loads and batched writes."""
+
+    @pytest.mark.asyncio
+    async def test_load_index_uses_two_round_trips(self):
+        redis = FakeRedis()
+        repo = RedisDocumentRepository(redis)
+        for i in range(40):
+            await repo.put(f"doc:{i}", {"i": i}, index_keys=["idx"], member=str(i))
+
+        redis.round_trips = 0
+        docs = await repo.load_index("idx", lambda doc_id: f"doc:{doc_id}")
+
+        assert sorted(d["i"] for d in docs) == list(range(40))
+        assert redis.round_trips == 2
+
+
+class TestServicesOnRepository:
+    """Test the user services load documents in bulk."""
+
+    @pytest.mark.asyncio
+    async def test_watchlists_bulk_loaded(self):
+        redis = FakeRedis()
+        service = WatchlistService(redis_client=redis)
+        for i in range(10):
+            await service.create_watchlist("u1", f"List {i}")
+
+        redis.round_trips = 0
+        watchlists = await service.get_watchlists("u1")
+
+        assert len(watchlists) == 10
+        assert watchlists[0].is_default
+        assert redis.round_trips == 2
+
+    @pytest.mark.asyncio
+    async def test_watchlist_default_switch_and_delete(self):
+        service = WatchlistService(redis_client=FakeRedis())
+        first = await service.create_watchlist("u1", "First")
+        second = await service.create_watchlist("u1", "Second", is_default=True)
+
+        assert (await service.get_default_watchlist("u1")).watchlist_id == second.watchlist_id
+        assert await service.delete_watchlist("u1", second.watchlist_id)
+
+        remaining = await service.get_watchlists("u1")
+        assert [w.watchlist_id for w in remaining] == [first.watchlist_id]
+        assert remaining[0].is_default
+
+    @pytest.mark.asyncio
+    async def test_theses_bulk_loaded_and_filtered_by_owner(self):
+        redis = FakeRedis()
+        service = ThesisTrackingService(redis_client=redis)
+        for ticker in ("AAPL", "MSFT", "NVDA"):
+            await service.create_thesis("u1", ticker, f"{ticker} thesis", "summary")
+        await service.create_thesis("u2", "AAPL", "other", "summary")
+
+        redis.round_trips = 0
+        theses = await service.get_theses("u1")
+        assert len(theses) == 3
+        assert redis.round_trips == 2
+
+        active = await service.get_thesis_for_ticker("u1", "aapl")
+        assert active.ticker == "AAPL" and active.user_id == "u1"
+
+        assert await service.delete_thesis("u1", active.thesis_id)
+        assert await service.get_thesis_for_ticker("u1", "AAPL") is None
+
+    @pytest.mark.asyncio
+    async def test_legacy_json_screener_still_loads(self):
+        redis = FakeRedis()
+        service = CustomScreenerService(redis_client=redis)
+        screener = await service.create_screener("u1", "Momentum", conditions=[])
+
+        # Simulate a document written by the JSON-based implementation
+        key = service.SCREENER_KEY.format(screener_id=screener.screener_id)
+        redis.values[key] = json.dumps(screener.to_dict()).encode()
+
+        screeners = await service.get_screeners("u1")
+        assert [s.name for s in screeners] == ["Momentum"]
+
+    @pytest.mark.asyncio
+    async def test_alert_rules_round_trip(self):
+        service = AlertService(redis_client=FakeRedis())
+        rule = await service.create_rule(
+            "u1", "Breakout", AlertType.PRICE_TARGET_HIT, {"ticker": "AAPL", "target": 200}
+        )
+
+        rules = await service.get_rules("u1")
+        assert [r.rule_id for r in rules] == [rule.rule_id]
+        assert (await service.get_rule("u1", rule.rule_id)).conditions["target"] == 200
+        assert await service.delete_rule("u1", rule.rule_id)
+        assert await service.get_rules("u1") == []
@@ -0,0 +1,160 @@
+"""Tests for buffered and streamed exports."""
+
+import csv
+import gzip
+import io
+import json
+
+import pytest
+
+from maverick_services.export_service import (
+    EXPORT_CHUNK_ROWS,
+    ExportFormat,
+    ExportService,
+    ExportType,
+)
+
+
+def _trades(n: int) -> list[dict]:
+    return [
+        {
+            "date": "2024-01-02",
+            "ticker": f"T{i % 50}",
+            "action": "BUY" if i % 2 else "SELL",
+            "shares": i,
+            "price": 10.5 + i,
+            "total_value": (10.5 + i) * i,
+            "notes": "note, with comma",
+        }
+        for i in range(n)
+    ]
+
+
+async def _collect(export) -> bytes:
+    return b"".join([chunk async for chunk in export.chunks])
+
+
+class TestBufferedExports:
+    """Test buffered exports keep their existing output."""
+
+    @pytest.mark.asyncio
+    async def test_json_layout_matches_indented_dump(self):
+        service = ExportService()
+        rows = list(service.trade_journal_rows(_trades(3)))
+
+        result = await service.export(ExportType.TRADE_JOURNAL, rows, ExportFormat.JSON)
+
+        assert result.content.decode() == json.dumps(rows, indent=2, default=str)
+        empty = await service.export(ExportType.TRADE_JOURNAL, [], ExportFormat.JSON)
+        assert empty.content == b"[]"
+
+    @pytest.mark.asyncio
+    async def test_tax_report_summary(self):
+        service = ExportService()
+        result = await service.export_tax_report(
+            2024,
+            [
+                {"ticker": "A", "proceeds": 150, "cost_basis": 100, "is_long_term": True},
+                {"ticker": "B", "proceeds": 80, "cost_basis": 100},
+            ],
+        )
+
+        rows = list(csv.reader(io.StringIO(result.content.decode())))
+        assert rows[-3] == ["Short-term Gains/Losses:", "", "", "", "", "", "$-20.00", ""]
+        assert rows[-1][6] == "$30.00"
+        assert result.row_count == 7
+
+
+class TestStreamedExports:
+    """Test chunked, compressed and Parquet streams."""
+
+    @pytest.mark.asyncio
+    async def test_csv_stream_matches_buffered_export(self):
+        service = ExportService()
+        trades = _trades(EXPORT_CHUNK_ROWS * 2 + 7)
+
+        buffered = await service.export_trade_journal(trades)
+        export = service.stream(
+            ExportType.TRADE_JOURNAL, service.trade_journal_rows(trades)
+        )
+        chunks = [chunk async for chunk in export.chunks]
+
+        assert len(chunks) == 3
+        assert b"".join(chunks) == buffered.content
+
+    @pytest.mark.asyncio
+    async def test_gzip_stream_from_async_rows(self):
+        service = ExportService()
+        trades = _trades(1200)
+
+        async def rows():
+            for row in service.trade_journal_rows(trades):
+                yield row
+
+        export = service.stream(
+            ExportType.TRADE_JOURNAL, rows(), ExportFormat.JSON, compress=True
+        )
+
+        assert export.filename.endswith(".json.gz")
+        assert export.content_type == "application/gzip"
+        decoded = json.loads(gzip.decompress(await _collect(export)))
+        assert len(decoded) == 1200
+        assert decoded[0]["Ticker"] == "T0"
+
+    @pytest.mark.asyncio
+    async def test_parquet_row_groups(self):
+        pq = pytest.importorskip("pyarrow.parquet")
+        service = ExportService()
+        trades = _trades(EXPORT_CHUNK_ROWS + 10)
+
+        export = service.stream(
+            ExportType.TRADE_JOURNAL,
+            service.trade_journal_rows(trades),
+            ExportFormat.PARQUET,
+            compress=True,
+        )
+        assert not export.compressed
+
+        parquet = pq.ParquetFile(io.BytesIO(await _collect(export)))
+        assert parquet.metadata.num_rows == len(trades)
+        assert parquet.metadata.num_row_groups == 2
+        assert parquet.read().column("Ticker")[1].as_py() == "T1"
+
+    @pytest.mark.asyncio
+    async def test_parquet_missing_values_are_nulls(self):
+        pq = pytest.importorskip("pyarrow.parquet")
+        service = ExportService()
+        result = await service.export_screening_results(
+            "Missing", [{"ticker": "A", "volume": 100}, {"ticker": "B", "volume": None}],
+            format=ExportFormat.PARQUET,
+        )
+
+        table = pq.read_table(io.BytesIO(result.content))
+        assert table.column("volume").to_pylist() == [100, None]
+
+    @pytest.mark.asyncio
+    async def test_parquet_null_in_later_batch(self):
+        pq = pytest.importorskip("pyarrow.parquet")
+        rows = [{"ticker": f"T{i}", "volume": i, "notes": ""} for i in range(EXPORT_CHUNK_ROWS + 100)]
+        rows[EXPORT_CHUNK_ROWS + 50]["volume"] = ""
+        rows[EXPORT_CHUNK_ROWS + 60]["notes"] = "late note"
+
+        export = ExportService().stream(ExportType.SCREENING_RESULTS, rows, ExportFormat.PARQUET)
+        table = pq.read_table(io.BytesIO(await _collect(export)))
+
+        volume = table.column("volume").to_pylist()
+        assert table.schema.field("volume").type == "int64"
+        assert volume[EXPORT_CHUNK_ROWS + 50] is None and volume[-1] == len(rows) - 1
+        assert table.column("notes").to_pylist()[EXPORT_CHUNK_ROWS + 60] == "late note"
+
+    @pytest.mark.asyncio
+    async def test_parquet_mixed_types_fall_back_to_text(self):
+        pq = pytest.importorskip("pyarrow.parquet")
+        service = ExportService()
+        result = await service.export_screening_results(
+            "Mixed", [{"ticker": "A", "volume": 100}, {"ticker": "B", "volume": "n/a"}],
+            format=ExportFormat.PARQUET,
+        )
+
+        table = pq.read_table(io.BytesIO(result.content))
+        assert table.column("volume").to_pylist() == ["100", "n/a"]
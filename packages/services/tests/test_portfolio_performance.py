@@ -0,0 +1,100 @@
+"""Tests for vectorized portfolio performance."""
+
+import asyncio
+from datetime import date, timedelta
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from maverick_services.portfolio_service import PortfolioService, _performance_series
+
+
+class FakeRepository:
+    def __init__(self, positions):
+        self.positions = positions
+
+    async def get_positions(self, user_id, portfolio_name):
+        return self.positions
+
+
+class FakeHistoricalProvider:
+    """Serves fixed closes and records fetch concurrency."""
+
+    def __init__(self, closes: dict[str, list[float | None]], dates: list[date]):
+        self.closes = closes
+        self.dates = dates
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = []
+
+    async def get_historical(self, ticker, start_date, end_date):
+        self.calls.append(ticker)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if ticker not in self.closes:
+            raise LookupError(ticker)
+        return [
+            {"date": d, "close": c}
+            for d, c in zip(self.dates, self.closes[ticker])
+        ]
+
+
+DATES = [date(2024, 1, 1) + timedelta(days=i) for i in range(4)]
+
+
+class TestPerformanceSeries:
+    """Test the matrix valuation matches the per-date rules."""
+
+    def test_missing_prices_use_fallback(self):
+        prices = np.array([[10.0, np.nan], [11.0, 20.0], [0.0, 22.0]])
+        series = _performance_series(
+            prices,
+            shares=np.array([2.0, 1.0]),
+            fallback_prices=np.array([5.0, 15.0]),
+            benchmark=np.array([np.nan, 100.0, 110.0]),
+        )
+
+        np.testing.assert_allclose(series["value"], [35.0, 42.0, 32.0])
+        np.testing.assert_allclose(series["daily_return"][1:], [20.0, -23.8095238])
+        assert np.isnan(series["benchmark_return"][0])
+        np.testing.assert_allclose(series["benchmark_return"][1:], [0.0, 10.0])
+        np.testing.assert_allclose(series["drawdown"], [0.0, 0.0, 23.8095238])
+
+
+class TestGetPerformance:
+    """Test get_performance end to end."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_fetch_and_decimal_output(self):
+        provider = FakeHistoricalProvider(
+            {
+                "AAPL": [100.0, 110.0, 99.0, 121.0],
+                "MSFT": [50.0, None, 55.0, 60.0],
+                "SPY": [400.0, 404.0, 408.0, 412.0],
+            },
+            DATES,
+        )
+        positions = [
+            {"ticker": "AAPL", "shares": 10, "avg_cost": 90},
+            {"ticker": "MSFT", "shares": 4, "avg_cost": 45},
+            {"ticker": "GONE", "shares": 1, "avg_cost": 7},
+        ]
+        service = PortfolioService(FakeRepository(positions), historical_provider=provider)
+
+        chart = await service.get_performance("u1", period="7d")
+
+        assert sorted(provider.calls) == ["AAPL", "GONE", "MSFT", "SPY"]
+        assert provider.max_in_flight == 4
+
+        values = [p.portfolio_value for p in chart.data]
+        assert values == [Decimal("1207"), Decimal("1287"), Decimal("1217"), Decimal("1457")]
+        assert chart.data[0].daily_return is None
+        assert chart.data[-1].benchmark_return == Decimal("3")
+        assert chart.total_return_value == Decimal("250")
+        assert chart.total_return == Decimal(str(round(250 / 1207 * 100, 6)))
+        assert chart.alpha == chart.total_return - Decimal("3")
+        assert chart.max_drawdown_date == DATES[2]
+        assert isinstance(chart.volatility, Decimal)
@@ -0,0 +1,203 @@
+"""Tests for the vectorized custom screener engine."""
+
+import numpy as np
+import pytest
+
+from maverick_services.custom_screener_service import (
+    CustomScreenerService,
+    FilterCondition,
+)
+from maverick_services import screener_engine
+from maverick_services.screener_engine import (
+    UniverseSnapshot,
+    clear_universe_snapshots,
+    compile_conditions,
+    get_universe_snapshot,
+    select_top,
+)
+from tests.test_document_repository import FakeRedis
+
+SECTORS = ["Technology", "Healthcare", "Energy", None]
+
+
+def _universe(n: int = 500) -> list[dict]:
+    rng = np.random.default_rng(7)
+    stocks = []
+    for i in range(n):
+        stock = {
+            "ticker": f"T{i}",
+            "price": float(rng.uniform(1, 300)),
+            "rsi_14": float(rng.uniform(0, 100)),
+            "volume_ratio": float(rng.uniform(0, 4)),
+            "sector": SECTORS[i % len(SECTORS)],
+        }
+        if i % 7 == 0:
+            stock["pe_ratio"] = None
+        elif i % 11 == 0:
+            stock["pe_ratio"] = "n/a"
+        else:
+            stock["pe_ratio"] = float(rng.uniform(-10, 60))
+        stocks.append(stock)
+    return stocks
+
+
+def _reference_match(stock: dict, condition: FilterCondition) -> bool:
+    """Scalar semantics of the original per-stock evaluation."""
+    value = stock.get(condition.field.value)
+    if value is None:
+        return False
+    op, target = condition.operator.value, condition.value
+    try:
+        if op == "equals":
+            return value == target
+        if op == "not_equals":
+            return value != target
+        if op == "greater_than":
+            return float(value) > float(target)
+        if op == "less_or_equal":
+            return float(value) <= float(target)
+        if op == "between":
+            return float(target) <= float(value) <= float(condition.value2)
+        if op == "in":
+            return value in target
+        if op == "not_in":
+            return value not in target
+        if op == "contains":
+            return str(target).lower() in str(value).lower()
+    except (TypeError, ValueError):
+        return False
+    return False
+
+
+CONDITION_SETS = [
+    [{"field": "rsi_14", "operator": "between", "value": 30, "value2": 70}],
+    [
+        {"field": "price", "operator": "greater_than", "value": 50},
+        {"field": "pe_ratio", "operator": "less_or_equal", "value": 20},
+    ],
+    [{"field": "sector", "operator": "in", "value": ["Technology", "Energy"]}],
+    [{"field": "sector", "operator": "not_in", "value": ["Technology"]}],
+    [{"field": "sector", "operator": "contains", "value": "care"}],
+    [{"field": "sector", "operator": "not_equals", "value": "Energy"}],
+    [{"field": "sector", "operator": "equals", "value": "Energy"}],
+    [{"field": "dividend_yield", "operator": "greater_than", "value": 1}],
+]
+
+
+class TestCompiledFilter:
+    """Test vectorized masks match the scalar semantics."""
+
+    @pytest.mark.parametrize("raw_conditions", CONDITION_SETS)
+    def test_matches_reference(self, raw_conditions):
+        stocks = _universe()
+        conditions = [FilterCondition.from_dict(c) for c in raw_conditions]
+
+        mask = compile_conditions(conditions).evaluate(
+            UniverseSnapshot.from_records(stocks)
+        )
+        expected = [
+            all(_reference_match(s, c) for c in conditions) for s in stocks
+        ]
+        assert mask.tolist() == expected
+
+    def test_compiled_once_per_condition_set(self):
+        conditions = [FilterCondition.from_dict(c) for c in CONDITION_SETS[1]]
+        again = [FilterCondition.from_dict(c) for c in CONDITION_SETS[1]]
+        assert compile_conditions(conditions) is compile_conditions(again)
+
+
+class TestSelectTop:
+    """Test argpartition ranking matches a full sort."""
+
+    @pytest.mark.parametrize("descending", [True, False])
+    def test_top_n_matches_full_sort(self, descending):
+        stocks = _universe()
+        snapshot = UniverseSnapshot.from_records(stocks)
+        mask = snapshot.numeric("price") > 20
+
+        top = select_top(snapshot, mask, 25, sort_by="rsi_14", descending=descending)
+
+        expected = sorted(
+            (s for s in stocks if s["price"] > 20),
+            key=lambda s: s["rsi_14"],
+            reverse=descending,
+        )[:25]
+        assert snapshot.rows(top) == expected
+
+    def test_missing_sort_values_rank_as_zero(self):
+        stocks = [{"pe_ratio": 5.0}, {"pe_ratio": None}, {"pe_ratio": -3.0}]
+        snapshot = UniverseSnapshot.from_records(stocks)
+        top = select_top(snapshot, np.ones(3, dtype=bool), 3, sort_by="pe_ratio")
+        assert top.tolist() == [0, 1, 2]
+
+    def test_text_sort_field(self):
+        stocks = [{"sector": "b"}, {"sector": "a"}, {"sector": None}]
+        snapshot = UniverseSnapshot.from_records(stocks)
+        top = select_top(
+            snapshot, np.ones(3, dtype=bool), 3, sort_by="sector", descending=False
+        )
+        assert top.tolist() == [1, 0, 2]
+
+
+class TestRunScreener:
+    """Test screeners share one cached universe snapshot."""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_shared_across_screeners(self):
+        clear_universe_snapshots()
+        stocks = _universe()
+        calls = []
+
+        async def fetcher():
+            calls.append(1)
+            return stocks
+
+        service = CustomScreenerService(redis_client=FakeRedis())
+        momentum = await service.create_screener(
+            "u1", "Momentum", CONDITION_SETS[0], sort_by="volume_ratio", max_results=10
+        )
+        value = await service.create_screener("u2", "Value", CONDITION_SETS[1])
+
+        first = await service.run_screener("u1", momentum.screener_id, fetcher)
+        second = await service.run_screener("u2", value.screener_id, fetcher)
+
+        assert len(calls) == 1
+        assert len(first.stocks) == 10
+        assert first.total_matches == sum(30 <= s["rsi_14"] <= 70 for s in stocks)
+        ratios = [s["volume_ratio"] for s in first.stocks]
+        assert ratios == sorted(ratios, reverse=True)
+        assert all(s["price"] > 50 for s in second.stocks)
+
+        cached = await service.get_cached_results("u1", momentum.screener_id)
+        assert cached.stocks == first.stocks
+        clear_universe_snapshots()
+
+    @pytest.mark.asyncio
+    async def test_snapshot_keyed_on_universe_not_fetcher(self):
+        clear_universe_snapshots()
+        calls = []
+
+        def per_request_fetcher(universe):
+            async def fetcher():
+                calls.append(universe)
+                return _universe()
+            return fetcher
+
+        first = await get_universe_snapshot(per_request_fetcher("us"), "us")
+        again = await get_universe_snapshot(per_request_fetcher("us"), "us")
+        other = await get_universe_snapshot(per_request_fetcher("india"), "india")
+
+        assert again is first and other is not first
+        assert calls == ["us", "india"]
+        clear_universe_snapshots()
+
+    @pytest.mark.asyncio
+    async def test_clear_drops_fetch_locks(self):
+        async def fetcher():
+            return _universe()
+
+        await get_universe_snapshot(fetcher, "us")
+        clear_universe_snapshots()
+
+        # Locks are bound to the loop that used them; none may outlive a clear
+        assert not screener_engine._snapshot_locks